@@ -8,8 +8,15 @@
 Class that handles communications between Spyder kernel and frontend.
 
 Comms transmit data in a list of buffers, and in a json-able dictionnary.
-Here, we only support json to avoid issues of compatibility between Python
-versions. In the abstraction below, buffers is used to send bytes.
+Here, we mostly use json to avoid issues of compatibility between Python
+versions. In the abstraction below, buffers is used to send bytes and pickled
+values.
+
+Values are pickled when they are wrapped in `Pickled` or they are numpy or
+pandas objects. They are sent with pickle protocol 5, so that the data of
+their arrays travels in out-of-band buffers, i.e. it's not copied to the
+pickle stream. A pickled value takes several buffers: the pickle stream
+followed by its out-of-band buffers.
 
 The messages exchanged have the following msg_dict:
 
@@ -37,9 +44,14 @@
             'call_args': The function args,
             'call_kwargs': The function kwargs,
             'buffered_args': The args index that are in the buffers,
-            'buffered_kwargs': the kwargs keys that are in the buffers
+            'buffered_kwargs': the kwargs keys that are in the buffers,
+            'pickled_args': A list of [index, number of buffers] for the
+                            args that are pickled,
+            'pickled_kwargs': A list of [key, number of buffers] for the
+                              kwargs that are pickled
           }
-        - The buffer contains any bytes in the arguments
+        - The buffer contains any bytes in the arguments, followed by the
+          pickled arguments
     - If the 'settings' has `'blocking' =  True`, a reply is sent.
       (spyder_msg_type = 'remote_call_reply'):
         - The 'content' is a dict with: {
@@ -47,22 +59,30 @@
                         exception to be raised.
             'call_id': The uuid from above,
             'call_name': The function name (mostly for debugging),
-            'call_return_value': The return value of the function
+            'call_return_value': The return value of the function,
+            'pickled_return_value': Whether the return value is pickled
            }
-        - The buffer contains the return value if it is bytes
+        - The buffer contains the return value if it is bytes or pickled
 """
 import logging
+import pickle
 import sys
 import uuid
 import traceback
 import builtins
 
+import cloudpickle
+
 
 logger = logging.getLogger(__name__)
 
 # Max timeout (in secs) for blocking calls
 TIMEOUT = 3
 
+# Packages whose objects are always pickled, so that their data is sent in
+# out-of-band buffers
+PICKLED_PACKAGES = {'numpy', 'pandas'}
+
 
 class CommError(RuntimeError):
     pass
@@ -94,6 +114,57 @@ def stacksummary_from_json(stack):
     ])
 
 
+class Pickled:
+    """
+    Wrapper for a value that needs to be pickled to be sent.
+
+    The other side receives the value itself, not this wrapper.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+
+def is_pickled(value):
+    """Check if `value` is sent pickled."""
+    if isinstance(value, Pickled):
+        return True
+    module = type(value).__module__ or ''
+    return module.partition('.')[0] in PICKLED_PACKAGES
+
+
+def pickle_to_buffers(value):
+    """
+    Pickle `value` to a list of buffers.
+
+    The first buffer is the pickle stream and the rest are the out-of-band
+    buffers of the arrays in `value`, which are not copied.
+    """
+    if isinstance(value, Pickled):
+        value = value.value
+
+    out_of_band = []
+    stream = cloudpickle.dumps(
+        value, protocol=5, buffer_callback=out_of_band.append
+    )
+    return [stream] + [buffer.raw() for buffer in out_of_band]
+
+
+def unpickle_from_buffers(buffers):
+    """
+    Unpickle a value from the buffers created by `pickle_to_buffers`.
+
+    Arrays are rebuilt on top of their out-of-band buffers. Only the buffers
+    received as read-only are copied, so that arrays are writable.
+    """
+    out_of_band = []
+    for buffer in buffers[1:]:
+        view = memoryview(buffer)
+        out_of_band.append(bytearray(view) if view.readonly else view)
+
+    return pickle.loads(buffers[0], buffers=out_of_band)
+
+
 class CommsErrorWrapper():
     def __init__(self, call_name, call_id):
         self.call_name = call_name
@@ -357,6 +428,12 @@ def _handle_remote_call(self, msg, buffers):
                     args[idx] = buffers.pop(0)
                 for name in msg_dict['buffered_kwargs']:
                     kwargs[name] = buffers.pop(0)
+                for idx, nbuffers in msg_dict.get('pickled_args', []):
+                    args[idx] = unpickle_from_buffers(buffers[:nbuffers])
+                    del buffers[:nbuffers]
+                for name, nbuffers in msg_dict.get('pickled_kwargs', []):
+                    kwargs[name] = unpickle_from_buffers(buffers[:nbuffers])
+                    del buffers[:nbuffers]
                 assert len(buffers) == 0
 
             return_value = self._remote_callback(
@@ -399,15 +476,21 @@ def _set_call_return_value(self, call_dict, return_value, is_error=False):
             return
 
         buffers = None
+        pickled = False
         if isinstance(return_value, bytes):
             buffers = [return_value]
             return_value = None
+        elif is_pickled(return_value):
+            buffers = pickle_to_buffers(return_value)
+            return_value = None
+            pickled = True
 
         content = {
             'is_error': is_error,
             'call_id': call_dict['call_id'],
             'call_name': call_dict['call_name'],
-            'call_return_value': return_value
+            'call_return_value': return_value,
+            'pickled_return_value': pickled
         }
 
         self._send_message(
@@ -471,6 +554,8 @@ def _get_call_return_value(self, call_dict, comm_id):
 
         if content['is_error']:
             return self._sync_error(return_value)
+        if content.get('unpickling_error'):
+            raise return_value
         return return_value
 
     def _wait_reply(self, comm_id, call_id, call_name, timeout):
@@ -492,6 +577,14 @@ def _handle_remote_call_reply(self, msg_dict, buffers):
         # Prepare return value
         if is_error:
             return_value = CommsErrorWrapper.from_json(return_value)
+        elif content.get('pickled_return_value'):
+            try:
+                return_value = unpickle_from_buffers(buffers)
+            except Exception as error:
+                # The error is raised where the call was made (e.g. when a
+                # module needed to unpickle the value is missing on this side)
+                return_value = error
+                content['unpickling_error'] = True
         elif buffers:
             assert len(buffers) == 1
             return_value = buffers[0]
@@ -513,7 +606,10 @@ def _handle_remote_call_reply(self, msg_dict, buffers):
             return self._async_error(return_value)
 
         # Callback
-        if callback is not None and not is_error:
+        if content.get('unpickling_error'):
+            logger.debug('Could not unpickle the reply of {}: {}'.format(
+                call_name, return_value))
+        elif callback is not None and not is_error:
             callback(return_value)
 
         # Blocking inbox
@@ -568,7 +664,8 @@ def __call__(self, *args, **kwargs):
         """
         Transmit the call to the other side of the tunnel.
 
-        The args and kwargs have to be JSON-serializable or bytes.
+        The args and kwargs have to be JSON-serializable, bytes or pickled
+        values (see `is_pickled`).
         """
         blocking = 'blocking' in self._settings and self._settings['blocking']
         self._settings['send_reply'] = blocking or self._callback is not None
@@ -592,6 +689,26 @@ def __call__(self, *args, **kwargs):
                 buffered_kwargs.append(name)
                 kwargs[name] = None
 
+        # Pickled values go after bytes, so that calls without them are
+        # understood by older versions.
+        pickled_args = []
+        pickled_kwargs = []
+
+        for i, arg in enumerate(args):
+            if is_pickled(arg):
+                pickled = pickle_to_buffers(arg)
+                buffers.extend(pickled)
+                pickled_args.append([i, len(pickled)])
+                args[i] = None
+
+        for name in kwargs:
+            arg = kwargs[name]
+            if is_pickled(arg):
+                pickled = pickle_to_buffers(arg)
+                buffers.extend(pickled)
+                pickled_kwargs.append([name, len(pickled)])
+                kwargs[name] = None
+
         call_id = uuid.uuid4().hex
         call_dict = {
             'call_name': self._name,
@@ -600,7 +717,9 @@ def __call__(self, *args, **kwargs):
             'call_args': args,
             'call_kwargs': kwargs,
             'buffered_args': buffered_args,
-            'buffered_kwargs': buffered_kwargs
+            'buffered_kwargs': buffered_kwargs,
+            'pickled_args': pickled_args,
+            'pickled_kwargs': pickled_kwargs
         }
 
         if not self._comms_wrapper.is_open(self._comm_id):
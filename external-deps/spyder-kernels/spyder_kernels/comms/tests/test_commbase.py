@@ -10,13 +10,50 @@
 Tests for commbase.py
 """
 
+# Third party imports
+import numpy as np
+import pytest
+
 # Local imports
 from spyder_kernels.comms.commbase import (
+    CommBase,
+    is_pickled,
+    Pickled,
+    pickle_to_buffers,
     stacksummary_from_json,
     stacksummary_to_json,
+    unpickle_from_buffers,
 )
 
 
+class LoopbackComm(CommBase):
+    """Comm that handles the calls it makes itself."""
+
+    def __init__(self):
+        super().__init__()
+        self._comms['loopback'] = {'comm': None, 'status': 'ready'}
+
+    def _send_message(
+        self, spyder_msg_type, content=None, comm_id=None, buffers=None
+    ):
+        # Buffers are received as bytes, like Jupyter does
+        buffers = [bytes(buffer) for buffer in buffers or []]
+        msg_dict = {'spyder_msg_type': spyder_msg_type, 'content': content}
+        self._message_handlers[spyder_msg_type](msg_dict, buffers)
+
+    def _wait_reply(self, comm_id, call_id, call_name, timeout):
+        pass
+
+
+def _raise_error():
+    raise ValueError("Can't unpickle this")
+
+
+class Unpicklable:
+    def __reduce__(self):
+        return (_raise_error, ())
+
+
 def test_stacksummary_roundtrip():
     """
     Test that roundtripping a JSON representation of a StackSummary works.
@@ -27,3 +64,51 @@ def test_stacksummary_roundtrip():
     ]
     stacksummary = stacksummary_from_json(json)
     assert stacksummary_to_json(stacksummary) == json
+
+
+def test_pickle_buffers_roundtrip():
+    """
+    Test that the data of arrays is pickled in out-of-band buffers without
+    copying it.
+    """
+    assert is_pickled(np.arange(3))
+    assert is_pickled(Pickled([1, 2]))
+    assert not is_pickled([1, 2])
+    assert not is_pickled(b'bytes')
+
+    arr = np.arange(100.).reshape((10, 10))
+    buffers = pickle_to_buffers(Pickled({'arr': arr}))
+    assert len(buffers) == 2
+    assert np.shares_memory(arr, np.asarray(buffers[1]))
+
+    # Arrays received in read-only buffers are writable
+    value = unpickle_from_buffers([bytes(buffer) for buffer in buffers])
+    np.testing.assert_array_equal(value['arr'], arr)
+    assert value['arr'].flags.writeable
+
+    # Arrays received in writable buffers use them directly
+    received = [buffers[0], memoryview(bytearray(buffers[1]))]
+    value = unpickle_from_buffers(received)
+    np.testing.assert_array_equal(value['arr'], arr)
+    assert np.shares_memory(value['arr'], np.asarray(received[1]))
+
+
+def test_remote_call_with_pickled_values():
+    """Test sending pickled arguments and return values in remote calls."""
+    comm = LoopbackComm()
+    comm.register_call_handler(
+        'multiply',
+        lambda arr, data=b'', factor=1: Pickled((arr * factor, data))
+    )
+    comm.register_call_handler('unpicklable', lambda: Pickled(Unpicklable()))
+
+    arr = np.arange(10.)
+    result, data = comm.remote_call(blocking=True).multiply(
+        arr, data=b'data', factor=np.float64(2)
+    )
+    np.testing.assert_array_equal(result, arr * 2)
+    assert data == b'data'
+
+    # Errors while unpickling are raised where the call is made
+    with pytest.raises(ValueError):
+        comm.remote_call(blocking=True).unpicklable()
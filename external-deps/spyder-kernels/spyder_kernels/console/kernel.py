@@ -33,7 +33,7 @@
 
 # Local imports
 import spyder_kernels
-from spyder_kernels.comms.commbase import stacksummary_to_json
+from spyder_kernels.comms.commbase import Pickled, stacksummary_to_json
 from spyder_kernels.comms.frontendcomm import FrontendComm
 from spyder_kernels.comms.decorators import (
     register_comm_handlers, comm_handler)
@@ -48,7 +48,9 @@
 from spyder_kernels.utils.iofuncs import iofunctions
 from spyder_kernels.utils.mpl import automatic_backend, MPL_BACKENDS_TO_SPYDER
 from spyder_kernels.utils.nsview import (
-    get_remote_data, make_remote_view, get_size)
+    get_remote_data, get_size, get_value_identity, make_remote_view,
+    make_remote_view_entry)
+from spyder_kernels.utils.remoteview import RemoteView
 from spyder_kernels.utils.style import create_pygments_dict
 from spyder_kernels.console.shell import SpyderShell
 from spyder_kernels.comms.utils import WriteContext
@@ -61,6 +63,18 @@
 # shown at all there)
 EXCLUDED_NAMES = ['In', 'Out', 'exit', 'get_ipython', 'quit']
 
+# Properties that identify the kind of a variable, in the order they are
+# checked. Only one of them can be True for a variable.
+VAR_KIND_PROPERTIES = [
+    'is_list',
+    'is_dict',
+    'is_set',
+    'is_array',
+    'is_image',
+    'is_data_frame',
+    'is_series',
+]
+
 
 class SpyderKernel(IPythonKernel):
     """Spyder kernel for Jupyter."""
@@ -78,6 +92,19 @@ def __init__(self, *args, **kwargs):
         register_comm_handlers(self.shell, self.frontend_comm)
 
         self.namespace_view_settings = {}
+
+        # Namespace view last sent to the frontend, used to only send what
+        # changed afterwards. It's None when the full view must be sent.
+        self._namespace_view_cache = None
+
+        # Map from type to the property that identifies its kind (see
+        # VAR_KIND_PROPERTIES)
+        self._var_kinds = {}
+
+        # Views of variables opened by the frontend, by id
+        self._remote_views = {}
+        self._last_remote_view_id = 0
+
         self.faulthandler_handle = None
         self._cwd_initialised = False
 
@@ -135,8 +162,7 @@ def get_state(self):
         with WriteContext("get_state"):
             if self._cwd_initialised:
                 state["cwd"] = self.get_cwd()
-            state["namespace_view"] = self.get_namespace_view()
-            state["var_properties"] = self.get_var_properties()
+            state["namespace_view_delta"] = self.get_namespace_view_delta()
         return state
 
     def publish_state(self):
@@ -147,7 +173,9 @@ def publish_state(self):
         try:
             self.frontend_call(blocking=False).update_state(self.get_state())
         except Exception:
-            pass
+            # The frontend could have missed the changes in the namespace
+            # view, so send it fully next time.
+            self._namespace_view_cache = None
 
     def enable_faulthandler(self):
         """
@@ -353,23 +381,133 @@ def get_var_properties(self):
 
             properties = {}
             for name, value in list(data.items()):
-                properties[name] = {
-                    'is_list':  self._is_list(value),
-                    'is_dict':  self._is_dict(value),
-                    'is_set': self._is_set(value),
-                    'len': self._get_len(value),
-                    'is_array': self._is_array(value),
-                    'is_image': self._is_image(value),
-                    'is_data_frame': self._is_data_frame(value),
-                    'is_series': self._is_series(value),
-                    'array_shape': self._get_array_shape(value),
-                    'array_ndim': self._get_array_ndim(value)
-                }
+                properties[name] = self._get_var_properties_entry(value)
 
             return properties
         else:
             return None
 
+    @comm_handler
+    def get_namespace_view_and_properties(self):
+        """
+        Return the namespace view and the properties of its variables.
+
+        This does the same as calling `get_namespace_view` and
+        `get_var_properties`, but the namespace is filtered only once and
+        a single reply is sent to the frontend.
+
+        This is a dictionary with the following structure
+
+        {
+            'view': {'a': {...}},
+            'properties': {'a': {...}}
+        }
+
+        Here 'view' is the output of `get_namespace_view` and 'properties'
+        the one of `get_var_properties`.
+
+        The frontend replaces its view with this one, so it's also used as
+        the base of the next `get_namespace_view_delta`.
+        """
+        settings = self.namespace_view_settings
+        if not settings:
+            return None
+
+        ns = self.shell._get_current_namespace()
+        data = get_remote_data(ns, settings, mode='editable',
+                               more_excluded_names=EXCLUDED_NAMES)
+
+        cache = {}
+        view = {}
+        properties = {}
+        for name, value in list(data.items()):
+            view[name] = make_remote_view_entry(value, settings)
+            properties[name] = self._get_var_properties_entry(value)
+            cache[name] = (get_value_identity(value), view[name])
+
+        self._namespace_view_cache = cache
+
+        return {'view': view, 'properties': properties}
+
+    def get_namespace_view_delta(self):
+        """
+        Return the changes in the namespace view since it was last sent to
+        the frontend.
+
+        This is a dictionary with the following structure
+
+        {
+            'reset': False,
+            'view': {'a': {...}},
+            'properties': {'a': {...}},
+            'removed': ['b']
+        }
+
+        Here:
+        * 'reset' is True if the frontend must discard the view it has, e.g.
+          because the view settings changed. In that case all variables are
+          included in 'view'.
+        * 'view' has the entries of `get_namespace_view` for the variables
+          that were added or changed.
+        * 'properties' has the entries of `get_var_properties` for the same
+          variables.
+        * 'removed' has the names of the variables that were removed.
+
+        Notes
+        -----
+        Variables with immutable values, and big arrays, dataframes, series
+        and containers, are only checked by identity or a fingerprint (see
+        `get_value_identity`), so their view is not computed again unless they
+        are reassigned or their shape changes. Changes made in place to big
+        values without changing their shape are only sent when the view is
+        fully refreshed with `get_namespace_view_and_properties`. The view of
+        other values is computed again and compared to the previous one. No
+        references to the values are kept between calls.
+        """
+        settings = self.namespace_view_settings
+        if not settings:
+            return None
+
+        ns = self.shell._get_current_namespace()
+        data = get_remote_data(ns, settings, mode='editable',
+                               more_excluded_names=EXCLUDED_NAMES)
+
+        reset = self._namespace_view_cache is None
+        cache = {} if reset else self._namespace_view_cache
+
+        # Map from name to an (identity, view) tuple. The identity is only
+        # computed for immutable and big values, to check if the variable
+        # changed without keeping a reference to objects that could be big.
+        new_cache = {}
+        view = {}
+        properties = {}
+        for name, value in list(data.items()):
+            identity = get_value_identity(value)
+            cached = cache.get(name)
+            if (
+                identity is not None
+                and cached is not None
+                and cached[0] == identity
+            ):
+                new_cache[name] = cached
+                continue
+
+            entry = make_remote_view_entry(value, settings)
+            if cached is None or cached[1] != entry:
+                view[name] = entry
+                properties[name] = self._get_var_properties_entry(value)
+
+            new_cache[name] = (identity, entry)
+
+        self._namespace_view_cache = new_cache
+
+        return {
+            'reset': reset,
+            'view': view,
+            'properties': properties,
+            'removed': [name for name in cache if name not in new_cache],
+        }
+
     @comm_handler
     def get_value(self, name, encoded=False):
         """Get the value of a variable"""
@@ -384,8 +522,9 @@ def get_value(self, name, encoded=False):
             value = value.to_pandas()
 
         if encoded:
-            # Encode with cloudpickle
-            value = cloudpickle.dumps(value)
+            # Pickle the value to be able to send any object. The data of its
+            # arrays is sent in out-of-band buffers, without copying it.
+            value = Pickled(value)
         return value
 
     @comm_handler
@@ -411,6 +550,52 @@ def copy_value(self, orig_name, new_name):
         ns = self.shell._get_reference_namespace(orig_name)
         ns[new_name] = ns[orig_name]
 
+    @comm_handler
+    def open_remote_view(self, name):
+        """
+        Open a view of a variable whose data is served in windows.
+
+        This is used by the frontend to display large dataframes and arrays
+        without getting a copy of them.
+
+        Returns
+        -------
+        Pickled
+            The id of the view and the output of `RemoteView.get_info`.
+        """
+        ns = self.shell._get_current_namespace()
+        view = RemoteView(ns[name])
+
+        self._last_remote_view_id += 1
+        view_id = self._last_remote_view_id
+        self._remote_views[view_id] = view
+
+        return Pickled((view_id, view.get_info()))
+
+    @comm_handler
+    def get_remote_view_window(self, view_id, row_start, row_stop, col_start,
+                               col_stop):
+        """Get a window of the data of a view."""
+        view = self._remote_views[view_id]
+        return Pickled(
+            view.get_window(row_start, row_stop, col_start, col_stop)
+        )
+
+    @comm_handler
+    def get_remote_view_stats(self, view_id):
+        """Get the statistics of a view."""
+        return Pickled(self._remote_views[view_id].get_stats())
+
+    @comm_handler
+    def sort_remote_view(self, view_id, column, ascending=True):
+        """Sort the rows of a view by a column or by its index (-1)."""
+        self._remote_views[view_id].sort(column, ascending)
+
+    @comm_handler
+    def close_remote_view(self, view_id):
+        """Close a view so that its data can be garbage collected."""
+        self._remote_views.pop(view_id, None)
+
     @comm_handler
     def load_data(self, filename, ext, overwrite=False):
         """
@@ -654,6 +839,7 @@ def set_configuration(self, conf):
                 self.publish_state()
             elif key == "namespace_view_settings":
                 self.namespace_view_settings = value
+                self._namespace_view_cache = None
                 self.publish_state()
             elif key == "pdb":
                 self.shell.set_pdb_configuration(value)
@@ -879,6 +1065,61 @@ def _get_len(self, var):
         except:
             return None
 
+    def _get_var_properties_entry(self, var):
+        """Return the properties of a variable"""
+        kind = self._get_var_kind(var)
+        is_array = kind == 'is_array'
+
+        properties = {
+            'is_list': kind == 'is_list',
+            'is_dict': kind == 'is_dict',
+            'is_set': kind == 'is_set',
+            'len': self._get_len(var),
+            'is_array': is_array,
+            'is_image': kind == 'is_image',
+            'is_data_frame': kind == 'is_data_frame',
+            'is_series': kind == 'is_series',
+            'array_shape': None,
+            'array_ndim': None
+        }
+
+        if is_array:
+            try:
+                properties['array_shape'] = var.shape
+                properties['array_ndim'] = var.ndim
+            except Exception:
+                pass
+
+        return properties
+
+    def _get_var_kind(self, var):
+        """
+        Return the property in VAR_KIND_PROPERTIES that is True for a
+        variable, or None if there's none.
+
+        The result is saved per type, so that the checks are done only once
+        for all variables of the same type.
+        """
+        var_type = type(var)
+        try:
+            return self._var_kinds[var_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable type
+            var_type = None
+
+        kind = None
+        for name in VAR_KIND_PROPERTIES:
+            if getattr(self, '_' + name)(var):
+                kind = name
+                break
+
+        if var_type is not None:
+            self._var_kinds[var_type] = kind
+
+        return kind
+
     def _is_array(self, var):
         """Return True if variable is a NumPy array"""
         try:
@@ -935,26 +1176,6 @@ def _is_set(self, var):
         except Exception:
             return False
 
-    def _get_array_shape(self, var):
-        """Return array's shape"""
-        try:
-            if self._is_array(var):
-                return var.shape
-            else:
-                return None
-        except:
-            return None
-
-    def _get_array_ndim(self, var):
-        """Return array's ndim"""
-        try:
-            if self._is_array(var):
-                return var.ndim
-            else:
-                return None
-        except:
-            return None
-
     # --- For the Help plugin
     def _eval(self, text):
         """
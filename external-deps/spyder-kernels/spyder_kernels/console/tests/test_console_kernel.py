@@ -33,6 +33,7 @@
 
 # Local imports
 from spyder_kernels.comms.commbase import CommBase
+from spyder_kernels.console import kernel as kernel_module
 from spyder_kernels.customize.spyderpdb import SpyderPdb
 from spyder_kernels.utils.iofuncs import iofunctions
 from spyder_kernels.utils.pythonenv import PythonEnvType
@@ -336,6 +337,110 @@ def test_get_var_properties(kernel):
     assert "'array_ndim': None" in var_properties
 
 
+def test_get_namespace_view_and_properties(kernel):
+    """
+    Test that the namespace view and properties are computed together.
+    """
+    asyncio.run(kernel.do_execute('a = 1; b = [1, 2]', True))
+
+    namespace = kernel.get_namespace_view_and_properties()
+    assert namespace['view'] == kernel.get_namespace_view()
+    assert namespace['properties'] == kernel.get_var_properties()
+
+    properties = namespace['properties']['b']
+    assert properties['is_list']
+    assert not properties['is_dict']
+    assert properties['len'] == 2
+    assert properties['array_shape'] is None
+
+
+def test_get_namespace_view_delta(kernel):
+    """
+    Test that only the changes in the namespace view are sent after it was
+    sent fully.
+    """
+    # Setting the view settings makes the kernel send the full view
+    kernel.set_configuration(
+        {"namespace_view_settings": kernel.namespace_view_settings}
+    )
+    asyncio.run(kernel.do_execute('a = 1; b = [1]; c = "c"', True))
+
+    delta = kernel.get_namespace_view_delta()
+    assert delta['reset']
+    assert {'a', 'b', 'c'} <= set(delta['view'])
+    assert set(delta['view']) == set(delta['properties'])
+
+    # Nothing changed
+    delta = kernel.get_namespace_view_delta()
+    assert not delta['reset']
+    assert delta['view'] == {}
+    assert delta['removed'] == []
+
+    # Reassign, change in place, remove and add variables
+    asyncio.run(
+        kernel.do_execute('a = 2; b.append(2); del c; d = 3', True)
+    )
+
+    delta = kernel.get_namespace_view_delta()
+    assert not delta['reset']
+    assert set(delta['view']) == {'a', 'b', 'd'}
+    assert delta['view']['a']['view'] == '2'
+    assert delta['view']['b']['size'] == 2
+    assert delta['properties']['b']['len'] == 2
+    assert delta['removed'] == ['c']
+
+    # Values are not kept alive by the cache
+    asyncio.run(kernel.do_execute('e = "e" * 10**6', True))
+    value = kernel.shell.user_ns['e']
+    refcount = sys.getrefcount(value)
+    delta = kernel.get_namespace_view_delta()
+    assert set(delta['view']) == {'e'}
+    assert sys.getrefcount(value) == refcount
+    del value
+
+    # A new value with the same id is not taken as the old one
+    asyncio.run(kernel.do_execute('del e; e = "f" * 10**6', True))
+    delta = kernel.get_namespace_view_delta()
+    assert set(delta['view']) == {'e'}
+
+
+def test_get_namespace_view_delta_big_values(kernel, mocker):
+    """
+    Test that the view of big arrays and containers is not computed again
+    unless they are reassigned or their shape changes.
+    """
+    kernel.set_configuration(
+        {"namespace_view_settings": kernel.namespace_view_settings}
+    )
+    asyncio.run(
+        kernel.do_execute(
+            'import numpy as np; a = np.zeros(10**6); b = [0] * 10**4', True
+        )
+    )
+    delta = kernel.get_namespace_view_delta()
+    assert {'a', 'b'} <= set(delta['view'])
+
+    # Unchanged big values are not displayed again
+    spy = mocker.spy(kernel_module, 'make_remote_view_entry')
+    delta = kernel.get_namespace_view_delta()
+    assert delta['view'] == {}
+    assert spy.call_count == 0
+
+    # Changes in their shape are seen
+    asyncio.run(kernel.do_execute('a.shape = (10**3, 10**3); b.pop()', True))
+    delta = kernel.get_namespace_view_delta()
+    assert set(delta['view']) == {'a', 'b'}
+    assert delta['view']['a']['size'] == (10**3, 10**3)
+    assert delta['view']['b']['size'] == 10**4 - 1
+
+    # Changes made in place are only seen when the view is fully refreshed
+    asyncio.run(kernel.do_execute('a[0, 0] = 5', True))
+    assert kernel.get_namespace_view_delta()['view'] == {}
+    namespace = kernel.get_namespace_view_and_properties()
+    assert namespace['view']['a']['view'].startswith('[[5.')
+    assert kernel.get_namespace_view_delta()['view'] == {}
+
+
 def test_get_value(kernel):
     """Test getting the value of a variable."""
     name = 'a'
@@ -361,6 +466,27 @@ def test_get_value_with_polars(kernel):
     assert_series_equal(kernel.get_value('polars_s'), pandas_s)
 
 
+def test_remote_view(kernel):
+    """Test getting windows of a variable from a remote view."""
+    command = (
+        "import polars; "
+        "polars_df = polars.DataFrame({'a': [3, 1, 2], 'b': [4, 5, 6]})"
+    )
+    asyncio.run(kernel.do_execute(command, True))
+
+    view_id, info = kernel.open_remote_view('polars_df').value
+    assert info['type_name'] == 'Polars DataFrame'
+    assert info['shape'] == (3, 2)
+
+    kernel.sort_remote_view(view_id, 0)
+    window = kernel.get_remote_view_window(view_id, 0, 2, 1, 2).value
+    assert list(window.index) == [1, 2]
+    assert list(window['b']) == [5, 6]
+
+    kernel.close_remote_view(view_id)
+    assert view_id not in kernel._remote_views
+
+
 def test_set_value(kernel):
     """Test setting the value of a variable."""
     name = 'a'
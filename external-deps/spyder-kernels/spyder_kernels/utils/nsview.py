@@ -13,6 +13,7 @@
 import inspect
 import pathlib
 import re
+import sys
 
 from spyder_kernels.utils.lazymodules import (
     bs4, FakeObject, numpy as np, pandas as pd, PIL)
@@ -727,13 +728,111 @@ def make_remote_view(data, settings, more_excluded_names=None):
                            more_excluded_names=more_excluded_names)
     remote = {}
     for key, value in list(data.items()):
-        view = value_to_display(value, minmax=settings['minmax'])
-        remote[key] = {
-            'type':  get_human_readable_type(value),
-            'size':  get_size(value),
-            'view':  view,
-            'python_type': get_type_string(value),
-            'numpy_type': get_numpy_type_string(value)
-        }
+        remote[key] = make_remote_view_entry(value, settings)
 
     return remote
+
+
+def make_remote_view_entry(value, settings):
+    """Make the entry of *value* in a remote view."""
+    view = value_to_display(value, minmax=settings['minmax'])
+    return {
+        'type':  get_human_readable_type(value),
+        'size':  get_size(value),
+        'view':  view,
+        'python_type': get_type_string(value),
+        'numpy_type': get_numpy_type_string(value)
+    }
+
+
+# Types whose instances can't change after they are created, so their view
+# only needs to be computed again if a variable is bound to another object.
+IMMUTABLE_TYPES = (
+    bool,
+    bytes,
+    complex,
+    datetime.date,
+    datetime.datetime,
+    datetime.timedelta,
+    float,
+    int,
+    str,
+    type(None),
+)
+
+
+# Types of containers identified by their id and length
+CONTAINER_TYPES = (dict, frozenset, list, set, tuple)
+
+# Minimum number of elements of mutable values (arrays, dataframes and
+# containers) for them to be identified by a fingerprint instead of their
+# contents. Smaller ones are cheap to display.
+FINGERPRINT_MIN_SIZE = 1000
+
+
+def get_value_identity(value):
+    """
+    Return a key that identifies *value*, or None if it can't be done cheaply.
+
+    The key holds no reference to *value*. For immutable values, besides
+    their id, which can be reused by another object once *value* is deleted,
+    it has their type, length and hash, so that a new object with the same id
+    is very unlikely to get the same key. Hashes of strings and bytes are
+    cached by Python, so this is cheap even for big ones.
+
+    Big arrays, dataframes, series and containers get a fingerprint with
+    their id, type, shape or length and, for arrays, their dtype, strides
+    and data pointer. Their contents can change in place without changing
+    it, so such changes are only seen when their view is fully refreshed.
+    """
+    value_type = type(value)
+    if value_type in IMMUTABLE_TYPES:
+        length = len(value) if value_type in (str, bytes) else None
+        return (id(value), value_type, length, hash(value))
+
+    if value_type in CONTAINER_TYPES:
+        if len(value) < FINGERPRINT_MIN_SIZE:
+            return None
+        return (id(value), value_type, len(value))
+
+    try:
+        if np.ndarray is not FakeObject and isinstance(value, np.ndarray):
+            if value.size < FINGERPRINT_MIN_SIZE:
+                return None
+            return (
+                id(value),
+                value_type,
+                value.shape,
+                value.dtype.str,
+                value.strides,
+                value.__array_interface__['data'][0],
+            )
+
+        # Pandas is only checked if it's already imported, because importing
+        # it is slow.
+        if 'pandas' in sys.modules:
+            if isinstance(value, pd.DataFrame):
+                if value.size < FINGERPRINT_MIN_SIZE:
+                    return None
+                return (
+                    id(value),
+                    value_type,
+                    value.shape,
+                    id(value.index),
+                    id(value.columns),
+                )
+            elif isinstance(value, pd.Series):
+                if value.size < FINGERPRINT_MIN_SIZE:
+                    return None
+                return (
+                    id(value),
+                    value_type,
+                    value.shape,
+                    str(value.dtype),
+                    id(value.index),
+                )
+    except Exception:
+        # Objects can fail in many ways when inspected
+        pass
+
+    return None
@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Views of large dataframes and arrays held by the kernel.
+
+They allow the frontend to display those objects without receiving a copy of
+them. Instead, it asks for the windows of data it needs to show, and column
+statistics and sort orders are computed here.
+"""
+
+import warnings
+
+from spyder_kernels.utils.lazymodules import numpy as np, pandas as pd
+
+
+POLARS_TYPES = {
+    "<class 'polars.dataframe.frame.DataFrame'>": 'Polars DataFrame',
+    "<class 'polars.series.series.Series'>": 'Polars Series',
+}
+
+
+def _is_real_numeric_dtype(dtype):
+    """Check if `dtype` is a numeric one, excluding bools and complexes."""
+    try:
+        return pd.api.types.is_any_real_numeric_dtype(dtype)
+    except AttributeError:
+        # Pandas < 2.0
+        return (
+            pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            and not pd.api.types.is_complex_dtype(dtype)
+        )
+
+
+def column_max_min(col):
+    """
+    Compute the maximum and minimum of a pandas Series.
+
+    Returns
+    -------
+    list or None
+        [vmax, vmin] ignoring NaN's, or None if the column is not numeric.
+        For complex numbers, the absolute values are used. If vmax equals
+        vmin, then vmin is decreased by one.
+    """
+    # This is necessary to catch some errors in Pandas when computing the
+    # maximum of a column.
+    # Fixes spyder-ide/spyder#17145 and spyder-ide/spyder#24094
+    try:
+        if _is_real_numeric_dtype(col.dtype):
+            vmax = col.max(skipna=True)
+            vmin = col.min(skipna=True)
+        elif pd.api.types.is_complex_dtype(col.dtype):
+            vmax = col.abs().max(skipna=True)
+            vmin = col.abs().min(skipna=True)
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+
+    if vmax != vmin:
+        return [vmax, vmin]
+    else:
+        return [vmax, vmin - 1]
+
+
+def columns_max_min(df):
+    """
+    Compute the maximum and minimum of all columns of a pandas DataFrame.
+
+    This gives the same result as calling `column_max_min` for each column,
+    but columns with a Numpy numeric dtype are processed in a single
+    vectorized pass per dtype, which is much faster for wide dataframes.
+
+    Returns
+    -------
+    list
+        List whose k-th entry is the output of `column_max_min` for the k-th
+        column.
+    """
+    stats = [None] * df.shape[1]
+    if df.shape[0] == 0:
+        return stats
+
+    # Column positions are used instead of labels because the latter could be
+    # duplicated.
+    positions_by_dtype = {}
+    for position, dtype in enumerate(df.dtypes):
+        positions_by_dtype.setdefault(dtype, []).append(position)
+
+    for dtype, positions in positions_by_dtype.items():
+        if not isinstance(dtype, np.dtype):
+            # Extension dtypes, e.g. nullable integers or categories
+            for position in positions:
+                stats[position] = column_max_min(df.iloc[:, position])
+            continue
+        elif dtype.kind not in 'iufc':
+            continue
+
+        block = df.iloc[:, positions].to_numpy()
+        if dtype.kind == 'c':
+            block = np.abs(block)
+
+        with warnings.catch_warnings():
+            # Raised for columns that only contain NaN's
+            warnings.simplefilter('ignore', RuntimeWarning)
+            vmaxs = np.nanmax(block, axis=0)
+            vmins = np.nanmin(block, axis=0)
+
+        for position, vmax, vmin in zip(positions, vmaxs, vmins):
+            if vmax != vmin:
+                stats[position] = [vmax, vmin]
+            else:
+                stats[position] = [vmax, vmin - 1]
+
+    return stats
+
+
+class RemoteView:
+    """
+    View of a dataframe or an array that is served in windows.
+
+    Parameters
+    ----------
+    value: object
+        A pandas or polars DataFrame or Series, a pandas Index, or a Numpy
+        array with one or two dimensions.
+
+    Raises
+    ------
+    TypeError
+        If `value` is not supported.
+    """
+
+    def __init__(self, value):
+        self.type_name = POLARS_TYPES.get(
+            str(type(value)), type(value).__name__
+        )
+        self.is_polars = self.type_name in POLARS_TYPES.values()
+        self.is_series = self.type_name in ['Series', 'Polars Series']
+
+        # Order in which rows are shown, or None to show them unsorted
+        self.permutation = None
+
+        if self.type_name == 'Polars Series':
+            self.kind = 'dataframe'
+            self.value = value.to_frame()
+        elif self.is_polars:
+            self.kind = 'dataframe'
+            self.value = value
+        elif isinstance(value, pd.Series):
+            self.kind = 'dataframe'
+            self.value = value.to_frame()
+        elif isinstance(value, pd.Index):
+            self.kind = 'dataframe'
+            self.value = pd.DataFrame(value)
+        elif isinstance(value, pd.DataFrame):
+            self.kind = 'dataframe'
+            self.value = value
+        elif (
+            isinstance(value, np.ndarray)
+            and not isinstance(value, np.ma.MaskedArray)
+            and value.dtype.names is None
+            and value.ndim in (1, 2)
+        ):
+            self.kind = 'array'
+            self.value = (
+                value.reshape((value.shape[0], 1)) if value.ndim == 1
+                else value
+            )
+        else:
+            raise TypeError(
+                "Remote views of {} objects are not supported".format(
+                    self.type_name
+                )
+            )
+
+    def get_info(self):
+        """
+        Return the information needed by the frontend to set up the view.
+
+        This is a dictionary with the kind ('dataframe' or 'array'), shape
+        and type name of the object. For dataframes, it also contains its
+        columns and the number and names of the levels in its index. For
+        arrays, it contains its dtype.
+        """
+        info = {
+            'kind': self.kind,
+            'shape': tuple(self.value.shape),
+            'type_name': self.type_name,
+            'is_series': self.is_series,
+        }
+
+        if self.kind == 'array':
+            info['dtype'] = self.value.dtype
+        elif self.is_polars:
+            info['columns'] = pd.Index(self.value.columns)
+            info['index_nlevels'] = 1
+            info['index_names'] = [None]
+        else:
+            index = self.value.index
+            info['columns'] = self.value.columns
+            info['index_nlevels'] = index.nlevels
+            info['index_names'] = list(index.names)
+
+        return info
+
+    def _row_positions(self, start, stop):
+        """Return the positions of the rows shown between start and stop."""
+        if self.permutation is None:
+            return slice(start, stop)
+        return self.permutation[start:stop]
+
+    def get_window(self, row_start, row_stop, col_start, col_stop):
+        """
+        Return a window of the data.
+
+        Row positions refer to the rows as currently sorted. For dataframes,
+        the result is a pandas DataFrame that includes the index labels of
+        its rows. For polars ones, those labels are the row positions in the
+        original dataframe.
+        """
+        rows = self._row_positions(row_start, row_stop)
+        columns = slice(col_start, col_stop)
+
+        if self.kind == 'array':
+            return self.value[rows, columns]
+        elif self.is_polars:
+            window = self.value[:, columns][rows].to_pandas()
+            positions = np.arange(self.value.shape[0])[rows]
+            window.index = pd.Index(positions)
+            return window
+        else:
+            return self.value.iloc[rows, columns]
+
+    def get_stats(self):
+        """
+        Return the statistics used to color the cells of the frontend.
+
+        For dataframes, this is a list whose k-th entry is the output of
+        `column_max_min` for the k-th column. For arrays, it's a dictionary
+        with the minimum and maximum of the array (of its absolute values for
+        complex ones) and whether it has infinite values.
+        """
+        if self.kind == 'array':
+            return self._get_array_stats()
+
+        if self.value.shape[0] == 0:
+            return None
+
+        if not self.is_polars:
+            return columns_max_min(self.value)
+
+        return [
+            column_max_min(self.value.to_series(i).to_pandas())
+            for i in range(self.value.shape[1])
+        ]
+
+    def _get_array_stats(self):
+        data = self.value
+        stats = {'vmin': None, 'vmax': None, 'has_inf': False}
+        if data.dtype.name == 'object':
+            return stats
+
+        if data.dtype.kind in ['f', 'c']:
+            stats['has_inf'] = bool(np.any(np.isinf(data)))
+
+        color_func = np.abs if data.dtype.kind == 'c' else np.real
+        try:
+            stats['vmin'] = np.nanmin(color_func(data))
+            stats['vmax'] = np.nanmax(color_func(data))
+        except (AttributeError, TypeError, ValueError):
+            pass
+
+        return stats
+
+    def sort(self, column, ascending=True):
+        """
+        Sort the rows of the view by a column, or by the index if `column`
+        is -1.
+
+        The data itself is not modified, only the order in which rows are
+        served. The sort is stable and leaves missing values at the end.
+        """
+        if self.kind == 'array':
+            raise TypeError("Arrays can't be sorted")
+
+        if column == -1:
+            if self.is_polars:
+                self.permutation = None if ascending else (
+                    np.arange(self.value.shape[0])[::-1]
+                )
+                return
+            keys = self.value.index.to_series(index=pd.RangeIndex(
+                self.value.shape[0]
+            ))
+        elif self.is_polars:
+            keys = self.value.to_series(column).to_pandas()
+        else:
+            keys = self.value.iloc[:, column].reset_index(drop=True)
+
+        if pd.api.types.is_complex_dtype(keys.dtype):
+            raise TypeError(
+                "No ordering relation is defined for complex numbers"
+            )
+
+        self.permutation = keys.sort_values(
+            ascending=ascending, kind='mergesort', na_position='last'
+        ).index.to_numpy()
@@ -30,6 +30,7 @@
     get_size,
     get_supported_types,
     get_type_string,
+    get_value_identity,
     is_editable_type,
     is_supported,
     sort_against,
@@ -500,5 +501,35 @@ def test_polars_series():
     assert get_human_readable_type(s) == 'Polars Series'
 
 
+def test_get_value_identity():
+    """Test the keys used to know if a value changed in a namespace view."""
+    # Immutable values are identified by their contents
+    value = 'spam' * 10
+    assert get_value_identity(value) == get_value_identity(value)
+    assert get_value_identity(value) != get_value_identity(value + 'eggs')
+
+    # Small mutable values are not identified, so they're displayed again
+    assert get_value_identity([1, 2]) is None
+    assert get_value_identity(np.zeros(10)) is None
+    assert get_value_identity(pd.DataFrame([1, 2])) is None
+
+    # Big ones get a fingerprint that changes with their shape
+    def reshape_array(value):
+        value.shape = (100, 100)
+
+    for value, reshape in [
+        (list(range(10**4)), lambda value: value.pop()),
+        (np.zeros(10**4), reshape_array),
+        (pd.DataFrame(np.zeros((10**4, 2))), lambda value: value.pop(1)),
+        (pd.Series(np.zeros(10**4)), lambda value: value.drop(
+            0, inplace=True)),
+    ]:
+        identity = get_value_identity(value)
+        assert identity is not None
+        assert get_value_identity(value) == identity
+        reshape(value)
+        assert get_value_identity(value) != identity
+
+
 if __name__ == "__main__":
     pytest.main()
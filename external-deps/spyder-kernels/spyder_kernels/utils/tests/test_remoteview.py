@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for remoteview.py
+"""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+from spyder_kernels.utils.remoteview import (
+    RemoteView, column_max_min, columns_max_min)
+
+
+def test_dataframe_view():
+    """Test getting windows of a dataframe and sorting them."""
+    df = pd.DataFrame(
+        {'a': [3, 1, 2, np.nan], 'b': list('wxyz')},
+        index=list('pqrs')
+    )
+    view = RemoteView(df)
+
+    info = view.get_info()
+    assert info['kind'] == 'dataframe'
+    assert info['shape'] == (4, 2)
+    assert info['type_name'] == 'DataFrame'
+    assert list(info['columns']) == ['a', 'b']
+    assert info['index_nlevels'] == 1
+
+    window = view.get_window(1, 3, 1, 2)
+    assert list(window.index) == ['q', 'r']
+    assert list(window['b']) == ['x', 'y']
+
+    # Sort by a column, leaving NaN's at the end
+    view.sort(0, ascending=True)
+    assert list(view.get_window(0, 4, 1, 2)['b']) == ['x', 'y', 'w', 'z']
+
+    view.sort(0, ascending=False)
+    assert list(view.get_window(0, 4, 0, 1).index) == ['p', 'r', 'q', 's']
+
+    # Sort by index
+    view.sort(-1, ascending=False)
+    assert list(view.get_window(0, 2, 0, 2).index) == ['s', 'r']
+
+    # The dataframe itself is not modified
+    assert list(df.index) == list('pqrs')
+
+
+def test_dataframe_view_stats():
+    """Test the column statistics of a dataframe view."""
+    df = pd.DataFrame({
+        'a': [1, 5, 3],
+        'b': [1j, 2, -3],
+        'c': ['x', 'y', 'z'],
+        'd': [2., 2., np.nan]
+    })
+    view = RemoteView(df)
+
+    assert view.get_stats() == [[5, 1], [3, 1], None, [2., 1.]]
+    assert column_max_min(df['c']) is None
+
+
+def test_columns_max_min():
+    """
+    Test that the vectorized column statistics agree with those computed
+    column by column.
+    """
+    df = pd.DataFrame({
+        'int': [4, 1, 9],
+        'float': [np.nan, 2.5, -1.],
+        'nan': [np.nan] * 3,
+        'complex': [3 + 4j, 1j, 0],
+        'nullable': pd.Series([1, None, 3], dtype='Int64'),
+        'bool': [True, False, True],
+        'str': list('abc'),
+        'category': pd.Series(list('aab'), dtype='category'),
+        'date': pd.date_range('2020-01-01', periods=3),
+        'constant': [7, 7, 7],
+    })
+
+    # Duplicated labels must not be an issue
+    df = pd.concat([df, df[['int']]], axis=1)
+
+    expected = [column_max_min(df.iloc[:, i]) for i in range(df.shape[1])]
+    np.testing.assert_equal(columns_max_min(df), expected)
+    assert columns_max_min(df.iloc[:0]) == [None] * df.shape[1]
+
+
+def test_series_and_index_views():
+    """Test that series and indexes are served as dataframes."""
+    view = RemoteView(pd.Series([1, 2, 3], name='s'))
+    info = view.get_info()
+    assert info['is_series']
+    assert info['shape'] == (3, 1)
+
+    view = RemoteView(pd.Index([4, 5, 6]))
+    assert view.get_info()['type_name'] == 'Index'
+    assert list(view.get_window(0, 3, 0, 1).iloc[:, 0]) == [4, 5, 6]
+
+
+def test_array_view():
+    """Test getting windows and statistics of arrays."""
+    arr = np.arange(12, dtype=float).reshape((3, 4))
+    arr[0, 0] = np.inf
+    view = RemoteView(arr)
+
+    info = view.get_info()
+    assert info['kind'] == 'array'
+    assert info['dtype'] == arr.dtype
+    np.testing.assert_array_equal(view.get_window(1, 3, 2, 4), arr[1:3, 2:4])
+
+    stats = view.get_stats()
+    assert stats['has_inf']
+    assert stats['vmax'] == np.inf
+
+    # One dimensional arrays are shown as columns
+    view = RemoteView(np.arange(5))
+    assert view.get_info()['shape'] == (5, 1)
+
+    with pytest.raises(TypeError):
+        view.sort(0)
+
+
+def test_unsupported_views():
+    """Test that unsupported objects raise an error."""
+    for value in [np.zeros((2, 2, 2)), np.ma.array([1, 2]), [1, 2]]:
+        with pytest.raises(TypeError):
+            RemoteView(value)
+
+
+if __name__ == "__main__":
+    pytest.main()
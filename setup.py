@@ -339,6 +339,7 @@ def run(self):
         'pandas',
         'pillow',
         'pytest<8.0',
+        'pytest-benchmark',
         'pytest-cov',
         'pytest-lazy-fixture',
         'pytest-mock',
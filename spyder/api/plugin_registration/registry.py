@@ -32,6 +32,7 @@
 from spyder.api.exceptions import SpyderAPIError
 from spyder.api.plugins import Plugins, SpyderDockablePlugin, SpyderPluginV2
 from spyder.utils.icon_manager import ima
+from spyder.utils.timeline import STARTUP_TIMELINE
 
 if TYPE_CHECKING:
     from qtpy.QtGui import QIcon
@@ -123,6 +124,16 @@ class SpyderPluginRegistry(_PluginRegistryPreferencesAdapter, QObject):
         ``False`` otherwise.
     """
 
+    sig_plugin_activated: Signal = Signal(str)
+    """
+    Signal emitted when a deferred plugin is activated after startup.
+
+    Parameters
+    ----------
+    plugin_name: str
+        Name of the plugin that was activated.
+    """
+
     def __init__(self) -> None:
         """
         Create a global registry for internal and external Spyder plugins.
@@ -162,6 +173,13 @@ def __init__(self) -> None:
         self.enabled_plugins: set[str] = set()
         """Set of the names of all enabled plugins."""
 
+        self.deferred_plugins: dict[str, type[SpyderPluginClass]] = {}
+        """
+        Mapping of plugin names to the classes of enabled plugins that were
+        not created at startup and will be when one of their
+        :attr:`~spyder.api.plugins.SpyderPluginV2.ACTIVATION_TRIGGERS` happens.
+        """
+
         self.internal_plugins: set[str] = set()
         """Set of the names of all internal plugins (part of Spyder itself)."""
 
@@ -193,8 +211,10 @@ def __init__(self) -> None:
     # -------------------------------------------------------------------------
     def _load_and_register_plugins(self):
         """Load and register internal and external plugins."""
-        external_plugins = find_external_plugins()
-        internal_plugins = find_internal_plugins()
+        with STARTUP_TIMELINE.span("find_external_plugins"):
+            external_plugins = find_external_plugins()
+        with STARTUP_TIMELINE.span("find_internal_plugins"):
+            internal_plugins = find_internal_plugins()
         all_plugins = external_plugins.copy()
         all_plugins.update(internal_plugins.copy())
 
@@ -244,6 +264,9 @@ def _load_and_register_plugins(self):
         self.all_internal_plugins = registry_internal_plugins
         self.all_external_plugins = registry_external_plugins
 
+        # Plugins with activation triggers are created on demand
+        self.deferred_plugins = self._get_deferred_plugins(enabled_plugins)
+
         # Instantiate internal plugins
         for plugin_name in internal_plugins:
             PluginClass = internal_plugins[plugin_name]
@@ -265,6 +288,10 @@ def _load_and_register_plugins(self):
                 ):
                     continue
 
+                if plugin_name in self.deferred_plugins:
+                    logger.debug(f"Deferring plugin {plugin_name}")
+                    continue
+
                 self.register_plugin(
                     self.main, PluginClass, external=False
                 )
@@ -285,6 +312,10 @@ def _load_and_register_plugins(self):
                 ):
                     continue
 
+                if plugin_name in self.deferred_plugins:
+                    logger.debug(f"Deferring plugin {plugin_name}")
+                    continue
+
                 try:
                     self.register_plugin(
                         self.main, PluginClass, external=True
@@ -293,6 +324,73 @@ def _load_and_register_plugins(self):
                     print("%s: %s" % (PluginClass, str(error)), file=STDERR)
                     traceback.print_exc(file=STDERR)
 
+    def _get_deferred_plugins(
+        self, enabled_plugins: dict[str, type[SpyderPluginClass]]
+    ) -> dict[str, type[SpyderPluginClass]]:
+        """
+        Get the enabled plugins that can be created on demand.
+
+        Those are the ones with activation triggers that no plugin created at
+        startup strictly requires and whose pane (if they have one) was not
+        visible or undocked in the previous session.
+        """
+        if (
+            not self.get_conf("lazy_plugin_activation", section="main")
+            or running_under_pytest()
+        ):
+            return {}
+
+        deferred_plugins = {}
+        for plugin_name, PluginClass in enabled_plugins.items():
+            if (
+                not PluginClass.ACTIVATION_TRIGGERS
+                or (
+                    PluginClass.REQUIRE_WEB_WIDGETS
+                    and not self._are_web_widgets_available()
+                )
+                or self._was_pane_shown(PluginClass)
+            ):
+                continue
+            deferred_plugins[plugin_name] = PluginClass
+
+        # Plugins required by the ones created at startup need to be created
+        # too, which can make them require other deferred plugins. Note that
+        # Plugins.All is not taken into account because the plugins that use
+        # it handle the others when they become available.
+        while True:
+            required_plugins = {
+                required_plugin
+                for plugin_name, PluginClass in enabled_plugins.items()
+                if plugin_name not in deferred_plugins
+                for required_plugin in PluginClass.REQUIRES
+                if required_plugin in deferred_plugins
+            }
+            if not required_plugins:
+                break
+
+            for plugin_name in required_plugins:
+                deferred_plugins.pop(plugin_name)
+
+        return deferred_plugins
+
+    def _was_pane_shown(self, PluginClass: type[SpyderPluginClass]) -> bool:
+        """
+        Check if the pane of a plugin was visible or undocked in the previous
+        session.
+        """
+        if not issubclass(PluginClass, SpyderDockablePlugin):
+            return False
+
+        visible_plugins = self.get_conf(
+            "last_visible_plugins", default=[], section="quick_layouts"
+        )
+        undocked = self.get_conf(
+            "undocked_on_window_close",
+            default=False,
+            section=PluginClass.CONF_SECTION,
+        )
+        return PluginClass.NAME in visible_plugins or undocked
+
     def _update_dependents(self, plugin: str, dependent_plugin: str, key: str):
         """Add `dependent_plugin` to the list of dependents of `plugin`."""
         plugin_dependents = self.plugin_dependents.get(plugin, {})
@@ -347,7 +445,8 @@ def _instantiate_spyder_plugin(
             CONF.register_plugin(PluginClass)
 
         # Create and store plugin instance
-        plugin_instance = PluginClass(main_window, configuration=CONF)
+        with STARTUP_TIMELINE.span(f"{plugin_name}.__init__", "plugin"):
+            plugin_instance = PluginClass(main_window, configuration=CONF)
         self.plugin_registry[plugin_name] = plugin_instance
 
         # Connect plugin availability signal to notification system
@@ -358,7 +457,8 @@ def _instantiate_spyder_plugin(
         )
 
         # Initialize plugin instance
-        plugin_instance.initialize()
+        with STARTUP_TIMELINE.span(f"{plugin_name}.on_initialize", "plugin"):
+            plugin_instance.initialize()
 
         # Register plugins that are already available
         self._notify_plugin_dependencies(plugin_name)
@@ -505,6 +605,81 @@ def register_plugin(
 
         return instance
 
+    def activate_plugin(self, plugin_name: str) -> SpyderPluginClass:
+        """
+        Create a deferred plugin, if it was not created yet.
+
+        This is called when one of the plugin's
+        :attr:`~spyder.api.plugins.SpyderPluginV2.ACTIVATION_TRIGGERS`
+        happens. The deferred plugins it requires are activated first.
+
+        Parameters
+        ----------
+        plugin_name: str
+            Name of the plugin to activate.
+
+        Returns
+        -------
+        plugin: SpyderPluginClass
+            The instance of the plugin.
+
+        Raises
+        ------
+        SpyderAPIError
+            If the plugin is neither in the registry nor deferred.
+        """
+        if plugin_name in self.plugin_registry:
+            return self.plugin_registry[plugin_name]
+
+        if plugin_name not in self.deferred_plugins:
+            raise SpyderAPIError(
+                f"Plugin {plugin_name} was not found in the registry"
+            )
+
+        logger.debug(f"Activating plugin {plugin_name}")
+        PluginClass = self.deferred_plugins.pop(plugin_name)
+
+        for required_plugin in PluginClass.REQUIRES:
+            if required_plugin in self.deferred_plugins:
+                self.activate_plugin(required_plugin)
+
+        plugin = self.register_plugin(
+            self.main,
+            PluginClass,
+            external=plugin_name in self.all_external_plugins,
+        )
+
+        # Run the main window setup steps that the plugin missed
+        if not self.main.is_starting_up:
+            plugin.before_mainwindow_visible()
+        if not self.main.is_setting_up:
+            plugin.on_mainwindow_visible()
+
+        self.sig_plugin_activated.emit(plugin_name)
+        return plugin
+
+    def get_deferred_plugins(
+        self, trigger: str | None = None
+    ) -> list[type[SpyderPluginClass]]:
+        """
+        Get the classes of the plugins that are waiting to be activated.
+
+        Parameters
+        ----------
+        trigger: str | None, optional
+            If given, only return the plugins that are activated by this
+            :class:`~spyder.api.plugins.PluginActivationTriggers` value.
+
+        Returns
+        -------
+        list[type[SpyderPluginClass]]
+            The classes of the deferred plugins.
+        """
+        return [
+            PluginClass for PluginClass in self.deferred_plugins.values()
+            if trigger is None or trigger in PluginClass.ACTIVATION_TRIGGERS
+        ]
+
     def notify_plugin_availability(
         self,
         plugin_name: str,
@@ -905,6 +1080,7 @@ def reset(self) -> None:
         self.plugin_availability = {}
 
         self.enabled_plugins = set()
+        self.deferred_plugins = {}
         self.internal_plugins = set()
         self.external_plugins = set()
 
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# (see LICENSE.txt for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for the activation of deferred plugins in the plugin registry."""
+
+# Standard library imports
+from unittest.mock import MagicMock
+
+# Third-party imports
+import pytest
+
+# Local imports
+from spyder.api.exceptions import SpyderAPIError
+from spyder.api.plugins import PluginActivationTriggers, SpyderPluginV2
+from spyder.api.plugin_registration import registry as registry_module
+from spyder.api.plugin_registration.registry import SpyderPluginRegistry
+
+
+class Viewer(SpyderPluginV2):
+    NAME = "viewer"
+    ACTIVATION_TRIGGERS = [PluginActivationTriggers.PaneShown]
+
+
+class Reader(SpyderPluginV2):
+    NAME = "reader"
+    REQUIRES = ["parser"]
+    ACTIVATION_TRIGGERS = [PluginActivationTriggers.FileOpened]
+
+
+class Parser(SpyderPluginV2):
+    NAME = "parser"
+    ACTIVATION_TRIGGERS = [PluginActivationTriggers.FileOpened]
+
+
+class Writer(SpyderPluginV2):
+    NAME = "writer"
+    REQUIRES = ["reader"]
+    OPTIONAL = ["viewer"]
+
+
+PLUGINS = {
+    plugin.NAME: plugin for plugin in [Viewer, Reader, Parser, Writer]
+}
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = SpyderPluginRegistry()
+    registry.main = MagicMock(is_starting_up=False, is_setting_up=False)
+
+    monkeypatch.setattr(
+        registry_module, "running_under_pytest", lambda: False
+    )
+    monkeypatch.setattr(
+        registry,
+        "get_conf",
+        lambda option, default=None, section=None: (
+            True if option == "lazy_plugin_activation" else default
+        ),
+    )
+
+    def register_plugin(main_window, PluginClass, external=False):
+        plugin = MagicMock(NAME=PluginClass.NAME)
+        registry.plugin_registry[PluginClass.NAME] = plugin
+        return plugin
+
+    monkeypatch.setattr(registry, "register_plugin", register_plugin)
+    return registry
+
+
+def test_get_deferred_plugins(registry):
+    """
+    Check that plugins required by the ones created at startup are not
+    deferred, even through other deferred plugins.
+    """
+    assert registry._get_deferred_plugins(PLUGINS) == {"viewer": Viewer}
+
+    plugins = {name: PLUGINS[name] for name in ["viewer", "reader", "parser"]}
+    registry.deferred_plugins = registry._get_deferred_plugins(plugins)
+    assert registry.get_deferred_plugins() == [Viewer, Reader, Parser]
+    assert registry.get_deferred_plugins(
+        PluginActivationTriggers.FileOpened
+    ) == [Reader, Parser]
+
+
+def test_activate_plugin(registry):
+    """Check that deferred plugins are created with their requirements."""
+    registry.deferred_plugins = {
+        name: PLUGINS[name] for name in ["reader", "parser"]
+    }
+    activated = []
+    registry.sig_plugin_activated.connect(activated.append)
+
+    reader = registry.activate_plugin("reader")
+    assert activated == ["parser", "reader"]
+    assert registry.deferred_plugins == {}
+    reader.before_mainwindow_visible.assert_called_once()
+    reader.on_mainwindow_visible.assert_called_once()
+
+    # Activating a plugin again returns the same instance
+    assert registry.activate_plugin("reader") is reader
+    assert activated == ["parser", "reader"]
+
+    with pytest.raises(SpyderAPIError):
+        registry.activate_plugin("viewer")
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -23,7 +23,12 @@
 * :class:`SpyderDockablePlugin` creates a new pane in Spyder's main window.
 """
 
-from .enum import DockablePlugins, OptionalPlugins, Plugins  # noqa
+from .enum import (  # noqa
+    DockablePlugins,
+    OptionalPlugins,
+    PluginActivationTriggers,
+    Plugins,
+)
 from .new_api import SpyderDockablePlugin, SpyderPluginV2  # noqa
 
 
@@ -31,6 +36,7 @@
     "Plugins",
     "DockablePlugins",
     "OptionalPlugins",
+    "PluginActivationTriggers",
     "SpyderPluginV2",
     "SpyderDockablePlugin",
 ]
@@ -158,3 +158,25 @@ class OptionalPlugins:
 
     EnvManager = "spyder_env_manager"
     """The Spyder Environment Manager plugin."""
+
+
+class PluginActivationTriggers:
+    """Pseudo-enum class listing the events that can activate a plugin.
+
+    Values are used in
+    :attr:`~spyder.api.plugins.SpyderPluginV2.ACTIVATION_TRIGGERS`.
+    """
+
+    PaneShown = "pane_shown"
+    """The user shows the plugin's pane from the
+    :menuselection:`Window --> Panes` menu.
+
+    Only dockable plugins can use this trigger. They are also activated at
+    startup if their pane was visible or undocked in the previous session.
+    """
+
+    FileOpened = "file_opened"
+    """A file with one of the extensions in the plugin's
+    :attr:`~spyder.api.plugins.SpyderDockablePlugin.FILE_EXTENSIONS` is
+    opened.
+    """
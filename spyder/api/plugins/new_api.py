@@ -334,6 +334,26 @@ class SpyderPluginV2(
     for more information.
     """
 
+    ACTIVATION_TRIGGERS: list[str] = []
+    """
+    Events that activate the plugin on demand instead of when Spyder starts.
+
+    If this list is not empty, the plugin is not created (and its
+    :meth:`on_initialize` method is not called) until one of these events
+    happens, which makes Spyder start faster. Values must come from the
+    :class:`~spyder.api.plugins.PluginActivationTriggers` pseudo-enum.
+
+    Plugins that other plugins strictly require (i.e. list in their
+    :attr:`REQUIRES`) are always created when Spyder starts.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        ACTIVATION_TRIGGERS = [PluginActivationTriggers.PaneShown]
+    """
+
     # --- API: Signals -------------------------------------------------------
     # ------------------------------------------------------------------------
     # Signals here are automatically connected by the Spyder main window and
@@ -75,6 +75,17 @@ def get_options(argv=None):
         help="Profile mode (internal test, not related "
              "with Python profiling)"
     )
+    parser.add_argument(
+        '--profile-startup',
+        dest="profile_startup",
+        nargs='?',
+        const='spyder-startup-trace.json',
+        default=None,
+        help="Write a timeline of the startup phases to a JSON file in the "
+             "Chrome trace format (spyder-startup-trace.json in the current "
+             "working directory by default) and show a summary of it in the "
+             "internal console"
+    )
     parser.add_argument(
         '--window-title',
         type=str,
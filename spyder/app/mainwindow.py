@@ -91,6 +91,7 @@
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.qthelpers import qapplication
 from spyder.utils.stylesheet import APP_STYLESHEET
+from spyder.utils.timeline import STARTUP_TIMELINE
 
 # Spyder API Imports
 from spyder.api.exceptions import SpyderAPIError
@@ -686,7 +687,10 @@ def setup(self):
         status.showMessage(_("Welcome to Spyder!"), 5000)
 
         # Load and register all plugins
-        PLUGIN_REGISTRY._load_and_register_plugins()
+        with STARTUP_TIMELINE.span(
+            "SpyderPluginRegistry._load_and_register_plugins"
+        ):
+            PLUGIN_REGISTRY._load_and_register_plugins()
 
         # Set window title
         self.set_window_title()
@@ -723,9 +727,12 @@ def pre_visible_setup(self):
             self.DOCKOPTIONS = self.DOCKOPTIONS | QMainWindow.VerticalTabs
         self.setDockOptions(self.DOCKOPTIONS)
 
-        for plugin_name in PLUGIN_REGISTRY:
+        for plugin_name in list(PLUGIN_REGISTRY):
             plugin_instance = PLUGIN_REGISTRY.get_plugin(plugin_name)
-            plugin_instance.before_mainwindow_visible()
+            with STARTUP_TIMELINE.span(
+                f"{plugin_name}.before_mainwindow_visible", "plugin"
+            ):
+                plugin_instance.before_mainwindow_visible()
 
         if self.splash is not None:
             self.splash.hide()
@@ -755,7 +762,10 @@ def post_visible_setup(self):
         """
         # This must be run before the main window is shown.
         # Fixes spyder-ide/spyder#12104
-        self.layouts.on_mainwindow_visible()
+        with STARTUP_TIMELINE.span(
+            f"{Plugins.Layout}.on_mainwindow_visible", "plugin"
+        ):
+            self.layouts.on_mainwindow_visible()
 
         # Process pending events and hide splash screen before moving forward.
         QApplication.processEvents()
@@ -775,19 +785,25 @@ def post_visible_setup(self):
         # Call on_mainwindow_visible for all plugins, except Layout and
         # Application because they need to be called first (see above) and last
         # (see below), respectively.
-        for plugin_name in PLUGIN_REGISTRY:
+        for plugin_name in list(PLUGIN_REGISTRY):
             if plugin_name not in (Plugins.Layout, Plugins.Application):
                 plugin = PLUGIN_REGISTRY.get_plugin(plugin_name)
-                plugin.on_mainwindow_visible()
-                QApplication.processEvents()
+                with STARTUP_TIMELINE.span(
+                    f"{plugin_name}.on_mainwindow_visible", "plugin"
+                ):
+                    plugin.on_mainwindow_visible()
+                    QApplication.processEvents()
 
         self.restore_scrollbar_position.emit()
 
         # This must be called after restore_scrollbar_position.emit so that
         # the in-app appeal dialog has focus on macOS.
         # Fixes spyder-ide/spyder#22454.
-        self.get_plugin(Plugins.Application).on_mainwindow_visible()
-        QApplication.processEvents()
+        with STARTUP_TIMELINE.span(
+            f"{Plugins.Application}.on_mainwindow_visible", "plugin"
+        ):
+            self.get_plugin(Plugins.Application).on_mainwindow_visible()
+            QApplication.processEvents()
 
         # Server to maintain just one Spyder instance and open files in it if
         # the user tries to start other instances with
@@ -807,14 +823,16 @@ def post_visible_setup(self):
 
         # Reopen last session if no project is active
         # NOTE: This needs to be after the calls to on_mainwindow_visible
-        self.reopen_last_session()
+        with STARTUP_TIMELINE.span("Reopen last session"):
+            self.reopen_last_session()
 
         # Raise the menuBar to the top of the main window widget's stack
         # Fixes spyder-ide/spyder#3887.
         self.menuBar().raise_()
 
         # Restore undocked plugins
-        self.restore_undocked_plugins()
+        with STARTUP_TIMELINE.span("Restore undocked plugins"):
+            self.restore_undocked_plugins()
 
         # Prevent freezes when moving panes
         self._prevent_freeze_when_moving_dockwidgets()
@@ -1226,6 +1244,9 @@ def _test_setting_opengl(self, option):
 #==============================================================================
 def main(options, args):
     """Main function"""
+    # This includes the time it took to import this module
+    STARTUP_TIMELINE.add_span("start.main", STARTUP_TIMELINE.origin)
+
     # **** For Pytest ****
     if running_under_pytest():
         if CONF.get('main', 'opengl') != 'automatic':
@@ -1272,7 +1293,8 @@ def main(options, args):
     setup_logging(options)
 
     # **** Create the application ****
-    app = create_application()
+    with STARTUP_TIMELINE.span("Create application"):
+        app = create_application()
 
     # **** Create splash screen ****
     splash = create_splash_screen()
@@ -62,6 +62,7 @@
                                 running_under_pytest, is_conda_based_app)
 from spyder.utils.conda import get_conda_root_prefix
 from spyder.utils.external import lockfile
+from spyder.utils.timeline import STARTUP_TIMELINE
 
 # Enforce correct CONDA_EXE environment variable
 # Do not rely on CONDA_PYTHON_EXE or CONDA_PREFIX in case Spyder is started
@@ -146,6 +147,8 @@ def main():
     Spyder is already running, this will just parse and send command line
     options to the application.
     """
+    STARTUP_TIMELINE.start()
+
     # Parse command line options
     options, args = (CLI_OPTIONS, CLI_ARGS)
 
@@ -249,6 +252,10 @@ def main():
         _filepath = get_conf_path(_filename)
     os.environ['SPYDER_DEBUG_FILE'] = _filepath
 
+    # The working directory can change while Spyder starts
+    if options.profile_startup:
+        options.profile_startup = osp.realpath(options.profile_startup)
+
     if options.paths:
         from spyder.config.base import get_conf_paths
         sys.stdout.write('\nconfig:' + '\n')
@@ -5502,13 +5502,14 @@ def test_goto_find(main_window, qtbot, tmpdir):
     assert len(results) == 5
     assert len(findinfiles.result_browser.files) == 1
 
-    file_item = list(findinfiles.result_browser.files.values())[0]
-    assert file_item.childCount() == 5
+    model = findinfiles.result_browser.model()
+    file_index = model.index(0, 0)
+    assert model.rowCount(file_index) == 5
 
     for i in range(5):
-        item = file_item.child(i)
-        findinfiles.result_browser.setCurrentItem(item)
-        findinfiles.result_browser.on_item_activated(item)
+        index = model.index(i, 0, file_index)
+        findinfiles.result_browser.setCurrentIndex(index)
+        findinfiles.result_browser.on_item_activated(index)
         cursor = code_editor.textCursor()
         position = (cursor.selectionStart(), cursor.selectionEnd())
         assert position == match_positions[i]
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+
+"""
+Benchmark for the phases of Spyder's startup.
+
+This is a slow test, so it needs to be run with the `--run-slow` option::
+
+    python runtests.py --run-slow spyder/app/tests/test_startup_benchmark.py
+
+To see where the startup time goes, start Spyder with ``--profile-startup``
+and load the trace file it saves in ``chrome://tracing`` or Perfetto.
+"""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.utils.timeline import STARTUP_TIMELINE
+
+
+# Maximum duration (in seconds) of each startup phase. They are generous to
+# account for slow CI machines, so failing means that a phase regressed.
+STARTUP_BUDGETS = {
+    'Startup': 60,
+    'start.main': 10,
+    'find_external_plugins': 5,
+    'find_internal_plugins': 2,
+    'SpyderPluginRegistry._load_and_register_plugins': 30,
+    '*.__init__': 5,
+    '*.on_initialize': 5,
+    '*.before_mainwindow_visible': 5,
+    '*.on_mainwindow_visible': 15,
+    'Restore layout': 5,
+    'Reopen last session': 10,
+    'Spawn kernel': 10,
+    '*': 10,
+}
+
+
+@pytest.mark.slow
+def test_startup_phases(main_window, tmpdir):
+    """Check that no startup phase takes longer than its budget."""
+    durations = STARTUP_TIMELINE.get_durations()
+    for phase in [
+        'Startup',
+        'find_internal_plugins',
+        'SpyderPluginRegistry._load_and_register_plugins',
+        'editor.on_initialize',
+        'Restore layout',
+    ]:
+        assert phase in durations
+
+    # Save the timeline to inspect it if the test fails
+    STARTUP_TIMELINE.write_chrome_trace(str(tmpdir.join('trace.json')))
+    print(STARTUP_TIMELINE.format_summary())
+
+    regressions = STARTUP_TIMELINE.find_regressions(STARTUP_BUDGETS)
+    assert not regressions, '\n'.join(
+        f"{name} took {duration:.2f} s (budget: {budget} s)"
+        for name, duration, budget in regressions
+    )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -35,6 +35,7 @@
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.qthelpers import file_uri, qapplication
 from spyder.utils.theme_manager import THEME_MANAGER
+from spyder.utils.timeline import STARTUP_TIMELINE
 
 # For spyder-ide/spyder#7447.
 try:
@@ -368,6 +369,24 @@ def spy_excepthook(type_, value, tback):
     return app
 
 
+def report_startup_timeline(main, filename):
+    """
+    Write the startup timeline to `filename` and show a summary of it in the
+    internal console (or the terminal if it's not available).
+    """
+    try:
+        STARTUP_TIMELINE.write_chrome_trace(filename)
+        message = f"Startup timeline saved to {filename}"
+    except OSError as error:
+        message = f"Could not save the startup timeline to {filename}: {error}"
+
+    summary = STARTUP_TIMELINE.format_summary() + "\n\n" + message
+    if main.console is not None:
+        main.console.print_text(summary)
+    else:
+        print(summary)
+
+
 def create_window(WindowClass, app, splash, options, args):
     """
     Create and show Spyder's main window and start QApplication event loop.
@@ -386,10 +405,15 @@ def create_window(WindowClass, app, splash, options, args):
         List of file names passed to the Spyder executable in the
         command line.
     """
+    # This does nothing if the timeline was started by spyder.app.start
+    STARTUP_TIMELINE.start()
+
     # Main window
-    main = WindowClass(splash, options)
+    with STARTUP_TIMELINE.span("MainWindow.__init__"):
+        main = WindowClass(splash, options)
     try:
-        main.setup()
+        with STARTUP_TIMELINE.span("MainWindow.setup"):
+            main.setup()
     except BaseException:
         if main.console is not None:
             try:
@@ -398,9 +422,12 @@ def create_window(WindowClass, app, splash, options, args):
                 pass
         raise
 
-    main.pre_visible_setup()
-    main.show()
-    main.post_visible_setup()
+    with STARTUP_TIMELINE.span("MainWindow.pre_visible_setup"):
+        main.pre_visible_setup()
+    with STARTUP_TIMELINE.span("MainWindow.show"):
+        main.show()
+    with STARTUP_TIMELINE.span("MainWindow.post_visible_setup"):
+        main.post_visible_setup()
 
     # Add a reference to the main window so it can be accessed from the
     # application.
@@ -415,7 +442,8 @@ def create_window(WindowClass, app, splash, options, args):
         main.console.set_namespace_item('spy', Spy(app=app, window=main))
 
     # Propagate current configurations to all configuration observers
-    CONF.notify_all_observers()
+    with STARTUP_TIMELINE.span("Notify configuration observers"):
+        CONF.notify_all_observers()
 
     # Don't show icons in menus for Mac
     if sys.platform == 'darwin':
@@ -441,6 +469,10 @@ def create_window(WindowClass, app, splash, options, args):
     # the window
     app.focusChanged.connect(main.change_last_focused_widget)
 
+    STARTUP_TIMELINE.finish()
+    if options.profile_startup:
+        report_startup_timeline(main, options.profile_startup)
+
     if not running_under_pytest():
         app.exec_()
     return main
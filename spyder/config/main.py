@@ -87,6 +87,7 @@
               'show_message_when_panes_are_empty': True,
               'max_recent_files': 20,
               'disable_zoom_mouse': False,
+              'lazy_plugin_activation': True,
               }),
             ('update_manager',
              {
@@ -354,6 +355,8 @@
               'type_column': False,
               'date_column': False,
               'search_files_in_switcher': True,
+              'search_index': False,
+              'symbol_index': True,
               }),
             ('explorer',
              {
@@ -380,7 +383,8 @@
               'more_options': False,
               'case_sensitive': False,
               'exclude_case_sensitive': False,
-              'max_results': 1000,
+              'max_results': 100000,
+              'use_ignore_files': True,
               }),
             ('completions',
              {
@@ -756,4 +760,4 @@
 #    or if you want to *rename* options, then you need to do a MAJOR update in
 #    version, e.g. from 3.0.0 to 4.0.0
 # 3. You don't need to touch this value if you're just adding a new option
-CONF_VERSION = '88.1.0'
+CONF_VERSION = '88.2.0'
@@ -19,7 +19,8 @@
 from qtpy.QtCore import QTimer, Slot
 
 # Local imports
-from spyder.api.plugins import Plugins, SpyderDockablePlugin, SpyderPluginV2
+from spyder.api.plugins import (
+    PluginActivationTriggers, Plugins, SpyderDockablePlugin, SpyderPluginV2)
 from spyder.api.translations import _
 from spyder.api.plugin_registration.decorators import (
     on_plugin_available, on_plugin_teardown)
@@ -808,6 +809,14 @@ def open_file_in_plugin(self, filename: str) -> None:
         then open the file in the Editor plugin.
         """
         ext = osp.splitext(filename)[1]
+
+        # Create the deferred plugins that open files with this extension
+        for PluginClass in PLUGIN_REGISTRY.get_deferred_plugins(
+            PluginActivationTriggers.FileOpened
+        ):
+            if ext in getattr(PluginClass, "FILE_EXTENSIONS", []):
+                PLUGIN_REGISTRY.activate_plugin(PluginClass.NAME)
+
         for plugin_name in PLUGIN_REGISTRY:
             if PLUGIN_REGISTRY.is_plugin_available(plugin_name):
                 plugin = PLUGIN_REGISTRY.get_plugin(plugin_name)
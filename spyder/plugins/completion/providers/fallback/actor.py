@@ -21,8 +21,9 @@
 from qtpy.QtCore import QObject, QThread, QMutex, QMutexLocker, Signal, Slot
 
 # Local imports
-from spyder.plugins.completion.providers.fallback.utils import (
-    get_keywords, get_words, is_prefix_valid)
+from spyder.plugins.completion.providers.fallback.tokenindex import (
+    TokenIndex, find_prefix, sort_words)
+from spyder.plugins.completion.providers.fallback.utils import get_keywords
 
 
 FALLBACK_COMPLETION = "Fallback"
@@ -42,29 +43,51 @@ def __init__(self, parent):
         self.daemon = True
         self.mutex = QMutex()
         self.file_tokens = {}
+        self._keywords = {}
         self.thread = QThread(None)
         self.moveToThread(self.thread)
 
         self.thread.started.connect(self.started)
         self.sig_mailbox.connect(self.handle_msg)
 
-    def tokenize(self, text, offset, language, current_word):
+    def get_keywords(self, language):
         """
-        Return all tokens in `text` and all keywords associated by
-        Pygments to `language`.
+        Get the keywords associated by Pygments to `language`, sorted to
+        search them by prefix.
         """
-        valid = is_prefix_valid(text, offset, language)
+        if language not in self._keywords:
+            try:
+                lexer = get_lexer_by_name(language)
+                keywords = get_keywords(lexer)
+            except Exception:
+                keywords = []
+            self._keywords[language] = sort_words(keywords)
+        return self._keywords[language]
+
+    def tokenize(self, index, line, column, current_word):
+        """
+        Return the tokens in `index` and the keywords associated by
+        Pygments to its language that start with `current_word`.
+        """
+        valid = index.is_prefix_valid(line, column)
         if not valid:
             return []
 
-        # Get language keywords provided by Pygments
-        try:
-            lexer = get_lexer_by_name(language)
-            keywords = get_keywords(lexer)
-        except Exception:
-            keywords = []
+        prefix = current_word or ''
+        keywords = find_prefix(self.get_keywords(index.language), prefix)
         keyword_set = set(keywords)
-        keywords = [
+
+        # Skip the word being written, unless it's also somewhere else
+        word_at_cursor = index.get_word_at(line, column)
+        if word_at_cursor is not None and index.count(word_at_cursor) > 1:
+            word_at_cursor = None
+
+        tokens = [
+            token for token in index.get_words(prefix)
+            if token not in keyword_set and token != word_at_cursor
+        ]
+
+        return [
             lsp.CompletionItem(
                 label=keyword,
                 kind=lsp.CompletionItemKind.Keyword,
@@ -74,11 +97,7 @@ def tokenize(self, text, offset, language, current_word):
                 data={'provider': FALLBACK_COMPLETION},
             )
             for keyword in keywords
-        ]
-
-        # Get file tokens
-        tokens = get_words(text, offset, language)
-        tokens = [
+        ] + [
             lsp.CompletionItem(
                 label=token,
                 kind=lsp.CompletionItemKind.Text,
@@ -89,20 +108,6 @@ def tokenize(self, text, offset, language, current_word):
             )
             for token in tokens
         ]
-        for token in tokens:
-            if token.label not in keyword_set:
-                keywords.append(token)
-
-        # Filter matching results
-        if current_word is not None:
-            current_word = current_word.lower()
-            keywords = [
-                k
-                for k in keywords
-                if current_word in (k.insert_text or k.label).lower()
-            ]
-
-        return keywords
 
     def stop(self):
         """Stop actor."""
@@ -128,9 +133,8 @@ def handle_msg(self, message):
         logger.debug(u'Perform request {0} with id {1}'.format(msg_type, _id))
         if msg_type == lsp.TEXT_DOCUMENT_DID_OPEN:
             self.file_tokens[file] = {
-                'text': msg['text'],
+                'index': TokenIndex(msg['text'], msg['language']),
                 'offset': msg['offset'],
-                'language': msg['language'],
             }
         elif msg_type == lsp.TEXT_DOCUMENT_DID_CHANGE:
             self._apply_content_changes(file, msg.get('content_changes', []))
@@ -140,16 +144,19 @@ def handle_msg(self, message):
             tokens = []
             if file in self.file_tokens:
                 text_info = self.file_tokens[file]
+                index = text_info['index']
+                if 'line' in msg and 'column' in msg:
+                    line, column = msg['line'], msg['column']
+                else:
+                    line, column = index.get_position(
+                        msg.get('offset', text_info['offset']))
                 tokens = self.tokenize(
-                    text_info['text'],
-                    msg.get('offset', text_info['offset']),
-                    text_info['language'],
-                    msg['current_word'])
+                    index, line, column, msg['current_word'])
             self.sig_set_tokens.emit(_id, tokens)
 
     def _apply_content_changes(self, file, content_changes):
         """
-        Apply incremental content changes to the stored file text.
+        Apply incremental content changes to the index of a file.
 
         Parameters
         ----------
@@ -161,111 +168,17 @@ def _apply_content_changes(self, file, content_changes):
             - lsp.TextDocumentContentChangeWholeDocument (full document
               replacement)
         """
-        if not content_changes:
-            return
-
         text_info = self.file_tokens.get(file)
         if not text_info:
             return
 
-        current_text = text_info['text']
-
+        index = text_info['index']
         for change in content_changes:
             # Handle whole document replacement
             if hasattr(change, 'text') and not hasattr(change, 'range'):
-                current_text = change.text
+                index.set_text(change.text)
                 continue
 
             # Handle incremental range-based changes
             if hasattr(change, 'range'):
-                current_text = self._apply_range_change(
-                    current_text, change.range, change.text
-                )
-
-        text_info['text'] = current_text
-
-    def _apply_range_change(self, text, range, new_text):
-        """
-        Apply a range-based text change to the document text.
-
-        Parameters
-        ----------
-        text : str
-            Current document text.
-        range : lsp.Range
-            Start and end positions of the change.
-        new_text : str
-            Text to insert at the range.
-
-        Returns
-        -------
-        str
-            Updated document text.
-        """
-        lines = text.splitlines(keepends=True)
-
-        # Calculate byte offset from line/character position
-        start_offset = self._line_col_to_offset(
-            lines, range.start.line, range.start.character
-        )
-        end_offset = self._line_col_to_offset(
-            lines, range.end.line, range.end.character
-        )
-
-        # Replace the range with new text
-        return text[:start_offset] + new_text + text[end_offset:]
-
-    def _line_col_to_offset(self, lines, line, character):
-        """
-        Convert 0-based line and character position to text offset.
-
-        Parameters
-        ----------
-        lines : list[str]
-            Document split by newlines.
-        line : int
-            0-based line number.
-        character : int
-            0-based character position on the line.
-
-        Returns
-        -------
-        int
-            Offset position in the original text.
-        """
-        # Sum lengths of all previous lines. `lines` was created with
-        # `splitlines(keepends=True)`, so each entry already includes its
-        # line ending (if present) and we must not add extra newline
-        # characters here.
-        prev_lines_len = 0
-        max_line_index = min(line, len(lines))
-        for i in range(max_line_index):
-            prev_lines_len += len(lines[i])
-
-        # If the requested line is beyond the current document, clamp to end
-        if line >= len(lines):
-            return prev_lines_len
-
-        # Work on the line content without its line ending for column counting
-        target_line = lines[line]
-        if target_line.endswith('\r\n'):
-            line_content = target_line[:-2]
-        elif target_line.endswith('\n') or target_line.endswith('\r'):
-            line_content = target_line[:-1]
-        else:
-            line_content = target_line
-
-        # LSP positions use UTF-16 code units. Python strings use code points
-        # (UCS-4 on this build), so characters outside the BMP count as two
-        # UTF-16 units. Walk the line and find the Python index that
-        # corresponds to the requested UTF-16 column.
-        utf16_units = 0
-        idx = 0
-        target_len = len(line_content)
-        while idx < target_len and utf16_units < character:
-            cp = ord(line_content[idx])
-            utf16_units += 1 if cp <= 0xFFFF else 2
-            idx += 1
-
-        # Return the offset in Python string indices
-        return prev_lines_len + idx
+                index.apply_change(change.range, change.text)
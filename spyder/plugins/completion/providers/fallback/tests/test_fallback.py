@@ -9,6 +9,8 @@
 
 import pytest
 from lsprotocol import types as lsp
+from spyder.plugins.completion.providers.fallback.tokenindex import (
+    TokenIndex)
 from spyder.plugins.completion.providers.fallback.utils import get_words
 
 
@@ -88,6 +90,43 @@ def test_get_words():
     assert set(tokens) == {'foo', 'baz', 'car456'}
 
 
+def test_token_index():
+    index = TokenIndex(TEST_FILE, 'python')
+    assert index.get_words() == ['file', 'is', 'test', 'This']
+    assert index.get_words('T') == ['test', 'This']
+
+    # Append a function at the end
+    index.apply_change(
+        lsp.Range(
+            start=lsp.Position(line=3, character=0),
+            end=lsp.Position(line=3, character=0),
+        ),
+        "def func(args):\n    pass\n"
+    )
+    assert index.text == TEST_FILE + "def func(args):\n    pass\n"
+    assert index.get_words('a') == ['args']
+    assert index.get_words('p') == ['pass']
+
+    # Rename `args` to `kwargs`, which removes it from the index
+    index.apply_change(
+        lsp.Range(
+            start=lsp.Position(line=3, character=9),
+            end=lsp.Position(line=3, character=13),
+        ),
+        "kwargs"
+    )
+    assert index.get_words('a') == []
+    assert index.get_words('k') == ['kwargs']
+    assert index.get_word_at(3, 11) == 'kwargs'
+    assert index.count('kwargs') == 1
+
+    # Positions are in UTF-16 code units
+    index.set_text('😀 foo_bar\n')
+    assert index.get_word_at(0, 3) == 'foo_bar'
+    assert index.get_position(4) == (0, 4)
+    assert index.get_position(11) == (1, 0)
+
+
 @pytest.mark.parametrize('file_fixture', language_list, indirect=True)
 def test_tokenize(qtbot_module, fallback_fixture, file_fixture):
     filename, expected_tokens, contents = file_fixture
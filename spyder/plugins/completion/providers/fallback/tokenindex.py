@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the words of a file for the fallback completion engine.
+
+It's updated with the changes sent by the editor, so that only the lines
+affected by a change are scanned again, and it keeps its words sorted to
+find the ones that start with a prefix by bisection.
+"""
+
+# Standard library imports
+from bisect import bisect_left, insort
+from collections import Counter
+
+# Local imports
+from spyder.plugins.completion.providers.fallback.utils import (
+    LANGUAGE_REGEX, all_regex, is_prefix_valid)
+from spyder.utils.qstringhelpers import qstring_length
+
+
+def strip_line_ending(line):
+    """Remove the line ending of a line."""
+    return line.splitlines()[0] if line else line
+
+
+def has_line_ending(line):
+    """Check if a line ends with a line ending."""
+    return strip_line_ending(line) != line
+
+
+def sort_words(words):
+    """Sort words without duplicates to search them by prefix."""
+    return sorted({(word.lower(), word) for word in words})
+
+
+def find_prefix(sorted_words, prefix):
+    """
+    Find the words that start with `prefix`, ignoring case.
+
+    Parameters
+    ----------
+    sorted_words : list of tuple
+        (lowercase word, word) pairs, as returned by `sort_words`.
+    prefix : str
+        Prefix to look for.
+
+    Returns
+    -------
+    list of str
+        Matching words, in alphabetical order.
+    """
+    prefix = prefix.lower()
+    words = []
+    index = bisect_left(sorted_words, (prefix,))
+    while index < len(sorted_words):
+        key, word = sorted_words[index]
+        if not key.startswith(prefix):
+            break
+        words.append(word)
+        index += 1
+    return words
+
+
+def utf16_to_index(text, column):
+    """
+    Convert a column in UTF-16 code units, as used by LSP positions, to an
+    index in `text`.
+    """
+    if text.isascii():
+        return min(column, len(text))
+
+    utf16_units = 0
+    index = 0
+    while index < len(text) and utf16_units < column:
+        utf16_units += 1 if ord(text[index]) <= 0xFFFF else 2
+        index += 1
+    return index
+
+
+class TokenIndex:
+    """Words of a file, updated incrementally when it changes."""
+
+    def __init__(self, text, language):
+        self.language = language
+        self._regex = LANGUAGE_REGEX.get(language.lower(), all_regex)
+
+        # Lines of text, with their line endings. There's always a last
+        # line without line ending, which is empty if the text ends with a
+        # line ending, so that line numbers are the same as in the editor.
+        self._lines = ['']
+
+        # Words of each line
+        self._line_words = [[]]
+
+        # Number of occurrences of each word and (lowercase word, word) pairs
+        # of them in order
+        self._counts = Counter()
+        self._sorted_words = []
+
+        self.set_text(text)
+
+    @property
+    def text(self):
+        """Text of the file."""
+        return ''.join(self._lines)
+
+    def set_text(self, text):
+        """Replace the whole text of the file."""
+        self._replace_lines(0, len(self._lines), text)
+
+    def apply_change(self, change_range, new_text):
+        """
+        Replace the text in `change_range` by `new_text`.
+
+        Parameters
+        ----------
+        change_range : lsp.Range
+            Start and end positions of the change, in UTF-16 code units.
+            Positions after the end of the text are taken as its end.
+        new_text : str
+            Text to insert in the range.
+        """
+        lines = self._lines
+        start_line, start = self._get_index(change_range.start)
+        end_line, end = self._get_index(change_range.end)
+        text = lines[start_line][:start] + new_text + lines[end_line][end:]
+
+        # Keep \r\n line endings together
+        if start_line > 0 and text.startswith('\n'):
+            if lines[start_line - 1].endswith('\r'):
+                start_line -= 1
+                text = lines[start_line] + text
+        if end_line < len(lines) - 1 and text.endswith('\r'):
+            end_line += 1
+            text += lines[end_line]
+
+        self._replace_lines(start_line, end_line + 1, text)
+
+    def get_words(self, prefix=''):
+        """Get the words that start with `prefix`, ignoring case."""
+        return find_prefix(self._sorted_words, prefix)
+
+    def count(self, word):
+        """Get the number of occurrences of a word."""
+        return self._counts[word]
+
+    def get_word_at(self, line, column):
+        """
+        Get the word that contains or ends at a position, or None if there's
+        no word there.
+        """
+        if line >= len(self._lines):
+            return None
+
+        text = strip_line_ending(self._lines[line])
+        index = utf16_to_index(text, column)
+        for match in self._regex.finditer(text):
+            if match.start() <= index <= match.end():
+                return match.group()
+        return None
+
+    def is_prefix_valid(self, line, column):
+        """Check if the prefix at a position is valid to complete it."""
+        if line >= len(self._lines):
+            return False
+
+        # The character before the first column is a line ending
+        if column == 0:
+            return line > 0
+
+        text = strip_line_ending(self._lines[line])
+        return is_prefix_valid(text, column, self.language)
+
+    def get_position(self, offset):
+        """
+        Get the line and column of an offset in UTF-16 code units, as given
+        by the editor.
+        """
+        last_line = len(self._lines) - 1
+        for line, text in enumerate(self._lines):
+            length = qstring_length(text)
+            if offset < length or line == last_line:
+                text = strip_line_ending(text)
+                return line, max(min(offset, qstring_length(text)), 0)
+            offset -= length
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _get_index(self, position):
+        """Get the line and index in it of an lsp.Position."""
+        if position.line >= len(self._lines):
+            last_line = len(self._lines) - 1
+            return last_line, len(self._lines[last_line])
+
+        text = strip_line_ending(self._lines[position.line])
+        return position.line, utf16_to_index(text, position.character)
+
+    def _replace_lines(self, first, last, text):
+        """Replace lines `first` to `last` (not included) by `text`."""
+        new_lines = text.splitlines(keepends=True)
+        if last == len(self._lines) and (
+            not new_lines or has_line_ending(new_lines[-1])
+        ):
+            new_lines.append('')
+
+        new_words = [self._regex.findall(line) for line in new_lines]
+
+        # Words are added before removing the old ones, so that the ones in
+        # both (e.g. when typing in a line) are not removed from the sorted
+        # words to add them again.
+        for words in new_words:
+            self._add_words(words)
+        for words in self._line_words[first:last]:
+            self._remove_words(words)
+
+        self._lines[first:last] = new_lines
+        self._line_words[first:last] = new_words
+
+    def _add_words(self, words):
+        counts = self._counts
+        for word in words:
+            counts[word] += 1
+            if counts[word] == 1:
+                insort(self._sorted_words, (word.lower(), word))
+
+    def _remove_words(self, words):
+        counts = self._counts
+        for word in words:
+            counts[word] -= 1
+            if counts[word] == 0:
+                del counts[word]
+                key = (word.lower(), word)
+                del self._sorted_words[bisect_left(self._sorted_words, key)]
@@ -302,6 +302,12 @@ def set_namespace_item(self, name, value):
         """
         self.get_widget().set_namespace_item(name, value)
 
+    def print_text(self, text):
+        """
+        Print `text` in the internal console, followed by a new prompt.
+        """
+        self.get_widget().print_text(text)
+
     # ---- Private API
     # -------------------------------------------------------------------------
     def _update_syspath(self, new_path, prioritize):
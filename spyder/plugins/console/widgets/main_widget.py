@@ -634,6 +634,13 @@ def set_namespace_item(self, name, item):
         """
         self.shell.interpreter.namespace[name] = item
 
+    def print_text(self, text):
+        """
+        Print text in the internal console, followed by a new prompt.
+        """
+        self.shell.write('\n' + text, flush=True)
+        self.shell.new_prompt(self.shell.interpreter.p1)
+
     def exit_interpreter(self):
         """
         Exit the internal console interpreter.
@@ -593,7 +593,7 @@ def clear_all_breakpoints(self):
 
         editorstack = self._get_current_editorstack()
         if editorstack is not None:
-            for data in editorstack.data:
+            for data in editorstack.get_loaded_data():
                 if data.editor.breakpoints_manager is not None:
                     data.editor.breakpoints_manager.clear_breakpoints()
 
@@ -169,6 +169,9 @@ def toogle_breakpoint(
             else:
                 self._breakpoint_blocks[block.blockNumber()] = block
         block.setUserData(data)
+        self.editor.flag_index.set_flag(
+            'breakpoint', block.blockNumber(), data.breakpoint
+        )
         self.editor.sig_flags_changed.emit()
         self.breakpoints_changed()
 
@@ -196,6 +199,7 @@ def clear_breakpoints(self):
             data.breakpoint = False
             # data.breakpoint_condition = None  # not necessary, but logical
         self._breakpoint_blocks = {}
+        self.editor.flag_index.clear('breakpoint')
         # Inform the editor that the breakpoints are changed
         self.breakpoints_changed()
         # Inform the editor that the flags must be updated
@@ -9,14 +9,14 @@
 """
 
 # Standard library imports
+from bisect import bisect_left
 import logging
 from math import ceil
 import os
 import sys
 
 # Third party imports
-from lsprotocol import types as lsp
-from qtpy.QtCore import QSize, Qt, QThread
+from qtpy.QtCore import QSize, Qt
 from qtpy.QtGui import QColor, QCursor, QPainter
 from qtpy.QtWidgets import QApplication, QStyle, QStyleOptionSlider
 from superqt.utils import qdebounced
@@ -32,9 +32,6 @@
 # Time to wait before refreshing flags
 REFRESH_RATE = 1000
 
-# Maximum number of flags to paint in a file
-MAX_FLAGS = 1000
-
 _cfbundleid = os.getenv("__CFBundleIdentifier", "")
 
 
@@ -75,17 +72,9 @@ def __init__(self):
         self._slider_range_brush = QColor(Qt.gray)
         self._slider_range_brush.setAlphaF(.5)
 
-        # Dictionary with flag lists
-        self._dict_flag_list = {}
-
         # Keep track if todo markers are enabled.
         self.todo_enabled = True
 
-        # Thread to update flags on it.
-        self._update_flags_thread = QThread(None)
-        self._update_flags_thread.run = self._update_flags
-        self._update_flags_thread.finished.connect(self.update)
-
     def on_install(self, editor):
         """Manages install setup of the pane."""
         super().on_install(editor)
@@ -121,11 +110,6 @@ def slider(self):
         """This property holds whether the vertical scrollbar is visible."""
         return self.editor.verticalScrollBar().isVisible()
 
-    def closeEvent(self, event):
-        self._update_flags_thread.quit()
-        self._update_flags_thread.wait()
-        super().closeEvent(event)
-
     def sizeHint(self):
         """Override Qt method"""
         return QSize(self.WIDTH, 0)
@@ -141,47 +125,14 @@ def update_flag_colors(self, color_dict):
 
     @qdebounced(timeout=REFRESH_RATE)
     def update_flags(self):
-        """Update flags list in a thread."""
-        logger.debug("Updating current flags")
-
-        self._dict_flag_list = {
-            'error': [],
-            'warning': [],
-            'todo': [],
-            'breakpoint': [],
-        }
-
-        # Run this computation in a different thread to prevent freezing
-        # the interface
-        if not self._update_flags_thread.isRunning():
-            self._update_flags_thread.start()
+        """
+        Update flags.
 
-    def _update_flags(self):
-        """Update flags list."""
-        editor = self.editor
-        block = editor.document().firstBlock()
-        while block.isValid():
-            # Parse all lines in the file looking for something to flag.
-            data = block.userData()
-            if data:
-                if data.code_analysis:
-                    for _, _, severity, _ in data.code_analysis:
-                        if severity == lsp.DiagnosticSeverity.Error:
-                            flag_type = 'error'
-                            break
-                    else:
-                        flag_type = 'warning'
-                elif data.todo:
-                    flag_type = 'todo'
-                elif data.breakpoint:
-                    flag_type = 'breakpoint'
-                else:
-                    flag_type = None
-
-                if flag_type is not None:
-                    self._dict_flag_list[flag_type].append(block)
-
-            block = block.next()
+        Flags are kept up to date in the editor's flag index, so this only
+        needs to paint them again.
+        """
+        logger.debug("Updating current flags")
+        self.update()
 
     def paintEvent(self, event):
         """
@@ -242,12 +193,17 @@ def paintEvent(self, event):
         else:
             flag_height_lines = 0
 
-        # All the lists of block numbers for flags
+        # All the sorted lists of block numbers for flags
+        document = editor.document()
         dict_flag_lists = {
             "occurrence": editor.occurrences,
-            "found_results": editor.found_results
+            "found_results": sorted(
+                block.blockNumber() for block in editor.found_results
+                if is_block_safe(block)
+            ),
         }
-        dict_flag_lists.update(self._dict_flag_list)
+        for flag_type in ["error", "warning", "todo", "breakpoint"]:
+            dict_flag_lists[flag_type] = editor.flag_index.get(flag_type)
 
         # This is necessary to paint find matches above errors and warnings.
         # See spyder-ide/spyder#20970
@@ -259,12 +215,17 @@ def paintEvent(self, event):
             if flag_type == 'todo' and not self.todo_enabled:
                 continue
 
+            block_numbers = dict_flag_lists[flag_type]
+            if not block_numbers:
+                continue
+
             painter.setBrush(self._facecolors[flag_type])
             painter.setPen(self._edgecolors[flag_type])
             if editor.verticalScrollBar().maximum() == 0:
                 # No scroll
-                for block in dict_flag_lists[flag_type]:
-                    if not is_block_safe(block):
+                for block_number in block_numbers:
+                    block = document.findBlockByNumber(block_number)
+                    if not block.isValid():
                         continue
                     geometry = editor.blockBoundingGeometry(block)
                     rect_y = ceil(
@@ -275,28 +236,40 @@ def paintEvent(self, event):
                     painter.drawRect(rect_x, rect_y, rect_w, rect_h)
             elif last_line == 0:
                 # Only one line
-                for block in dict_flag_lists[flag_type]:
-                    if not is_block_safe(block):
-                        continue
-                    rect_y = ceil(first_y_pos)
-                    painter.drawRect(rect_x, rect_y, rect_w, rect_h)
+                rect_y = ceil(first_y_pos)
+                painter.drawRect(rect_x, rect_y, rect_w, rect_h)
             else:
                 # Many lines
-                if len(dict_flag_lists[flag_type]) < MAX_FLAGS:
-                    # If the file is too long, do not freeze the editor
-                    next_line = 0
-                    for block in dict_flag_lists[flag_type]:
-                        if not is_block_safe(block):
-                            continue
-                        block_line = block.firstLineNumber()
-                        # block_line = -1 if invalid
-                        if block_line < next_line:
-                            # Don't print flags on top of flags
-                            continue
-                        next_line = block_line + flag_height_lines / 2
-                        frac = block_line / last_line
-                        rect_y = ceil(first_y_pos + frac * line_height)
-                        painter.drawRect(rect_x, rect_y, rect_w, rect_h)
+                # Flags that would be painted on top of the previous one are
+                # skipped by searching for the next block past it, so that
+                # the number of flags looked at depends on the height of the
+                # area and not on the length of the file.
+                index = 0
+                while index < len(block_numbers):
+                    block = document.findBlockByNumber(block_numbers[index])
+                    block_line = block.firstLineNumber()
+                    # block_line = -1 if invalid
+                    if block_line < 0:
+                        break
+
+                    frac = block_line / last_line
+                    rect_y = ceil(first_y_pos + frac * line_height)
+                    painter.drawRect(rect_x, rect_y, rect_w, rect_h)
+
+                    # Don't print flags on top of flags
+                    next_line = block_line + flag_height_lines / 2
+                    next_block = document.findBlockByLineNumber(
+                        ceil(next_line)
+                    )
+                    if not next_block.isValid():
+                        break
+                    next_block_number = next_block.blockNumber()
+                    if next_block.firstLineNumber() < next_line:
+                        next_block_number += 1
+
+                    index = bisect_left(
+                        block_numbers, next_block_number, index + 1
+                    )
 
         # Paint the slider range
         if not self._unit_testing:
@@ -18,7 +18,11 @@
 
 File contents are compared using their hash. The variable `file_hashes`
 contains the hash of all files currently open in the editor and all autosave
-files.
+files. To avoid hashing files that didn't change, the revision of their
+document when they were last checked is kept in `file_revisions`.
+
+Autosave files are written in a background thread by `AutosaveWriter`, which
+keeps only the last pending copy of each file.
 
 On startup, the contents of the autosave directory is checked and if autosave
 files are found, the user is asked whether to recover them;
@@ -31,21 +35,189 @@
 import os
 import os.path as osp
 import re
+import threading
 
 # Third party imports
-from qtpy.QtCore import QTimer
+from qtpy.QtCore import QObject, QTimer
 
 # Local imports
 from spyder.api.translations import _
 from spyder.config.base import get_conf_path, running_under_pytest
 from spyder.plugins.editor.widgets.autosaveerror import AutosaveErrorDialog
 from spyder.plugins.editor.widgets.recover import RecoveryDialog
+from spyder.utils import encoding
 from spyder.utils.programs import is_spyder_process
+from spyder.utils.workers import WorkerManager
 
 
 logger = logging.getLogger(__name__)
 
 
+class AutosaveWriter(QObject):
+    """
+    Writer of autosave files in a background thread.
+
+    Copies of files are queued by the name of their autosave file, so if a
+    file is autosaved again before its previous copy is written, only the
+    last one is written. Files are written atomically, so that a crash while
+    writing doesn't leave an autosave file half-written. Copies can be
+    written by the background thread and `flush` at the same time, but never
+    two of the same file.
+
+    If writing a file fails, its hash and revision are removed from the
+    `file_hashes` and `file_revisions` of the autosave component, so that
+    it's autosaved again later. If it's written with a different encoding
+    (because its text can't be encoded with the original one), the autosave
+    component is notified in the main thread.
+
+    Attributes:
+        autosave (AutosaveForPlugin or AutosaveForStack): autosave component
+            this writer belongs to.
+    """
+
+    def __init__(self, autosave):
+        """
+        Constructor.
+
+        Args:
+            autosave (AutosaveForPlugin or AutosaveForStack): autosave
+                component this writer belongs to.
+        """
+        super().__init__()
+        self.autosave = autosave
+
+        # Map from autosave file names to the (file name, text, encoding) of
+        # the copy to write in them
+        self._pending = {}
+
+        # Autosave files being written
+        self._writing = set()
+
+        self._condition = threading.Condition()
+        self._scheduled = False
+        self._worker_manager = None
+
+    def write(self, filename, autosave_filename, text, encoding_name):
+        """
+        Queue a copy of a file to be written to its autosave file.
+
+        Args:
+            filename (str): name of the original file.
+            autosave_filename (str): name of the autosave file.
+            text (str): text to write.
+            encoding_name (str): encoding of the original file.
+        """
+        with self._condition:
+            self._pending[autosave_filename] = (filename, text, encoding_name)
+            if self._scheduled:
+                return
+            self._scheduled = True
+
+        if self._worker_manager is None:
+            self._worker_manager = WorkerManager(self, max_threads=1)
+        worker = self._worker_manager.create_python_worker(
+            self._write_pending, True
+        )
+        worker.sig_finished.connect(self._on_worker_finished)
+        worker.start()
+
+    def cancel(self, autosave_filename):
+        """
+        Don't write a queued copy to an autosave file.
+
+        If the file is being written, this waits until it's done, so that it
+        can be removed safely afterwards. Copies queued later are written.
+        """
+        with self._condition:
+            self._pending.pop(autosave_filename, None)
+            while autosave_filename in self._writing:
+                self._condition.wait()
+
+    def flush(self):
+        """Write all queued copies in the current thread."""
+        errors, encodings = self._write_pending()
+        with self._condition:
+            while self._writing:
+                self._condition.wait()
+        self._report_results(errors, encodings)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _write_pending(self, from_worker=False):
+        """
+        Write queued copies until there are no more of them.
+
+        Returns:
+            tuple: list of (file name, autosave file name, error) tuples for
+                the files that couldn't be written, and list of (file name,
+                original encoding, new encoding) tuples for the files written
+                with a different encoding.
+        """
+        errors = []
+        encodings = []
+        while True:
+            with self._condition:
+                autosave_filename = None
+                while self._pending:
+                    # Files being written in another thread are written again
+                    # when it's done, so that their last copy is kept.
+                    autosave_filename = next(
+                        (name for name in self._pending
+                         if name not in self._writing),
+                        None
+                    )
+                    if autosave_filename is not None:
+                        break
+                    self._condition.wait()
+
+                if autosave_filename is None:
+                    if from_worker:
+                        self._scheduled = False
+                    return errors, encodings
+
+                filename, text, encoding_name = self._pending.pop(
+                    autosave_filename
+                )
+                self._writing.add(autosave_filename)
+
+            try:
+                new_encoding = encoding.write(
+                    text, autosave_filename, encoding_name
+                )
+                if new_encoding != encoding_name:
+                    encodings.append((filename, encoding_name, new_encoding))
+            except (PermissionError, OSError) as error:
+                errors.append((filename, autosave_filename, error))
+            finally:
+                with self._condition:
+                    self._writing.discard(autosave_filename)
+                    self._condition.notify_all()
+
+    def _on_worker_finished(self, worker, output, error):
+        if error is not None:
+            logger.debug(f"Error writing autosave files: {error}")
+        elif output:
+            self._report_results(*output)
+
+    def _report_results(self, errors, encodings):
+        """
+        Update the encoding of files written with a different one, forget
+        the files that couldn't be written and notify the user.
+        """
+        for filename, old_encoding, new_encoding in encodings:
+            self.autosave.file_encoding_changed(
+                filename, old_encoding, new_encoding
+            )
+
+        for filename, autosave_filename, error in errors:
+            self.autosave.file_hashes.pop(autosave_filename, None)
+            self.autosave.file_revisions.pop(filename, None)
+            action = (_('Error while autosaving {} to {}')
+                      .format(filename, autosave_filename))
+            msgbox = AutosaveErrorDialog(action, error)
+            msgbox.exec_if_enabled()
+
+
 class AutosaveForPlugin(object):
     """
     Component of editor plugin implementing autosave functionality.
@@ -55,6 +227,9 @@ class AutosaveForPlugin(object):
         file_hashes (dict): map between file names and hash of their contents.
             This is used for both files opened in the editor and their
             corresponding autosave files.
+        file_revisions (dict): map between names of opened files and the
+            revision of their document when they were last checked.
+        writer (AutosaveWriter): writer of autosave files.
     """
 
     # Interval (in ms) between two autosaves
@@ -73,8 +248,11 @@ def __init__(self, editor):
         self.editor = editor
         self.name_mapping = {}
         self.file_hashes = {}
+        self.file_revisions = {}
         self.recover_files_to_open = []
 
+        self.writer = AutosaveWriter(self)
+
         self.timer = QTimer(self.editor)
         self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.do_autosave)
@@ -220,21 +398,34 @@ def register_autosave_for_stack(self, autosave_for_stack):
         """
         Register an AutosaveForStack object.
 
-        This replaces the `name_mapping` and `file_hashes` attributes
-        in `autosave_for_stack` with references to the corresponding
-        attributes of `self`, so that all AutosaveForStack objects
-        share the same data.
+        This replaces the `name_mapping`, `file_hashes`, `file_revisions`
+        and `writer` attributes in `autosave_for_stack` with references to
+        the corresponding attributes of `self`, so that all AutosaveForStack
+        objects share the same data.
         """
         autosave_for_stack.name_mapping = self.name_mapping
         autosave_for_stack.file_hashes = self.file_hashes
+        autosave_for_stack.file_revisions = self.file_revisions
+        autosave_for_stack.writer = self.writer
+
+    def file_encoding_changed(self, filename, old_encoding, new_encoding):
+        """
+        Update the encoding of a file in all editor stacks after it was
+        autosaved with a different one.
+        """
+        for editorstack in self.editor.editorstacks:
+            editorstack.autosave.file_encoding_changed(
+                filename, old_encoding, new_encoding
+            )
 
 
 class AutosaveForStack(object):
     """
     Component of EditorStack implementing autosave functionality.
 
-    In Spyder, the `name_mapping` and `file_hashes` are set to references to
-    the corresponding variables in `AutosaveForPlugin`.
+    In Spyder, the `name_mapping`, `file_hashes`, `file_revisions` and
+    `writer` are set to references to the corresponding variables in
+    `AutosaveForPlugin`.
 
     Attributes:
         stack (EditorStack): editor stack this component belongs to.
@@ -242,6 +433,9 @@ class AutosaveForStack(object):
         file_hashes (dict): map between file names and hash of their contents.
             This is used for both files opened in the editor and their
             corresponding autosave files.
+        file_revisions (dict): map between names of opened files and the
+            revision of their document when they were last checked.
+        writer (AutosaveWriter): writer of autosave files.
     """
 
     def __init__(self, editorstack):
@@ -254,6 +448,9 @@ def __init__(self, editorstack):
         self.stack = editorstack
         self.name_mapping = {}
         self.file_hashes = {}
+        self.file_revisions = {}
+
+        self.writer = AutosaveWriter(self)
 
     def create_unique_autosave_filename(self, filename, autosave_dir):
         """
@@ -310,9 +507,13 @@ def remove_autosave_file(self, filename):
         if filename not in self.name_mapping:
             return
         autosave_filename = self.name_mapping[filename]
+        self.writer.cancel(autosave_filename)
         try:
             os.remove(autosave_filename)
-        except (FileNotFoundError, OSError) as error:
+        except FileNotFoundError:
+            # The file was cancelled before it was written
+            pass
+        except OSError as error:
             action = (_('Error while removing autosave file {}')
                       .format(autosave_filename))
             msgbox = AutosaveErrorDialog(action, error)
@@ -363,21 +564,26 @@ def maybe_autosave(self, index):
         """
         Autosave a file if necessary.
 
-        If the file is newly created (and thus not named by the user), do
-        nothing.  If the current contents are the same as the autosave file
-        (if it exists) or the original file (if no autosave filee exists),
-        then do nothing. If the current contents are the same as the file on
-        disc, but the autosave file is different, then remove the autosave
-        file. In all other cases, autosave the file.
+        If the file is newly created (and thus not named by the user), its
+        editor wasn't created yet or its document didn't change since it was
+        last checked, do nothing. If the
+        current contents are the same as the autosave file (if it exists) or
+        the original file (if no autosave filee exists), then do nothing. If
+        the current contents are the same as the file on disc, but the
+        autosave file is different, then remove the autosave file. In all
+        other cases, autosave the file.
 
         Args:
             index (int): index into self.stack.data
         """
         finfo = self.stack.data[index]
-        if finfo.newly_created:
+        if finfo.newly_created or not finfo.is_loaded:
             return
 
         orig_filename = finfo.filename
+        revision = finfo.editor.document().revision()
+        if self.file_revisions.get(orig_filename) == revision:
+            return
         try:
             orig_hash = self.file_hashes[orig_filename]
         except KeyError:
@@ -388,41 +594,43 @@ def maybe_autosave(self, index):
             logger.debug('KeyError when retrieving hash of %s', orig_filename)
             orig_hash = None
 
-        new_hash = self.stack.compute_hash(finfo)
+        text = str(finfo.editor.get_text_with_eol())
+        new_hash = hash(text)
         if orig_filename in self.name_mapping:
             autosave_filename = self.name_mapping[orig_filename]
-            autosave_hash = self.file_hashes[autosave_filename]
+            autosave_hash = self.file_hashes.get(autosave_filename)
             if new_hash != autosave_hash:
                 if new_hash == orig_hash:
                     self.remove_autosave_file(orig_filename)
                 else:
-                    self.autosave(finfo)
+                    self.autosave(finfo, text)
         else:
             if new_hash != orig_hash:
-                self.autosave(finfo)
+                self.autosave(finfo, text)
 
-    def autosave(self, finfo):
+        self.file_revisions[orig_filename] = revision
+
+    def autosave(self, finfo, text=None):
         """
         Autosave a file.
 
-        Save a copy in a file with name `self.get_autosave_filename()` and
-        update the cached hash of the autosave file. An error dialog notifies
-        the user of any errors raised when saving.
+        Queue a copy to be saved in a file with name
+        `self.get_autosave_filename()` and update the cached hash of the
+        autosave file. An error dialog notifies the user of any errors raised
+        when saving.
 
         Args:
             fileinfo (FileInfo): file that is to be autosaved.
+            text (str): contents of the file, if already known.
         """
+        if text is None:
+            text = str(finfo.editor.get_text_with_eol())
         autosave_filename = self.get_autosave_filename(finfo.filename)
         logger.debug('Autosaving %s to %s', finfo.filename, autosave_filename)
-        try:
-            self.stack._write_to_file(finfo, autosave_filename)
-            autosave_hash = self.stack.compute_hash(finfo)
-            self.file_hashes[autosave_filename] = autosave_hash
-        except (PermissionError, OSError) as error:
-            action = (_('Error while autosaving {} to {}')
-                      .format(finfo.filename, autosave_filename))
-            msgbox = AutosaveErrorDialog(action, error)
-            msgbox.exec_if_enabled()
+        self.file_hashes[autosave_filename] = hash(text)
+        self.writer.write(
+            finfo.filename, autosave_filename, text, finfo.encoding
+        )
 
     def autosave_all(self):
         """Autosave all opened files where necessary."""
@@ -445,8 +653,30 @@ def file_renamed(self, old_name, new_name):
                          old_name, new_name)
             old_hash = None
         self.remove_autosave_file(old_name)
+        self.file_revisions.pop(old_name, None)
         if old_hash is not None:
             del self.file_hashes[old_name]
             self.file_hashes[new_name] = old_hash
         index = self.stack.has_filename(new_name)
         self.maybe_autosave(index)
+
+    def file_encoding_changed(self, filename, old_encoding, new_encoding):
+        """
+        Update the encoding of a file after it was autosaved with a different
+        one, so that it's not tried again.
+
+        The encoding is not changed if it was set to another one since the
+        file was queued to be autosaved.
+
+        Args:
+            filename (str): name of the original file.
+            old_encoding (str): encoding the file was queued with.
+            new_encoding (str): encoding the file was written with.
+        """
+        index = self.stack.has_filename(filename)
+        if index is None:
+            return
+
+        finfo = self.stack.data[index]
+        if finfo.encoding == old_encoding:
+            finfo.encoding = new_encoding
@@ -78,6 +78,45 @@ def is_block_safe(block):
     return block.isValid() and isinstance(block.userData(), BlockUserData)
 
 
+def get_changed_blocks(document, position, chars_added, old_block_count):
+    """
+    Get the blocks affected by a change reported by `contentsChange`.
+
+    Parameters
+    ----------
+    document: QTextDocument
+        Document that changed.
+    position, chars_added: int
+        Arguments of the `contentsChange` signal.
+    old_block_count: int
+        Number of blocks in the document before the change.
+
+    Returns
+    -------
+    tuple or None
+        (first, last, old_last), where blocks `first` to `last` of the
+        document replaced blocks `first` to `old_last` before the change, or
+        None if the change doesn't match the number of blocks given.
+    """
+    first = document.findBlock(position)
+    last = document.findBlock(position + chars_added)
+    if not first.isValid():
+        first = document.lastBlock()
+    if not last.isValid():
+        last = document.lastBlock()
+
+    first_number = first.blockNumber()
+    last_number = last.blockNumber()
+    old_last_number = last_number - (document.blockCount() - old_block_count)
+    if (
+        old_last_number < first_number - 1
+        or old_last_number >= old_block_count
+    ):
+        return None
+
+    return first_number, last_number, old_last_number
+
+
 class BlockUserData(QTextBlockUserData):
 
     def __init__(
@@ -22,14 +22,26 @@
     r"#\s*(TODO|todo|FIXME|fixme|XXX|xxx|HINT|hint|TIP|tip|@todo|@TODO|"
     r"HACK|hack|BUG|bug|OPTIMIZE|optimize|!!!|\?\?\?)([^#]*)"
 )
+TASKS_REGEX = re.compile(TASKS_PATTERN)
+
+
+def find_line_tasks(text):
+    """Find the tasks in a line of source code."""
+    results = []
+    if '#' not in text:
+        return results
+
+    for todo in TASKS_REGEX.findall(text):
+        todo_text = (todo[-1].strip(' :').capitalize() if todo[-1]
+                     else todo[-2])
+        results.append(todo_text)
+    return results
 
 
 def find_tasks(source_code):
     """Find tasks in source code (TODO, FIXME, XXX, ...)."""
     results = []
     for line, text in enumerate(source_code.splitlines()):
-        for todo in re.findall(TASKS_PATTERN, text):
-            todo_text = (todo[-1].strip(' :').capitalize() if todo[-1]
-                         else todo[-2])
+        for todo_text in find_line_tasks(text):
             results.append((todo_text, line + 1))
     return results
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the blocks of a document flagged in the scroll flag area.
+"""
+
+# Standard library imports
+from bisect import bisect_left, bisect_right, insort
+
+# Third party imports
+from lsprotocol import types as lsp
+
+# Local imports
+from spyder.plugins.editor.utils.editor import get_changed_blocks
+
+
+# Types of flags that come from the user data of blocks, sorted from the
+# least to the most important one, which is painted last
+FLAG_TYPES = ['breakpoint', 'todo', 'warning', 'error']
+
+
+def get_block_flags(data):
+    """Get the types of flags of a block, given its user data."""
+    flag_types = []
+    if not data:
+        return flag_types
+
+    if data.code_analysis:
+        for __, __, severity, __ in data.code_analysis:
+            if severity == lsp.DiagnosticSeverity.Error:
+                flag_types.append('error')
+                break
+        else:
+            flag_types.append('warning')
+    if data.todo:
+        flag_types.append('todo')
+    if data.breakpoint:
+        flag_types.append('breakpoint')
+
+    return flag_types
+
+
+class FlagIndex:
+    """
+    Sorted block numbers of the errors, warnings, todos and breakpoints of a
+    document.
+
+    Diagnostics, todos and breakpoints update it directly when they change.
+    When the document is edited, flags after the edit are shifted and the
+    ones in the edited blocks are taken again from their user data, so that
+    it doesn't need to go through all the blocks of the document.
+    """
+
+    def __init__(self, document):
+        self._flags = {flag_type: [] for flag_type in FLAG_TYPES}
+        self._document = document
+        self._block_count = document.blockCount()
+        document.contentsChange.connect(self._on_contents_change)
+
+    def get(self, flag_type):
+        """Get the sorted block numbers with a type of flag."""
+        return self._flags[flag_type]
+
+    def set_flag(self, flag_type, block_number, flagged=True):
+        """Add or remove a flag for a block."""
+        block_numbers = self._flags[flag_type]
+        index = bisect_left(block_numbers, block_number)
+        present = (
+            index < len(block_numbers)
+            and block_numbers[index] == block_number
+        )
+        if flagged and not present:
+            block_numbers.insert(index, block_number)
+        elif not flagged and present:
+            del block_numbers[index]
+
+    def set_flags(self, flag_type, block_numbers):
+        """Replace all flags of a type."""
+        self._flags[flag_type] = sorted(set(block_numbers))
+
+    def clear(self, flag_type=None):
+        """Remove all flags of a type, or all of them if it's None."""
+        flag_types = FLAG_TYPES if flag_type is None else [flag_type]
+        for flag_type in flag_types:
+            self._flags[flag_type] = []
+
+    def update_from_blocks(self, first=0, last=None):
+        """Take the flags of some blocks again from their user data."""
+        if last is None:
+            last = self._document.blockCount() - 1
+        self._replace_blocks(first, last, last)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _replace_blocks(self, first, last, old_last):
+        """
+        Replace the flags of blocks `first` to `old_last` with those in the
+        user data of blocks `first` to `last`, and shift the flags after them
+        accordingly.
+        """
+        delta = last - old_last
+        for block_numbers in self._flags.values():
+            start = bisect_left(block_numbers, first)
+            end = bisect_right(block_numbers, old_last)
+            if delta == 0:
+                del block_numbers[start:end]
+            else:
+                block_numbers[start:] = [
+                    block_number + delta
+                    for block_number in block_numbers[end:]
+                ]
+
+        block = self._document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last:
+            for flag_type in get_block_flags(block.userData()):
+                insort(self._flags[flag_type], block.blockNumber())
+            block = block.next()
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Move flags according to the blocks added or removed."""
+        document = self._document
+        old_block_count = self._block_count
+        self._block_count = document.blockCount()
+
+        changed = get_changed_blocks(
+            document, position, chars_added, old_block_count
+        )
+        if changed is None:
+            self.clear()
+            self.update_from_blocks()
+        else:
+            self._replace_blocks(*changed)
@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Utilities to show files that are too large to be opened in the editor.
+
+Their contents are memory-mapped and only the lines that are shown are
+read and decoded, using an index of the offsets where lines start that is
+built in the background.
+"""
+
+# Standard library imports
+from array import array
+from bisect import bisect_right
+from codecs import (BOM_UTF8, BOM_UTF16_BE, BOM_UTF16_LE, BOM_UTF32_BE,
+                    BOM_UTF32_LE)
+import logging
+import mmap
+import os
+import re
+import threading
+
+# Local imports
+from spyder.utils.encoding import guess_file_encoding
+
+
+# ---- Constants
+# -----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+# Files bigger than this (in bytes) are opened in a read-only viewer instead
+# of the editor
+LARGE_FILE_SIZE = 25 * 1024**2
+
+# Maximum number of bytes of a line that are shown
+MAX_LINE_LENGTH = 10000
+
+# Number of bytes that are scanned at a time to index lines or search text
+CHUNK_SIZE = 4 * 1024**2
+
+# BOMs that define how lines are decoded and where the first one starts. The
+# UTF-32 LE BOM starts with the UTF-16 LE one, so it needs to be checked first.
+BOMS = [
+    (BOM_UTF32_LE, 'utf-32-le'),
+    (BOM_UTF32_BE, 'utf-32-be'),
+    (BOM_UTF8, 'utf-8'),
+    (BOM_UTF16_LE, 'utf-16-le'),
+    (BOM_UTF16_BE, 'utf-16-be'),
+]
+
+
+# ---- Auxiliary functions
+# -----------------------------------------------------------------------------
+def is_large_file(filename):
+    """Check if a file is too large to be opened in the editor."""
+    try:
+        return os.path.getsize(filename) > LARGE_FILE_SIZE
+    except OSError:
+        return False
+
+
+# ---- Index
+# -----------------------------------------------------------------------------
+class LineIndex:
+    """
+    Offsets of the lines of a memory-mapped file.
+
+    The offsets are found in a background thread after calling `start`, so
+    that the first lines of the file can be shown while the rest is being
+    indexed.
+
+    Notes
+    -----
+    All public methods are thread-safe.
+    """
+
+    def __init__(self, filename, encoding=None):
+        """
+        Parameters
+        ----------
+        filename: str
+            Path to the file.
+        encoding: str, optional
+            Encoding of the file. It's guessed from its start by default.
+        """
+        self.filename = filename
+        if encoding is None:
+            encoding = guess_file_encoding(filename)
+
+        self._file = open(filename, 'rb')
+        try:
+            self._data = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except ValueError:
+            # Empty files can't be mapped
+            self._data = b''
+
+        # Files with a BOM are decoded with the codec of their byte order and
+        # the BOM is skipped.
+        self._start = 0
+        self.encoding = encoding
+        head = self._data[:4]
+        for bom, codec in BOMS:
+            if head.startswith(bom):
+                self._start = len(bom)
+                self.encoding = codec
+                break
+
+        self._newline = '\n'.encode(self.encoding)
+        self._carriage_return = '\r'.encode(self.encoding)
+
+        # Offsets where lines start. The last one is where the line after the
+        # last indexed line ending starts.
+        self._offsets = array('q', [self._start])
+        self._indexed = self._start
+
+        self._lock = threading.RLock()
+        self._thread = None
+        self._ready = False
+        self._stopped = False
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    @property
+    def size(self):
+        """Size of the file in bytes."""
+        return len(self._data)
+
+    @property
+    def ready(self):
+        """Whether all lines of the file were indexed."""
+        return self._ready
+
+    @property
+    def progress(self):
+        """Fraction of the file that was indexed, between 0 and 1."""
+        if self._ready or not self.size:
+            return 1
+        return self._indexed / self.size
+
+    @property
+    def line_count(self):
+        """
+        Number of lines indexed so far, which is the number of lines of the
+        file once it's ready.
+        """
+        with self._lock:
+            if self._ready:
+                return len(self._offsets)
+            return len(self._offsets) - 1
+
+    def start(self):
+        """Start indexing the lines of the file in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._index, daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Stop indexing lines and close the file."""
+        self._stopped = True
+        if self._thread is not None:
+            self._thread.join()
+
+        with self._lock:
+            if isinstance(self._data, mmap.mmap):
+                self._data.close()
+            self._data = b''
+            self._file.close()
+
+    def get_line(self, line):
+        """
+        Get the text of a line, without its line ending.
+
+        Lines longer than MAX_LINE_LENGTH bytes are truncated.
+
+        Parameters
+        ----------
+        line: int
+            Line number, starting at 0. It must be less than `line_count`.
+        """
+        with self._lock:
+            start, end = self._get_line_bounds(line)
+            truncated = end - start > MAX_LINE_LENGTH
+            raw = self._data[start:min(end, start + MAX_LINE_LENGTH)]
+
+        if not truncated:
+            if raw.endswith(self._newline):
+                raw = raw[:-len(self._newline)]
+            if raw.endswith(self._carriage_return):
+                raw = raw[:-len(self._carriage_return)]
+
+        text = raw.decode(self.encoding, errors='replace')
+        return text + ' [...]' if truncated else text
+
+    def get_lines(self, first, count):
+        """Get the text of `count` lines starting at `first`."""
+        last = min(first + count, self.line_count)
+        return [self.get_line(line) for line in range(first, last)]
+
+    def find(self, text, line=0, column=0, backwards=False,
+             case_sensitive=False):
+        """
+        Find text in the file.
+
+        Case-insensitive searches only ignore the case of ASCII letters,
+        because they are done over the bytes of the file.
+
+        Parameters
+        ----------
+        text: str
+            Text to search for.
+        line, column: int, optional
+            Position where the search starts, with the line starting at 0.
+        backwards: bool, optional
+            Whether to search before the position instead of after it.
+        case_sensitive: bool, optional
+            Whether to take case into account.
+
+        Returns
+        -------
+        tuple or None
+            (line, column) of the first match, or None if there's no match
+            or the file is not indexed yet.
+        """
+        if not text or not self._ready:
+            return None
+
+        try:
+            pattern = text.encode(self.encoding)
+        except UnicodeEncodeError:
+            # The text can't be in the file
+            return None
+
+        if not case_sensitive:
+            pattern = re.compile(re.escape(pattern), re.IGNORECASE)
+
+        with self._lock:
+            line = max(0, min(line, len(self._offsets) - 1))
+            line_start = self._offsets[line]
+            prefix = self.get_line(line)[:column]
+            offset = line_start + len(prefix.encode(self.encoding))
+
+            if backwards:
+                found = self._rfind(pattern, offset)
+            else:
+                found = self._find(pattern, offset)
+            if found == -1:
+                return None
+
+            line = bisect_right(self._offsets, found) - 1
+            prefix = self._data[self._offsets[line]:found]
+            return line, len(prefix.decode(self.encoding, errors='replace'))
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _get_line_bounds(self, line):
+        offsets = self._offsets
+        if not 0 <= line < len(offsets):
+            raise IndexError(f"Line {line} is not indexed")
+
+        start = offsets[line]
+        if line + 1 < len(offsets):
+            end = offsets[line + 1]
+        elif self._ready:
+            end = self.size
+        else:
+            raise IndexError(f"Line {line} is not indexed")
+        return start, end
+
+    def _is_aligned(self, offset):
+        """Check if an offset is at the start of a character."""
+        return (offset - self._start) % len(self._newline) == 0
+
+    def _index(self):
+        """Find the offsets where lines start."""
+        start = self._start
+        size = self.size
+
+        # Chunks are aligned to characters, so that no line ending is split
+        # between two of them
+        unit = len(self._newline)
+        chunk_size = max(CHUNK_SIZE - CHUNK_SIZE % unit, unit)
+
+        try:
+            while start < size and not self._stopped:
+                end = min(start + chunk_size, size)
+                offsets = self._find_line_starts(start, end)
+                with self._lock:
+                    self._offsets.extend(offsets)
+                    self._indexed = end
+                start = end
+        except Exception:
+            logger.debug(
+                f"Error indexing lines of {self.filename}", exc_info=True
+            )
+            return
+
+        self._ready = not self._stopped
+
+    def _find_line_starts(self, start, end):
+        """
+        Find the offsets where lines start after a line ending that is
+        between `start` and `end`.
+        """
+        newline = self._newline
+        if len(newline) == 1:
+            # Splitting lines is done in C, which is much faster than
+            # looking for each line ending in Python.
+            pieces = self._data[start:end].split(newline)
+            pieces.pop()
+            offsets = []
+            offset = start
+            for piece in pieces:
+                offset += len(piece) + 1
+                offsets.append(offset)
+            return offsets
+
+        # Wide encodings can have the bytes of a line ending in other
+        # characters, so only aligned ones are taken.
+        offsets = []
+        offset = self._data.find(newline, start, end)
+        while offset != -1:
+            if self._is_aligned(offset):
+                offsets.append(offset + len(newline))
+                offset = self._data.find(newline, offset + len(newline), end)
+            else:
+                offset = self._data.find(newline, offset + 1, end)
+        return offsets
+
+    def _find(self, pattern, offset):
+        """Find the first match of pattern after `offset`."""
+        data = self._data
+        while True:
+            if isinstance(pattern, bytes):
+                found = data.find(pattern, offset)
+            else:
+                match = pattern.search(data, offset)
+                found = -1 if match is None else match.start()
+
+            if found == -1 or self._is_aligned(found):
+                return found
+            offset = found + 1
+
+    def _rfind(self, pattern, offset):
+        """Find the last match of pattern that ends before `offset`."""
+        data = self._data
+        if isinstance(pattern, bytes):
+            found = data.rfind(pattern, 0, offset)
+            while found != -1 and not self._is_aligned(found):
+                found = data.rfind(pattern, 0, found + len(pattern) - 1)
+            return found
+
+        # Regular expressions can only search forwards, so the text before
+        # the offset is searched in chunks, from the closest to the farthest.
+        # Chunks overlap so that matches between them are found.
+        overlap = max(len(pattern.pattern) - 1, 0)
+        chunk_size = max(CHUNK_SIZE, 2 * overlap)
+        end = offset
+        while end > 0:
+            start = max(end - chunk_size, 0)
+            found = -1
+            for match in pattern.finditer(data, start, end):
+                if self._is_aligned(match.start()):
+                    found = match.start()
+            if found != -1 or start == 0:
+                return found
+            end = start + overlap
+        return -1
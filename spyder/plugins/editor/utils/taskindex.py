@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the tasks (TODO, FIXME, XXX, ...) of a document.
+"""
+
+# Third party imports
+from qtpy.QtCore import QObject, Signal
+
+# Local imports
+from spyder.plugins.editor.utils.editor import (
+    BlockUserData, get_changed_blocks)
+from spyder.plugins.editor.utils.findtasks import find_line_tasks
+
+
+class TaskIndex(QObject):
+    """
+    Tasks of a QTextDocument, kept in the user data of its blocks.
+
+    Only the blocks touched by an edit are scanned again, and the blocks with
+    tasks are tracked by the `todo` flags of a FlagIndex, so that neither
+    the scroll flag area nor the list of tasks need to go through all the
+    blocks of the document.
+    """
+
+    sig_tasks_changed = Signal()
+    """This signal is emitted when tasks are added, removed or changed."""
+
+    def __init__(self, document, flag_index, editor=None):
+        """
+        Parameters
+        ----------
+        document: QTextDocument
+            Document to find tasks in.
+        flag_index: FlagIndex
+            Index of the flags of the document, which must be connected to
+            its `contentsChange` signal before this one.
+        editor: CodeEditor, optional
+            Editor set in the user data created for blocks.
+        """
+        super().__init__()
+        self._document = document
+        self._flag_index = flag_index
+        self._editor = editor
+        self._enabled = False
+        self._block_count = document.blockCount()
+        self._task_count = 0
+        document.contentsChange.connect(self._on_contents_change)
+
+    @property
+    def enabled(self):
+        """Whether tasks are searched in the document."""
+        return self._enabled
+
+    def set_enabled(self, state):
+        """
+        Start or stop searching tasks in the document.
+
+        When enabled, the whole document is scanned, and its tasks are
+        removed when disabled.
+        """
+        if state == self._enabled:
+            return
+
+        self._enabled = state
+        if state:
+            self._scan_blocks(0, self._document.blockCount() - 1)
+        else:
+            self.set_tasks([])
+
+    def get_tasks(self):
+        """
+        Get the tasks of the document.
+
+        Returns
+        -------
+        list of tuple
+            (text, line number) of every task, with line numbers starting at
+            1, in the order they appear in the document.
+        """
+        tasks = []
+        for block_number in self._flag_index.get('todo'):
+            block = self._document.findBlockByNumber(block_number)
+            data = block.userData()
+            if not data or not data.todo:
+                continue
+
+            if isinstance(data.todo, str):
+                texts = data.todo.split('\n')
+            else:
+                texts = [data.todo]
+            tasks.extend((text, block_number + 1) for text in texts)
+        return tasks
+
+    def set_tasks(self, tasks):
+        """
+        Replace the tasks of the document.
+
+        Parameters
+        ----------
+        tasks: list of tuple
+            (text, line number) of every task, with line numbers starting at
+            1, as given by `find_tasks`.
+        """
+        for block_number in self._flag_index.get('todo'):
+            data = self._document.findBlockByNumber(block_number).userData()
+            if data:
+                data.todo = ''
+
+        for text, line_number in tasks:
+            block = self._document.findBlockByNumber(line_number - 1)
+            data = block.userData()
+            if not data:
+                data = BlockUserData(self._editor)
+                block.setUserData(data)
+            data.todo = text
+
+        self._flag_index.set_flags(
+            'todo',
+            [line_number - 1 for text, line_number in tasks if text]
+        )
+        self._task_count = len(self._flag_index.get('todo'))
+        self.sig_tasks_changed.emit()
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _scan_blocks(self, first, last):
+        """Find again the tasks of blocks `first` to `last`."""
+        changed = False
+        block = self._document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last:
+            todo = '\n'.join(find_line_tasks(block.text()))
+            data = block.userData()
+            if (data.todo if data else '') != todo:
+                if not data:
+                    data = BlockUserData(self._editor)
+                    block.setUserData(data)
+                data.todo = todo
+                changed = True
+
+            self._flag_index.set_flag('todo', block.blockNumber(), bool(todo))
+            block = block.next()
+
+        # Tasks can also be removed with the blocks that contained them
+        task_count = len(self._flag_index.get('todo'))
+        if changed or task_count != self._task_count:
+            self._task_count = task_count
+            self.sig_tasks_changed.emit()
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Scan the blocks affected by a change."""
+        document = self._document
+        old_block_count = self._block_count
+        self._block_count = document.blockCount()
+        if not self._enabled:
+            return
+
+        changed = get_changed_blocks(
+            document, position, chars_added, old_block_count
+        )
+        if changed is None:
+            self._scan_blocks(0, document.blockCount() - 1)
+        else:
+            self._scan_blocks(changed[0], changed[1])
@@ -8,13 +8,17 @@
 # Standard library imports
 import ast
 import os.path as osp
+import threading
+import time
 
 # Third party imports
 import pytest
 
 # Local imports
+from spyder.plugins.editor.utils import autosave
 from spyder.plugins.editor.utils.autosave import (AutosaveForStack,
-                                                  AutosaveForPlugin)
+                                                  AutosaveForPlugin,
+                                                  AutosaveWriter)
 
 
 def test_autosave_component_set_interval(mocker):
@@ -180,26 +184,132 @@ def test_autosave(mocker, have_hash):
     """Test that AutosaveForStack.maybe_autosave writes the contents to the
     autosave file and updates the file_hashes."""
     mock_editor = mocker.Mock()
+    mock_editor.get_text_with_eol.return_value = 'spam'
     mock_fileinfo = mocker.Mock(editor=mock_editor, filename='orig',
-                                newly_created=False)
+                                newly_created=False, encoding='utf-8')
     mock_document = mocker.Mock()
+    mock_document.revision.return_value = 7
     mock_fileinfo.editor.document.return_value = mock_document
     mock_stack = mocker.Mock(data=[mock_fileinfo])
     addon = AutosaveForStack(mock_stack)
+    mock_write = mocker.patch.object(addon.writer, 'write')
     addon.name_mapping = {'orig': 'autosave'}
     addon.file_hashes = {'autosave': 2}
     if have_hash:
         addon.file_hashes['orig'] = 1
-    mock_stack.compute_hash.return_value = 3
 
     addon.maybe_autosave(0)
 
-    mock_stack._write_to_file.assert_called_with(mock_fileinfo, 'autosave')
-    mock_stack.compute_hash.assert_called_with(mock_fileinfo)
+    mock_write.assert_called_with('orig', 'autosave', 'spam', 'utf-8')
     if have_hash:
-        assert addon.file_hashes == {'orig': 1, 'autosave': 3}
+        assert addon.file_hashes == {'orig': 1, 'autosave': hash('spam')}
     else:
-        assert addon.file_hashes == {'autosave': 3}
+        assert addon.file_hashes == {'autosave': hash('spam')}
+    assert addon.file_revisions == {'orig': 7}
+
+    # The file is not checked again while its revision doesn't change
+    addon.maybe_autosave(0)
+    assert mock_editor.get_text_with_eol.call_count == 1
+
+
+def test_autosave_writer(mocker, tmpdir):
+    """Test that AutosaveWriter only writes the last queued copy of a file,
+    doesn't write cancelled ones and reports errors."""
+    mocker.patch('spyder.plugins.editor.utils.autosave.WorkerManager')
+    mock_dialog = mocker.patch(
+        'spyder.plugins.editor.utils.autosave.AutosaveErrorDialog')
+    spy_write = mocker.spy(autosave.encoding, 'write')
+    writer = AutosaveWriter(AutosaveForStack(None))
+    foo = str(tmpdir.join('foo.py'))
+    bar = str(tmpdir.join('bar.py'))
+
+    writer.write('foo_orig.py', foo, 'spam\n', 'utf-8')
+    writer.write('bar_orig.py', bar, 'ham\n', 'utf-8')
+    writer.write('foo_orig.py', foo, 'eggs\n', 'utf-8')
+    writer.cancel(bar)
+    writer.flush()
+
+    assert spy_write.call_count == 1
+    assert tmpdir.join('foo.py').read() == 'eggs\n'
+    assert not tmpdir.join('bar.py').check()
+    assert not mock_dialog.called
+
+    # Errors forget the file so that it's autosaved again
+    missing = str(tmpdir.join('missing', 'foo.py'))
+    writer.autosave.file_hashes = {missing: 1}
+    writer.autosave.file_revisions = {'foo_orig.py': 2}
+    writer.write('foo_orig.py', missing, 'spam\n', 'utf-8')
+    writer.flush()
+
+    assert mock_dialog.called
+    assert writer.autosave.file_hashes == {}
+    assert writer.autosave.file_revisions == {}
+
+
+def test_autosave_writer_encoding(mocker, tmpdir):
+    """Test that the encoding of a file is updated if its autosave file is
+    written with a different one."""
+    mocker.patch('spyder.plugins.editor.utils.autosave.WorkerManager')
+    fileinfo = mocker.Mock(filename='orig', encoding='ascii')
+    mock_stack = mocker.Mock(data=[fileinfo])
+    mock_stack.has_filename.return_value = 0
+    writer = AutosaveWriter(AutosaveForStack(mock_stack))
+    foo = str(tmpdir.join('foo.py'))
+
+    writer.write('orig', foo, 'ñam\n', 'ascii')
+    writer.flush()
+
+    assert tmpdir.join('foo.py').read_text('utf-8') == 'ñam\n'
+    assert fileinfo.encoding == 'utf-8'
+
+    # The encoding is kept if it was changed in the meantime
+    writer.write('orig', foo, 'ñam\n', 'ascii')
+    fileinfo.encoding = 'latin-1'
+    writer.flush()
+
+    assert fileinfo.encoding == 'latin-1'
+
+
+def test_autosave_writer_cancel_while_writing(mocker, tmpdir):
+    """Test that cancelling a copy that is being written waits until it's
+    done, even if other copies are written at the same time."""
+    mocker.patch('spyder.plugins.editor.utils.autosave.WorkerManager')
+    writer = AutosaveWriter(AutosaveForStack(None))
+    foo = str(tmpdir.join('foo.py'))
+    bar = str(tmpdir.join('bar.py'))
+
+    # Block writing foo.py until the test releases it
+    release = threading.Event()
+    write = autosave.encoding.write
+
+    def slow_write(text, filename, encoding_name):
+        if filename == foo:
+            release.wait(10)
+        return write(text, filename, encoding_name)
+
+    mocker.patch.object(autosave.encoding, 'write', side_effect=slow_write)
+
+    writer.write('foo_orig.py', foo, 'spam\n', 'utf-8')
+    foo_thread = threading.Thread(target=writer.flush)
+    foo_thread.start()
+    while foo not in writer._writing:
+        time.sleep(0.01)
+
+    # Write another file while foo.py is being written
+    writer.write('bar_orig.py', bar, 'ham\n', 'utf-8')
+    writer._write_pending()
+    assert tmpdir.join('bar.py').read() == 'ham\n'
+
+    cancel_thread = threading.Thread(target=writer.cancel, args=(foo,))
+    cancel_thread.start()
+    cancel_thread.join(0.2)
+    assert cancel_thread.is_alive()
+
+    release.set()
+    cancel_thread.join(10)
+    foo_thread.join(10)
+    assert not cancel_thread.is_alive()
+    assert tmpdir.join('foo.py').read() == 'spam\n'
 
 
 @pytest.mark.parametrize('latin', [True, False])
@@ -289,14 +399,15 @@ def test_autosave_file_renamed(mocker, tmpdir, have_hash):
     mocker.patch('spyder.plugins.editor.utils.autosave.get_conf_path',
                  return_value=str(tmpdir))
     mock_editor = mocker.Mock()
+    mock_editor.get_text_with_eol.return_value = 'spam'
     mock_fileinfo = mocker.Mock(editor=mock_editor, filename='new_foo.py',
-                                newly_created=False)
+                                newly_created=False, encoding='utf-8')
     mock_document = mocker.Mock()
     mock_fileinfo.editor.document.return_value = mock_document
     mock_stack = mocker.Mock(data=[mock_fileinfo])
     mock_stack.has_filename.return_value = 0
-    mock_stack.compute_hash.return_value = 3
     addon = AutosaveForStack(mock_stack)
+    mock_write = mocker.patch.object(addon.writer, 'write')
     old_autosavefile = str(tmpdir.join('old_foo.py'))
     new_autosavefile = str(tmpdir.join('new_foo.py'))
     addon.name_mapping = {'old_foo.py': old_autosavefile}
@@ -309,13 +420,14 @@ def test_autosave_file_renamed(mocker, tmpdir, have_hash):
     addon.file_renamed('old_foo.py', 'new_foo.py')
 
     mock_remove.assert_any_call(old_autosavefile)
-    mock_stack._write_to_file.assert_called_with(
-        mock_fileinfo, new_autosavefile)
+    mock_write.assert_called_with(
+        'new_foo.py', new_autosavefile, 'spam', 'utf-8')
     assert addon.name_mapping == {'new_foo.py': new_autosavefile}
     if have_hash:
-        assert addon.file_hashes == {'new_foo.py': 1, new_autosavefile: 3}
+        assert addon.file_hashes == {
+            'new_foo.py': 1, new_autosavefile: hash('spam')}
     else:
-        assert addon.file_hashes == {new_autosavefile: 3}
+        assert addon.file_hashes == {new_autosavefile: hash('spam')}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for flagindex.py"""
+
+# Third party imports
+from lsprotocol import types as lsp
+from qtpy.QtGui import QTextCursor
+from qtpy.QtWidgets import QPlainTextEdit
+
+# Local imports
+from spyder.plugins.editor.utils.editor import BlockUserData
+from spyder.plugins.editor.utils.flagindex import FlagIndex, get_block_flags
+
+
+def set_breakpoint(document, block_number):
+    block = document.findBlockByNumber(block_number)
+    data = BlockUserData(None)
+    data.breakpoint = True
+    block.setUserData(data)
+
+
+def test_get_block_flags():
+    """Test the flags given by the user data of a block."""
+    data = BlockUserData(None)
+    assert get_block_flags(None) == []
+    assert get_block_flags(data) == []
+
+    data.todo = 'TODO'
+    data.breakpoint = True
+    data.code_analysis = [
+        ('pycodestyle', 'E227', lsp.DiagnosticSeverity.Warning, 'warning')
+    ]
+    assert get_block_flags(data) == ['warning', 'todo', 'breakpoint']
+
+    data.code_analysis.append(
+        ('pyflakes', 'E', lsp.DiagnosticSeverity.Error, 'error')
+    )
+    assert get_block_flags(data) == ['error', 'todo', 'breakpoint']
+
+
+def test_flag_index(qtbot):
+    """Test that flags are moved when the document is edited."""
+    # Use the document of an editor, because documents without a layout
+    # don't emit contentsChange
+    editor = QPlainTextEdit('\n'.join(f'line{i}' for i in range(100)))
+    qtbot.addWidget(editor)
+    document = editor.document()
+    index = FlagIndex(document)
+
+    for block_number in [10, 20, 30]:
+        set_breakpoint(document, block_number)
+    index.update_from_blocks()
+    index.set_flags('todo', [25, 5])
+    assert index.get('breakpoint') == [10, 20, 30]
+    assert index.get('todo') == [5, 25]
+
+    index.set_flag('todo', 15)
+    index.set_flag('todo', 5, False)
+    assert index.get('todo') == [15, 25]
+
+    # Add two lines before line 20
+    cursor = QTextCursor(document.findBlockByNumber(18))
+    cursor.insertText('a\nb\n')
+    assert index.get('breakpoint') == [10, 22, 32]
+    assert index.get('todo') == [15, 27]
+
+    # Remove lines 21 to 22, which takes the breakpoint in 22 away
+    cursor = QTextCursor(document.findBlockByNumber(21))
+    cursor.setPosition(
+        document.findBlockByNumber(23).position(), QTextCursor.KeepAnchor
+    )
+    cursor.removeSelectedText()
+    assert index.get('breakpoint') == [10, 30]
+    assert index.get('todo') == [15, 25]
+
+    # Editing a line doesn't change flags
+    cursor = QTextCursor(document.findBlockByNumber(10))
+    cursor.insertText('foo')
+    assert index.get('breakpoint') == [10, 30]
+
+    index.clear()
+    assert index.get('breakpoint') == index.get('todo') == []
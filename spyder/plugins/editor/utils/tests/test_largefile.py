@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for largefile.py"""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.editor.utils import largefile
+from spyder.plugins.editor.utils.largefile import is_large_file, LineIndex
+
+
+TEXT = 'spam\r\neggs and Ham\n\nham\nlast'
+LINES = ['spam', 'eggs and Ham', '', 'ham', 'last']
+
+
+@pytest.fixture
+def line_index(tmp_path, monkeypatch, request):
+    """Create a LineIndex for TEXT in the encoding given as parameter."""
+    # Use small chunks to test that lines between them are found
+    monkeypatch.setattr(largefile, 'CHUNK_SIZE', 7)
+
+    encoding = request.param
+    filename = tmp_path / 'spam.log'
+    filename.write_bytes(TEXT.encode(encoding))
+
+    index = LineIndex(str(filename), encoding)
+    yield index
+    index.close()
+
+
+def build(index):
+    index.start()
+    index._thread.join()
+    return index
+
+
+@pytest.mark.parametrize(
+    'line_index', ['utf-8', 'utf-8-sig', 'utf-16', 'utf-32'], indirect=True
+)
+def test_get_lines(line_index):
+    """Test that lines are indexed in different encodings."""
+    assert not line_index.ready
+    assert line_index.line_count == 0
+
+    build(line_index)
+    assert line_index.ready
+    assert line_index.progress == 1
+    assert line_index.line_count == len(LINES)
+    assert line_index.get_lines(0, 10) == LINES
+    assert line_index.get_line(3) == 'ham'
+
+
+@pytest.mark.parametrize(
+    'line_index', ['utf-8', 'utf-16', 'utf-32'], indirect=True
+)
+def test_find(line_index):
+    """Test searching text forwards and backwards."""
+    assert line_index.find('ham') is None
+    build(line_index)
+
+    assert line_index.find('ham') == (1, 9)
+    assert line_index.find('ham', 1, 10) == (3, 0)
+    assert line_index.find('Ham', case_sensitive=True) == (1, 9)
+    assert line_index.find('ham', 1, 10, case_sensitive=True) == (3, 0)
+    assert line_index.find('xyz') is None
+
+    assert line_index.find('ham', 4, 0, backwards=True) == (3, 0)
+    assert line_index.find('ham', 3, 0, backwards=True) == (1, 9)
+    assert line_index.find(
+        'ham', 3, 0, backwards=True, case_sensitive=True) is None
+    assert line_index.find('spam', 4, 4, backwards=True) == (0, 0)
+
+
+def test_long_lines(tmp_path, monkeypatch):
+    """Test that long lines are truncated."""
+    monkeypatch.setattr(largefile, 'MAX_LINE_LENGTH', 4)
+    filename = tmp_path / 'spam.log'
+    filename.write_bytes(b'abcdefgh\nxyz\n')
+
+    index = build(LineIndex(str(filename), 'utf-8'))
+    assert index.get_lines(0, 10) == ['abcd [...]', 'xyz', '']
+    index.close()
+
+
+def test_empty_file(tmp_path):
+    filename = tmp_path / 'empty.log'
+    filename.write_bytes(b'')
+
+    index = build(LineIndex(str(filename)))
+    assert index.line_count == 1
+    assert index.get_line(0) == ''
+    index.close()
+
+
+def test_is_large_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(largefile, 'LARGE_FILE_SIZE', 10)
+    filename = tmp_path / 'spam.log'
+    filename.write_bytes(b'spam')
+    assert not is_large_file(str(filename))
+
+    filename.write_bytes(b'spam' * 10)
+    assert is_large_file(str(filename))
+    assert not is_large_file(str(tmp_path / 'eggs.log'))
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for taskindex.py"""
+
+# Third party imports
+from qtpy.QtGui import QTextCursor
+from qtpy.QtWidgets import QPlainTextEdit
+
+# Local imports
+from spyder.plugins.editor.utils.findtasks import find_line_tasks, find_tasks
+from spyder.plugins.editor.utils.flagindex import FlagIndex
+from spyder.plugins.editor.utils.taskindex import TaskIndex
+
+
+TEXT = """\
+import os
+# TODO: first task
+x = 1  # FIXME
+y = 2
+# XXX third # HACK fourth
+"""
+
+
+def test_find_line_tasks():
+    """Test finding the tasks of a line."""
+    assert find_line_tasks('x = 1') == []
+    assert find_line_tasks('# just a comment') == []
+    assert find_line_tasks('# todo: do something') == ['Do something']
+    assert find_line_tasks('x = 1  # FIXME') == ['FIXME']
+    assert find_line_tasks('# XXX a # HACK b') == ['A', 'B']
+
+
+def test_task_index(qtbot):
+    """Test that only the blocks changed by an edit are scanned again."""
+    # Use the document of an editor, because documents without a layout
+    # don't emit contentsChange
+    editor = QPlainTextEdit(TEXT)
+    qtbot.addWidget(editor)
+    document = editor.document()
+    flag_index = FlagIndex(document)
+    index = TaskIndex(document, flag_index)
+    assert index.get_tasks() == []
+
+    # The whole document is scanned when enabling the index
+    with qtbot.waitSignal(index.sig_tasks_changed):
+        index.set_enabled(True)
+    assert index.get_tasks() == find_tasks(TEXT)
+    assert flag_index.get('todo') == [1, 2, 4]
+
+    # Insert two lines before the FIXME, one of them with a task
+    cursor = QTextCursor(document.findBlockByNumber(2))
+    with qtbot.waitSignal(index.sig_tasks_changed):
+        cursor.insertText('# BUG new\nz = 3\n')
+    assert index.get_tasks() == [
+        ('First task', 2),
+        ('New', 3),
+        ('FIXME', 5),
+        ('Third', 7),
+        ('Fourth', 7),
+    ]
+    assert flag_index.get('todo') == [1, 2, 4, 6]
+
+    # Typing in a line without tasks doesn't change them
+    cursor = QTextCursor(document.findBlockByNumber(3))
+    with qtbot.assertNotEmitted(index.sig_tasks_changed):
+        cursor.insertText('w = 0; ')
+
+    # Removing the line of a task removes it
+    cursor = QTextCursor(document.findBlockByNumber(1))
+    cursor.setPosition(
+        document.findBlockByNumber(2).position(), QTextCursor.KeepAnchor
+    )
+    with qtbot.waitSignal(index.sig_tasks_changed):
+        cursor.removeSelectedText()
+    assert [line for __, line in index.get_tasks()] == [2, 4, 6, 6]
+
+    # Tasks are removed when disabling the index and not found after that
+    index.set_enabled(False)
+    assert index.get_tasks() == []
+    assert flag_index.get('todo') == []
+    QTextCursor(document).insertText('# TODO\n')
+    assert index.get_tasks() == []
+
+
+def test_set_tasks(qtbot):
+    """Test replacing the tasks of a document."""
+    editor = QPlainTextEdit(TEXT)
+    qtbot.addWidget(editor)
+    document = editor.document()
+    flag_index = FlagIndex(document)
+    index = TaskIndex(document, flag_index)
+
+    index.set_enabled(True)
+    index.set_tasks([('Spam', 1), ('Eggs', 4)])
+    assert index.get_tasks() == [('Spam', 1), ('Eggs', 4)]
+    assert flag_index.get('todo') == [0, 3]
+    assert not document.findBlockByNumber(1).userData().todo
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+"""Tests for wordindex.py"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+from qtpy.QtGui import QTextCursor
+from qtpy.QtWidgets import QPlainTextEdit
+
+# Local imports
+from spyder.plugins.editor.utils.wordindex import WordIndex, index_line
+
+
+def find_in_text(text, word):
+    """Find the occurrences of a word in text without an index."""
+    positions = []
+    for block_number, line in enumerate(text.split('\n')):
+        columns = index_line(line).get(word, [])
+        positions.extend((block_number, column) for column in columns)
+    return positions
+
+
+def test_index_line():
+    """Test that columns are given in UTF-16 code units."""
+    assert index_line('a = b + a') == {'a': [0, 8], 'b': [4]}
+    assert index_line('𨭎 = foo_1 # 𨭎') == {'𨭎': [0, 13], 'foo_1': [5]}
+
+
+@pytest.mark.parametrize('text', ['foo', 'foo_bar2', 'años'])
+def test_is_word(text):
+    assert WordIndex.is_word(text)
+
+
+@pytest.mark.parametrize('text', ['', 'foo bar', 'foo.bar', '(foo'])
+def test_is_not_word(text):
+    assert not WordIndex.is_word(text)
+
+
+def test_word_index_edits(qtbot):
+    """Test that the index is kept up to date when the document changes."""
+    lines = ['foo = bar + 1', 'bar = foo', '', '    return baz, foo']
+
+    # Use the document of an editor, because documents without a layout
+    # don't emit contentsChange
+    editor = QPlainTextEdit('\n'.join(lines * 50))
+    qtbot.addWidget(editor)
+    document = editor.document()
+    index = WordIndex(document)
+
+    assert index.find('foo') == find_in_text(document.toPlainText(), 'foo')
+    assert index.find('bar', 4, 5) == [(4, 6), (5, 0)]
+    assert index.find_blocks('baz') == list(range(3, 200, 4))
+
+    random.seed(0)
+    words = ['foo', 'bar', ' ', '\n', '.', 'foo\nbar', '']
+    for __ in range(200):
+        cursor = QTextCursor(document)
+        position = random.randint(0, document.characterCount() - 1)
+        cursor.setPosition(position)
+        if random.random() < 0.5:
+            end = min(
+                position + random.randint(0, 30),
+                document.characterCount() - 1
+            )
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.insertText(random.choice(words))
+
+        text = document.toPlainText()
+        for word in ['foo', 'bar', 'baz']:
+            assert index.find(word) == find_in_text(text, word)
+
+    # The whole text can be replaced too
+    document.setPlainText('baz\nfoo baz')
+    assert index.find('baz') == [(0, 0), (1, 4)]
+    assert index.find('bar') == []
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the positions of the words in a document.
+"""
+
+# Standard library imports
+import re
+
+# Local imports
+from spyder.plugins.editor.utils.editor import get_changed_blocks
+from spyder.utils.qstringhelpers import qstring_length
+
+
+WORD_REGEXP = re.compile(r'\w+')
+
+
+def index_line(text):
+    """
+    Get the words of a line of text.
+
+    Returns
+    -------
+    dict
+        Mapping of words to the list of columns where they start, in UTF-16
+        code units.
+    """
+    words = {}
+    is_ascii = text.isascii()
+    for match in WORD_REGEXP.finditer(text):
+        start = match.start()
+        if not is_ascii:
+            start = qstring_length(text[:start])
+        words.setdefault(match.group(), []).append(start)
+    return words
+
+
+class WordIndex:
+    """
+    Index of the positions of the words in a QTextDocument.
+
+    The index is built the first time it's queried and is then updated with
+    the blocks that change in the document, so that finding all the
+    occurrences of a word doesn't require searching the whole document.
+    """
+
+    def __init__(self, document):
+        # Words of each block of the document, or None if the index has not
+        # been built yet
+        self._lines = None
+
+        # Revisions of the blocks when they were indexed
+        self._revisions = []
+
+        self._document = document
+        document.contentsChange.connect(self._on_contents_change)
+
+    @staticmethod
+    def is_word(text):
+        """Check if text is a single word, and hence can be searched for."""
+        return WORD_REGEXP.fullmatch(text) is not None
+
+    def find(self, word, first=0, last=None):
+        """
+        Find the occurrences of a word between two blocks (both included).
+
+        Returns
+        -------
+        list of tuple
+            (block number, column) of every occurrence, with columns in UTF-16
+            code units.
+        """
+        lines = self._get_lines()
+        if last is None:
+            last = len(lines) - 1
+
+        positions = []
+        for block_number in range(max(first, 0), min(last + 1, len(lines))):
+            columns = lines[block_number].get(word)
+            if columns is not None:
+                positions.extend(
+                    (block_number, column) for column in columns
+                )
+        return positions
+
+    def find_blocks(self, word):
+        """Get the numbers of the blocks where a word appears."""
+        return [
+            block_number
+            for block_number, words in enumerate(self._get_lines())
+            if word in words
+        ]
+
+    def clear(self):
+        """Drop the index, so that it's built again when needed."""
+        self._lines = None
+        self._revisions = []
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _get_lines(self):
+        """Get the words of each block, building the index if needed."""
+        if self._lines is None:
+            self._lines = []
+            self._revisions = []
+            block = self._document.firstBlock()
+            while block.isValid():
+                self._lines.append(index_line(block.text()))
+                self._revisions.append(block.revision())
+                block = block.next()
+        return self._lines
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Index again the blocks affected by a change in the document."""
+        if self._lines is None:
+            return
+
+        document = self._document
+        delta = document.blockCount() - len(self._lines)
+        changed = get_changed_blocks(
+            document, position, chars_added, len(self._lines)
+        )
+        if changed is None:
+            # The change doesn't match the blocks we know about
+            self.clear()
+            return
+        first_number, last_number, old_last_number = changed
+
+        lines = []
+        revisions = []
+        block = document.findBlockByNumber(first_number)
+        while block.isValid() and block.blockNumber() <= last_number:
+            block_number = block.blockNumber()
+
+            # Format changes (e.g. from the syntax highlighter) also emit
+            # contentsChange, but they don't change the block revision.
+            if (
+                delta == 0
+                and block.revision() == self._revisions[block_number]
+            ):
+                lines.append(self._lines[block_number])
+            else:
+                lines.append(index_line(block.text()))
+
+            revisions.append(block.revision())
+            block = block.next()
+
+        self._lines[first_number:old_last_number + 1] = lines
+        self._revisions[first_number:old_last_number + 1] = revisions
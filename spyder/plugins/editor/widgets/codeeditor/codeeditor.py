@@ -79,8 +79,11 @@
     LineNumberArea, PanelsManager, ScrollFlagArea)
 from spyder.plugins.editor.utils.editor import (TextHelper, BlockUserData,
                                                 get_file_language)
+from spyder.plugins.editor.utils.flagindex import FlagIndex
 from spyder.plugins.editor.utils.kill_ring import QtKillRing
 from spyder.plugins.editor.utils.languages import ALL_LANGUAGES, CELL_LANGUAGES
+from spyder.plugins.editor.utils.taskindex import TaskIndex
+from spyder.plugins.editor.utils.wordindex import WordIndex
 from spyder.plugins.editor.widgets.gotoline import GoToLineDialog
 from spyder.plugins.editor.widgets.base import TextEditBaseWidget
 from spyder.plugins.editor.widgets.codeeditor.inline_completions_mixin import (
@@ -431,7 +434,6 @@ def __init__(
 
         # Indicate occurrences of the selected word
         self.cursorPositionChanged.connect(self._cursor_position_changed)
-        self.__find_first_pos = None
         self.__find_args = {}
 
         self.language = None
@@ -459,7 +461,24 @@ def __init__(
         self.occurrence_timer.setSingleShot(True)
         self.occurrence_timer.setInterval(1500)
         self.occurrence_timer.timeout.connect(self.mark_occurrences)
+
+        # Block numbers with occurrences of the marked text, which is
+        # decorated only in the visible portion of the editor
         self.occurrences = []
+        self._occurrences_text = None
+        self._occurrences_count = 0
+
+        # Index of the words in the document, used to find occurrences
+        self.word_index = WordIndex(self.document())
+
+        # Index of the blocks with errors, warnings, todos and breakpoints,
+        # used to paint them in the scroll flag area
+        self.flag_index = FlagIndex(self.document())
+
+        # Index of the tasks (TODO, FIXME, etc) in the document, updated with
+        # the blocks that change in it
+        self.task_index = TaskIndex(self.document(), self.flag_index, self)
+        self.task_index.sig_tasks_changed.connect(self.sig_flags_changed)
 
         # Update decorations
         self.update_decorations_timer = QTimer(self)
@@ -744,6 +763,11 @@ def get_document_id(self):
     def set_as_clone(self, editor):
         """Set as clone editor"""
         self.setDocument(editor.document())
+        self.word_index = editor.word_index
+        self.flag_index = editor.flag_index
+        self.task_index.sig_tasks_changed.disconnect(self.sig_flags_changed)
+        self.task_index = editor.task_index
+        self.task_index.sig_tasks_changed.connect(self.sig_flags_changed)
         self.document_id = editor.get_document_id()
         self.highlighter = editor.highlighter
         self._rehighlight_timer.timeout.connect(
@@ -1547,28 +1571,36 @@ def scroll_line_up(self):
 
     # ---- Find occurrences
     # -------------------------------------------------------------------------
-    def __find_first(self, text):
-        """Find first occurrence: scan whole document"""
-        flags = QTextDocument.FindCaseSensitively|QTextDocument.FindWholeWords
-        cursor = self.textCursor()
-        # Scanning whole document
-        cursor.movePosition(QTextCursor.Start)
-        regexp = QRegularExpression(
-            r"\b%s\b" % QRegularExpression.escape(text)
-        )
-        cursor = self.document().find(regexp, cursor, flags)
-        self.__find_first_pos = cursor.position()
-        return cursor
+    def _find_occurrences(self, text, first=0, last=None):
+        """
+        Find the occurrences of text between blocks first and last.
 
-    def __find_next(self, text, cursor):
-        """Find next occurrence"""
+        Returns a list of (block number, column) tuples, with columns in
+        UTF-16 code units.
+        """
+        if self.word_index.is_word(text):
+            return self.word_index.find(text, first, last)
+
+        # Only words are indexed, so other text is searched in the document
         flags = QTextDocument.FindCaseSensitively|QTextDocument.FindWholeWords
         regexp = QRegularExpression(
             r"\b%s\b" % QRegularExpression.escape(text)
         )
-        cursor = self.document().find(regexp, cursor, flags)
-        if cursor.position() != self.__find_first_pos:
-            return cursor
+        document = self.document()
+        cursor = QTextCursor(document.findBlockByNumber(first))
+        positions = []
+        while True:
+            cursor = document.find(regexp, cursor, flags)
+            if cursor.isNull():
+                break
+
+            block = document.findBlock(cursor.selectionStart())
+            if last is not None and block.blockNumber() > last:
+                break
+
+            column = cursor.selectionStart() - block.position()
+            positions.append((block.blockNumber(), column))
+        return positions
 
     def _cursor_position_changed(self):
         """Cursor position has changed"""
@@ -1597,6 +1629,8 @@ def _cursor_position_changed(self):
     def clear_occurrences(self):
         """Clear occurrence markers"""
         self.occurrences = []
+        self._occurrences_text = None
+        self._occurrences_count = 0
         self.clear_extra_selections('occurrences')
         self.sig_flags_changed.emit()
 
@@ -1657,36 +1691,45 @@ def mark_occurrences(self):
         ):
             return
 
-        # Highlighting all occurrences of word *text*
-        cursor = self.__find_first(text)
-        self.occurrences = []
-        extra_selections = self.get_extra_selections('occurrences')
-        first_occurrence = None
-        while cursor:
-            block = cursor.block()
-            if not block.userData():
-                # Add user data to check block validity
-                block.setUserData(BlockUserData(self))
-            self.occurrences.append(block)
+        # Flag all occurrences of *text*, but only decorate the visible ones
+        positions = self._find_occurrences(text)
+        self.occurrences = list(dict.fromkeys(
+            block_number for block_number, __ in positions
+        ))
+        self._occurrences_text = text
+        self._occurrences_count = len(positions)
+        self.highlight_visible_occurrences()
+        self.sig_flags_changed.emit()
+
+    def highlight_visible_occurrences(self):
+        """
+        Decorate the occurrences of the marked text in the visible portion of
+        the editor plus a buffer.
+        """
+        text = self._occurrences_text
+        if text is None:
+            return
+
+        first, last = self.get_buffer_block_numbers()
+        length = qstring_length(text)
+        document = self.document()
+        extra_selections = []
+        for block_number, column in self._find_occurrences(text, first, last):
+            position = document.findBlockByNumber(block_number).position()
+            cursor = QTextCursor(document)
+            cursor.setPosition(position + column)
+            cursor.setPosition(
+                position + column + length, QTextCursor.KeepAnchor
+            )
 
             selection = self.get_selection(cursor)
-            if len(selection.cursor.selectedText()) > 0:
-                extra_selections.append(selection)
-                if len(extra_selections) == 1:
-                    first_occurrence = selection
-                else:
-                    selection.format.setBackground(self.occurrence_color)
-                    first_occurrence.format.setBackground(
-                        self.occurrence_color)
-            cursor = self.__find_next(text, cursor)
-        self.set_extra_selections('occurrences', extra_selections)
+            # Only mark the word under the cursor if there are other
+            # occurrences of it
+            if self._occurrences_count > 1:
+                selection.format.setBackground(self.occurrence_color)
+            extra_selections.append(selection)
 
-        if len(self.occurrences) > 1 and self.occurrences[-1] == 0:
-            # XXX: this is never happening with PySide but it's necessary
-            # for PyQt4... this must be related to a different behavior for
-            # the QTextDocument.find function between those two libraries
-            self.occurrences.pop(-1)
-        self.sig_flags_changed.emit()
+        self.set_extra_selections('occurrences', extra_selections)
 
     # ---- Highlight found results
     # -------------------------------------------------------------------------
@@ -2309,6 +2352,8 @@ def update_decorations(self):
         if self.folding_supported and self.code_folding:
             self.highlight_folded_regions()
 
+        self.highlight_visible_occurrences()
+
         # This is required to update decorations whether there are or not
         # underline errors in the visible portion of the screen.
         # See spyder-ide/spyder#14268.
@@ -2528,19 +2573,17 @@ def show_todo(self, line_number, data):
             at_line=line_number,
         )
 
+    def set_tasks_enabled(self, state):
+        """Start or stop finding tasks in the document."""
+        self.task_index.set_enabled(state and self.is_python_or_ipython())
+
+    def get_todo_results(self):
+        """Get the (text, line number) of the tasks in the document."""
+        return self.task_index.get_tasks()
+
     def process_todo(self, todo_results):
         """Process todo finder results"""
-        for data in self.blockuserdata_list():
-            data.todo = ''
-
-        for message, line_number in todo_results:
-            block = self.document().findBlockByNumber(line_number - 1)
-            data = block.userData()
-            if not data:
-                data = BlockUserData(self)
-            data.todo = message
-            block.setUserData(data)
-        self.sig_flags_changed.emit()
+        self.task_index.set_tasks(todo_results)
 
     # ---- Comments/Indentation
     # -------------------------------------------------------------------------
@@ -199,6 +199,10 @@ def __init__(self):
             self.finish_code_analysis)
         self._diagnostics = []
 
+        # Type of flag (error or warning) of the blocks with diagnostics,
+        # which is computed in update_diagnostics_thread
+        self._diagnostics_flags = {}
+
         self.leading_whitespaces = {}
 
         # Other attributes
@@ -678,6 +682,9 @@ def cleanup_code_analysis(self):
         self.clear_extra_selections("code_analysis_underline")
         for data in self.blockuserdata_list():
             data.code_analysis = []
+        self._diagnostics_flags = {}
+        self.flag_index.clear('error')
+        self.flag_index.clear('warning')
 
         self.setUpdatesEnabled(True)
         # When the new code analysis results are empty, it is necessary
@@ -718,6 +725,21 @@ def finish_code_analysis(self):
         self.linenumberarea.update()
         if self.underline_errors_enabled:
             self.underline_errors()
+
+        # This is done here instead of in the thread to avoid changing the
+        # flag index while the document is being edited.
+        if not self.is_cloned:
+            for flag_type in ['error', 'warning']:
+                self.flag_index.set_flags(
+                    flag_type,
+                    [
+                        block_number
+                        for block_number, block_flag_type
+                        in self._diagnostics_flags.items()
+                        if block_flag_type == flag_type
+                    ]
+                )
+
         self.sig_process_code_analysis.emit()
         self.sig_flags_changed.emit()
 
@@ -743,6 +765,8 @@ def _process_code_analysis(self, underline):
         document = self.document()
         if underline:
             first_block, last_block = self.get_buffer_block_numbers()
+        else:
+            diagnostics_flags = {}
 
         for diagnostic in self._diagnostics:
             message = diagnostic.message
@@ -805,8 +829,20 @@ def _process_code_analysis(self, underline):
                     data.code_analysis.append(
                         (source, code, severity, message)
                     )
+
+                    block_nb = block.blockNumber()
+                    if (
+                        severity == lsp.DiagnosticSeverity.Error
+                        or diagnostics_flags.get(block_nb) == 'error'
+                    ):
+                        diagnostics_flags[block_nb] = 'error'
+                    else:
+                        diagnostics_flags[block_nb] = 'warning'
                 block.setUserData(data)
 
+        if not underline:
+            self._diagnostics_flags = diagnostics_flags
+
     # ---- Completion
     # -------------------------------------------------------------------------
     @schedule_request(
@@ -55,11 +55,20 @@ def test_decorations(codeeditor, qtbot):
     cursor.movePosition(QTextCursor.Right, n=5)
     editor.setTextCursor(cursor)
 
-    # Assert number of decorations is the one we expect.
+    # Assert all lines with occurrences are flagged, but only the occurrences
+    # in the visible portion of the editor plus a buffer are decorated.
     qtbot.wait(3000)
     decorations = editor.decorations._sorted_decorations()
 
-    assert len(decorations) == 2 + text.count('some_variable')
+    lines = text.split('\n')
+    assert editor.occurrences == [
+        i for i, line in enumerate(lines) if 'some_variable' in line
+    ]
+
+    first, last = editor.get_buffer_block_numbers()
+    visible_text = '\n'.join(lines[first:last + 1])
+    assert len(decorations) == 2 + visible_text.count('some_variable')
+    assert len(decorations) < 2 + text.count('some_variable')
 
     # Assert that selection 0 is current cell
     assert decorations[0].kind == 'current_cell'
@@ -45,6 +45,7 @@
 from spyder.plugins.editor.api.editorextension import EditorExtension
 from spyder.plugins.editor.api.panel import Panel, PanelPosition
 from spyder.plugins.editor.utils.autosave import AutosaveForStack
+from spyder.plugins.editor.utils.bookmarks import load_bookmarks
 from spyder.plugins.editor.utils.editor import get_file_language
 from spyder.plugins.editor.widgets.codeeditor import CodeEditor
 from spyder.plugins.editor.widgets.editorstack.helpers import (
@@ -331,6 +332,7 @@ def __init__(self, parent, actions, use_switcher=True):
         self.tempfile_path = None
         self.title = _("Editor")
         self.todolist_enabled = True
+        self._current_project_path = None
         self.is_analysis_done = False
         self.linenumbers_enabled = True
         self.blanks_enabled = False
@@ -659,7 +661,7 @@ def create_top_widgets(self):
 
     def hide_tooltip(self):
         """Hide any open tooltips."""
-        for finfo in self.data:
+        for finfo in self.get_loaded_data():
             finfo.editor.hide_tooltip()
 
     @Slot()
@@ -699,7 +701,7 @@ def closeEvent(self, event):
 
         # Remove editor references from the outline explorer settings
         if self.outlineexplorer is not None:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 self.outlineexplorer.remove_editor(finfo.editor.oe_proxy)
 
                 # Delete reference to oe_proxy for cloned editors to prevent it
@@ -708,7 +710,7 @@ def closeEvent(self, event):
                     finfo.editor.oe_proxy.deleteLater()
 
         # Notify the LSP that the file was closed, if necessary.
-        for finfo in self.data:
+        for finfo in self.get_loaded_data():
             if not finfo.editor.is_cloned:
                 finfo.editor.notify_close()
 
@@ -718,6 +720,19 @@ def clone_editor_from(self, other_finfo, set_current):
         fname = other_finfo.filename
         enc = other_finfo.encoding
         new = other_finfo.newly_created
+
+        if not other_finfo.is_loaded:
+            # Clones of lazy files are lazy too, and their editor is created
+            # after the one of the file they are cloned from.
+            self.add_lazy_file(
+                fname,
+                loader=functools.partial(
+                    self._load_lazy_clone, other_finfo=other_finfo
+                ),
+                line=other_finfo.pending_line,
+            )
+            return None
+
         finfo = self.create_new_editor(
             fname,
             enc,
@@ -729,7 +744,6 @@ def clone_editor_from(self, other_finfo, set_current):
             panels=other_finfo.editor.external_panels,
             shortcuts=other_finfo.editor.external_shortcuts,
         )
-        finfo.set_todo_results(other_finfo.todo_results)
         return finfo.editor
 
     def clone_from(self, other):
@@ -809,7 +823,7 @@ def display_help(self, help_text, clicked):
     )
     def on_pyflakes_enabled_change(self, value):
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 if finfo.editor.is_python_like():
                     finfo.editor.pyflakes_linting_enabled = value
 
@@ -837,7 +851,7 @@ def set_title(self, text):
     def set_classfunc_dropdown_visible(self, state):
         self.show_class_func_dropdown = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 if finfo.editor.is_python_like():
                     finfo.editor.classfuncdropdown.setVisible(state)
 
@@ -854,7 +868,7 @@ def has_markers(self):
     def set_todolist_enabled(self, state, current_finfo=None):
         self.todolist_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 self.__update_editor_margins(finfo.editor)
                 finfo.cleanup_todo_results()
                 if state and current_finfo is not None:
@@ -865,21 +879,21 @@ def set_todolist_enabled(self, state, current_finfo=None):
     def set_linenumbers_enabled(self, state, current_finfo=None):
         self.linenumbers_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 self.__update_editor_margins(finfo.editor)
 
     @on_conf_change(option='blank_spaces')
     def set_blanks_enabled(self, state):
         self.blanks_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_blanks_enabled(state)
 
     @on_conf_change(option='scroll_past_end')
     def set_scrollpastend_enabled(self, state):
         self.scrollpastend_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_scrollpastend_enabled(state)
 
     @on_conf_change(option='edge_line')
@@ -887,7 +901,7 @@ def set_edgeline_enabled(self, state):
         logger.debug(f"Set edge line to {state}")
         self.edgeline_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.edge_line.set_enabled(state)
 
     @on_conf_change(
@@ -899,42 +913,42 @@ def set_edgeline_columns(self, columns):
         logger.debug(f"Set edge line columns to {columns}")
         self.edgeline_columns = columns
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.edge_line.set_columns(columns)
 
     @on_conf_change(option='indent_guides')
     def set_indent_guides(self, state):
         self.indent_guides = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_identation_guides(state)
 
     @on_conf_change(option='close_parentheses')
     def set_close_parentheses_enabled(self, state):
         self.close_parentheses_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_close_parentheses_enabled(state)
 
     @on_conf_change(option='close_quotes')
     def set_close_quotes_enabled(self, state):
         self.close_quotes_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_close_quotes_enabled(state)
 
     @on_conf_change(option='add_colons')
     def set_add_colons_enabled(self, state):
         self.add_colons_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_add_colons_enabled(state)
 
     @on_conf_change(option='auto_unindent')
     def set_auto_unindent_enabled(self, state):
         self.auto_unindent_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_auto_unindent_enabled(state)
 
     @on_conf_change(option='indent_chars')
@@ -942,14 +956,14 @@ def set_indent_chars(self, indent_chars):
         indent_chars = indent_chars[1:-1]  # removing the leading/ending '*'
         self.indent_chars = indent_chars
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_indent_chars(indent_chars)
 
     @on_conf_change(option='tab_stop_width_spaces')
     def set_tab_stop_width_spaces(self, tab_stop_width_spaces):
         self.tab_stop_width_spaces = tab_stop_width_spaces
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.tab_stop_width_spaces = tab_stop_width_spaces
                 finfo.editor.update_tab_stop_width_spaces()
 
@@ -961,13 +975,13 @@ def set_default_font(self, font, color_scheme=None):
         if color_scheme is not None:
             self.color_scheme = color_scheme
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_font(font, color_scheme)
 
     def set_color_scheme(self, color_scheme):
         self.color_scheme = color_scheme
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_color_scheme(color_scheme)
 
                 # Update the most important extra selections so new color
@@ -987,28 +1001,28 @@ def set_color_scheme(self, color_scheme):
     def set_wrap_enabled(self, state):
         self.wrap_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_wrap_mode(state)
 
     @on_conf_change(option='tab_always_indent')
     def set_tabmode_enabled(self, state):
         self.tabmode_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_tab_mode(state)
 
     @on_conf_change(option='strip_trailing_spaces_on_modify')
     def set_stripmode_enabled(self, state):
         self.stripmode_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_strip_mode(state)
 
     @on_conf_change(option='intelligent_backspace')
     def set_intelligent_backspace_enabled(self, state):
         self.intelligent_backspace_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_intelligent_backspace(state)
 
     @on_conf_change(option='enable_code_snippets', section='completions')
@@ -1016,14 +1030,14 @@ def set_code_snippets_enabled(self, state):
         logger.debug(f"Set code snippets to {state}")
         self.code_snippets_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_code_snippets(state)
 
     @on_conf_change(option='code_folding')
     def set_code_folding_enabled(self, state):
         self.code_folding_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_code_folding(state)
 
     @on_conf_change(option='automatic_completions')
@@ -1031,7 +1045,7 @@ def set_automatic_completions_enabled(self, state):
         logger.debug(f"Set automatic completions to {state}")
         self.automatic_completions_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_automatic_completions(state)
 
     @on_conf_change(option='automatic_completions_after_chars')
@@ -1039,7 +1053,7 @@ def set_automatic_completions_after_chars(self, chars):
         logger.debug(f"Set chars for automatic completions to {chars}")
         self.automatic_completion_chars = chars
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_automatic_completions_after_chars(chars)
 
     @on_conf_change(option='completions_hint')
@@ -1047,7 +1061,7 @@ def set_completions_hint_enabled(self, state):
         logger.debug(f"Set completions hint to {state}")
         self.completions_hint_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_completions_hint(state)
 
     @on_conf_change(option='completions_hint_after_ms')
@@ -1055,7 +1069,7 @@ def set_completions_hint_after_ms(self, ms):
         logger.debug(f"Set completions hint after {ms} ms")
         self.completions_hint_after_ms = ms
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_completions_hint_after_ms(ms)
 
     @on_conf_change(
@@ -1067,7 +1081,7 @@ def set_hover_hints_enabled(self, state):
         logger.debug(f"Set hover hints to {state}")
         self.hover_hints_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_hover_hints(state)
 
     @on_conf_change(
@@ -1078,21 +1092,21 @@ def set_format_on_save(self, state):
         logger.debug(f"Set format on save to {state}")
         self.format_on_save = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_format_on_save(state)
 
     @on_conf_change(option='occurrence_highlighting')
     def set_occurrence_highlighting_enabled(self, state):
         self.occurrence_highlighting_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_occurrence_highlighting(state)
 
     @on_conf_change(option='occurrence_highlighting/timeout')
     def set_occurrence_highlighting_timeout(self, timeout):
         self.occurrence_highlighting_timeout = timeout
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_occurrence_timeout(timeout)
 
     @on_conf_change(option='underline_errors')
@@ -1100,21 +1114,21 @@ def set_underline_errors_enabled(self, state):
         logger.debug(f"Set underline errors to {state}")
         self.underline_errors_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_underline_errors_enabled(state)
 
     @on_conf_change(option='highlight_current_line')
     def set_highlight_current_line_enabled(self, state):
         self.highlight_current_line_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_highlight_current_line(state)
 
     @on_conf_change(option='highlight_current_cell')
     def set_highlight_current_cell_enabled(self, state):
         self.highlight_current_cell_enabled = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_highlight_current_cell(state)
 
     def set_checkeolchars_enabled(self, state):
@@ -1124,21 +1138,21 @@ def set_checkeolchars_enabled(self, state):
     def set_always_remove_trailing_spaces(self, state):
         self.always_remove_trailing_spaces = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_remove_trailing_spaces(state)
 
     @on_conf_change(option='add_newline')
     def set_add_newline(self, state):
         self.add_newline = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_add_newline(state)
 
     @on_conf_change(option='always_remove_trailing_newlines')
     def set_remove_trailing_newlines(self, state):
         self.remove_trailing_newlines = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_remove_trailing_newlines(state)
 
     @on_conf_change(option='convert_eol_on_save')
@@ -1156,14 +1170,14 @@ def set_multicursor_support(self, state):
         """If `state` is `True`, multi-cursor editing is enabled."""
         self.multicursor_support = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.toggle_multi_cursor(state)
 
     @on_conf_change(option='mouse_shortcuts')
     def set_mouse_shortcuts(self, state):
         self.mouse_shortcuts = state
         if self.data:
-            for finfo in self.data:
+            for finfo in self.get_loaded_data():
                 finfo.editor.set_mouse_shortcuts(state)
 
     def set_current_project_path(self, root_path=None):
@@ -1175,7 +1189,8 @@ def set_current_project_path(self, root_path=None):
         root_path: str or None, optional
             Path to current project root path. Default is None.
         """
-        for finfo in self.data:
+        self._current_project_path = root_path
+        for finfo in self.get_loaded_data():
             finfo.editor.set_current_project_path(root_path)
 
     # ---- Stacked widget management
@@ -1187,7 +1202,21 @@ def get_current_finfo(self):
             return self.data[self.get_stack_index()]
 
     def get_current_editor(self):
-        return self.tabs.currentWidget()
+        editor = self.tabs.currentWidget()
+        if editor is not None and not isinstance(editor, CodeEditor):
+            # This is the placeholder of a lazy file, so its editor needs to
+            # be created.
+            editor = self.data[self.get_stack_index()].editor
+        return editor
+
+    def get_loaded_data(self):
+        """
+        Return the FileInfo of the files whose editor was created.
+
+        This is used to apply options to editors, because the ones of lazy
+        files take them from the editorstack when they are created.
+        """
+        return [finfo for finfo in self.data if finfo.is_loaded]
 
     def get_stack_count(self):
         return self.tabs.count()
@@ -1241,12 +1270,15 @@ def get_tab_tip(self, filename, is_modified=None, is_readonly=None):
             return text % (osp.basename(filename), osp.dirname(filename))
 
     def add_to_data(self, finfo, set_current, add_where='end'):
-        finfo.editor.oe_proxy = None
+        if finfo.is_loaded:
+            finfo.editor.oe_proxy = None
+            widget = finfo.editor
+        else:
+            widget = finfo.placeholder
         index = 0 if add_where == 'start' else len(self.data)
         self.data.insert(index, finfo)
         index = self.data.index(finfo)
-        editor = finfo.editor
-        self.tabs.insertTab(index, editor, self.get_tab_text(index))
+        self.tabs.insertTab(index, widget, self.get_tab_text(index))
         self.set_stack_title(index, False)
         if set_current:
             self.set_stack_index(index)
@@ -1264,7 +1296,8 @@ def __repopulate_stack(self):
             index = self.data.index(finfo)
             tab_text = self.get_tab_text(index, is_modified)
             tab_tip = self.get_tab_tip(finfo.filename)
-            index = self.tabs.addTab(finfo.editor, tab_text)
+            widget = finfo.editor if finfo.is_loaded else finfo.placeholder
+            index = self.tabs.addTab(widget, tab_text)
             self.tabs.setTabToolTip(index, tab_tip)
         self.tabs.blockSignals(False)
 
@@ -1326,7 +1359,7 @@ def set_stack_title(self, index, is_modified):
         finfo = self.data[index]
         fname = finfo.filename
         is_modified = (is_modified or finfo.newly_created) and not finfo.default
-        is_readonly = finfo.editor.isReadOnly()
+        is_readonly = finfo.editor.isReadOnly() if finfo.is_loaded else None
         tab_text = self.get_tab_text(index, is_modified, is_readonly)
         tab_tip = self.get_tab_tip(fname, is_modified, is_readonly)
 
@@ -1651,33 +1684,42 @@ def close_file(self, index=None, force=False):
                  and can_close_file)
         if is_ok:
             finfo = self.data[index]
+            is_loaded = finfo.is_loaded
             self.threadmanager.close_threads(finfo)
             # Removing editor reference from outline explorer settings:
-            if self.outlineexplorer is not None:
+            if self.outlineexplorer is not None and is_loaded:
                 self.outlineexplorer.remove_editor(finfo.editor.oe_proxy)
 
             filename = self.data[index].filename
             self.remove_from_data(index)
-            editor = finfo.editor
-            editor.notify_close()
-            editor.setParent(None)
-            editor.completion_widget.setParent(None)
-
-            # Explicitly schedule the C++ objects for deletion. This is
-            # necessary on PySide because signal connections there hold
-            # strong, GC-invisible references to lambda/closure slots, so
-            # these widgets would otherwise never be garbage-collected, i.e.
-            # leak, because the C++ side is only destroyed with the Python
-            # wrapper.
-            editor.deleteLater()
-            editor.completion_widget.deleteLater()
+            if is_loaded:
+                editor = finfo.editor
+                editor.notify_close()
+                editor.setParent(None)
+                editor.completion_widget.setParent(None)
+
+                # Explicitly schedule the C++ objects for deletion. This is
+                # necessary on PySide because signal connections there hold
+                # strong, GC-invisible references to lambda/closure slots, so
+                # these widgets would otherwise never be garbage-collected,
+                # i.e. leak, because the C++ side is only destroyed with the
+                # Python wrapper.
+                editor.deleteLater()
+                editor.completion_widget.deleteLater()
+            else:
+                # Lazy files only have a placeholder, and their editor must
+                # not be created after closing them.
+                finfo.placeholder.deleteLater()
+                finfo.placeholder = None
+                finfo.set_loader(None)
 
             # We pass self object ID as a QString, because otherwise it would
             # depend on the platform: long for 64bit, int for 32bit. Replacing
             # by long all the time is not working on some 32bit platforms.
             # See spyder-ide/spyder#1094 and spyder-ide/spyder#1098.
             self.sig_close_file.emit(str(id(self)), filename)
-            self.sig_codeeditor_deleted.emit(editor)
+            if is_loaded:
+                self.sig_codeeditor_deleted.emit(editor)
 
             self.opened_files_list_changed.emit()
             self.sig_update_code_analysis_actions.emit()
@@ -1705,6 +1747,7 @@ def close_file(self, index=None, force=False):
 
             if finfo.filename in self.autosave.file_hashes:
                 del self.autosave.file_hashes[finfo.filename]
+            self.autosave.file_revisions.pop(finfo.filename, None)
 
         if self.get_stack_count() == 0 and self.create_new_file_if_empty:
             self.sig_new_file[()].emit()
@@ -1725,23 +1768,23 @@ def register_completion_capabilities(self, capabilities, language):
             Programming language for the language server (it has to be
             in small caps).
         """
-        for index in range(self.get_stack_count()):
-            editor = self.tabs.widget(index)
+        for finfo in self.get_loaded_data():
+            editor = finfo.editor
             if editor.language.lower() == language:
                 editor.register_completion_capabilities(capabilities)
 
     def start_completion_services(self, language):
         """Notify language server availability to code editors."""
-        for index in range(self.get_stack_count()):
-            editor = self.tabs.widget(index)
+        for finfo in self.get_loaded_data():
+            editor = finfo.editor
             if editor.language.lower() == language:
                 editor.start_completion_services()
 
     def stop_completion_services(self, language):
         """Notify language server unavailability to code editors."""
         try:
-            for index in range(self.get_stack_count()):
-                editor = self.tabs.widget(index)
+            for finfo in self.get_loaded_data():
+                editor = finfo.editor
                 if editor.language.lower() == language:
                     editor.stop_completion_services()
         except RuntimeError:
@@ -1828,13 +1871,18 @@ def save_if_changed(self, cancelable=False, index=None):
             buttons |= QMessageBox.Cancel
         unsaved_nb = 0
         for index in indexes:
-            if self.data[index].editor.document().isModified():
+            if self.data[index].is_modified():
                 unsaved_nb += 1
         if not unsaved_nb:
             # No file to save
             return True
         yes_all = no_all = False
         for index in indexes:
+            # Lazy files can't have changes, so there's no need to create
+            # their editors by making them current.
+            if index < len(self.data) and not self.data[index].is_loaded:
+                continue
+
             self.set_stack_index(index)
 
             # Prevent error when trying to remove several unsaved files from
@@ -1850,10 +1898,7 @@ def save_if_changed(self, cancelable=False, index=None):
                     return False
             elif no_all:
                 self.autosave.remove_autosave_file(finfo)
-            elif (
-                finfo.editor.document().isModified()
-                and self.save_dialog_on_tests
-            ):
+            elif finfo.is_modified() and self.save_dialog_on_tests:
                 if unsaved_nb > 1:
                     buttons |= QMessageBox.YesToAll | QMessageBox.NoToAll
 
@@ -2221,7 +2266,7 @@ def save_all(self, save_new_files=True):
         """
         all_saved = True
         for index in range(self.get_stack_count()):
-            if self.data[index].editor.document().isModified():
+            if self.data[index].is_modified():
                 all_saved &= self.save(index, save_new_files=save_new_files)
         return all_saved
 
@@ -2243,13 +2288,6 @@ def analyze_script(self, index=None):
                 finfo.run_todo_finder()
         self.is_analysis_done = True
 
-    def set_todo_results(self, filename, todo_results):
-        """Synchronize todo results between editorstacks"""
-        index = self.has_filename(filename)
-        if index is None:
-            return
-        self.data[index].set_todo_results(todo_results)
-
     def get_todo_results(self):
         if self.data:
             return self.data[self.get_stack_index()].todo_results
@@ -2325,7 +2363,7 @@ def tab_navigation_mru(self, forward=True):
     def focus_changed(self):
         """Editor focus has changed"""
         fwidget = QApplication.focusWidget()
-        for finfo in self.data:
+        for finfo in self.get_loaded_data():
             if fwidget is finfo.editor:
                 if finfo.editor.operation_in_progress:
                     self.spinner.start()
@@ -2363,7 +2401,8 @@ def _sync_outlineexplorer_file_order(self):
         """
         if self.outlineexplorer is not None:
             self.outlineexplorer.treewidget.set_editor_ids_order(
-                [finfo.editor.get_document_id() for finfo in self.data])
+                [finfo.editor.get_document_id()
+                 for finfo in self.get_loaded_data()])
 
     def __refresh_statusbar(self, index):
         """Refreshing statusbar widgets"""
@@ -2489,7 +2528,7 @@ def __check_file_status(self, index):
 
     def __modify_stack_title(self):
         for index, finfo in enumerate(self.data):
-            state = finfo.editor.document().isModified()
+            state = finfo.is_modified()
             self.set_stack_title(index, state)
 
     def refresh(self, index=None):
@@ -2536,7 +2575,7 @@ def modification_changed(self, state=None, index=None, editor_id=None):
         """
         if editor_id is not None:
             for index, _finfo in enumerate(self.data):
-                if id(_finfo.editor) == editor_id:
+                if _finfo.is_loaded and id(_finfo.editor) == editor_id:
                     break
 
         # This must be done before refreshing save/save all actions:
@@ -2643,16 +2682,60 @@ def create_new_editor(
         Create a new editor instance
         Returns finfo object (instead of editor as in previous releases)
         """
+        editor = self._create_code_editor(extensions, panels, shortcuts)
+        finfo = FileInfo(fname, enc, editor, new, self.threadmanager)
+
+        self.add_to_data(finfo, set_current, add_where)
+        self._connect_file_info(finfo)
+        self._setup_editor(finfo, txt, cloned_from)
+
+        if self.get_stack_index() == 0:
+            self.current_changed(0)
+
+        return finfo
+
+    def add_lazy_file(self, fname, loader, add_where="end", line=None):
+        """
+        Add a tab for a file whose editor is created only when it's needed.
+
+        Parameters
+        ----------
+        fname: str
+            Name of the file.
+        loader: callable
+            Function that creates the editor of the file, which receives its
+            FileInfo.
+        add_where: str, optional
+            Where to add the tab ("start" or "end").
+        line: int, optional
+            Line to go to when the editor is created.
+
+        Returns
+        -------
+        FileInfo
+            The FileInfo of the file, which only has a placeholder widget.
+        """
+        finfo = FileInfo(fname, None, None, False, self.threadmanager, loader)
+        finfo.pending_line = line
+        finfo.placeholder = QWidget(self)
+
+        self.add_to_data(finfo, False, add_where)
+        self._connect_file_info(finfo)
+        self.opened_files_list_changed.emit()
+        return finfo
+
+    def _create_code_editor(self, extensions, panels, shortcuts):
+        """Create a CodeEditor instance."""
         editor = CodeEditor(
             self, extensions=extensions, panels=panels, shortcuts=shortcuts
         )
         editor.go_to_definition.connect(
             lambda fname, line, column: self.sig_go_to_definition.emit(
                 fname, line, column))
+        return editor
 
-        finfo = FileInfo(fname, enc, editor, new, self.threadmanager)
-
-        self.add_to_data(finfo, set_current, add_where)
+    def _connect_file_info(self, finfo):
+        """Connect the signals of a FileInfo to the editorstack."""
         finfo.sig_send_to_help.connect(self.send_to_help)
         finfo.sig_show_object_info.connect(self.inspect_current_object)
         finfo.todo_results_changed.connect(self.todo_results_changed)
@@ -2660,11 +2743,19 @@ def create_new_editor(
                                 self.edit_goto.emit(fname, lineno, name))
         finfo.sig_save_bookmarks.connect(lambda s1, s2:
                                          self.sig_save_bookmarks.emit(s1, s2))
+        finfo.text_changed_at.connect(
+            lambda fname, positions:
+            self.text_changed_at.emit(fname, positions))
+
+    def _setup_editor(self, finfo, txt, cloned_from):
+        """Set up the editor of a file and connect its signals."""
+        editor = finfo.editor
         editor.sig_new_file.connect(self.sig_new_file)
         editor.sig_process_code_analysis.connect(
             self.sig_update_code_analysis_actions)
         editor.sig_refresh_formatting.connect(self.refresh_formatting)
         editor.sig_save_requested.connect(self.save)
+        fname = finfo.filename
         language = get_file_language(fname, txt)
         editor.setup_editor(
             linenumbers=self.linenumbers_enabled,
@@ -2713,9 +2804,6 @@ def create_new_editor(
         if cloned_from is None:
             editor.set_text(txt)
             editor.document().setModified(False)
-        finfo.text_changed_at.connect(
-            lambda fname, positions:
-            self.text_changed_at.emit(fname, positions))
         editor.sig_cursor_position_changed.connect(
             self.editor_cursor_position_changed)
         editor.textChanged.connect(self.start_stop_analysis_timer)
@@ -2771,10 +2859,78 @@ def create_new_editor(
         }
         self.sig_open_file.emit(options)
         self.sig_codeeditor_created.emit(editor)
-        if self.get_stack_index() == 0:
-            self.current_changed(0)
 
-        return finfo
+    def _create_lazy_editor(
+        self, finfo, txt, cloned_from, extensions, panels, shortcuts
+    ):
+        """Create the editor of a lazy file and put it in its tab."""
+        editor = self._create_code_editor(extensions, panels, shortcuts)
+        finfo.set_editor(editor)
+
+        # Replace the placeholder of the file with its editor, without
+        # changing the current tab.
+        placeholder = finfo.placeholder
+        finfo.placeholder = None
+        index = self.data.index(finfo)
+        current_index = self.get_stack_index()
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, editor, self.get_tab_text(index))
+        self.tabs.setCurrentIndex(current_index)
+        self.tabs.blockSignals(False)
+        self.stack_history.replace_widget(placeholder, editor)
+        placeholder.deleteLater()
+
+        self._setup_editor(finfo, txt, cloned_from)
+        self.set_stack_title(index, False)
+        self.tabs.refresh_style()
+
+        if self._current_project_path is not None:
+            editor.set_current_project_path(self._current_project_path)
+
+    def _load_lazy_file(self, finfo, extensions, panels, shortcuts):
+        """Read a lazy file from disk and create its editor."""
+        filename = finfo.filename
+        try:
+            text, enc = encoding.read(filename)
+        except Exception:
+            # The file could have been removed since it was added, which is
+            # checked when its tab is refreshed.
+            logger.debug(f"Error reading lazy file {filename}", exc_info=True)
+            text, enc = "", "utf-8"
+
+        finfo.encoding = enc
+        finfo.lastmodified = QFileInfo(filename).lastModified()
+        self.autosave.file_hashes[filename] = hash(text)
+        self._create_lazy_editor(
+            finfo, text, None, extensions, panels, shortcuts
+        )
+
+        slots = self.get_conf('bookmarks', default={})
+        finfo.editor.set_bookmarks(load_bookmarks(filename, slots))
+        self._after_file_loaded(finfo, text)
+
+        if finfo.pending_line is not None:
+            finfo.editor.go_to_line(finfo.pending_line)
+            finfo.pending_line = None
+
+    def _load_lazy_clone(self, finfo, other_finfo):
+        """Create the editor of a lazy clone of `other_finfo`."""
+        # This creates the editor of other_finfo if it's lazy too
+        other_editor = other_finfo.editor
+        finfo.encoding = other_finfo.encoding
+        self._create_lazy_editor(
+            finfo,
+            "",
+            other_editor,
+            other_editor.external_extensions,
+            other_editor.external_panels,
+            other_editor.external_shortcuts,
+        )
+
+        if finfo.pending_line is not None:
+            finfo.editor.go_to_line(finfo.pending_line)
+            finfo.pending_line = None
 
     def editor_cursor_position_changed(self, line, index):
         """Cursor position of one of the editor in the stack has changed"""
@@ -2856,14 +3012,37 @@ def load(
         shortcuts: (
             list[tuple[str, Callable[[CodeEditor], None], str]] | None
         ) = None,
+        lazy: bool = False,
+        line: int | None = None,
     ):
         """
         Load filename, create an editor instance and return it.
 
         This also sets the hash of the loaded file in the autosave component.
+
+        If `lazy` is True, the file is only added as a tab and it's read and
+        its editor created when it's needed (e.g. when its tab is activated),
+        after which it goes to `line`. That's used to restore sessions with
+        many files quickly.
         """
         filename = osp.abspath(str(filename))
 
+        if lazy:
+            if not osp.isfile(filename):
+                return
+
+            return self.add_lazy_file(
+                filename,
+                loader=functools.partial(
+                    self._load_lazy_file,
+                    extensions=extensions,
+                    panels=panels,
+                    shortcuts=shortcuts,
+                ),
+                add_where=add_where,
+                line=line,
+            )
+
         if processevents:
             self.starting_long_process.emit(_("Loading %s...") % filename)
 
@@ -2890,11 +3069,18 @@ def load(
             panels=panels,
             shortcuts=shortcuts,
         )
-        index = self.data.index(finfo)
 
         if processevents:
             self.ending_long_process.emit("")
 
+        self._after_file_loaded(finfo, text)
+        return finfo
+
+    def _after_file_loaded(self, finfo, text):
+        """Check and analyze a file after its editor was created."""
+        filename = finfo.filename
+        index = self.data.index(finfo)
+
         # Fix mixed EOLs
         if (
             self.isVisible() and self.checkeolchars_enabled
@@ -2926,8 +3112,6 @@ def load(
         if self.highlight_current_line_enabled:
             finfo.editor.highlight_current_line()
 
-        return finfo
-
     def set_os_eol_chars(self, index=None, osname=None):
         """
         Sets the EOL character(s) based on the operating system.
@@ -6,7 +6,7 @@
 
 # Standard library imports
 from __future__ import annotations
-from collections.abc import MutableSequence
+from collections.abc import Callable, MutableSequence
 import logging
 from typing import TYPE_CHECKING
 
@@ -14,9 +14,6 @@
 from qtpy.QtCore import Signal, QFileInfo, QObject, QTimer, QThread
 from qtpy.QtWidgets import QApplication
 
-# Local imports
-from spyder.plugins.editor.utils.findtasks import find_tasks
-
 
 if TYPE_CHECKING:
     from spyder.plugins.editor.widgets.codeeditor import CodeEditor
@@ -123,7 +120,14 @@ def update_queue(self):
 
 
 class FileInfo(QObject):
-    """File properties."""
+    """
+    File properties.
+
+    Files restored from a previous session can be added without an editor,
+    which is created by calling `loader` the first time it's accessed (e.g.
+    when its tab is activated). Until then, `placeholder` is shown in its
+    tab instead.
+    """
 
     todo_results_changed = Signal()
     sig_save_bookmarks = Signal(str, str)
@@ -138,9 +142,10 @@ def __init__(
         self,
         filename: str,
         encoding: str,
-        editor: "CodeEditor",
+        editor: "CodeEditor" | None,
         new: bool,
         threadmanager: ThreadManager,
+        loader: Callable[["FileInfo"], None] | None = None,
     ):
         """Initialize the FileInfo."""
         QObject.__init__(self)
@@ -150,14 +155,46 @@ def __init__(
         self.newly_created = new
         self.default = False      # Default untitled file
         self.encoding = encoding
-        self.editor = editor
         self.path = []
 
+        # Function that creates the editor of a lazy file and sets it with
+        # `set_editor`, and widget shown in its tab until then
+        self._editor = None
+        self._loader = loader
+        self.placeholder = None
+
+        # Line to go to when the editor of a lazy file is created
+        self.pending_line = None
+
         self.classes = (filename, None, None)
-        self.todo_results = []
         self.lastmodified = QFileInfo(filename).lastModified()
 
+        if editor is not None:
+            self.set_editor(editor)
+
+    @property
+    def editor(self):
+        """Editor of the file, which is created if it's not loaded yet."""
+        if self._editor is None and self._loader is not None:
+            loader, self._loader = self._loader, None
+            loader(self)
+        return self._editor
+
+    @property
+    def is_loaded(self):
+        """Whether the editor of the file was created."""
+        return self._editor is not None
+
+    def set_loader(self, loader):
+        """Set the function that creates the editor of a lazy file."""
+        self._loader = loader
+
+    def set_editor(self, editor):
+        """Set the editor of the file."""
+        self._editor = editor
         self.editor.textChanged.connect(self.text_changed)
+        self.editor.task_index.sig_tasks_changed.connect(
+            self.todo_results_changed)
         self.editor.sig_bookmarks_changed.connect(self.bookmarks_changed)
         self.editor.sig_show_object_info.connect(self.sig_show_object_info)
         self.editor.sig_show_completion_object_info.connect(
@@ -173,7 +210,8 @@ def filename(self):
     def filename(self, value):
         """Filename setter."""
         self._filename = value
-        self.editor.filename = value
+        if self.is_loaded:
+            self.editor.filename = value
         self.sig_filename_changed.emit(value)
 
     def text_changed(self):
@@ -187,26 +225,33 @@ def get_source_code(self):
         """Return associated editor source code."""
         return str(self.editor.toPlainText())
 
+    def is_modified(self):
+        """Whether the file has unsaved changes."""
+        return self.is_loaded and self.editor.document().isModified()
+
+    def get_cursor_line_number(self):
+        """Return the line of the cursor, without loading the file."""
+        if self.is_loaded:
+            return self.editor.get_cursor_line_number()
+        return self.pending_line if self.pending_line is not None else 1
+
+    @property
+    def todo_results(self):
+        """TODO finder results, read from the blocks of the editor."""
+        return self.editor.get_todo_results()
+
     def run_todo_finder(self):
-        """Run TODO finder."""
-        if self.editor.is_python_or_ipython():
-            self.threadmanager.add_thread(find_tasks,
-                                          self.todo_finished,
-                                          self.get_source_code(), self)
-
-    def todo_finished(self, results):
-        """Code analysis thread has finished."""
-        self.set_todo_results(results)
-        self.todo_results_changed.emit()
-
-    def set_todo_results(self, results):
-        """Set TODO results and update markers in editor."""
-        self.todo_results = results
-        self.editor.process_todo(results)
+        """
+        Run TODO finder.
+
+        The whole file is only scanned the first time. After that, the
+        editor finds tasks again in the blocks that change.
+        """
+        self.editor.set_tasks_enabled(True)
 
     def cleanup_todo_results(self):
         """Clean-up TODO finder results."""
-        self.todo_results = []
+        self.editor.set_tasks_enabled(False)
 
     def bookmarks_changed(self):
         """Bookmarks list has changed."""
@@ -278,6 +323,13 @@ def remove(self, tab_index):
         if _id in self.history:
             self.history.remove(_id)
 
+    def replace_widget(self, old_widget, new_widget):
+        """Replace the entries of a widget by another one's."""
+        self.history = [
+            id(new_widget) if _id == id(old_widget) else _id
+            for _id in self.history
+        ]
+
     def remove_and_append(self, index):
         """Remove previous entrances of a tab, and add it as the latest."""
         while index in self:
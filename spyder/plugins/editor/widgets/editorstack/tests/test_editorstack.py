@@ -758,7 +758,7 @@ def test_autosave_all(editor_bot, mocker):
     assert actual_calls == expected_calls
 
 
-def test_maybe_autosave(editor_bot):
+def test_maybe_autosave(editor_bot, qtbot):
     """
     Test that maybe_autosave() saves text to correct autosave file if contents
     are changed.
@@ -767,6 +767,9 @@ def test_maybe_autosave(editor_bot):
     editor.set_text('spam\n')
     editor_stack.autosave.maybe_autosave(0)
     autosave_filename = os.path.join(get_conf_path('autosave'), 'foo.py')
+
+    # The file is written in a background thread
+    qtbot.waitUntil(lambda: os.path.isfile(autosave_filename))
     assert open(autosave_filename).read() == 'spam\n'
     os.remove(autosave_filename)
 
@@ -781,23 +784,44 @@ def test_maybe_autosave_saves_only_if_changed(editor_bot, mocker):
     call #3 should not autosave.
     """
     editor_stack, editor = editor_bot
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_write = mocker.patch.object(editor_stack.autosave.writer, 'write')
     editor_stack.autosave.maybe_autosave(0)  # call #1, should not write
-    assert editor_stack._write_to_file.call_count == 0
+    assert mock_write.call_count == 0
     editor.set_text('ham\n')
     editor_stack.autosave.maybe_autosave(0)  # call #2, should write
-    assert editor_stack._write_to_file.call_count == 1
+    assert mock_write.call_count == 1
     editor_stack.autosave.maybe_autosave(0)  # call #3, should not write
-    assert editor_stack._write_to_file.call_count == 1
+    assert mock_write.call_count == 1
+
+
+def test_maybe_autosave_skips_unchanged_documents(editor_bot, mocker):
+    """
+    Test that maybe_autosave() doesn't get the text of documents whose
+    revision didn't change since they were last checked.
+    """
+    editor_stack, editor = editor_bot
+    mocker.patch.object(editor_stack.autosave.writer, 'write')
+    editor.set_text('ham\n')
+    mock_get_text = mocker.spy(editor, 'get_text_with_eol')
+
+    editor_stack.autosave.maybe_autosave(0)
+    editor_stack.autosave.maybe_autosave(0)
+    assert mock_get_text.call_count == 1
+
+    # Setting the same text again makes a new revision of the document, so
+    # it's checked again
+    editor.set_text('ham\n')
+    editor_stack.autosave.maybe_autosave(0)
+    assert mock_get_text.call_count == 2
 
 
 def test_maybe_autosave_does_not_save_new_files(editor_bot, mocker):
     """Test that maybe_autosave() does not save newly created files."""
     editor_stack, editor = editor_bot
     editor_stack.data[0].newly_created = True
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_write = mocker.patch.object(editor_stack.autosave.writer, 'write')
     editor_stack.autosave.maybe_autosave(0)
-    editor_stack._write_to_file.assert_not_called()
+    mock_write.assert_not_called()
 
 
 def test_opening_sets_file_hash(base_editor_bot, mocker):
@@ -836,6 +860,42 @@ def test_closing_removes_file_hash(base_editor_bot, mocker):
     assert editor_stack.autosave.file_hashes == {}
 
 
+def test_lazy_load(base_editor_bot, qtbot, tmpdir):
+    """Test that the editors of lazy files are created when needed."""
+    editor_stack = base_editor_bot
+    spam = tmpdir.join('spam.py')
+    spam.write('spam = 1\n')
+    ham = tmpdir.join('ham.py')
+    ham.write('ham = 1\nham = 2\nham = 3\n')
+
+    editor_stack.load(str(spam))
+    finfo = editor_stack.load(str(ham), lazy=True, line=3)
+
+    # The file is only added as a tab
+    assert not finfo.is_loaded
+    assert editor_stack.get_filenames() == [str(spam), str(ham)]
+    assert editor_stack.tabs.widget(1) is finfo.placeholder
+    assert finfo.get_cursor_line_number() == 3
+    assert str(ham) not in editor_stack.autosave.file_hashes
+
+    # Activating its tab creates its editor and goes to its line
+    editor_stack.set_stack_index(1)
+    assert finfo.is_loaded
+    assert editor_stack.tabs.widget(1) is finfo.editor
+    assert editor_stack.get_current_editor() is finfo.editor
+    assert finfo.editor.toPlainText() == 'ham = 1\nham = 2\nham = 3\n'
+    assert finfo.editor.get_cursor_line_number() == 3
+    assert editor_stack.autosave.file_hashes[str(ham)] == hash(ham.read())
+
+    # Closing a lazy file doesn't create its editor
+    eggs = tmpdir.join('eggs.py')
+    eggs.write('eggs = 1\n')
+    finfo = editor_stack.load(str(eggs), lazy=True)
+    editor_stack.close_file(2)
+    assert not finfo.is_loaded
+    assert editor_stack.get_filenames() == [str(spam), str(ham)]
+
+
 @pytest.mark.parametrize('filename', ['ham.py', 'ham.txt'])
 def test_maybe_autosave_does_not_save_after_open(base_editor_bot, mocker,
                                                  qtbot, filename):
@@ -850,10 +910,10 @@ def test_maybe_autosave_does_not_save_after_open(base_editor_bot, mocker,
     mocker.patch('spyder.plugins.editor.widgets.editorstack.editorstack.encoding.read',
                  return_value=('spam\n', 42))
     editor_stack.load(filename)
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_write = mocker.patch.object(editor_stack.autosave.writer, 'write')
     qtbot.wait(100)  # Wait for PygmentsSH.makeCharlist() if applicable
     editor_stack.autosave.maybe_autosave(0)
-    editor_stack._write_to_file.assert_not_called()
+    mock_write.assert_not_called()
 
 
 def test_maybe_autosave_does_not_save_after_reload(base_editor_bot, mocker):
@@ -867,50 +927,53 @@ def test_maybe_autosave_does_not_save_after_reload(base_editor_bot, mocker):
     editor_stack = base_editor_bot
     txt = 'spam\n'
     editor_stack.create_new_editor('ham.py', 'ascii', txt, set_current=True)
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mock_write = mocker.patch.object(editor_stack.autosave.writer, 'write')
     mocker.patch('spyder.plugins.editor.widgets.editorstack.editorstack.encoding.read',
                  return_value=(txt, 'ascii'))
     editor_stack.reload(0)
     editor_stack.autosave.maybe_autosave(0)
-    editor_stack._write_to_file.assert_not_called()
+    mock_write.assert_not_called()
 
 def test_autosave_updates_name_mapping(editor_bot, mocker, qtbot):
     """Test that maybe_autosave() updates name_mapping."""
     editor_stack, editor = editor_bot
     assert editor_stack.autosave.name_mapping == {}
-    mocker.patch.object(editor_stack, '_write_to_file')
+    mocker.patch.object(editor_stack.autosave.writer, 'write')
     editor.set_text('spam\n')
     editor_stack.autosave.maybe_autosave(0)
     expected = {'foo.py': os.path.join(get_conf_path('autosave'), 'foo.py')}
     assert editor_stack.autosave.name_mapping == expected
 
 
-def test_maybe_autosave_handles_error(editor_bot, mocker):
+def test_maybe_autosave_handles_error(editor_bot, mocker, qtbot):
     """Test that autosave() ignores errors when writing to file."""
     editor_stack, editor = editor_bot
-    mock_write = mocker.patch.object(editor_stack, '_write_to_file')
+    mock_write = mocker.patch(
+        'spyder.plugins.editor.utils.autosave.encoding.write')
     mock_dialog = mocker.patch(
         'spyder.plugins.editor.utils.autosave.AutosaveErrorDialog')
-    try:
-        mock_write.side_effect = PermissionError
-    except NameError:  # Python 2
-        mock_write.side_effect = IOError
+    mock_write.side_effect = PermissionError
     editor.set_text('spam\n')
     editor_stack.autosave.maybe_autosave(0)
-    assert mock_dialog.called
+    qtbot.waitUntil(lambda: mock_dialog.called)
+
+    # The file is autosaved again next time
+    assert editor_stack.autosave.file_revisions == {}
 
 
 def test_remove_autosave_file(editor_bot, mocker, qtbot):
     """
     Test that remove_autosave_file() removes the autosave file.
 
-    Also, test that it updates `name_mapping`.
+    Also, test that it updates `name_mapping` and that copies queued before
+    removing the file are not written afterwards.
     """
     editor_stack, editor = editor_bot
     autosave = editor_stack.autosave
     editor.set_text('spam\n')
 
     autosave.maybe_autosave(0)
+    autosave.writer.flush()
 
     autosave_filename = os.path.join(get_conf_path('autosave'), 'foo.py')
     assert os.access(autosave_filename, os.R_OK)
@@ -922,6 +985,16 @@ def test_remove_autosave_file(editor_bot, mocker, qtbot):
     assert not os.access(autosave_filename, os.R_OK)
     assert autosave.name_mapping == {}
 
+    # Queue a copy and remove the file before it's written
+    editor.set_text('ham\n')
+    autosave.maybe_autosave(0)
+    autosave.remove_autosave_file(editor_stack.data[0].filename)
+    autosave.writer.flush()
+    qtbot.wait(100)
+
+    assert not os.access(autosave_filename, os.R_OK)
+    assert autosave.name_mapping == {}
+
 
 def test_ipython_files(base_editor_bot, qtbot):
     """Test support for IPython files in the editor."""
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Read-only viewer for files that are too large to be opened in the editor.
+"""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+from qtpy.QtCore import QRect, Qt, QTimer, Signal
+from qtpy.QtGui import QColor, QFontMetrics, QKeySequence, QPainter
+from qtpy.QtWidgets import (QAbstractScrollArea, QApplication, QHBoxLayout,
+                            QLabel, QLineEdit, QVBoxLayout, QWidget)
+
+# Local imports
+from spyder.api.translations import _
+from spyder.plugins.editor.utils.largefile import LineIndex
+from spyder.utils.icon_manager import ima
+from spyder.utils.palette import SpyderPalette
+from spyder.utils.qthelpers import create_toolbutton
+
+
+# Interval (in ms) to check the progress of the line index
+INDEX_POLL_INTERVAL = 250
+
+
+class LargeFileView(QAbstractScrollArea):
+    """
+    Widget that paints the lines of a LineIndex that are visible.
+
+    Only those lines are read from the file, so scrolling doesn't depend on
+    its size.
+    """
+
+    def __init__(self, parent, line_index):
+        super().__init__(parent)
+        self.line_index = line_index
+        self.current_line = 0
+
+        # (line, column, length) of the last search match
+        self.match = None
+
+        self._line_count = 0
+        self._max_line_length = 0
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+        self.horizontalScrollBar().valueChanged.connect(
+            self.viewport().update)
+        self.update_line_count()
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def update_line_count(self):
+        """Update the scroll range with the lines indexed so far."""
+        self._line_count = self.line_index.line_count
+        self._update_scrollbars()
+        self.viewport().update()
+
+    def go_to_line(self, line, column=None, length=0):
+        """
+        Go to a line, starting at 0, and center it if it's not visible.
+
+        If `column` is given, the text between it and `length` characters
+        after it is highlighted.
+        """
+        line = max(0, min(line, self._line_count - 1))
+        self.match = None if column is None else (line, column, length)
+        self.current_line = line
+
+        first = self.verticalScrollBar().value()
+        if not first <= line < first + self._visible_line_count():
+            self.verticalScrollBar().setValue(
+                line - self._visible_line_count() // 2
+            )
+
+        if column is not None:
+            metrics = QFontMetrics(self.font())
+            x = metrics.horizontalAdvance(
+                self.line_index.get_line(line)[:column]
+            )
+            hbar = self.horizontalScrollBar()
+            if not hbar.value() <= x < hbar.value() + self._text_width():
+                hbar.setValue(x - self._text_width() // 2)
+
+        self.viewport().update()
+
+    def copy(self):
+        """Copy the current line to the clipboard."""
+        if self._line_count:
+            QApplication.clipboard().setText(
+                self.line_index.get_line(self.current_line)
+            )
+
+    # ---- Qt methods
+    # -------------------------------------------------------------------------
+    def paintEvent(self, event):
+        """Paint the visible lines and their line numbers."""
+        painter = QPainter(self.viewport())
+        metrics = QFontMetrics(self.font())
+        line_height = metrics.height()
+        gutter_width = self._gutter_width()
+        width = self.viewport().width()
+
+        painter.fillRect(
+            QRect(0, 0, gutter_width, self.viewport().height()),
+            QColor(SpyderPalette.COLOR_BACKGROUND_2)
+        )
+
+        first = self.verticalScrollBar().value()
+        lines = self.line_index.get_lines(first, self._visible_line_count())
+        x_offset = gutter_width - self.horizontalScrollBar().value()
+        max_line_length = self._max_line_length
+        for i, text in enumerate(lines):
+            line = first + i
+            y = i * line_height
+            if line == self.current_line:
+                painter.fillRect(
+                    QRect(gutter_width, y, width, line_height),
+                    QColor(SpyderPalette.COLOR_BACKGROUND_3)
+                )
+
+            if self.match is not None and self.match[0] == line:
+                __, column, length = self.match
+                start = metrics.horizontalAdvance(text[:column])
+                match_width = metrics.horizontalAdvance(
+                    text[column:column + length]
+                )
+                painter.fillRect(
+                    QRect(x_offset + start, y, match_width, line_height),
+                    QColor(SpyderPalette.COLOR_ACCENT_3)
+                )
+
+            painter.setPen(QColor(SpyderPalette.COLOR_TEXT_1))
+            painter.setClipRect(
+                QRect(gutter_width, 0, width, self.viewport().height())
+            )
+            painter.drawText(x_offset, y + metrics.ascent(), text)
+            painter.setClipping(False)
+
+            painter.setPen(QColor(SpyderPalette.COLOR_TEXT_4))
+            painter.drawText(
+                QRect(0, y, gutter_width - 6, line_height),
+                Qt.AlignRight | Qt.AlignVCenter,
+                str(line + 1)
+            )
+
+            max_line_length = max(
+                max_line_length, metrics.horizontalAdvance(text)
+            )
+
+        # The horizontal range grows with the longest line that was shown,
+        # because measuring all lines would need to read the whole file.
+        if max_line_length > self._max_line_length:
+            self._max_line_length = max_line_length
+            QTimer.singleShot(0, self._update_scrollbars)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_scrollbars()
+
+    def keyPressEvent(self, event):
+        key = event.key()
+        ctrl = event.modifiers() & Qt.ControlModifier
+        page = max(self._visible_line_count() - 1, 1)
+        if event.matches(QKeySequence.Copy):
+            self.copy()
+        elif key == Qt.Key_Up:
+            self.go_to_line(self.current_line - 1)
+        elif key == Qt.Key_Down:
+            self.go_to_line(self.current_line + 1)
+        elif key == Qt.Key_PageUp:
+            self.go_to_line(self.current_line - page)
+        elif key == Qt.Key_PageDown:
+            self.go_to_line(self.current_line + page)
+        elif key == Qt.Key_Home and ctrl:
+            self.go_to_line(0)
+        elif key == Qt.Key_End and ctrl:
+            self.go_to_line(self._line_count - 1)
+        else:
+            super().keyPressEvent(event)
+
+    def mousePressEvent(self, event):
+        line_height = QFontMetrics(self.font()).height()
+        line = (
+            self.verticalScrollBar().value()
+            + int(event.pos().y() // line_height)
+        )
+        if line < self._line_count:
+            self.current_line = line
+            self.viewport().update()
+        super().mousePressEvent(event)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _visible_line_count(self):
+        line_height = QFontMetrics(self.font()).height()
+        return self.viewport().height() // line_height + 1
+
+    def _gutter_width(self):
+        metrics = QFontMetrics(self.font())
+        digits = len(str(max(self._line_count, 1)))
+        return metrics.horizontalAdvance('9' * max(digits, 3)) + 12
+
+    def _text_width(self):
+        return max(self.viewport().width() - self._gutter_width(), 1)
+
+    def _update_scrollbars(self):
+        visible = self._visible_line_count()
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(self._line_count - visible + 1, 0))
+        vbar.setPageStep(visible)
+
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(self._max_line_length - self._text_width(), 0))
+        hbar.setPageStep(self._text_width())
+
+
+class LargeFileViewer(QWidget):
+    """
+    Window to show a file that is too large to be opened in the editor.
+
+    The file is memory-mapped and its lines are indexed in the background, so
+    it can be shown right away. It's read-only and doesn't have the
+    extensions and panels of the editor (e.g. syntax highlighting or code
+    folding), which would need to go through the whole file.
+    """
+
+    sig_closed = Signal(str)
+    """
+    This signal is emitted when the viewer is closed.
+
+    Parameters
+    ----------
+    filename: str
+        Name of the file shown in the viewer.
+    """
+
+    def __init__(self, parent, filename, font=None):
+        super().__init__(parent, Qt.Window)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.filename = filename
+        self.setWindowTitle(
+            _("{} (read-only large file viewer)").format(
+                osp.basename(filename)
+            )
+        )
+
+        self.line_index = LineIndex(filename)
+        self.view = LargeFileView(self, self.line_index)
+        if font is not None:
+            self.view.setFont(font)
+
+        # Search widgets
+        self.search_text = QLineEdit(self)
+        self.search_text.setPlaceholderText(_("Search"))
+        self.search_text.returnPressed.connect(self.find_next)
+        self.previous_button = create_toolbutton(
+            self,
+            triggered=self.find_previous,
+            icon=ima.icon('findprevious'),
+            tip=_("Find previous")
+        )
+        self.next_button = create_toolbutton(
+            self,
+            triggered=self.find_next,
+            icon=ima.icon('findnext'),
+            tip=_("Find next")
+        )
+        self.case_button = create_toolbutton(
+            self,
+            icon=ima.icon("format_letter_case"),
+            tip=_("Enable case sensitive searches")
+        )
+        self.case_button.setCheckable(True)
+        self.status_label = QLabel(self)
+
+        search_layout = QHBoxLayout()
+        search_layout.addWidget(self.search_text)
+        search_layout.addWidget(self.previous_button)
+        search_layout.addWidget(self.next_button)
+        search_layout.addWidget(self.case_button)
+        search_layout.addWidget(self.status_label)
+
+        layout = QVBoxLayout()
+        layout.addLayout(search_layout)
+        layout.addWidget(self.view)
+        self.setLayout(layout)
+        self.resize(900, 600)
+
+        # Update the view while lines are indexed
+        self._timer = QTimer(self)
+        self._timer.setInterval(INDEX_POLL_INTERVAL)
+        self._timer.timeout.connect(self._update_progress)
+        self._pending_line = None
+        self.line_index.start()
+        self._timer.start()
+        self._update_progress()
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def go_to_line(self, line):
+        """
+        Go to a line, starting at 1, or after it's indexed if it's not yet.
+        """
+        if line - 1 < self.line_index.line_count:
+            self.view.go_to_line(line - 1)
+        else:
+            self._pending_line = line
+
+    def find_next(self):
+        """Find the next match of the search text."""
+        self._find(backwards=False)
+
+    def find_previous(self):
+        """Find the previous match of the search text."""
+        self._find(backwards=True)
+
+    # ---- Qt methods
+    # -------------------------------------------------------------------------
+    def closeEvent(self, event):
+        self._timer.stop()
+        self.line_index.close()
+        self.sig_closed.emit(self.filename)
+        super().closeEvent(event)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _update_progress(self):
+        """Show the lines indexed so far and stop when all are."""
+        self.view.update_line_count()
+        ready = self.line_index.ready
+        if ready:
+            self._timer.stop()
+            self.status_label.setText(
+                _("{:,} lines").format(self.line_index.line_count)
+            )
+        else:
+            self.status_label.setText(
+                _("Indexing lines... {:.0%}").format(
+                    self.line_index.progress
+                )
+            )
+
+        for widget in [self.search_text, self.previous_button,
+                       self.next_button]:
+            widget.setEnabled(ready)
+
+        line = self._pending_line
+        if line is not None and (
+            ready or line - 1 < self.line_index.line_count
+        ):
+            self._pending_line = None
+            self.view.go_to_line(line - 1)
+
+    def _find(self, backwards):
+        text = self.search_text.text()
+        if not text or not self.line_index.ready:
+            return
+
+        # Search from the end of the current match, or from the current line
+        match = self.view.match
+        if match is not None and match[0] == self.view.current_line:
+            line, column, length = match
+            if not backwards:
+                column += length
+        else:
+            line, column = self.view.current_line, 0
+
+        case_sensitive = self.case_button.isChecked()
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            found = self.line_index.find(
+                text, line, column, backwards, case_sensitive
+            )
+            if found is None:
+                # Wrap around the file
+                if backwards:
+                    last_line = self.line_index.line_count - 1
+                    start = (
+                        last_line,
+                        len(self.line_index.get_line(last_line))
+                    )
+                else:
+                    start = (0, 0)
+                found = self.line_index.find(
+                    text, *start, backwards, case_sensitive
+                )
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if found is None:
+            self.status_label.setText(_("No matches"))
+        else:
+            self.view.go_to_line(found[0], found[1], len(text))
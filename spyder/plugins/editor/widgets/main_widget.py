@@ -48,6 +48,7 @@
     SelectionContextModificator, ExtraAction)
 from spyder.plugins.editor.utils.autosave import AutosaveForPlugin
 from spyder.plugins.editor.utils.editor import get_default_file_content
+from spyder.plugins.editor.utils.largefile import is_large_file
 from spyder.plugins.editor.utils.switcher_manager import EditorSwitcherManager
 from spyder.plugins.editor.widgets.codeeditor import (
     CodeEditor,
@@ -57,6 +58,7 @@
     DocstringContext,
 )
 from spyder.plugins.editor.widgets.editorstack import EditorStack
+from spyder.plugins.editor.widgets.largefileviewer import LargeFileViewer
 from spyder.plugins.editor.widgets.splitter import EditorSplitter
 from spyder.plugins.editor.widgets.window import EditorMainWindow
 from spyder.plugins.editor.utils.bookmarks import (load_bookmarks,
@@ -315,6 +317,9 @@ def __init__(self, name, plugin, parent, ignore_last_opened_files=False):
         self._print_editor = self._create_print_editor()
         self._print_editor.hide()
 
+        # Viewers of files that are too large to be opened in the editor
+        self._large_file_viewers = {}
+
         # To save run extensions
         self.supported_run_extensions = []
 
@@ -839,7 +844,7 @@ def set_ancestor(self, ancestor):
         See spyder-ide/spyder#11076
         """
         for editorstack in self.editorstacks:
-            for finfo in editorstack.data:
+            for finfo in editorstack.get_loaded_data():
                 comp_widget = finfo.editor.completion_widget
 
                 # This is necessary to catch an error when the plugin is
@@ -879,7 +884,10 @@ def on_close(self):
         )
         for window in self.editorwindows:
             window.close()
+        for viewer in list(self._large_file_viewers.values()):
+            viewer.close()
         self.autosave.stop_autosave_timer()
+        self.autosave.writer.flush()
 
     # ---- Private API
     # ------------------------------------------------------------------------
@@ -1132,7 +1140,7 @@ def update_font(self, font):
         for editorstack in self.editorstacks:
             editorstack.set_default_font(font, color_scheme)
             completion_size = self.get_conf('completion/size', section='main')
-            for finfo in editorstack.data:
+            for finfo in editorstack.get_loaded_data():
                 comp_widget = finfo.editor.completion_widget
                 comp_widget.setup_appearance(completion_size, font)
 
@@ -1639,7 +1647,7 @@ def refresh_save_actions(self):
         self.sig_file_action_enabled.emit(ApplicationActions.SaveFile, state)
 
         state = any(
-            finfo.editor.document().isModified() or finfo.newly_created
+            finfo.is_modified() or finfo.newly_created
             for finfo in editorstack.data
         )
         self.sig_file_action_enabled.emit(ApplicationActions.SaveAll, state)
@@ -1680,17 +1688,11 @@ def update_todo_menu(self):
 
     def todo_results_changed(self):
         """
-        Synchronize todo results between editorstacks and refresh todo list
-        navigation buttons.
+        Refresh todo list navigation buttons.
+
+        Todo results don't need to be synchronized between editorstacks
+        because editors of the same file share their document and its tasks.
         """
-        editorstack = self.get_current_editorstack()
-        results = editorstack.get_todo_results()
-        index = editorstack.get_stack_index()
-        if index != -1:
-            filename = editorstack.data[index].filename
-            for other_editorstack in self.editorstacks:
-                if other_editorstack is not editorstack:
-                    other_editorstack.set_todo_results(filename, results)
         self.update_todo_actions()
 
     def refresh_eol_chars(self, os_name):
@@ -1834,7 +1836,7 @@ def new(
         if created_from_here:
             if self.untitled_num == 0:
                 for finfo in current_es.data:
-                    current_filename = finfo.editor.filename
+                    current_filename = finfo.filename
                     if _("untitled") in current_filename:
                         # Start the counter of the untitled_num with respect
                         # to this number if there's other untitled file in
@@ -1923,6 +1925,7 @@ def load(
         end_column: int | None = None,
         set_focus: bool = True,
         add_where: str = "end",
+        lazy: bool = False,
     ):
         """
         Load a text file.
@@ -1936,6 +1939,8 @@ def load(
         the start position in this line and end_column the length
         (So that the end position is start_column + end_column)
         Alternatively, the first match of word is used as a position.
+        lazy: if True, the editors of the files that don't get the focus are
+        created only when they are needed (e.g. when their tabs are activated)
         """
         cursor_history_state = self.__ignore_cursor_history
         self.__ignore_cursor_history = True
@@ -2017,6 +2022,14 @@ def _convert(fname):
                 if not osp.isfile(filename):
                     continue
 
+                # Files that are too large are shown in a read-only viewer
+                # instead, which doesn't need to read them whole.
+                if is_large_file(filename):
+                    self.open_large_file(
+                        filename, goto[index] if goto is not None else None
+                    )
+                    continue
+
                 current_es = self.get_current_editorstack(editorwindow)
 
                 # Creating the editor widget in the first editorstack
@@ -2030,6 +2043,8 @@ def _convert(fname):
                     extensions=self._plugin.extensions,
                     panels=self._plugin.panels,
                     shortcuts=self._plugin.shortcuts,
+                    lazy=lazy and not focus,
+                    line=goto[index] if goto is not None else None,
                 )
 
                 # This can happen when it was not possible to load filename
@@ -2039,6 +2054,11 @@ def _convert(fname):
                     continue
 
                 self._clone_file_everywhere(finfo)
+
+                # Lazy files go to their line when their editor is created
+                if not finfo.is_loaded:
+                    self.sig_new_recent_file.emit(filename)
+                    continue
                 current_editor = current_es.set_current_filename(filename,
                                                                  focus=focus)
                 slots = self.get_conf('bookmarks', default={})
@@ -2060,6 +2080,31 @@ def _convert(fname):
         self.__ignore_cursor_history = cursor_history_state
         self.add_cursor_to_history()
 
+    def open_large_file(self, filename, line=None):
+        """
+        Show a file that is too large to be opened in the editor in a
+        read-only viewer.
+        """
+        viewer = self._large_file_viewers.get(filename)
+        if viewer is None:
+            try:
+                viewer = LargeFileViewer(self, filename, font=self._font)
+            except (OSError, ValueError):
+                logger.debug(
+                    f"Error opening large file {filename}", exc_info=True
+                )
+                return
+
+            viewer.sig_closed.connect(self._large_file_viewers.pop)
+            self._large_file_viewers[filename] = viewer
+            self.sig_new_recent_file.emit(filename)
+
+        if line is not None:
+            viewer.go_to_line(line)
+        viewer.show()
+        viewer.raise_()
+        viewer.activateWindow()
+
     def _create_print_editor(self):
         """Create a SimpleCodeEditor instance to print file contents."""
         editor = SimpleCodeEditor(self)
@@ -2985,7 +3030,7 @@ def save_bookmark(self, slot_num):
             if osp.isfile(filename):
                 index = editorstack.has_filename(filename)
                 if index is not None:
-                    block = (editorstack.tabs.widget(index).document()
+                    block = (editorstack.data[index].editor.document()
                              .findBlockByNumber(line_num))
                     block.userData().bookmarks.remove((slot_num, column))
         if editorstack is not None:
@@ -3134,13 +3179,15 @@ def setup_open_files(self, close_previous_files=True):
                     # the last focused file.
                     if index > 0:
                         self.load(filenames[index::-1], goto=clines[index::-1],
-                                  set_focus=False, add_where='start')
+                                  set_focus=False, add_where='start',
+                                  lazy=True)
                     # Then we load the files located to the right of the last
                     # focused file in the tabbar, while keeping the focus on
                     # the last focused file.
                     if index < (len(filenames) - 1):
                         self.load(filenames[index+1:], goto=clines[index:],
-                                  set_focus=False, add_where='end')
+                                  set_focus=False, add_where='end',
+                                  lazy=True)
                     # Finally we load any recovered files at the end of
                     # the tabbar, while keeping focus on the last focused file.
                     if self.autosave.recover_files_to_open:
@@ -211,7 +211,7 @@ def get_layout_settings(self):
             # XXX - this overrides value from the loop to always be False?
             orientation = False
             if hasattr(editorstack, 'data'):
-                clines = [finfo.editor.get_cursor_line_number()
+                clines = [finfo.get_cursor_line_number()
                           for finfo in editorstack.data]
                 cfname = editorstack.get_current_filename()
             splitsettings.append((orientation == Qt.Vertical, cfname, clines))
@@ -254,7 +254,6 @@ def set_layout_settings(self, settings, dont_goto=None):
                 splitter = splitter.widget(1)
             editorstack = splitter.widget(0)
             for j, finfo in enumerate(editorstack.data):
-                editor = finfo.editor
                 # TODO: go_to_line is not working properly (the line it jumps
                 # to is not the corresponding to that file). This will be fixed
                 # in a future PR (which will fix spyder-ide/spyder#3857).
@@ -263,9 +262,16 @@ def set_layout_settings(self, settings, dont_goto=None):
                     pass
                 else:
                     try:
-                        editor.go_to_line(clines[j])
+                        line = clines[j]
                     except IndexError:
-                        pass
+                        continue
+
+                    # Don't create the editors of lazy files just for this
+                    if finfo.is_loaded:
+                        finfo.editor.go_to_line(line)
+                    else:
+                        finfo.pending_line = line
+            editor = editorstack.get_current_editor()
         hexstate = settings.get('hexstate')
         if hexstate is not None:
             self.restoreState(
@@ -82,6 +82,8 @@ def on_projects_available(self):
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.connect(self.set_project_path)
         projects.sig_project_closed.connect(self.unset_project_path)
+        projects.sig_search_index_changed.connect(self.set_search_index)
+        self.set_search_index(projects.get_search_index())
 
     @on_plugin_available(plugin=Plugins.MainMenu)
     def on_main_menu_available(self):
@@ -114,6 +116,8 @@ def on_projects_teardon_plugin_teardown(self):
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.disconnect(self.set_project_path)
         projects.sig_project_closed.disconnect(self.unset_project_path)
+        projects.sig_search_index_changed.disconnect(self.set_search_index)
+        self.set_search_index(None)
 
     @on_plugin_teardown(plugin=Plugins.MainMenu)
     def on_main_menu_teardown(self):
@@ -167,6 +171,17 @@ def set_project_path(self, path):
         """
         self.get_widget().set_project_path(path)
 
+    def set_search_index(self, search_index):
+        """
+        Set the index used to narrow down searches in the current project.
+
+        Parameters
+        ----------
+        search_index: spyder.plugins.projects.utils.search_index.SearchIndex
+            Search index of the project or None to not use any.
+        """
+        self.get_widget().set_search_index(search_index)
+
     def set_max_results(self, value=None):
         """
         Set maximum amount of results to add to the result browser.
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Parallel search engine for Find in Files.
+
+Files are scanned as whole buffers: each one is memory-mapped and a single
+compiled regular expression is run over it. Byte offsets of the matches are
+then mapped back to line numbers. Lists of files are split in chunks that are
+dispatched to a pool of processes, which return their results per chunk.
+
+Notes
+-----
+This module must not import Qt because it's imported by the worker
+processes.
+"""
+
+# Standard library imports
+import concurrent.futures
+import logging
+import mmap
+import multiprocessing
+import os
+import os.path as osp
+import re
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+# Number of files sent to a worker at once.
+CHUNK_SIZE = 64
+
+# Maximum number of worker processes.
+MAX_WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+
+# Number of matches after which the stop flag is checked again while
+# scanning a single file.
+STOP_CHECK_INTERVAL = 256
+
+# Stop flag shared with the worker processes. It's set by `_init_worker`.
+_stop_event = None
+
+
+# ---- Auxiliary functions
+# ----------------------------------------------------------------------------
+def _init_worker(stop_event):
+    """Initialize a worker process with the shared stop flag."""
+    global _stop_event
+    _stop_event = stop_event
+
+
+def compile_patterns(texts, text_re, case_sensitive):
+    """
+    Compile the search texts to patterns that can be run over a buffer.
+
+    Parameters
+    ----------
+    texts: list
+        List of `(text, encoding)` tuples, where `text` is a bytes object or
+        a compiled bytes pattern (if `text_re` is True).
+    text_re: bool
+        Whether `texts` are regular expressions.
+    case_sensitive: bool
+        Whether the search is case sensitive.
+
+    Returns
+    -------
+    list
+        List of `(pattern, encoding, group)` tuples, where `group` is the
+        match group that spans the searched text.
+    """
+    flags = re.MULTILINE
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+
+    patterns = []
+    for text, enc in texts:
+        if text_re:
+            pattern = re.compile(text.pattern, text.flags | flags)
+            group = 0
+        else:
+            # A lookahead is used so that overlapping occurrences are found,
+            # as it's done by bytes.find.
+            pattern = re.compile(b'(?=(' + re.escape(text) + b'))', flags)
+            group = 1
+        patterns.append((pattern, enc, group))
+
+    return patterns
+
+
+def _scan_buffer(fname, buffer, pattern, enc, group, limit, stop_event):
+    """
+    Find all matches of `pattern` in `buffer`.
+
+    Matches are restricted to a single line, including its line ending, as
+    if each line was searched separately. That way patterns like ``\\s``
+    or ``[^x]*`` don't match across lines.
+    """
+    results = []
+    lineno = 0
+    line_start = 0
+    line_end = -1
+    line = None
+    pos = 0
+    size = len(buffer)
+    i = 0
+
+    while pos <= size:
+        if (
+            stop_event is not None
+            and i % STOP_CHECK_INTERVAL == 0
+            and stop_event.is_set()
+        ):
+            break
+        i += 1
+
+        match = pattern.search(buffer, pos)
+        if match is None:
+            break
+
+        # Map the byte offset of the match to its line
+        if match.start() >= line_end:
+            lineno += buffer[line_start:match.start()].count(b'\n')
+            line_start = buffer.rfind(b'\n', 0, match.start()) + 1
+            newline = buffer.find(b'\n', match.start())
+            line_end = size if newline == -1 else newline + 1
+            line = buffer[line_start:line_end]
+
+        # Search again in the line alone if the match crosses its end
+        if match.end() > line_end:
+            match = pattern.search(buffer, match.start(), line_end)
+            if match is None:
+                pos = line_end
+                continue
+
+        # Empty matches (e.g. the lookaheads used for plain text) move the
+        # search one byte forward, so that overlapping occurrences are found
+        if match.end() > match.start():
+            pos = match.end()
+        else:
+            pos = match.start() + 1
+
+        bstart, bend = match.span(group)
+        bstart = bstart - line_start
+        bend = bend - line_start
+
+        try:
+            # Go from binary position to utf8 position
+            start = len(line[:bstart].decode(enc))
+            end = start + len(line[bstart:bend].decode(enc))
+            line_enc = enc
+        except UnicodeDecodeError:
+            # Positions are kept in bytes, which is what decoding the line as
+            # latin-1 gives.
+            start = bstart
+            end = bend
+            line_enc = 'latin-1'
+
+        results.append(
+            (fname, lineno + 1, start, end, line_start, len(line), line_enc)
+        )
+        if len(results) >= limit:
+            break
+
+    return results
+
+
+def scan_file(fname, patterns, limit, stop_event=None):
+    """
+    Search `patterns` in a file.
+
+    Parameters
+    ----------
+    fname: str
+        Path to the file.
+    patterns: list
+        Patterns returned by `compile_patterns`. Only the matches of the
+        first one found in the file are returned.
+    limit: int
+        Maximum number of matches to return.
+    stop_event: multiprocessing.Event, optional
+        Flag to stop the search.
+
+    Returns
+    -------
+    list
+        List of `(filename, lineno, start, end, offset, length, encoding)`
+        tuples, where `start` and `end` are the positions of the match in
+        its line, `offset` and `length` are the position of the line in the
+        file and its size in bytes, and `encoding` is the one its text must
+        be decoded with.
+
+    Raises
+    ------
+    OSError
+        If the file can't be read.
+    """
+    fname = osp.abspath(fname)
+    with open(fname, 'rb') as f:
+        # Empty files can't be memory-mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            for pattern, enc, group in patterns:
+                results = _scan_buffer(
+                    fname, buffer, pattern, enc, group, limit, stop_event
+                )
+                if results:
+                    return results
+
+    return []
+
+
+def search_files(filenames, patterns, limit, stop_event=None):
+    """
+    Search `patterns` in a list of files.
+
+    This is the function run by the worker processes.
+
+    Returns
+    -------
+    tuple
+        A list with the matches found (see `scan_file`) and a bool that is
+        True if some of the files couldn't be read.
+    """
+    if stop_event is None:
+        stop_event = _stop_event
+
+    results = []
+    error = False
+    for fname in filenames:
+        if stop_event is not None and stop_event.is_set():
+            break
+
+        try:
+            results.extend(
+                scan_file(fname, patterns, limit - len(results), stop_event)
+            )
+        except (OSError, ValueError):
+            # ValueError is raised by mmap for files that can't be mapped
+            # (e.g. special files).
+            error = True
+
+        if len(results) >= limit:
+            break
+
+    return results, error
+
+
+# ---- Engine
+# ----------------------------------------------------------------------------
+class SearchEngine:
+    """
+    Search engine that distributes files to a pool of processes.
+
+    Files are added with `submit` and results are collected with
+    `get_results`. The process pool is only started once a full chunk of
+    files is submitted, so that searches over a few files are done in the
+    calling thread without the overhead of spawning processes.
+    """
+
+    def __init__(self, patterns, max_results, max_workers=MAX_WORKERS):
+        self.patterns = patterns
+        self.max_results = max_results
+        self.max_workers = max_workers
+
+        # Spawn is used instead of fork because the latter is not safe in a
+        # multithreaded Qt application.
+        self._context = multiprocessing.get_context('spawn')
+        self._stop_event = self._context.Event()
+        self._executor = None
+        self._futures = set()
+        self._pending = []
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    @property
+    def stop_event(self):
+        """Flag shared with the worker processes to stop the search."""
+        return self._stop_event
+
+    @property
+    def stopped(self):
+        return self._stop_event.is_set()
+
+    def submit(self, filename):
+        """Add a file to the search."""
+        self._pending.append(filename)
+        if len(self._pending) >= CHUNK_SIZE:
+            self._submit_pending()
+
+    def get_results(self, wait=False):
+        """
+        Get results of the chunks of files that have been processed.
+
+        Parameters
+        ----------
+        wait: bool, optional
+            If True, send the files that are still pending and wait until all
+            of them are processed. Default is False.
+
+        Yields
+        ------
+        tuple
+            Results of a chunk of files (see `search_files`).
+        """
+        if wait and self._pending:
+            if self._executor is None:
+                # Too few files to use the process pool
+                filenames, self._pending = self._pending, []
+                yield search_files(
+                    filenames, self.patterns, self.max_results,
+                    self._stop_event
+                )
+            else:
+                self._submit_pending()
+
+        if wait:
+            futures = concurrent.futures.as_completed(self._futures)
+        else:
+            futures = [f for f in self._futures if f.done()]
+
+        for future in futures:
+            if self.stopped:
+                return
+
+            self._futures.discard(future)
+            try:
+                yield future.result()
+            except Exception:
+                # This can happen if a worker dies unexpectedly (e.g. because
+                # it ran out of memory).
+                logger.error("Error in search worker", exc_info=True)
+                yield [], True
+
+    def stop(self):
+        """Stop the search as soon as possible."""
+        self._stop_event.set()
+        self._pending = []
+        self.close()
+
+    def close(self):
+        """Shutdown the process pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._futures = set()
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _submit_pending(self):
+        if self.stopped:
+            return
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._stop_event,),
+            )
+
+        filenames, self._pending = self._pending, []
+        self._futures.add(
+            self._executor.submit(
+                search_files, filenames, self.patterns, self.max_results
+            )
+        )
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""Tests for the Find in Files search engine."""
+
+# Standard library imports
+import os.path as osp
+import re
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils.search_engine import (
+    compile_patterns, scan_file, search_files, SearchEngine)
+
+
+DATA_DIR = osp.join(
+    osp.dirname(osp.dirname(osp.dirname(__file__))), 'widgets', 'tests',
+    'data'
+)
+FILENAMES = [
+    osp.join(DATA_DIR, f) for f in ['ham.txt', 'spam.cpp', 'spam.py',
+                                    'spam.txt']
+]
+
+
+def get_matches(results):
+    matches = {}
+    for filename, lineno, start, *__ in results:
+        matches.setdefault(osp.basename(filename), []).append((lineno, start))
+    return matches
+
+
+@pytest.mark.parametrize(
+    "text, text_re, case_sensitive, expected",
+    [
+        (b'spam', False, True,
+         {'spam.txt': [(1, 0), (1, 5), (3, 22)],
+          'spam.py': [(2, 7), (5, 1), (7, 12)],
+          'spam.cpp': [(2, 9), (6, 15), (8, 2), (11, 4), (11, 10),
+                       (13, 12)]}),
+        (b'ham', False, False,
+         {'spam.txt': [(1, 10)],
+          'ham.txt': [(1, 0), (1, 10), (3, 0), (4, 0), (5, 4), (9, 0),
+                      (10, 0)]}),
+        (b'HaM', False, True, {'ham.txt': [(9, 0)]}),
+        (b'^spam', True, True, {'spam.txt': [(1, 0)]}),
+        (b'sp.m$', True, True, {'spam.py': [(2, 7)], 'spam.txt': [(3, 22)]}),
+    ]
+)
+def test_search_files(text, text_re, case_sensitive, expected):
+    """Test that matches are mapped to the right lines and columns."""
+    if text_re:
+        text = re.compile(text)
+    patterns = compile_patterns([(text, 'utf-8')], text_re, case_sensitive)
+
+    results, error = search_files(FILENAMES, patterns, 1000)
+
+    assert not error
+    assert get_matches(results) == expected
+
+
+def test_overlapping_matches(tmp_path):
+    """Literal searches find overlapping occurrences, as bytes.find does."""
+    fname = tmp_path / 'overlap.txt'
+    fname.write_bytes('aaa\nñaa\n'.encode('utf-8'))
+    patterns = compile_patterns([(b'aa', 'utf-8')], False, True)
+
+    results = scan_file(str(fname), patterns, 1000)
+
+    assert [(r[1], r[2], r[3]) for r in results] == [
+        (1, 0, 2), (1, 1, 3), (2, 1, 3)]
+
+    # Lines can be read back from their offset and length
+    offset, length, encoding = results[-1][4:]
+    line = fname.read_bytes()[offset:offset + length].decode(encoding)
+    assert line == 'ñaa\n'
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        (rb'a\s*b', [(3, 0, 2), (4, 0, 3)]),
+        (rb'b[^x]*c', [(3, 1, 4)]),
+        (rb'c\s', [(3, 3, 5)]),
+    ]
+)
+def test_matches_in_single_lines(tmp_path, text, expected):
+    """Regular expressions don't match across lines."""
+    fname = tmp_path / 'lines.txt'
+    fname.write_bytes(b'a \n b\nab c\na b')
+    patterns = compile_patterns([(re.compile(text), 'utf-8')], True, True)
+
+    results = scan_file(str(fname), patterns, 1000)
+
+    assert [(r[1], r[2], r[3]) for r in results] == expected
+
+
+def test_empty_file(tmp_path):
+    fname = tmp_path / 'empty.txt'
+    fname.write_bytes(b'')
+    patterns = compile_patterns([(b'spam', 'utf-8')], False, True)
+    assert scan_file(str(fname), patterns, 1000) == []
+
+
+def test_max_results():
+    patterns = compile_patterns([(b'spam', 'utf-8')], False, True)
+    results, __ = search_files(FILENAMES, patterns, 4)
+    assert len(results) == 4
+
+
+def test_engine_stop():
+    """Stopping the engine discards pending files and results."""
+    patterns = compile_patterns([(b'spam', 'utf-8')], False, True)
+    engine = SearchEngine(patterns, 1000)
+    for filename in FILENAMES:
+        engine.submit(filename)
+
+    engine.stop()
+
+    assert engine.stopped
+    assert list(engine.get_results(wait=True)) == []
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""Tests for the Find in Files directory walker."""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils import walker
+from spyder.plugins.findinfiles.utils.walker import (
+    IgnoreRules, is_text_file_cached, walk_files)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    files = [
+        'spam.py',
+        'ham.log',
+        'logs/today.txt',
+        'docs/index.md',
+        'docs/build/index.html',
+        'src/keep.log',
+        'src/eggs.py',
+        'node_modules/lib.js',
+        '.hidden/spam.py',
+        'venv/lib/site.py',
+        'venv/pyvenv.cfg',
+    ]
+    for name in files:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('spam\n')
+
+    (tmp_path / '.gitignore').write_text('*.log\n/logs/\n# Comment\n')
+    (tmp_path / 'src' / '.ignore').write_text('!keep.log\n')
+    return tmp_path
+
+
+def get_files(root, **kwargs):
+    return sorted(
+        osp.relpath(entry.path, root).replace(os.sep, '/')
+        for entry in walk_files(str(root), **kwargs)
+    )
+
+
+def test_walk_files_ignore_rules(tree):
+    """Test that ignore files and ignored folders are honored."""
+    assert get_files(tree) == [
+        '.gitignore',
+        'docs/index.md',
+        'spam.py',
+        'src/.ignore',
+        'src/eggs.py',
+        'src/keep.log',
+    ]
+
+
+def test_walk_files_no_ignore_rules(tree):
+    """Test that only hidden folders are skipped without ignore rules."""
+    assert get_files(tree, use_ignore_files=False) == [
+        '.gitignore',
+        'docs/build/index.html',
+        'docs/index.md',
+        'ham.log',
+        'logs/today.txt',
+        'node_modules/lib.js',
+        'spam.py',
+        'src/.ignore',
+        'src/eggs.py',
+        'src/keep.log',
+        'venv/lib/site.py',
+        'venv/pyvenv.cfg',
+    ]
+
+
+def test_walk_files_exclude(tree):
+    exclude = re.compile(r'src' + re.escape(os.sep) + r'|\.md$')
+    assert get_files(tree, exclude=exclude) == [
+        '.gitignore',
+        'spam.py',
+    ]
+
+
+def test_walk_files_stopped(tree):
+    assert get_files(tree, stopped=lambda: True) == []
+
+
+@pytest.mark.parametrize(
+    "pattern, path, is_dir, expected",
+    [
+        ('*.py', 'a/b/spam.py', False, True),
+        ('/spam.py', 'a/spam.py', False, None),
+        ('/spam.py', 'spam.py', False, True),
+        ('docs/', 'docs', True, True),
+        ('docs/', 'docs', False, None),
+        ('a/**/b', 'a/x/y/b', True, True),
+        ('a/**/b', 'a/b', True, True),
+        ('**/foo', 'x/foo', False, True),
+        ('foo/**', 'foo/bar/baz', False, True),
+        ('file?.[ch]', 'dir/file1.c', False, True),
+        ('file[!0-9].c', 'file1.c', False, None),
+    ]
+)
+def test_ignore_rules(pattern, path, is_dir, expected):
+    rules = IgnoreRules('base', [pattern + '\n'])
+    assert rules.match(path, is_dir) is expected
+
+
+def test_ignore_rules_negation():
+    """The last matching rule wins."""
+    rules = IgnoreRules('base', ['*.log\n', '!keep.log\n'])
+    assert rules.match('other.log', False) is True
+    assert rules.match('keep.log', False) is False
+
+
+def test_text_file_cache(tree, mocker):
+    """Test that files are sniffed only once while they don't change."""
+    is_text_file = mocker.patch.object(
+        walker, 'is_text_file', return_value=True
+    )
+    entry = next(e for e in os.scandir(tree) if e.name == 'spam.py')
+
+    assert is_text_file_cached(entry)
+    assert is_text_file_cached(entry)
+    assert is_text_file.call_count == 1
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Directory walker for Find in Files.
+
+It's based on `os.scandir`, so the file type information returned by the OS
+for each entry is reused instead of calling `os.stat` on every path. It also
+honors the rules in `.gitignore` and `.ignore` files and skips folders that
+are rarely worth searching in (e.g. virtual environments).
+"""
+
+# Standard library imports
+import os
+import re
+
+# Local imports
+from spyder.utils.encoding import is_text_file
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Files with ignore rules, in increasing order of precedence
+IGNORE_FILES = ['.gitignore', '.ignore']
+
+# Folders that are skipped when ignore rules are used
+IGNORED_FOLDERS = {'__pycache__', 'node_modules', 'build', 'site-packages'}
+
+# File whose presence marks a folder as a virtual environment
+VENV_MARKER = 'pyvenv.cfg'
+
+# Maximum number of entries in the cache of text files
+MAX_TEXT_FILE_CACHE = 50000
+
+# Map from (path, mtime) to whether the file is a text one
+_text_file_cache = {}
+
+
+# ---- Auxiliary functions
+# ----------------------------------------------------------------------------
+def is_text_file_cached(entry):
+    """
+    Check if the file of a `DirEntry` is a text one.
+
+    Results are cached per path and modification time so that files are not
+    sniffed again in later searches.
+    """
+    try:
+        key = (entry.path, entry.stat().st_mtime_ns)
+    except OSError:
+        return False
+
+    result = _text_file_cache.get(key)
+    if result is None:
+        if len(_text_file_cache) >= MAX_TEXT_FILE_CACHE:
+            _text_file_cache.clear()
+        result = _text_file_cache[key] = is_text_file(entry.path)
+
+    return result
+
+
+def translate_ignore_pattern(pattern):
+    """
+    Translate a gitignore pattern to a regular expression.
+
+    Parameters
+    ----------
+    pattern: str
+        Pattern without the negation prefix or trailing slash.
+
+    Returns
+    -------
+    str
+        Regular expression that matches paths relative to the folder of the
+        ignore file, using forward slashes as separators.
+    """
+    # Patterns with a slash are relative to the folder of the ignore file.
+    # Otherwise they match at any level below it.
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+
+    i, n = 0, len(pattern)
+    parts = []
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i) and (i == 0 or pattern[i - 1] == '/'):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i) and i + 2 == n:
+            parts.append('.*')
+            i += 2
+        elif c == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif c == '?':
+            parts.append('[^/]')
+            i += 1
+        elif c == '[':
+            j = pattern.find(']', i + 2)
+            if j == -1:
+                parts.append(re.escape(c))
+                i += 1
+            else:
+                chars = pattern[i + 1:j]
+                if chars[0] == '!':
+                    chars = '^' + chars[1:]
+                parts.append('[' + chars.replace('\\', '\\\\') + ']')
+                i = j + 1
+        elif c == '\\' and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+
+    prefix = '' if anchored else '(?:.*/)?'
+    return prefix + ''.join(parts)
+
+
+class IgnoreRules:
+    """
+    Rules of the ignore files found in a folder.
+
+    Parameters
+    ----------
+    base: str
+        Folder where the ignore files are.
+    lines: list
+        Lines of the ignore files, in increasing order of precedence.
+    """
+
+    def __init__(self, base, lines):
+        self.base = base
+        self.rules = []
+
+        for line in lines:
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+
+            # Unescaped trailing spaces are not part of the pattern
+            if not line.endswith('\\ '):
+                line = line.rstrip(' ')
+
+            negate = line.startswith('!')
+            if negate or line.startswith('\\!') or line.startswith('\\#'):
+                line = line[1:]
+
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+
+            try:
+                regex = re.compile(translate_ignore_pattern(line) + r'\Z')
+            except re.error:
+                continue
+
+            self.rules.append((regex, negate, dir_only))
+
+        self.has_negations = any(negate for __, negate, __ in self.rules)
+
+        # Combined patterns to check in a single pass if any rule matches
+        self._any_dir = self._combine(self.rules)
+        self._any_file = self._combine(
+            [rule for rule in self.rules if not rule[2]]
+        )
+
+    def __bool__(self):
+        return bool(self.rules)
+
+    def _combine(self, rules):
+        if not rules:
+            return None
+        return re.compile(
+            '|'.join(f'(?:{regex.pattern})' for regex, __, __ in rules)
+        )
+
+    def match(self, relpath, is_dir):
+        """
+        Check if a path matches these rules.
+
+        Parameters
+        ----------
+        relpath: str
+            Path relative to `base`, with forward slashes as separators.
+        is_dir: bool
+            Whether the path is a folder.
+
+        Returns
+        -------
+        bool or None
+            True if the path is ignored, False if it's explicitly included by
+            a negated rule and None if no rule matches it.
+        """
+        combined = self._any_dir if is_dir else self._any_file
+        if combined is None or not combined.match(relpath):
+            return None
+
+        if not self.has_negations:
+            return True
+
+        # The last matching rule wins
+        for regex, negate, dir_only in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relpath):
+                return not negate
+
+        return None
+
+
+def read_ignore_rules(path, names):
+    """
+    Read the ignore files in `path`.
+
+    Parameters
+    ----------
+    path: str
+        Folder to read the files from.
+    names: set
+        Names of the entries in `path`, used to avoid trying to open files
+        that don't exist.
+
+    Returns
+    -------
+    IgnoreRules or None
+        The rules found, if any.
+    """
+    lines = []
+    for name in IGNORE_FILES:
+        if name in names:
+            try:
+                with open(os.path.join(path, name), encoding='utf-8',
+                          errors='replace') as f:
+                    lines.extend(f.readlines())
+            except OSError:
+                pass
+
+    rules = IgnoreRules(path, lines)
+    return rules if rules else None
+
+
+def is_ignored(path, is_dir, rules_stack):
+    """Check if `path` is ignored by the rules of its parent folders."""
+    # Deeper rules take precedence over the ones in parent folders.
+    for rules in reversed(rules_stack):
+        relpath = path[len(rules.base) + 1:]
+        if os.sep != '/':
+            relpath = relpath.replace(os.sep, '/')
+
+        result = rules.match(relpath, is_dir)
+        if result is not None:
+            return result
+
+    return False
+
+
+# ---- Walker
+# ----------------------------------------------------------------------------
+def walk_files(root, exclude=None, use_ignore_files=True, stopped=None):
+    """
+    Generate the files inside `root` that can be searched.
+
+    Parameters
+    ----------
+    root: str
+        Folder to walk.
+    exclude: re.Pattern, optional
+        Files and folders whose path matches this pattern are skipped. For
+        folders, the path is matched with a trailing separator.
+    use_ignore_files: bool, optional
+        Whether to honor `.gitignore` and `.ignore` files, and skip virtual
+        environments and the folders in `IGNORED_FOLDERS`. Default is True.
+    stopped: callable, optional
+        Function that returns True when walking must stop.
+
+    Yields
+    ------
+    os.DirEntry
+        Entries of the regular files found.
+
+    Notes
+    -----
+    * Hidden folders and symbolic links to folders are always skipped.
+    * Folders are walked depth-first.
+    """
+    # Stack of (path, ignore rules of it and its parents)
+    stack = [(root, [])]
+
+    while stack:
+        if stopped is not None and stopped():
+            return
+
+        path, rules_stack = stack.pop()
+
+        # The try/except is necessary to catch an error when Python can't
+        # access a directory with junctions on Windows.
+        # Fixes spyder-ide/spyder#24898
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        if use_ignore_files:
+            names = {entry.name for entry in entries}
+
+            # Skip virtual environments, unless the user is searching
+            # directly in one.
+            if VENV_MARKER in names and path != root:
+                continue
+
+            rules = read_ignore_rules(path, names)
+            if rules is not None:
+                rules_stack = rules_stack + [rules]
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if is_dir:
+                name = entry.name
+                if name.startswith('.'):
+                    # Exclude all dot dirs.
+                    continue
+                if exclude is not None and exclude.search(entry.path + os.sep):
+                    # Exclude patterns defined by the user
+                    continue
+                if use_ignore_files and (
+                    name in IGNORED_FOLDERS
+                    or is_ignored(entry.path, True, rules_stack)
+                ):
+                    continue
+
+                subdirs.append(entry.path)
+            else:
+                # Only search in regular files (i.e. not pipes). The
+                # try/except is necessary to catch an error when Python can't
+                # get the file status due to too many levels of symbolic
+                # links.
+                # Fixes spyder-ide/spyder#20798
+                try:
+                    if not entry.is_file():
+                        continue
+                except OSError:
+                    continue
+
+                if exclude is not None and exclude.search(entry.path):
+                    continue
+                if use_ignore_files and is_ignored(
+                    entry.path, False, rules_stack
+                ):
+                    continue
+
+                yield entry
+
+        # Reversed so that folders are walked in the order they were listed
+        stack.extend((d, rules_stack) for d in reversed(subdirs))
@@ -57,6 +57,7 @@ class FindInFilesWidgetActions:
     ToggleExcludeRegex = 'togle_use_regex_on_exlude_action'
     ToggleMoreOptions = 'toggle_more_options_action'
     ToggleSearchRegex = 'toggle_use_regex_on_search_action'
+    ToggleIgnoreFiles = 'toggle_use_ignore_files_action'
 
 
 class FindInFilesWidgetToolbars:
@@ -148,6 +149,7 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.text_color = self.get_conf('text_color')
         self.supported_encodings = self.get_conf('supported_encodings')
         self.search_thread = None
+        self.search_index = None
         self.running = False
         self.more_options_action = None
         self.extras_toolbar = None
@@ -404,12 +406,24 @@ def setup(self):
                 section=FindInFilesWidgetLocationToolbarSections.Main,
             )
 
-        menu = self.get_options_menu()
-        self.add_item_to_menu(
-            self.set_max_results_action,
-            menu=menu,
+        self.ignore_files_action = self.create_action(
+            FindInFilesWidgetActions.ToggleIgnoreFiles,
+            text=_('Skip files ignored by .gitignore and virtual '
+                   'environments'),
+            tip=_('Skip files ignored by .gitignore and virtual '
+                  'environments'),
+            toggled=True,
+            initial=self.get_conf('use_ignore_files'),
+            option='use_ignore_files'
         )
 
+        menu = self.get_options_menu()
+        for item in [self.ignore_files_action, self.set_max_results_action]:
+            self.add_item_to_menu(
+                item,
+                menu=menu,
+            )
+
     def update_actions(self):
         self.find_action.setIcon(self.create_icon(
             'stop' if self.running else 'find')
@@ -514,6 +528,7 @@ def _get_options(self):
         text_re = self.search_regexp_action.isChecked()
         exclude_re = self.exclude_regexp_action.isChecked()
         case_sensitive = self.case_action.isChecked()
+        use_ignore_files = self.ignore_files_action.isChecked()
 
         # Clear fields
         self.messages_action.setVisible(False)
@@ -565,7 +580,8 @@ def _get_options(self):
             else:
                 texts = [(re.compile(x[0]), x[1]) for x in texts]
 
-        return (path, file_search, exclude, texts, text_re, case_sensitive)
+        return (path, file_search, exclude, texts, text_re, case_sensitive,
+                use_ignore_files)
 
     def _update_options(self):
         """
@@ -677,6 +693,17 @@ def set_file_path(self, path):
         """
         self.path_selection_combo.file_path = path
 
+    def set_search_index(self, search_index):
+        """
+        Set the index used to narrow down the files to search in.
+
+        Parameters
+        ----------
+        search_index: spyder.plugins.projects.utils.search_index.SearchIndex
+            Search index or None to not use any.
+        """
+        self.search_index = search_index
+
     def set_search_text(self, text):
         """
         Set current search text.
@@ -735,8 +762,6 @@ def start(self):
 
         # Setup result_browser
         self.result_browser.set_path(options[0])
-        self.result_browser.longest_file_item = ''
-        self.result_browser.longest_line_item = ''
 
         # Start
         self.running = True
@@ -756,6 +781,7 @@ def start(self):
         )
         self.result_browser.clear_title(search_text)
         self.search_thread.initialize(*self._get_options())
+        self.search_thread.set_search_index(self.search_index)
         self.search_thread.start()
         self.update_actions()
 
@@ -795,7 +821,7 @@ def set_max_results(self, value=None):
             # dialog. Since that value seems a bit arbitrary, we decided to set
             # it to 5.
             # See spyder-ide/spyder#16256
-            dialog.setIntRange(5, 10000)
+            dialog.setIntRange(5, 1000000)
 
             # Connect slot
             dialog.intValueSelected.connect(
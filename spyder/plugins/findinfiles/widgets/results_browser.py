@@ -7,24 +7,31 @@
 """Results browser."""
 
 # Standard library imports
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping
 import os.path as osp
 
 # Third party imports
-from qtpy.QtCore import QPoint, QSize, Qt, Signal, Slot
+from qtpy.QtCore import (QAbstractItemModel, QModelIndex, QPoint, QSize, Qt,
+                         Signal, Slot)
 from qtpy.QtGui import (QAbstractTextDocumentLayout, QColor, QFontMetrics,
                         QTextDocument)
-from qtpy.QtWidgets import (QApplication, QStyle, QStyledItemDelegate,
-                            QStyleOptionViewItem, QTreeWidgetItem)
+from qtpy.QtWidgets import (QAbstractItemView, QApplication, QHeaderView,
+                            QStyle, QStyledItemDelegate, QStyleOptionViewItem,
+                            QTreeView)
 
 # Local imports
 from spyder.api.fonts import SpyderFontsMixin, SpyderFontType
 from spyder.api.translations import _
+from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.plugins.findinfiles.widgets.search_thread import (
-    ELLIPSIS, MAX_RESULT_LENGTH)
+    ELLIPSIS, MAX_RESULT_LENGTH, truncate_result)
 from spyder.utils import icon_manager as ima
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.stylesheet import AppStyle
-from spyder.widgets.onecolumntree import OneColumnTree
+from spyder.widgets.onecolumntree import (
+    OneColumnTreeActions, OneColumnTreeContextMenuSections)
 
 
 # ---- Constants
@@ -32,51 +39,23 @@
 ON = 'on'
 OFF = 'off'
 
+# Number of lines kept in memory to display results
+MAX_CACHED_LINES = 1024
 
-# ---- Items
-# ----------------------------------------------------------------------------
-class LineMatchItem(QTreeWidgetItem):
-
-    def __init__(self, parent, lineno, colno, match, font, text_color):
-        self.lineno = lineno
-        self.colno = colno
-        self.match = match['formatted_text']
-        self.plain_match = match['text']
-        self.text_color = text_color
-        self.font = font
-        super().__init__(parent, [self.__repr__()], QTreeWidgetItem.Type)
-
-    def __repr__(self):
-        match = str(self.match).rstrip()
-        _str = (
-            f"<!-- LineMatchItem -->"
-            f"<p style=\"color:'{self.text_color}';\">"
-            f'&nbsp;&nbsp;'
-            f"<b>{self.lineno}</b> ({self.colno}): "
-            f"<span style='font-family:{self.font.family()};"
-            f"font-size:{self.font.pointSize()}pt;'>{match}</span></p>"
-        )
-        return _str
-
-    def __unicode__(self):
-        return self.__repr__()
-
-    def __str__(self):
-        return self.__repr__()
+# Maximum number of bytes read from a line to display a result
+MAX_LINE_BYTES = 64 * 1024
 
-    def __lt__(self, x):
-        return self.lineno < x.lineno
 
-    def __ge__(self, x):
-        return self.lineno >= x.lineno
-
-
-class FileMatchItem(QTreeWidgetItem):
+# ---- Results
+# ----------------------------------------------------------------------------
+class FileResults:
+    """Matches found in a file."""
 
-    def __init__(self, parent, path, filename, sorting, text_color):
+    __slots__ = ('file_id', 'filename', 'rel_dirname', 'matches')
 
-        self.sorting = sorting
-        self.filename = osp.basename(filename)
+    def __init__(self, file_id, filename, path):
+        self.file_id = file_id
+        self.filename = filename
 
         # Get relative dirname according to the path we're searching in.
         dirname = osp.dirname(filename)
@@ -93,31 +72,363 @@ def __init__(self, parent, path, filename, sorting, text_color):
 
         self.rel_dirname = rel_dirname
 
-        title = (
-            f'<!-- FileMatchItem -->'
-            f'<b style="color:{text_color}">{osp.basename(filename)}</b>'
-            f'&nbsp;&nbsp;&nbsp;'
-            f'<span style="color:{text_color}">'
-            f'<em>{self.rel_dirname}</em>'
-            f'</span>'
+        # Positions of the matches of this file in the store
+        self.matches = array('l')
+
+    @property
+    def basename(self):
+        return osp.basename(self.filename)
+
+
+class ResultsStore(Mapping):
+    """
+    Columnar store of the matches found by a search.
+
+    Matches are saved in arrays of ints instead of one Python object per
+    match, so that hundreds of thousands of them can be kept in memory. The
+    text of their lines is not saved; only their position in the file, from
+    which they are read when the matches are displayed.
+
+    It's a mapping from the position of each match to a
+    `(filename, lineno, start, end)` tuple.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def __getitem__(self, key):
+        if not 0 <= key < len(self._linenos):
+            raise KeyError(key)
+
+        return (
+            self.files[self._file_ids[key]].filename,
+            self._linenos[key],
+            self._starts[key],
+            self._ends[key],
         )
 
-        super().__init__(parent, [title], QTreeWidgetItem.Type)
+    def __iter__(self):
+        return iter(range(len(self._linenos)))
+
+    def __len__(self):
+        return len(self._linenos)
+
+    def clear(self):
+        """Remove all results."""
+        # List of FileResults, indexed by file id
+        self.files = []
+
+        # Map from filename to its FileResults
+        self.filenames = {}
+
+        # Columns of the matches
+        self._file_ids = array('l')
+        self._linenos = array('l')
+        self._starts = array('l')
+        self._ends = array('l')
+        self._line_offsets = array('q')
+        self._line_lengths = array('l')
+        self._encoding_ids = array('B')
+
+        # Encodings of the lines, indexed by encoding id
+        self._encodings = []
+
+    def add_file(self, filename, path):
+        """Add a file and return its FileResults."""
+        file_results = self.filenames.get(filename)
+        if file_results is None:
+            file_results = FileResults(len(self.files), filename, path)
+            self.files.append(file_results)
+            self.filenames[filename] = file_results
+        return file_results
+
+    def add_match(self, file_results, lineno, start, end, line_offset,
+                  line_length, encoding):
+        """Add a match found in a file."""
+        file_results.matches.append(len(self._linenos))
+        self._file_ids.append(file_results.file_id)
+        self._linenos.append(lineno)
+        self._starts.append(start)
+        self._ends.append(end)
+        self._line_offsets.append(line_offset)
+        self._line_lengths.append(line_length)
+
+        if encoding not in self._encodings:
+            self._encodings.append(encoding)
+        self._encoding_ids.append(self._encodings.index(encoding))
+
+    def get_line_location(self, key):
+        """
+        Get the offset and length in bytes of the line of a match, and the
+        encoding its text must be decoded with.
+        """
+        return (
+            self._line_offsets[key],
+            self._line_lengths[key],
+            self._encodings[self._encoding_ids[key]],
+        )
 
-        self.setIcon(0, ima.get_icon_by_extension_or_type(filename, 1.0))
-        self.setToolTip(0, filename)
 
-    def __lt__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename < x.filename
-        else:
-            return False
+class LineCache:
+    """
+    Cache of the lines of the matches that are displayed.
+
+    Only the lines that are needed are read, from their position in the
+    file.
+    """
+
+    def __init__(self, max_lines=MAX_CACHED_LINES):
+        self.max_lines = max_lines
+        self._lines = OrderedDict()
+
+    def clear(self):
+        self._lines.clear()
+
+    def get_line(self, filename, offset, length, encoding):
+        """
+        Get the line that starts at byte `offset` of `filename`.
+
+        Parameters
+        ----------
+        filename: str
+            Path to the file.
+        offset, length: int
+            Position and size in bytes of the line when the file was searched.
+        encoding: str
+            Encoding the line must be decoded with, so that match positions
+            correspond to its characters.
+
+        Returns
+        -------
+        str
+            The text of the line, without its line ending. It's empty if the
+            file can't be read or it changed after the search.
+        """
+        key = (filename, offset)
+        line = self._lines.get(key)
+        if line is not None:
+            self._lines.move_to_end(key)
+            return line
+
+        # The byte before the line is read too, to check that the line still
+        # starts at the same position.
+        size = min(length, MAX_LINE_BYTES)
+        start = max(offset - 1, 0)
+        try:
+            with open(filename, 'rb') as f:
+                f.seek(start)
+                data = f.read(offset - start + size)
+        except OSError:
+            data = b''
 
-    def __ge__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename >= x.filename
-        else:
-            return False
+        if offset > 0:
+            data = data[1:] if data[:1] == b'\n' else b''
+
+        # Lines truncated to MAX_LINE_BYTES don't have their line ending
+        body = data[:-1] if size == length else data
+        if len(data) != size or b'\n' in body:
+            # The file changed after the search
+            data = b''
+
+        line = data.decode(encoding, errors='replace').rstrip('\r\n')
+        self._lines[key] = line
+        if len(self._lines) > self.max_lines:
+            self._lines.popitem(last=False)
+
+        return line
+
+
+# ---- Model
+# ----------------------------------------------------------------------------
+class ResultsModel(QAbstractItemModel):
+    """
+    Model of the results found by a search.
+
+    Top level rows are files and their children are the matches found in
+    them. Display data is computed only for the rows that are shown.
+    """
+
+    def __init__(self, parent, text_color):
+        super().__init__(parent)
+        self.store = ResultsStore()
+        self.lines = LineCache()
+        self.text_color = text_color
+        self.font = None
+        self.title = ''
+
+        # Longest line displayed so far, used to compute the items width
+        self.longest_line = ''
+
+        # Display order of the files
+        self._order = []
+        self._rows = {}
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def clear(self):
+        """Remove all results."""
+        self.beginResetModel()
+        self.store.clear()
+        self.lines.clear()
+        self._order = []
+        self._rows = {}
+        self.longest_line = ''
+        self.endResetModel()
+
+    def add_file(self, filename, path):
+        """Add a file and return the index of its row."""
+        file_results = self.store.filenames.get(filename)
+        if file_results is None:
+            row = len(self._order)
+            self.beginInsertRows(QModelIndex(), row, row)
+            file_results = self.store.add_file(filename, path)
+            self._order.append(file_results)
+            self._rows[file_results.file_id] = row
+            self.endInsertRows()
+
+        return self.createIndex(self._rows[file_results.file_id], 0)
+
+    def add_matches(self, filename, matches):
+        """
+        Add matches found in `filename`.
+
+        Parameters
+        ----------
+        filename: str
+            File where the matches were found. It must have been added with
+            `add_file`.
+        matches: list
+            List of `(lineno, start, end, line_offset, line_length,
+            encoding)` tuples.
+        """
+        file_results = self.store.filenames[filename]
+        parent = self.createIndex(self._rows[file_results.file_id], 0)
+        first = len(file_results.matches)
+
+        self.beginInsertRows(parent, first, first + len(matches) - 1)
+        for match in matches:
+            self.store.add_match(file_results, *match)
+        self.endInsertRows()
+
+    def sort_files(self):
+        """Sort files by their name."""
+        self.beginResetModel()
+        self._order.sort(key=lambda f: f.basename)
+        self._rows = {f.file_id: row for row, f in enumerate(self._order)}
+        self.endResetModel()
+
+    def set_title(self, title):
+        self.title = title
+        self.headerDataChanged.emit(Qt.Horizontal, 0, 0)
+
+    def get_file_results(self, index):
+        """Get the FileResults of a file row, or None for other rows."""
+        if index.isValid() and index.internalPointer() is None:
+            return self._order[index.row()]
+
+    def get_match(self, index):
+        """
+        Get the match of a row.
+
+        Returns
+        -------
+        tuple or None
+            A `(filename, lineno, start, end)` tuple, or None if `index` is
+            not a match row.
+        """
+        if not index.isValid():
+            return
+
+        file_results = index.internalPointer()
+        if file_results is None:
+            return
+
+        return self.store[file_results.matches[index.row()]]
+
+    # ---- Qt methods
+    # ------------------------------------------------------------------------
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column)
+
+        # Match rows point to the results of their file
+        return self.createIndex(row, column, self._order[parent.row()])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+
+        file_results = index.internalPointer()
+        if file_results is None:
+            return QModelIndex()
+
+        return self.createIndex(self._rows[file_results.file_id], 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._order)
+
+        if parent.internalPointer() is None:
+            return len(self._order[parent.row()].matches)
+
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        return self.rowCount(parent) > 0
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.title
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return
+
+        file_results = self.get_file_results(index)
+        if file_results is not None:
+            if role == Qt.DisplayRole:
+                return (
+                    f'<!-- FileMatchItem -->'
+                    f'<b style="color:{self.text_color}">'
+                    f'{file_results.basename}</b>'
+                    f'&nbsp;&nbsp;&nbsp;'
+                    f'<span style="color:{self.text_color}">'
+                    f'<em>{file_results.rel_dirname}</em>'
+                    f'</span>'
+                )
+            elif role == Qt.DecorationRole:
+                return ima.get_icon_by_extension_or_type(
+                    file_results.filename, 1.0
+                )
+            elif role == Qt.ToolTipRole:
+                return file_results.filename
+        elif role == Qt.DisplayRole:
+            file_results = index.internalPointer()
+            key = file_results.matches[index.row()]
+            filename, lineno, colno, match_end = self.store[key]
+            line = self.lines.get_line(
+                filename, *self.store.get_line_location(key)
+            )
+            match = truncate_result(line, colno, match_end, self.text_color)
+
+            if len(match['text']) > len(self.longest_line):
+                self.longest_line = match['text']
+
+            return (
+                f"<!-- LineMatchItem -->"
+                f"<p style=\"color:'{self.text_color}';\">"
+                f'&nbsp;&nbsp;'
+                f"<b>{lineno}</b> ({colno}): "
+                f"<span style='font-family:{self.font.family()};"
+                f"font-size:{self.font.pointSize()}pt;'>"
+                f"{match['formatted_text'].rstrip()}</span></p>"
+            )
 
 
 # ---- Browser
@@ -161,7 +472,7 @@ def paint(self, painter, option, index):
         doc.setDocumentMargin(0)
 
         # This needs to be an empty string to avoid overlapping the
-        # normal text of the QTreeWidgetItem
+        # normal text of the item
         options.text = ""
         style.drawControl(QStyle.CE_ItemViewItem, options, painter)
 
@@ -185,13 +496,15 @@ def sizeHint(self, option, index):
         return size
 
 
-class ResultsBrowser(OneColumnTree, SpyderFontsMixin):
+class ResultsBrowser(SpyderWidgetMixin, QTreeView, SpyderFontsMixin):
 
     sig_edit_goto_requested = Signal(str, int, str, int, int)
     sig_max_results_reached = Signal()
 
     def __init__(self, parent, text_color, max_results=1000):
-        super().__init__(parent)
+        QTreeView.__init__(self, parent)
+        SpyderWidgetMixin.__init__(self, class_parent=parent)
+
         self.search_text = None
         self.results = None
         self.max_results = max_results
@@ -200,32 +513,85 @@ def __init__(self, parent, text_color, max_results=1000):
         self.completed = None
         self.sorting = {}
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.data = None
-        self.files = None
-        self.root_items = None
         self.text_color = text_color
         self.path = None
         self.longest_file_item = ''
-        self.longest_line_item = ''
+
+        # Model
+        self.results_model = ResultsModel(self, text_color)
+        self.results_model.font = self.font
+        self.setModel(self.results_model)
 
         # Setup
+        self.setup()
+        self.setItemsExpandable(True)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.header().setStretchLastSection(False)
         self.set_title('')
         self.set_sorting(OFF)
-        self.setSortingEnabled(False)
         self.setItemDelegate(ItemDelegate(self))
         self.setUniformRowHeights(True)  # Needed for performance
-        self.sortByColumn(0, Qt.AscendingOrder)
 
-        # Only show the actions for collaps/expand all entries in the widget
-        # For further information see spyder-ide/spyder#13178
-        self.common_actions = self.common_actions[:2]
+        # To use mouseMoveEvent
+        self.setMouseTracking(True)
 
         # Signals
+        self.activated.connect(self.on_item_activated)
+        self.clicked.connect(self.on_item_clicked)
         self.header().sectionClicked.connect(self.sort_section)
 
-    def on_item_activated(self, item):
+    # ---- SpyderWidgetMixin API
+    # ------------------------------------------------------------------------
+    def setup(self):
+        self.menu = self.create_menu("context_menu")
+
+        # Only show the actions for collaps/expand all entries in the widget
+        # For further information see spyder-ide/spyder#13178
+        collapse_all_action = self.create_action(
+            OneColumnTreeActions.CollapseAllAction,
+            text=_("Collapse all"),
+            icon=ima.icon("collapse"),
+            triggered=self.collapseAll,
+            register_shortcut=False,
+        )
+        expand_all_action = self.create_action(
+            OneColumnTreeActions.ExpandAllAction,
+            text=_("Expand all"),
+            icon=ima.icon("expand"),
+            triggered=self.expandAll,
+            register_shortcut=False,
+        )
+
+        for item in [collapse_all_action, expand_all_action]:
+            self.add_item_to_menu(
+                item,
+                self.menu,
+                section=OneColumnTreeContextMenuSections.Global,
+            )
+
+    def update_actions(self):
+        pass
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    @property
+    def data(self):
+        """Matches displayed, as a `ResultsStore`."""
+        return self.results_model.store
+
+    @property
+    def files(self):
+        """Map from filename to the results displayed for it."""
+        return self.results_model.store.filenames
+
+    @property
+    def longest_line_item(self):
+        return self.results_model.longest_line
+
+    def on_item_activated(self, index):
         """Double-click event."""
-        itemdata = self.data.get(id(self.currentItem()))
+        itemdata = self.results_model.get_match(index)
         if itemdata is not None:
             filename, lineno, colno, colend = itemdata
             self.sig_edit_goto_requested.emit(
@@ -238,25 +604,23 @@ def set_sorting(self, flag):
 
     @Slot(int)
     def sort_section(self, idx):
-        self.setSortingEnabled(True)
+        if self.sorting['status'] == ON:
+            self.results_model.sort_files()
+            self.expandAll()
 
-    def on_item_clicked(self, item):
+    def on_item_clicked(self, index):
         """Click event."""
-        if isinstance(item, FileMatchItem):
-            if item.isExpanded():
-                self.collapseItem(item)
-            else:
-                self.expandItem(item)
+        if self.results_model.get_file_results(index) is not None:
+            self.setExpanded(index, not self.isExpanded(index))
         else:
-            self.on_item_activated(item)
+            self.on_item_activated(index)
 
     def clear_title(self, search_text):
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.clear()
-        self.setSortingEnabled(False)
+        self.results_model.font = self.font
+        self.results_model.clear()
         self.num_files = 0
-        self.data = {}
-        self.files = {}
+        self.longest_file_item = ''
         self.set_sorting(OFF)
         self.search_text = search_text
 
@@ -273,26 +637,20 @@ def set_title(self, title):
         else:
             elided_title = title
 
-        self.setHeaderLabels([elided_title])
+        self.results_model.set_title(elided_title)
 
     @Slot(object)
     def append_file_result(self, filename):
         """Real-time update of file items."""
         if len(self.data) < self.max_results:
-            item = FileMatchItem(
-                self,
-                self.path,
-                filename,
-                self.sorting,
-                self.text_color
-            )
-
-            self.files[filename] = item
-
-            item.setExpanded(True)
+            index = self.results_model.add_file(filename, self.path)
+            self.setExpanded(index, True)
             self.num_files += 1
 
-            item_text = osp.join(item.rel_dirname, item.filename)
+            file_results = self.files[filename]
+            item_text = osp.join(
+                file_results.rel_dirname, file_results.basename
+            )
             if len(item_text) > len(self.longest_file_item):
                 self.longest_file_item = item_text
 
@@ -300,9 +658,7 @@ def append_file_result(self, filename):
     def append_result(self, items, title):
         """Real-time update of line items."""
         if len(self.data) >= self.max_results:
-            self.set_title(_('Maximum number of results reached! Try '
-                             'narrowing the search.'))
-            self.sig_max_results_reached.emit()
+            self._notify_max_results_reached()
             return
 
         available = self.max_results - len(self.data)
@@ -311,19 +667,23 @@ def append_result(self, items, title):
 
         self.setUpdatesEnabled(False)
         self.set_title(title)
-        for item in items:
-            filename, lineno, colno, line, match_end = item
-            file_item = self.files.get(filename, None)
-            if file_item:
-                item = LineMatchItem(file_item, lineno, colno, line,
-                                     self.font, self.text_color)
-                self.data[id(item)] = (filename, lineno, colno, match_end)
 
-                if len(item.plain_match) > len(self.longest_line_item):
-                    self.longest_line_item = item.plain_match
+        # Rows are inserted in a single operation per file
+        groups = {}
+        for filename, *match in items:
+            if filename in self.files:
+                groups.setdefault(filename, []).append(match)
+
+        for filename, matches in groups.items():
+            self.results_model.add_matches(filename, matches)
 
         self.setUpdatesEnabled(True)
 
+        # The search engine stops once it finds the maximum number of
+        # results, so no other batch would tell that it was reached.
+        if len(self.data) >= self.max_results:
+            self._notify_max_results_reached()
+
     def set_max_results(self, value):
         """Set maximum amount of results to add."""
         self.max_results = value
@@ -344,7 +704,8 @@ def set_width(self):
         )
         file_item_width = file_item_size.width()
 
-        # Line item width
+        # Line item width. Lines are only read when they are shown, so the
+        # longest line of the ones shown so far is used.
         metrics = QFontMetrics(self.font)
         line_item_chars = len(self.longest_line_item)
         if line_item_chars >= MAX_RESULT_LENGTH:
@@ -373,3 +734,29 @@ def set_width(self):
                 width = width + 2 * AppStyle.MarginSize
 
         self.itemDelegate().width = width
+
+    # ---- Qt methods
+    # ------------------------------------------------------------------------
+    def contextMenuEvent(self, event):
+        """Override Qt method"""
+        self.menu.popup(event.globalPos())
+
+    def mouseMoveEvent(self, event):
+        """Change cursor shape."""
+        index = self.indexAt(event.pos())
+        if index.isValid():
+            vrect = self.visualRect(index)
+            item_identation = vrect.x() - self.visualRect(self.rootIndex()).x()
+            if event.pos().x() > item_identation:
+                # When hovering over results
+                self.setCursor(Qt.PointingHandCursor)
+            else:
+                # On every other element
+                self.setCursor(Qt.ArrowCursor)
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _notify_max_results_reached(self):
+        self.set_title(_('Maximum number of results reached! Try '
+                         'narrowing the search.'))
+        self.sig_max_results_reached.emit()
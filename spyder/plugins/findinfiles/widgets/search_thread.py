@@ -7,10 +7,8 @@
 """Search thread."""
 
 # Standard library imports
-import os
 import os.path as osp
 import re
-import stat
 import traceback
 
 # Third party imports
@@ -19,7 +17,10 @@
 # Local imports
 from spyder.api.translations import _
 from spyder.config.utils import EDIT_EXTENSIONS
-from spyder.utils.encoding import is_text_file
+from spyder.plugins.findinfiles.utils.search_engine import (
+    CHUNK_SIZE, compile_patterns, scan_file, SearchEngine)
+from spyder.plugins.findinfiles.utils.walker import (
+    is_text_file_cached, walk_files)
 from spyder.utils.palette import SpyderPalette
 
 
@@ -30,6 +31,100 @@
 MAX_NUM_CHAR_FRAGMENT = 40
 
 
+# ---- Auxiliary functions
+# ----------------------------------------------------------------------------
+def truncate_result(line, start, end, text_color):
+    """
+    Shorten text on line to display the match within `max_line_length`.
+
+    Parameters
+    ----------
+    line: str
+        Line where the match was found.
+    start: int
+        Start of the match in `line`.
+    end: int
+        End of the match in `line`.
+    text_color: str
+        Color used for the text.
+
+    Returns
+    -------
+    dict
+        Dictionary with the plain (`text`) and html (`formatted_text`)
+        versions of the truncated line.
+    """
+    html_escape_table = {
+        "&": "&amp;",
+        '"': "&quot;",
+        "'": "&apos;",
+        ">": "&gt;",
+        "<": "&lt;",
+    }
+
+    def html_escape(text):
+        """Produce entities within text."""
+        return "".join(html_escape_table.get(c, c) for c in text)
+
+    line = str(line)
+    left, match, right = line[:start], line[start:end], line[end:]
+
+    if len(line) > MAX_RESULT_LENGTH:
+        offset = (len(line) - len(match)) // 2
+
+        left = left.split(' ')
+        num_left_words = len(left)
+
+        if num_left_words == 1:
+            left = left[0]
+            if len(left) > MAX_NUM_CHAR_FRAGMENT:
+                left = ELLIPSIS + left[-offset:]
+            left = [left]
+
+        right = right.split(' ')
+        num_right_words = len(right)
+
+        if num_right_words == 1:
+            right = right[0]
+            if len(right) > MAX_NUM_CHAR_FRAGMENT:
+                right = right[:offset] + ELLIPSIS
+            right = [right]
+
+        left = left[-4:]
+        right = right[:4]
+
+        if len(left) < num_left_words:
+            left = [ELLIPSIS] + left
+
+        if len(right) < num_right_words:
+            right = right + [ELLIPSIS]
+
+        left = ' '.join(left)
+        right = ' '.join(right)
+
+        if len(left) > MAX_NUM_CHAR_FRAGMENT:
+            left = ELLIPSIS + left[-30:]
+
+        if len(right) > MAX_NUM_CHAR_FRAGMENT:
+            right = right[:30] + ELLIPSIS
+
+    match_color = SpyderPalette.COLOR_OCCURRENCE_4
+    trunc_line = dict(
+        text=''.join([left, match, right]),
+        formatted_text=(
+            f'<span style="color:{text_color}">'
+            f'{html_escape(left)}'
+            f'<span style="background-color:{match_color}">'
+            f'{html_escape(match)}'
+            f'</span>'
+            f'{html_escape(right)}'
+            f'</span>'
+        )
+    )
+
+    return trunc_line
+
+
 # ---- Thread
 # ----------------------------------------------------------------------------
 class SearchThread(QThread):
@@ -62,6 +157,8 @@ def __init__(self, parent, search_text, text_color, max_results=1000):
         self.max_results = max_results
 
         self.mutex = QMutex()
+        self.engine = None
+        self.search_index = None
         self.stopped = None
         self.pathlist = None
         self.error_flag = None
@@ -71,17 +168,18 @@ def __init__(self, parent, search_text, text_color, max_results=1000):
         self.text_re = None
         self.completed = None
         self.case_sensitive = True
+        self.use_ignore_files = True
         self.total_matches = 0
         self.is_file = False
         self.results = {}
 
         self.num_files = 0
-        self.files = []
+        self.files = set()
         self.partial_results = []
         self.total_items = 0
 
     def initialize(self, path, is_file, exclude,
-                   texts, text_re, case_sensitive):
+                   texts, text_re, case_sensitive, use_ignore_files=True):
         self.rootpath = path
         if exclude:
             self.exclude = re.compile(exclude)
@@ -91,26 +189,46 @@ def initialize(self, path, is_file, exclude,
         self.stopped = False
         self.completed = False
         self.case_sensitive = case_sensitive
+        self.use_ignore_files = use_ignore_files
+
+    def set_search_index(self, search_index):
+        """Set the index used to skip files that can't contain matches."""
+        self.search_index = search_index
 
     def run(self):
         try:
             self.filenames = []
+            patterns = compile_patterns(
+                self.texts, self.text_re, self.case_sensitive
+            )
+            with QMutexLocker(self.mutex):
+                self.engine = SearchEngine(patterns, self.max_results)
+                if self.stopped:
+                    self.engine.stop()
+
             if self.is_file:
                 self.find_string_in_file(self.rootpath)
             else:
                 self.find_files_in_path(self.rootpath)
+        except re.error:
+            self.error_flag = _("invalid regular expression")
         except Exception:
             # Important note: we have to handle unexpected exceptions by
             # ourselves because they won't be catched by the main thread
             # (known QThread limitation/bug)
             traceback.print_exc()
             self.error_flag = _("Unexpected error: see internal console")
+        finally:
+            if self.engine is not None:
+                self.engine.close()
         self.stop()
         self.sig_finished.emit(self.completed)
 
     def stop(self):
         with QMutexLocker(self.mutex):
             self.stopped = True
+            if self.engine is not None:
+                self.engine.stop()
             if not self.total_matches:
                 self.report_no_result()
 
@@ -118,82 +236,64 @@ def find_files_in_path(self, path):
         if self.pathlist is None:
             self.pathlist = []
         self.pathlist.append(path)
-        for path, dirs, files in os.walk(path):
-            with QMutexLocker(self.mutex):
+
+        # Files in the index that are not candidates can't contain the search
+        # text, unless they changed after being indexed.
+        candidates = None
+        if self.search_index is not None:
+            candidates = self.search_index.get_candidates(
+                self.texts, self.text_re, self.case_sensitive
+            )
+
+        try:
+            for i, entry in enumerate(
+                walk_files(
+                    path,
+                    exclude=self.exclude,
+                    use_ignore_files=self.use_ignore_files,
+                    stopped=lambda: self.stopped,
+                )
+            ):
                 if self.stopped:
                     return False
-            try:
-                # For directories
-                for d in dirs[:]:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-
-                    dirname = os.path.join(path, d)
-
-                    # Only search in regular directories.
-                    # The try/except is necessary to catch an error when Python
-                    # can't access a directory with junctions on Windows.
-                    # Fixes spyder-ide/spyder#24898
-                    try:
-                        st_dir_mode = os.stat(dirname).st_mode
-                        if not stat.S_ISDIR(st_dir_mode):
-                            dirs.remove(d)
-                    except OSError:
-                        dirs.remove(d)
-
-                    if (self.exclude and
-                            re.search(self.exclude, dirname + os.sep)):
-                        # Exclude patterns defined by the user
-                        dirs.remove(d)
-                    elif d.startswith('.'):
-                        # Exclude all dot dirs.
-                        dirs.remove(d)
-
-                # For files
-                for f in files:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-
-                    filename = os.path.join(path, f)
-                    ext = osp.splitext(filename)[1]
-
-                    # Only search in regular files (i.e. not pipes).
-                    # The try/except is necessary to catch an error when
-                    # Python can't get the file status due to too many levels
-                    # of symbolic links.
-                    # Fixes spyder-ide/spyder#20798
-                    try:
-                        st_file_mode = os.stat(filename).st_mode
-                        if not stat.S_ISREG(st_file_mode):
-                            continue
-                    except OSError:
-                        continue
-
-                    # Exclude patterns defined by the user
-                    if self.exclude and re.search(self.exclude, filename):
-                        continue
-
-                    # Don't search in plain text files with skipped extensions
-                    # (e.g .svg)
-                    if ext in self.SKIPPED_EXTENSIONS:
-                        continue
-
-                    # It's much faster to check for extension first before
-                    # validating if the file is plain text.
-                    if (
-                        ext in self.PYTHON_EXTENSIONS
-                        or ext in self.USEFUL_EXTENSIONS
-                        or ext in EDIT_EXTENSIONS
-                        or is_text_file(filename)
-                    ):
-                        self.find_string_in_file(filename)
-            except re.error:
-                self.error_flag = _("invalid regular expression")
-                return False
-            except FileNotFoundError:
-                return False
+
+                filename = entry.path
+                ext = osp.splitext(entry.name)[1]
+
+                # Don't search in plain text files with skipped extensions
+                # (e.g .svg)
+                if ext in self.SKIPPED_EXTENSIONS:
+                    continue
+
+                if (
+                    candidates is not None
+                    and filename not in candidates
+                    and self.search_index.is_up_to_date(
+                        filename, entry.stat()
+                    )
+                ):
+                    continue
+
+                # It's much faster to check for extension first before
+                # validating if the file is plain text.
+                if (
+                    ext in self.PYTHON_EXTENSIONS
+                    or ext in self.USEFUL_EXTENSIONS
+                    or ext in EDIT_EXTENSIONS
+                    or is_text_file_cached(entry)
+                ):
+                    self.engine.submit(filename)
+
+                # Show the results of the chunks of files that were already
+                # processed while we keep walking the tree.
+                if i % CHUNK_SIZE == 0:
+                    self.collect_results()
+        except OSError:
+            return False
+
+        self.collect_results(wait=True)
+        if self.stopped:
+            return False
 
         # Process pending results or report that no results were found
         if self.partial_results:
@@ -201,101 +301,61 @@ def find_files_in_path(self, path):
         elif not self.total_matches:
             self.report_no_result()
 
+        self.completed = True
         return True
 
     def find_string_in_file(self, fname):
         self.error_flag = False
         self.sig_current_file.emit(fname)
         try:
-            for lineno, line in enumerate(open(fname, 'rb')):
-                for text, enc in self.texts:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-                    line_search = line
-                    if not self.case_sensitive:
-                        line_search = line_search.lower()
-                    if self.text_re:
-                        found = re.search(text, line_search)
-                        if found is not None:
-                            break
-                    else:
-                        found = line_search.find(text)
-                        if found > -1:
-                            break
-                try:
-                    line_dec = line.decode(enc)
-                except UnicodeDecodeError:
-                    line_dec = line
-
-                if not self.case_sensitive:
-                    line = line.lower()
-
-                if self.text_re:
-                    for match in re.finditer(text, line):
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        bstart, bend = match.start(), match.end()
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:bstart].decode(enc))
-                            end = start + len(line[bstart:bend].decode(enc))
-                        except UnicodeDecodeError:
-                            start = bstart
-                            end = bend
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-                else:
-                    found = line.find(text)
-                    while found > -1:
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:found].decode(enc))
-                            end = start + len(text.decode(enc))
-                        except UnicodeDecodeError:
-                            start = found
-                            end = found + len(text)
-
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-
-                        for text, enc in self.texts:
-                            found = line.find(text, found + 1)
-                            if found > -1:
-                                break
-        except IOError as xxx_todo_changeme:
-            (_errno, _strerror) = xxx_todo_changeme.args
+            results = scan_file(
+                fname,
+                self.engine.patterns,
+                self.max_results,
+                self.engine.stop_event
+            )
+            self.add_results(results)
+        except (OSError, ValueError):
             self.error_flag = _("permission denied errors were encountered")
 
         # Process pending results or report that no results were found
-        if self.is_file:
-            if self.partial_results:
-                self.process_results()
-            elif not self.total_matches:
-                self.report_no_result()
+        if self.partial_results:
+            self.process_results()
+        elif not self.total_matches:
+            self.report_no_result()
 
         self.completed = True
 
+    def collect_results(self, wait=False):
+        """
+        Collect the results of the files processed by the search engine.
+
+        Parameters
+        ----------
+        wait: bool, optional
+            Whether to wait for all submitted files to be processed. Default
+            is False.
+        """
+        for results, error in self.engine.get_results(wait=wait):
+            if error:
+                self.error_flag = _(
+                    "permission denied errors were encountered"
+                )
+            self.add_results(results)
+
+    def add_results(self, results):
+        """Add results and process them in batches of increasing size."""
+        for result in results:
+            if self.stopped:
+                return
+
+            self.total_matches += 1
+            self.partial_results.append(result)
+            if len(self.partial_results) > (2**self.power):
+                self.process_results()
+                if self.power < self.max_power:
+                    self.power += 1
+
     def process_results(self):
         """
         Process all matches found inside a file.
@@ -303,8 +363,8 @@ def process_results(self):
         Creates the necessary files and emits signal for the creation of file
         item.
 
-        Creates the necessary data for lines found and emits signal for the
-        creation of line items in batch.
+        Creates the necessary data for matches found and emits signal for
+        their creation in batch.
 
         Creates the title based on the last entry of the lines batch.
         """
@@ -312,16 +372,16 @@ def process_results(self):
         num_matches = self.total_matches
         for result in self.partial_results:
             if self.total_items < self.max_results:
-                filename, lineno, colno, match_end, line = result
-
+                filename = result[0]
                 if filename not in self.files:
-                    self.files.append(filename)
+                    self.files.add(filename)
                     self.sig_file_match.emit(filename)
                     self.num_files += 1
 
-                line = self.truncate_result(line, colno, match_end)
-                item = (filename, lineno, colno, line, match_end)
-                items.append(item)
+                # The line text is not sent because the results browser
+                # reads it from its position in the file only when it's
+                # shown.
+                items.append(result)
                 self.total_items += 1
 
         # Process title
@@ -345,75 +405,7 @@ def truncate_result(self, line, start, end):
         """
         Shorten text on line to display the match within `max_line_length`.
         """
-        html_escape_table = {
-            "&": "&amp;",
-            '"': "&quot;",
-            "'": "&apos;",
-            ">": "&gt;",
-            "<": "&lt;",
-        }
-
-        def html_escape(text):
-            """Produce entities within text."""
-            return "".join(html_escape_table.get(c, c) for c in text)
-
-        line = str(line)
-        left, match, right = line[:start], line[start:end], line[end:]
-
-        if len(line) > MAX_RESULT_LENGTH:
-            offset = (len(line) - len(match)) // 2
-
-            left = left.split(' ')
-            num_left_words = len(left)
-
-            if num_left_words == 1:
-                left = left[0]
-                if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                    left = ELLIPSIS + left[-offset:]
-                left = [left]
-
-            right = right.split(' ')
-            num_right_words = len(right)
-
-            if num_right_words == 1:
-                right = right[0]
-                if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                    right = right[:offset] + ELLIPSIS
-                right = [right]
-
-            left = left[-4:]
-            right = right[:4]
-
-            if len(left) < num_left_words:
-                left = [ELLIPSIS] + left
-
-            if len(right) < num_right_words:
-                right = right + [ELLIPSIS]
-
-            left = ' '.join(left)
-            right = ' '.join(right)
-
-            if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                left = ELLIPSIS + left[-30:]
-
-            if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                right = right[:30] + ELLIPSIS
-
-        match_color = SpyderPalette.COLOR_OCCURRENCE_4
-        trunc_line = dict(
-            text=''.join([left, match, right]),
-            formatted_text=(
-                f'<span style="color:{self.text_color}">'
-                f'{html_escape(left)}'
-                f'<span style="background-color:{match_color}">'
-                f'{html_escape(match)}'
-                f'</span>'
-                f'{html_escape(right)}'
-                f'</span>'
-            )
-        )
-
-        return trunc_line
+        return truncate_result(line, start, end, self.text_color)
 
     def get_results(self):
         return self.results, self.pathlist, self.total_matches, self.error_flag
@@ -23,6 +23,7 @@
 from spyder.config.base import running_in_ci
 from spyder.config.manager import CONF
 from spyder.plugins.findinfiles.widgets.main_widget import FindInFilesWidget
+from spyder.plugins.findinfiles.widgets.results_browser import LineCache
 from spyder.plugins.findinfiles.widgets.combobox import (
     SearchInComboBox,
     SearchInComboBoxItems
@@ -724,7 +725,7 @@ def test_max_results(findinfiles, qtbot):
     assert len(findinfiles.result_browser.data) == value
 
     # Restore defaults
-    findinfiles.set_max_results(1000)
+    findinfiles.set_max_results(100000)
 
 
 @flaky(max_runs=5)
@@ -747,5 +748,54 @@ def test_find_in_single_file(findinfiles, qtbot):
     assert expected_results()['spam.txt'] == matches['spam.txt']
 
 
+def test_results_model(findinfiles, qtbot):
+    """
+    Test that the results model shows files and matches, and that the text of
+    the matched lines is read from the files.
+    """
+    findinfiles.set_search_text("spam")
+    findinfiles.set_file_path(osp.join(LOCATION, "data", 'spam.txt'))
+    findinfiles.path_selection_combo.setCurrentIndex(
+        SearchInComboBoxItems.File
+    )
+
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+
+    model = findinfiles.result_browser.model()
+    assert model.rowCount() == 1
+
+    file_index = model.index(0, 0)
+    assert 'spam.txt' in model.data(file_index)
+    assert model.rowCount(file_index) == 3
+    assert model.parent(model.index(0, 0, file_index)) == file_index
+
+    # Check the text shown for the first match
+    with open(osp.join(LOCATION, "data", 'spam.txt')) as f:
+        first_line = f.readline().rstrip()
+
+    display = model.data(model.index(0, 0, file_index))
+    assert '<b>1</b> (0)' in display
+    assert first_line.split()[-1] in display
+
+
+def test_line_cache(tmp_path):
+    """
+    Test that lines are read from their position with the encoding of the
+    search, and that they are not shown if the file changed.
+    """
+    fname = tmp_path / 'spam.txt'
+    fname.write_bytes('ham\r\nñam spam\n'.encode('latin-1'))
+    cache = LineCache()
+
+    assert cache.get_line(str(fname), 0, 5, 'utf-8') == 'ham'
+    assert cache.get_line(str(fname), 5, 9, 'latin-1') == 'ñam spam'
+
+    fname.write_bytes(b'spam\nham\n')
+    cache.clear()
+    assert cache.get_line(str(fname), 5, 9, 'latin-1') == ''
+    assert cache.get_line(str(tmp_path / 'eggs.txt'), 0, 5, 'utf-8') == ''
+
+
 if __name__ == "__main__":
     pytest.main(['-x', osp.basename(__file__), '-v', '-rw'])
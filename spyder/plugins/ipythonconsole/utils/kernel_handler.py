@@ -36,6 +36,7 @@
     SpyderWSKernelClient,
 )
 from spyder.utils.programs import check_version_range
+from spyder.utils.timeline import STARTUP_TIMELINE
 
 
 PERMISSION_ERROR_MSG = _(
@@ -410,11 +411,12 @@ def new_from_spec(cls, kernel_spec):
         kernel_manager._kernel_spec = kernel_spec
 
         try:
-            kernel_manager.start_kernel(
-                stderr=PIPE,
-                stdout=PIPE,
-                env=kernel_spec.env,
-            )
+            with STARTUP_TIMELINE.span("Spawn kernel", "kernel"):
+                kernel_manager.start_kernel(
+                    stderr=PIPE,
+                    stdout=PIPE,
+                    env=kernel_spec.env,
+                )
         except PermissionError:
             # Show a nice error message when jupyter_runtime_dir is not
             # writable.
@@ -16,10 +16,10 @@
 import sys
 
 # Third-party imports
-import cloudpickle
 from packaging.version import parse
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
-from spyder_kernels.comms.commbase import CommError
+from spyder_kernels.comms.commbase import (
+    CommError, CommsErrorWrapper, Pickled)
 
 # Local imports
 from spyder.api.translations import _
@@ -136,10 +136,11 @@ def get_value(self, name):
         msg_without_note = "<br>%s"
 
         # ---- Raise error which includes the message
-        kernel_call_success = False
         show_full_msg = True
         try:
-            value = self.call_kernel(
+            # The value is pickled by the kernel and unpickled here when its
+            # reply is received.
+            return self.call_kernel(
                 blocking=True,
                 # We prefer not to display errors because it's not clear that
                 # they are related to what users are doing in the Variable
@@ -148,9 +149,6 @@ def get_value(self, name):
                 display_error=False,
                 timeout=CALL_KERNEL_TIMEOUT
             ).get_value(name, encoded=True)
-            kernel_call_success = True
-            value = cloudpickle.loads(value)
-            return value
         except TimeoutError:
             raise ValueError(msg % reason_big)
         except (PicklingError, UnpicklingError, TypeError) as err:
@@ -228,7 +226,8 @@ def get_value(self, name):
         except CommError:
             raise ValueError(msg % reason_comm)
         except ModuleNotFoundError as e:
-            if not kernel_call_success:
+            # Errors raised in the kernel are wrapped in a CommsErrorWrapper
+            if e.args and isinstance(e.args[0], CommsErrorWrapper):
                 name = e.args[0].error.name
                 reason = reason_missing_package_target.format(name)
             elif e.name.startswith('numpy._core'):
@@ -292,15 +291,12 @@ def set_value(self, name, value):
             "<a href='{}'>Github</a>."
         ).format(GH_ISSUES)
 
-        # Encode with cloudpickle and base64
-        encoded_value = cloudpickle.dumps(value)
-
         try:
             self.call_kernel(
                 interrupt=True,
                 blocking=True,
                 display_error=True,
-            ).set_value(name, encoded_value, encoded=True)
+            ).set_value(name, Pickled(value))
         except ModuleNotFoundError as e:
             name = e.args[0].error.name
             if name.startswith('numpy._core'):
@@ -323,3 +319,74 @@ def copy_value(self, orig_name, new_name):
             blocking=False,
             display_error=True,
             ).copy_value(orig_name, new_name)
+
+    def open_remote_view(self, name):
+        """
+        Open a view of a variable whose data stays in the kernel.
+
+        Returns
+        -------
+        tuple
+            The id of the view and a dictionary with its kind, shape and other
+            information needed to display it.
+        """
+        return self.call_kernel(
+            interrupt=True,
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).open_remote_view(name)
+
+    def get_remote_view_window(self, view_id, row_start, row_stop, col_start,
+                               col_stop):
+        """Get a window of the data of a remote view."""
+        return self.call_kernel(
+            interrupt=True,
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).get_remote_view_window(
+            view_id, row_start, row_stop, col_start, col_stop
+        )
+
+    def request_remote_view_window(self, view_id, row_start, row_stop,
+                                   col_start, col_stop, callback):
+        """
+        Request a window of the data of a remote view without blocking.
+
+        `callback` is called with the window when it's received. It's not
+        called if the kernel fails to send it.
+        """
+        self.call_kernel(
+            interrupt=True,
+            callback=callback,
+            display_error=False,
+        ).get_remote_view_window(
+            view_id, row_start, row_stop, col_start, col_stop
+        )
+
+    def get_remote_view_stats(self, view_id):
+        """Get the statistics used to color the cells of a remote view."""
+        return self.call_kernel(
+            interrupt=True,
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).get_remote_view_stats(view_id)
+
+    def sort_remote_view(self, view_id, column, ascending):
+        """Sort the rows of a remote view."""
+        self.call_kernel(
+            interrupt=True,
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).sort_remote_view(view_id, column, ascending)
+
+    def close_remote_view(self, view_id):
+        """Close a remote view."""
+        self.call_kernel(
+            interrupt=False,
+            blocking=False,
+            display_error=False,
+        ).close_remote_view(view_id)
@@ -21,7 +21,8 @@
 # Local imports
 from spyder.api.exceptions import SpyderAPIError
 from spyder.api.plugins import (
-    Plugins, DockablePlugins, SpyderDockablePlugin, SpyderPluginV2)
+    Plugins, DockablePlugins, PluginActivationTriggers, SpyderDockablePlugin,
+    SpyderPluginV2)
 from spyder.api.plugin_registration.decorators import (
     on_plugin_available, on_plugin_teardown)
 from spyder.api.plugin_registration.registry import PLUGIN_REGISTRY
@@ -39,6 +40,7 @@
 from spyder.plugins.toolbar.api import (
     ApplicationToolbars, MainToolbarSections)
 from spyder.utils.qthelpers import qbytearray_to_str
+from spyder.utils.timeline import STARTUP_TIMELINE
 
 
 # For logging
@@ -115,6 +117,8 @@ def on_initialize(self):
         # The following flag is used to apply the window settings only once
         # during the first run
         self._window_settings_applied_on_first_run = False
+        # Actions of the Panes menu that activate deferred plugins, by name
+        self._activation_actions = {}
 
         # If Spyder has already been run once, this option needs to be False.
         # Note: _first_spyder_run needs to be accessed at least once in this
@@ -131,6 +135,8 @@ def on_initialize(self):
 
         self._update_fullscreen_action()
 
+        PLUGIN_REGISTRY.sig_plugin_activated.connect(self._on_plugin_activated)
+
     @on_plugin_available(plugin=Plugins.MainMenu)
     def on_main_menu_available(self):
         mainmenu = self.get_plugin(Plugins.MainMenu)
@@ -222,7 +228,8 @@ def before_mainwindow_visible(self):
         # window is visible (see below). This call avoids weird issues when the
         # window was not maximized in the last session. See:
         # https://github.com/spyder-ide/spyder/pull/22232#issuecomment-2224142496
-        self.setup_layout(default=False)
+        with STARTUP_TIMELINE.span("Restore layout"):
+            self.setup_layout(default=False)
 
     def on_mainwindow_visible(self):
         # Populate `Panes > Window` menu.
@@ -234,7 +241,8 @@ def on_mainwindow_visible(self):
         # This **MUST** be done after creating the plugins menu to correctly
         # restore the layout from the previous session.
         # Fixes spyder-ide/spyder#17945 and spyder-ide/spyder#21596
-        self.setup_layout(default=False)
+        with STARTUP_TIMELINE.span("Restore layout"):
+            self.setup_layout(default=False)
 
         # Correctly display dock tabbars.
         # This **MUST** be done after setting up the layout.
@@ -306,6 +314,56 @@ def _apply_docktabbar_style(self):
             plugin.dockwidget.is_shown = True
             plugin.dockwidget.install_tab_event_filter()
 
+    def _create_activation_action(self, PluginClass):
+        """
+        Create the action that shows the pane of a deferred plugin in the
+        Panes menu.
+        """
+        action = self.get_container().create_action(
+            f"activate {PluginClass.NAME}",
+            text=PluginClass.get_name(),
+            icon=PluginClass.get_icon(),
+            toggled=lambda checked, name=PluginClass.NAME: (
+                self._show_deferred_plugin(name) if checked else None
+            ),
+            register_action=False,
+        )
+        self._activation_actions[PluginClass.NAME] = action
+        return action
+
+    def _show_deferred_plugin(self, plugin_name):
+        """Activate a deferred plugin and show its pane."""
+        plugin = PLUGIN_REGISTRY.activate_plugin(plugin_name)
+        plugin.switch_to_plugin(force_focus=True)
+
+    def _on_plugin_activated(self, plugin_name):
+        """Add the pane of a plugin that was activated after startup."""
+        plugin = PLUGIN_REGISTRY.get_plugin(plugin_name)
+        if (
+            not isinstance(plugin, SpyderDockablePlugin)
+            or plugin.dockwidget is None
+        ):
+            return
+
+        # Put the pane where it was the last time it was created, if that's
+        # part of the window state restored at startup.
+        if not self.main.restoreDockWidget(plugin.dockwidget):
+            self.tabify_plugin(plugin, Plugins.Console)
+
+        if self._interface_locked:
+            plugin.dockwidget.remove_title_bar()
+        else:
+            plugin.dockwidget.set_title_bar()
+        self._apply_docktabbar_style()
+
+        # Replace the action that activated the plugin in the Panes menu
+        action = self._activation_actions.pop(plugin_name, None)
+        if action is not None:
+            self.plugins_menu.add_action(
+                plugin.toggle_view_action, before=action.action_id
+            )
+            self.plugins_menu.remove_action(action.action_id)
+
     def _update_shortcuts_in_plugins_menu(self, show=True):
         """
         Show/hide shortcuts for actions in the plugins menu.
@@ -953,6 +1011,7 @@ def create_plugins_menu(self):
             None,
         ]
 
+        items = []
         for plugin in self.get_dockable_plugins():
             action = plugin.toggle_view_action
             if action:
@@ -964,8 +1023,23 @@ def create_plugins_menu(self):
                 else:
                     action.setChecked(plugin.dockwidget.isVisible())
 
+            items.append((plugin.CONF_SECTION, action))
+
+        # Plugins that are created when their pane is shown get an action
+        # that activates them until then.
+        for PluginClass in PLUGIN_REGISTRY.get_deferred_plugins(
+            PluginActivationTriggers.PaneShown
+        ):
+            if issubclass(PluginClass, SpyderDockablePlugin):
+                items.append(
+                    (
+                        PluginClass.CONF_SECTION,
+                        self._create_activation_action(PluginClass),
+                    )
+                )
+
+        for name, action in items:
             try:
-                name = plugin.CONF_SECTION
                 pos = order.index(name)
             except ValueError:
                 pos = None
@@ -13,7 +13,8 @@
 from qtpy.QtCore import Signal
 
 # Local imports
-from spyder.api.plugins import Plugins, SpyderDockablePlugin
+from spyder.api.plugins import (
+    PluginActivationTriggers, Plugins, SpyderDockablePlugin)
 from spyder.api.plugin_registration.decorators import on_plugin_available
 from spyder.api.translations import _
 from spyder.config.base import get_conf_path
@@ -36,6 +37,7 @@ class OnlineHelp(SpyderDockablePlugin):
     WIDGET_CLASS = PydocBrowser
     LOG_PATH = get_conf_path(NAME)
     REQUIRE_WEB_WIDGETS = True
+    ACTIVATION_TRIGGERS = [PluginActivationTriggers.PaneShown]
     CAN_HANDLE_SEARCH_ACTIONS = True
 
     # --- Signals
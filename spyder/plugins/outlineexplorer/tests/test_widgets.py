@@ -289,6 +289,64 @@ def test_display_variables(create_outlineexplorer, qtbot):
         second_toggle_tree == initial_tree)
 
 
+def test_update_tree_diff(create_outlineexplorer):
+    """
+    Test that updating the tree only changes the items of the symbols that
+    changed, and that the result is the same as rebuilding it.
+    """
+    outlineexplorer, _ = create_outlineexplorer('text')
+    treewidget = outlineexplorer.treewidget
+    editor = treewidget.current_editor
+    root = treewidget.editor_items[editor.get_id()]
+
+    def get_tree(item):
+        return [
+            (item.child(i).text(0), item.child(i).toolTip(0),
+             get_tree(item.child(i)))
+            for i in range(item.childCount())
+        ]
+
+    def get_items():
+        return {item.text(0): item for item in treewidget.get_items()}
+
+    with open(CASES['text']['data'], 'r') as f:
+        data = json.load(f)
+
+    items = get_items()
+    items['Class1'].setExpanded(True)
+
+    # Insert two lines before func2, rename func3 and remove method2
+    for symbol in data:
+        symbol_range = symbol['location']['range']
+        if symbol_range['start']['line'] >= 26:
+            symbol_range['start']['line'] += 2
+        if symbol_range['end']['line'] >= 26:
+            symbol_range['end']['line'] += 2
+        if symbol['name'] == 'func3':
+            symbol['name'] = 'func4'
+    data = [symbol for symbol in data if symbol['name'] != 'method2']
+
+    assert treewidget.update_tree(_dicts_to_symbols(data), editor)
+    new_items = get_items()
+
+    # Only the items of new symbols are created
+    for name, item in new_items.items():
+        if name == 'func4':
+            assert item is not items['func3']
+        else:
+            assert item is items[name]
+            assert item.ref.node is item
+    assert 'method2' not in new_items
+    assert 'Line 29:' in new_items['func2'].toolTip(0)
+    assert new_items['Class1'].isExpanded()
+
+    # The result is the same as rebuilding the tree from scratch
+    tree = get_tree(root.node)
+    root.delete()
+    assert treewidget.update_tree(_dicts_to_symbols(data), editor)
+    assert get_tree(root.node) == tree
+
+
 if __name__ == "__main__":
     import os
     pytest.main(['-x', os.path.basename(__file__), '-v', '-rw'])
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+
+"""
+Benchmarks for updating the Outline explorer tree.
+
+These are slow tests, so they need to be run with the `--run-slow` option.
+For instance::
+
+    python runtests.py --run-slow \
+        spyder/plugins/outlineexplorer/tests/test_widgets_benchmark.py
+"""
+
+# Standard library imports
+from unittest.mock import MagicMock
+
+# Third party imports
+from lsprotocol import types as lsp
+import pytest
+
+# Local imports
+from spyder.plugins.outlineexplorer.main_widget import OutlineExplorerWidget
+
+
+pytest.importorskip('pytest_benchmark')
+
+
+# =============================================================================
+# ---- Auxiliary functions
+# =============================================================================
+def get_symbols(n_classes, inserted_line=None, n_methods=9):
+    """
+    Get the symbols of a file with `n_classes` classes of `n_methods` methods
+    each, as if a line was inserted before `inserted_line`.
+    """
+    def symbol(name, kind, start, end):
+        if inserted_line is not None:
+            start += start >= inserted_line
+            end += end >= inserted_line
+        return lsp.SymbolInformation(
+            name=name,
+            kind=kind,
+            location=lsp.Location(
+                uri='file:///generated.py',
+                range=lsp.Range(
+                    start=lsp.Position(line=start, character=0),
+                    end=lsp.Position(line=end, character=0),
+                ),
+            ),
+        )
+
+    symbols = []
+    line = 0
+    for i in range(n_classes):
+        class_start = line
+        line += 1
+        for j in range(n_methods):
+            symbols.append(
+                symbol(f'method_{j}', lsp.SymbolKind.Method, line, line + 2)
+            )
+            line += 3
+        symbols.append(
+            symbol(f'Class{i}', lsp.SymbolKind.Class, class_start, line - 1)
+        )
+    return symbols
+
+
+# =============================================================================
+# ---- Fixtures
+# =============================================================================
+@pytest.fixture
+def treewidget(qtbot):
+    """Outline explorer tree with an editor registered in it."""
+    plugin_mock = MagicMock()
+    plugin_mock.NAME = 'outline_explorer'
+    outlineexplorer = OutlineExplorerWidget(
+        'outline_explorer', plugin_mock, None)
+    outlineexplorer.setup()
+    qtbot.addWidget(outlineexplorer)
+
+    editor = MagicMock()
+    editor.fname = 'generated.py'
+    outlineexplorer.treewidget.register_editor(editor)
+    return outlineexplorer.treewidget, editor
+
+
+# =============================================================================
+# ---- Benchmarks
+# =============================================================================
+@pytest.mark.slow
+@pytest.mark.parametrize('n_classes', [10, 100, 500])
+@pytest.mark.parametrize('method', ['rebuild_tree', 'diff_tree'])
+def test_update_tree(benchmark, treewidget, n_classes, method):
+    """
+    Update the tree after inserting a line in the middle of a file, which
+    moves half of its symbols.
+    """
+    treewidget, editor = treewidget
+    root = treewidget.editor_items[editor.get_id()]
+    update = getattr(treewidget, method)
+    symbols = [
+        get_symbols(n_classes),
+        get_symbols(n_classes, inserted_line=n_classes * 14)
+    ]
+    treewidget.rebuild_tree(
+        root, treewidget.create_symbols_tree(symbols[0], 'python')
+    )
+
+    def insert_and_remove_line():
+        for items in reversed(symbols):
+            update(root, treewidget.create_symbols_tree(items, 'python'))
+
+    benchmark(insert_and_remove_line)
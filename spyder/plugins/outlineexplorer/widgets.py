@@ -156,6 +156,17 @@ def clone_node(self, node):
         if self.parent is not None:
             self.parent.replace_node(self.index, self)
 
+    def take_node(self, node):
+        """Take the item and state of `node`, which is the same symbol."""
+        self.id = node.id
+        self.status = node.status
+        self.selected = node.selected
+        self.node = node.node
+        self.node.ref = self
+
+        if self.position != node.position:
+            self.refresh()
+
     def refresh(self):
         self.node.update_info(self.name, self.kind, self.position[0] + 1,
                               self.status, self.selected)
@@ -582,15 +593,9 @@ def merge_interval(self, parent, node):
         node.refresh()
         return node
 
-    def update_tree(self, items, editor):
-        """Update tree with new items that come from the LSP."""
-        editor_id = editor.get_id()
-        language = editor.get_language()
-        current_tree = self.editor_tree_cache[editor_id]
-        root = self.editor_items[editor_id]
+    def create_symbols_tree(self, items, language):
+        """Create an interval tree with the symbols that come from the LSP."""
         tree_info = []
-
-        # Create tree with items that come from the LSP
         for symbol in items:
             symbol_name = symbol.name
             symbol_kind = symbol.kind
@@ -622,7 +627,17 @@ def update_tree(self, items, editor):
                 symbol_repr.status = False
             tree_info.append((symbol_start, symbol_end + 1, symbol_repr))
 
-        tree = IntervalTree.from_tuples(tree_info)
+        return IntervalTree.from_tuples(tree_info)
+
+    def update_tree(self, items, editor):
+        """Update tree with new items that come from the LSP."""
+        editor_id = editor.get_id()
+        language = editor.get_language()
+        current_tree = self.editor_tree_cache[editor_id]
+        root = self.editor_items[editor_id]
+
+        # Create tree with items that come from the LSP
+        tree = self.create_symbols_tree(items, language)
 
         # We must update the tree if the editor's root doesn't have children
         # yet but we have symbols for it saved in the cache
@@ -642,14 +657,29 @@ def update_tree(self, items, editor):
 
         logger.debug(f"Updating tree for file {editor.fname}")
 
+        # Rebuilding the tree from scratch is faster when there's nothing to
+        # preserve, but for large files updating only the symbols that
+        # changed avoids recreating thousands of items on every change.
+        if root.children:
+            self.diff_tree(root, tree)
+        else:
+            self.rebuild_tree(root, tree)
+
+        # Save new tree and finish
+        self.editor_tree_cache[editor_id] = tree
+        editor.is_tree_updated = True
+        self.sig_tree_updated.emit()
+        self.sig_hide_spinner.emit()
+        return True
+
+    def rebuild_tree(self, root, tree):
+        """Remove all items below `root` and create them again from `tree`."""
         # Create nodes with new tree
         for entry in sorted(tree):
             entry.data.create_node()
 
-        # Remove previous tree to create the new one.
-        # NOTE: This is twice as fast as detecting the symbols that changed
-        # and updating only those in current_tree.
-        self.editor_items[editor_id].delete()
+        # Remove previous tree to create the new one
+        root.delete()
 
         # Recreate tree structure
         tree_copy = IntervalTree(tree)
@@ -658,12 +688,117 @@ def update_tree(self, items, editor):
             data_initializer=root
         )
 
-        # Save new tree and finish
-        self.editor_tree_cache[editor_id] = tree
-        editor.is_tree_updated = True
-        self.sig_tree_updated.emit()
-        self.sig_hide_spinner.emit()
-        return True
+    def diff_tree(self, root, tree):
+        """
+        Update the items below `root` to match `tree`.
+
+        Symbols are matched by their name and kind under the same parent, so
+        the items of the ones that are still present are kept (together with
+        their expansion and selection state) and only moved or updated if
+        necessary. Items are only created for new symbols and removed for
+        the ones that disappeared.
+        """
+        children = self.nest_symbols(root, tree)
+        self._update_children(root, children)
+
+    def nest_symbols(self, root, tree):
+        """
+        Set the parent and children of the symbols in `tree`, without
+        creating their items.
+
+        This gives the same structure as `merge_interval` does when
+        rebuilding the tree.
+
+        Returns
+        -------
+        list of SymbolStatus
+            Top level symbols of the tree.
+        """
+        children = []
+        parent = root
+        for entry in sorted(tree):
+            node = entry.data
+            start = node.position[0]
+
+            # Look for the innermost symbol that contains this one
+            while parent is not root and parent.position[1] <= start:
+                parent = parent.parent
+
+            # Symbols with the same range must be at the same level
+            while parent is not root and parent.position == node.position:
+                parent = parent.parent
+
+            siblings = children if parent is root else parent.children
+            index = len(siblings)
+            while index > 0 and siblings[index - 1].position[0] == start:
+                index -= 1
+            siblings.insert(index, node)
+
+            node.parent = parent
+            node.path = root.path
+            parent = node
+
+        for entry in tree:
+            for index, child in enumerate(entry.data.children):
+                child.index = index
+        for index, child in enumerate(children):
+            child.index = index
+
+        return children
+
+    def _update_children(self, parent, children):
+        """
+        Replace the children of `parent` by `children`, reusing the items of
+        the current ones that have the same name and kind.
+        """
+        old_children = {}
+        for child in reversed(parent.children):
+            old_children.setdefault((child.name, child.kind), []).append(child)
+
+        for child in children:
+            matches = old_children.get((child.name, child.kind))
+            if matches:
+                old_child = matches.pop()
+                self._update_children(old_child, child.children)
+                child.take_node(old_child)
+            else:
+                self._create_nodes(child)
+
+        # Remove items of symbols that are not present anymore
+        item = parent.node
+        for matches in old_children.values():
+            for old_child in matches:
+                item.remove_children(old_child.node)
+
+        # Insert new items and move the ones whose position changed
+        for index, child in enumerate(children):
+            node = child.node
+            if index < item.childCount() and item.child(index) is node:
+                continue
+
+            if node.parent is item:
+                # Qt forgets the expansion state of the items taken out of
+                # the tree, so it needs to be set again after moving them
+                item.takeChild(item.indexOfChild(node))
+                item.append_children(index, node)
+                self._set_expanded(child)
+            else:
+                item.append_children(index, node)
+
+        parent.children = children
+
+    def _set_expanded(self, symbol):
+        """Set the expansion state of the items of a symbol and children."""
+        symbol.node.setExpanded(symbol.status)
+        for child in symbol.children:
+            self._set_expanded(child)
+
+    def _create_nodes(self, symbol):
+        """Create the items of a symbol and its children."""
+        symbol.create_node()
+        for index, child in enumerate(symbol.children):
+            self._create_nodes(child)
+            symbol.node.append_children(index, child.node)
 
     def remove_editor(self, editor):
         if editor in self.editor_ids:
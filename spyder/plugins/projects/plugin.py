@@ -87,6 +87,17 @@ class Projects(SpyderDockablePlugin):
         between projects (signature 2).
     """
 
+    sig_search_index_changed = Signal(object)
+    """
+    This signal is emitted when the search index of the active project is
+    created or removed.
+
+    Parameters
+    ----------
+    search_index: spyder.plugins.projects.utils.search_index.SearchIndex
+        The new search index or None if there's no index available.
+    """
+
     # ---- SpyderDockablePlugin API
     # -------------------------------------------------------------------------
     @staticmethod
@@ -112,6 +123,7 @@ def on_initialize(self):
         widget.sig_project_created.connect(self.sig_project_created)
         widget.sig_project_closed.connect(self.sig_project_closed)
         widget.sig_project_loaded.connect(self.sig_project_loaded)
+        widget.sig_search_index_changed.connect(self.sig_search_index_changed)
 
         treewidget.sig_delete_project.connect(self.delete_project)
         treewidget.sig_redirect_stdio_requested.connect(
@@ -147,6 +159,7 @@ def on_editor_available(self):
         widget.sig_project_closed[bool].connect(self._setup_editor_files)
         widget.sig_project_loaded.connect(self._set_path_in_editor)
         widget.sig_project_closed.connect(self._unset_path_in_editor)
+        widget.sig_go_to_symbol_requested.connect(self._go_to_symbol)
 
     @on_plugin_available(plugin=Plugins.Completions)
     def on_completions_available(self):
@@ -239,6 +252,7 @@ def on_editor_teardown(self):
         widget.sig_project_closed[bool].disconnect(self._setup_editor_files)
         widget.sig_project_loaded.disconnect(self._set_path_in_editor)
         widget.sig_project_closed.disconnect(self._unset_path_in_editor)
+        widget.sig_go_to_symbol_requested.disconnect(self._go_to_symbol)
 
     @on_plugin_teardown(plugin=Plugins.Completions)
     def on_completions_teardown(self):
@@ -295,6 +309,8 @@ def on_close(self, cancelable=False):
         """Perform actions before parent main window is closed"""
         self.get_widget().save_config()
         self.get_widget().watcher.stop()
+        self.get_widget()._stop_search_index(wait=True)
+        self.get_widget()._stop_symbol_index(wait=True)
         return True
 
     def on_mainwindow_visible(self):
@@ -403,6 +419,28 @@ def get_active_project_path(self):
         """Get path of the active project."""
         return self.get_widget().get_active_project_path()
 
+    def get_search_index(self):
+        """
+        Get the search index of the active project.
+
+        Returns
+        -------
+        spyder.plugins.projects.utils.search_index.SearchIndex or None
+            The index or None if it's disabled or there's no active project.
+        """
+        return self.get_widget().get_search_index()
+
+    def get_symbol_index(self):
+        """
+        Get the symbol index of the active project.
+
+        Returns
+        -------
+        spyder.plugins.projects.utils.symbol_index.SymbolIndex or None
+            The index or None if it's disabled or there's no active project.
+        """
+        return self.get_widget().get_symbol_index()
+
     def get_last_working_dir(self):
         """Get the path of the last working directory."""
         return self.get_conf(
@@ -471,6 +509,10 @@ def _unset_path_in_editor(self, __unused):
         editor = self.get_plugin(Plugins.Editor)
         editor.set_current_project_path()
 
+    def _go_to_symbol(self, filename, line_number, name):
+        editor = self.get_plugin(Plugins.Editor)
+        editor.load(filename, line_number, word=name)
+
     def _add_path_to_completions(self, path):
         self._completions.project_path_update(
             path,
@@ -505,6 +547,11 @@ def _get_open_filenames(self):
             return editor.get_filenames()
         return []
 
+    def _get_current_filename(self):
+        editor = self.get_plugin(Plugins.Editor)
+        if editor is not None:
+            return editor.get_current_filename()
+
     def _is_invalid_active_project(self):
         """Handle an invalid active project."""
         self.get_widget().is_invalid_active_project()
@@ -560,7 +607,9 @@ def _handle_switcher_search(self, search_text):
         text: str
             The current search text in the switcher dialog box.
         """
-        self.get_widget().handle_switcher_search(search_text)
+        self.get_widget().handle_switcher_search(
+            search_text, self._switcher.get_mode()
+        )
 
     def _display_items_in_switcher(self, items, setup, clear_section):
         """
@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Trigram index of the files of a project.
+
+It's used by Find in Files to narrow down the files that can contain the
+searched text before scanning them.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+import os.path as osp
+import re
+import threading
+
+# Local imports
+from spyder.config.base import get_conf_path
+from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.plugins.projects.utils.watcher import FOLDERS_TO_IGNORE
+from spyder.utils.encoding import atomic_write
+
+
+# ---- Constants
+# -----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+# Name of the file where the index is saved
+INDEX_FILENAME = 'search-index.json'
+
+# Increase this when the format of the saved index changes
+INDEX_VERSION = 2
+
+# Files bigger than this (in bytes) are not indexed
+MAX_FILE_SIZE = 10 * 1024**2
+
+# Extensions of files that are indexed
+INDEXED_EXTENSIONS = set(EDIT_EXTENSIONS) - {'.svg'}
+
+# Digits of hexadecimal escapes in regular expressions
+HEX_DIGITS = {bytes([c]) for c in b'0123456789abcdefABCDEF'}
+
+
+# ---- Auxiliary functions
+# -----------------------------------------------------------------------------
+def get_trigrams(data):
+    """
+    Get the trigrams of a bytes object.
+
+    Trigrams are computed over the lowercase version of `data`, so they can
+    be used for case sensitive and insensitive searches alike (although only
+    ASCII letters are lowercased). Each one is encoded as an int.
+    """
+    data = data.lower()
+    return {
+        (a << 16) | (b << 8) | c
+        for a, b, c in set(zip(data, data[1:], data[2:]))
+    }
+
+
+def _get_escape_length(source, i):
+    """
+    Get the length of the escape sequence that starts at index `i` of a
+    pattern, or 1 if there's no escape there.
+    """
+    if source[i:i + 1] != b'\\':
+        return 1
+
+    escaped = source[i + 1:i + 2]
+    if escaped in (b'x', b'u', b'U'):
+        # Hexadecimal escapes, with up to 2, 4 and 8 digits
+        digits = {b'x': 2, b'u': 4, b'U': 8}[escaped]
+        length = 2
+        while (
+            length < 2 + digits
+            and source[i + length:i + length + 1] in HEX_DIGITS
+        ):
+            length += 1
+        return length
+    elif escaped == b'N' and source[i + 2:i + 3] == b'{':
+        # Named characters
+        end = source.find(b'}', i + 3)
+        return len(source) - i if end == -1 else end + 1 - i
+    elif escaped.isdigit():
+        # Octal escapes and backreferences have up to 3 digits
+        length = 2
+        while length < 4 and source[i + length:i + length + 1].isdigit():
+            length += 1
+        return length
+    else:
+        return 2
+
+
+def get_regex_literals(pattern):
+    """
+    Get the literal strings that must be present in any match of `pattern`.
+
+    This is conservative: it's fine to miss literals, which only makes the
+    index less selective, but every literal returned must be required by the
+    pattern.
+
+    Parameters
+    ----------
+    pattern: re.Pattern
+        Compiled bytes pattern.
+
+    Returns
+    -------
+    list
+        List of bytes. It's empty if no required literal could be found.
+    """
+    source = pattern.pattern
+    if not isinstance(source, bytes) or pattern.flags & re.VERBOSE:
+        return []
+
+    # Inline flags (e.g. verbose mode) and lookarounds change how the rest of
+    # the pattern is interpreted, so they are not analyzed.
+    if b'(?' in source:
+        return []
+
+    literals = []
+    current = bytearray()
+
+    def end_run():
+        if current:
+            literals.append(bytes(current))
+            current.clear()
+
+    i = 0
+    depth = 0
+    while i < len(source):
+        char = source[i:i + 1]
+
+        if char == b'\\':
+            escaped = source[i + 1:i + 2]
+            if depth == 0 and escaped and not escaped.isalnum():
+                # Escaped punctuation is a literal
+                current += escaped
+            else:
+                # Character classes, anchors, backreferences, etc
+                end_run()
+            i += _get_escape_length(source, i)
+            continue
+
+        if char == b'[':
+            # Skip the character set, where a leading ] (after an optional ^)
+            # is a literal
+            end_run()
+            i += 1
+            if source[i:i + 1] == b'^':
+                i += 1
+            if source[i:i + 1] == b']':
+                i += 1
+            while i < len(source) and source[i:i + 1] != b']':
+                i += _get_escape_length(source, i)
+        elif char == b'(':
+            end_run()
+            depth += 1
+        elif char == b')':
+            depth = max(depth - 1, 0)
+        elif depth > 0:
+            # The contents of groups can be optional or alternatives
+            pass
+        elif char == b'|':
+            # No literal is required if there's a top-level alternation
+            return []
+        elif char in (b'*', b'?', b'{'):
+            # The previous character is optional
+            if current:
+                current.pop()
+            end_run()
+            if char == b'{':
+                while i < len(source) and source[i:i + 1] != b'}':
+                    i += 1
+        elif char == b'+':
+            end_run()
+        elif char in (b'.', b'^', b'$'):
+            end_run()
+        else:
+            current += char
+
+        i += 1
+
+    end_run()
+    return literals
+
+
+def get_project_index_path(root_path, filename):
+    """
+    Get the path where an index of the project in `root_path` is saved.
+
+    Indexes are saved in Spyder's config directory instead of the project
+    config folder, which can be committed to version control and come from
+    untrusted sources.
+    """
+    key = hashlib.sha1(
+        osp.normcase(osp.abspath(root_path)).encode(
+            'utf-8', errors='surrogateescape'
+        )
+    ).hexdigest()[:16]
+    return osp.join(get_conf_path('project_indexes'), key, filename)
+
+
+# ---- Index
+# -----------------------------------------------------------------------------
+class SearchIndex:
+    """
+    Trigram index of the text files in a project.
+
+    The index maps trigrams to the files that contain them and is updated
+    incrementally according to the modification time and size of the files.
+    It's saved in Spyder's config directory so that it can be reused across
+    sessions.
+
+    Notes
+    -----
+    All public methods are thread-safe.
+    """
+
+    def __init__(self, root_path):
+        self.root_path = root_path
+        self.index_path = get_project_index_path(root_path, INDEX_FILENAME)
+
+        # Map from filename to a (file id, mtime, size) tuple
+        self._files = {}
+
+        # Map from file id to its filename
+        self._filenames = {}
+
+        # Map from file id to its trigrams
+        self._file_trigrams = {}
+
+        # Map from trigram to the ids of the files that contain it
+        self._postings = {}
+
+        self._next_id = 0
+        self._lock = threading.RLock()
+        self._ready = False
+        self._stopped = False
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    @property
+    def ready(self):
+        """Whether the index can be used to narrow down searches."""
+        return self._ready
+
+    def load(self):
+        """Load the index saved for the project, if any."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if (
+                data['version'] != INDEX_VERSION
+                or data['root_path'] != self.root_path
+            ):
+                return False
+
+            files = {}
+            file_trigrams = {}
+            for file_id, (filename, mtime, size, trigrams) in enumerate(
+                data['files']
+            ):
+                files[str(filename)] = (file_id, int(mtime), int(size))
+                file_trigrams[file_id] = {int(t) for t in trigrams}
+        except FileNotFoundError:
+            return False
+        except Exception:
+            logger.debug(
+                f"Error loading search index from {self.index_path}",
+                exc_info=True
+            )
+            return False
+
+        with self._lock:
+            self._files = files
+            self._filenames = {
+                info[0]: filename for filename, info in files.items()
+            }
+            self._file_trigrams = file_trigrams
+            self._postings = {}
+            for file_id, trigrams in file_trigrams.items():
+                for trigram in trigrams:
+                    self._postings.setdefault(trigram, set()).add(file_id)
+            self._next_id = len(files)
+
+            # Files that changed since the index was saved are detected by
+            # the search thread and scanned anyway, so the index can be used
+            # right away.
+            self._ready = True
+
+        return True
+
+    def save(self):
+        """Save the index to Spyder's config directory."""
+        with self._lock:
+            # Postings are not saved because they can be computed from the
+            # trigrams of each file.
+            data = {
+                'version': INDEX_VERSION,
+                'root_path': self.root_path,
+                'files': [
+                    (
+                        filename,
+                        mtime,
+                        size,
+                        sorted(self._file_trigrams.get(file_id, ())),
+                    )
+                    for filename, (file_id, mtime, size)
+                    in self._files.items()
+                ],
+            }
+
+            try:
+                dirname = osp.dirname(self.index_path)
+                os.makedirs(dirname, exist_ok=True)
+                with atomic_write(self.index_path, overwrite=True,
+                                  dir=dirname, mode='wb') as f:
+                    f.write(json.dumps(data, separators=(',', ':')).encode())
+            except OSError:
+                logger.debug(
+                    f"Error saving search index to {self.index_path}",
+                    exc_info=True
+                )
+
+    def update(self):
+        """
+        Update the index for all files in the project.
+
+        Only files that were added or whose modification time or size changed
+        since the last update are read again.
+        """
+        seen = set()
+        for filename, st in self._walk():
+            if self._stopped:
+                return
+
+            seen.add(filename)
+            if not self.is_up_to_date(filename, st):
+                self._index_file(filename, st)
+
+        with self._lock:
+            for filename in set(self._files) - seen:
+                self._remove_file(filename)
+            self._ready = True
+
+    def stop(self):
+        """Stop updating the index."""
+        self._stopped = True
+
+    def update_file(self, filename):
+        """Update the index for `filename`."""
+        try:
+            st = os.stat(filename)
+        except OSError:
+            self.remove_file(filename)
+            return
+
+        if self._is_indexable(filename, st):
+            if not self.is_up_to_date(filename, st):
+                self._index_file(filename, st)
+        else:
+            self.remove_file(filename)
+
+    def remove_file(self, filename):
+        """Remove `filename` from the index."""
+        with self._lock:
+            self._remove_file(filename)
+
+    def remove_dir(self, dirname):
+        """Remove all files in `dirname` from the index."""
+        prefix = osp.join(dirname, '')
+        with self._lock:
+            for filename in list(self._files):
+                if filename.startswith(prefix):
+                    self._remove_file(filename)
+
+    def is_up_to_date(self, filename, st):
+        """
+        Check if `filename` is in the index and hasn't changed since it was
+        indexed.
+
+        Parameters
+        ----------
+        filename: str
+            Absolute path to the file.
+        st: os.stat_result
+            Current stat result of the file.
+        """
+        with self._lock:
+            info = self._files.get(filename)
+        return (
+            info is not None
+            and info[1] == st.st_mtime_ns
+            and info[2] == st.st_size
+        )
+
+    def get_candidates(self, texts, text_re, case_sensitive=True):
+        """
+        Get the files that can contain a match for any of `texts`.
+
+        Parameters
+        ----------
+        texts: list
+            List of `(text, encoding)` tuples, as passed to the Find in Files
+            search thread.
+        text_re: bool
+            Whether `texts` are compiled regular expressions.
+        case_sensitive: bool, optional
+            Whether the search is case sensitive. Default is True.
+
+        Returns
+        -------
+        set or None
+            Set of filenames, or None if the index can't be used to narrow
+            down the search (e.g. because the searched text is too short).
+        """
+        if not self._ready:
+            return None
+
+        candidates = set()
+        for text, __ in texts:
+            literals = get_regex_literals(text) if text_re else [text]
+
+            # Only ASCII letters are lowercased in the index, so other
+            # letters can appear with a different case in files.
+            if not case_sensitive and not all(
+                literal.isascii() for literal in literals
+            ):
+                return None
+
+            trigrams = set()
+            for literal in literals:
+                trigrams |= get_trigrams(literal)
+
+            if not trigrams:
+                return None
+
+            with self._lock:
+                # Start with the least common trigram to keep intersections
+                # small.
+                postings = sorted(
+                    (self._postings.get(t, set()) for t in trigrams),
+                    key=len
+                )
+                ids = set(postings[0])
+                for posting in postings[1:]:
+                    if not ids:
+                        break
+                    ids &= posting
+
+                candidates |= {self._filenames[i] for i in ids}
+
+        return candidates
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _is_indexable(self, filename, st):
+        return (
+            osp.splitext(filename)[1] in INDEXED_EXTENSIONS
+            and st.st_size <= MAX_FILE_SIZE
+        )
+
+    def _walk(self):
+        """Generate the indexable files of the project with their stats."""
+        for path, dirs, files in os.walk(self.root_path):
+            dirs[:] = [
+                d for d in dirs
+                if not d.startswith('.') and d not in FOLDERS_TO_IGNORE
+            ]
+            for f in files:
+                filename = osp.join(path, f)
+                try:
+                    st = os.stat(filename)
+                except OSError:
+                    continue
+
+                if self._is_indexable(filename, st):
+                    yield filename, st
+
+    def _index_file(self, filename, st):
+        try:
+            with open(filename, 'rb') as f:
+                trigrams = get_trigrams(f.read())
+        except OSError:
+            self.remove_file(filename)
+            return
+
+        with self._lock:
+            self._remove_file(filename)
+
+            file_id = self._next_id
+            self._next_id += 1
+            self._files[filename] = (file_id, st.st_mtime_ns, st.st_size)
+            self._filenames[file_id] = filename
+            self._file_trigrams[file_id] = trigrams
+            for trigram in trigrams:
+                self._postings.setdefault(trigram, set()).add(file_id)
+
+    def _remove_file(self, filename):
+        info = self._files.pop(filename, None)
+        if info is None:
+            return
+
+        file_id = info[0]
+        self._filenames.pop(file_id, None)
+        for trigram in self._file_trigrams.pop(file_id, ()):
+            posting = self._postings.get(trigram)
+            if posting is not None:
+                posting.discard(file_id)
+                if not posting:
+                    del self._postings[trigram]
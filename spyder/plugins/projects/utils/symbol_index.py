@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Symbol index of the Python files of a project.
+
+It's used by the Switcher to go to the classes and functions of any file in
+the project, without having to open it or wait for the LSP server.
+"""
+
+# Standard library imports
+import ast
+from concurrent.futures import ProcessPoolExecutor
+import json
+import logging
+import multiprocessing
+import os
+import os.path as osp
+import threading
+
+# Third party imports
+from lsprotocol import types as lsp
+
+# Local imports
+from spyder.plugins.projects.utils.search_index import (
+    get_project_index_path)
+from spyder.plugins.projects.utils.watcher import FOLDERS_TO_IGNORE
+from spyder.utils.encoding import atomic_write
+from spyder.utils.stringmatching import FuzzyMatcher
+
+
+# ---- Constants
+# -----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+# Name of the file where the index is saved
+INDEX_FILENAME = 'symbol-index.json'
+
+# Increase this when the format of the saved index changes
+INDEX_VERSION = 2
+
+# Files bigger than this (in bytes) are not indexed
+MAX_FILE_SIZE = 2 * 1024**2
+
+# Extensions of files that are indexed
+INDEXED_EXTENSIONS = {'.py', '.pyw'}
+
+# Minimum number of files to parse in a pool of processes instead of in the
+# current thread
+MIN_FILES_FOR_POOL = 100
+
+# Maximum number of processes used to parse files
+MAX_POOL_WORKERS = 4
+
+
+# ---- Auxiliary functions
+# -----------------------------------------------------------------------------
+def get_symbols(source):
+    """
+    Get the classes and functions defined in Python code.
+
+    Parameters
+    ----------
+    source: str or bytes
+        Code to parse.
+
+    Returns
+    -------
+    list
+        List of `(name, kind, line, container)` tuples, where `kind` is an
+        lsp.SymbolKind value, `line` starts at 1 and `container` is the
+        dotted name of the class or function where the symbol is defined (or
+        an empty string for top-level ones). It's empty if the code can't be
+        parsed.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    symbols = []
+    stack = [(node, '', False) for node in reversed(tree.body)]
+    while stack:
+        node, container, in_class = stack.pop()
+        if isinstance(node, ast.ClassDef):
+            kind = lsp.SymbolKind.Class
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if in_class:
+                kind = lsp.SymbolKind.Method
+            else:
+                kind = lsp.SymbolKind.Function
+        else:
+            # Look for definitions inside compound statements (e.g. if or try
+            # blocks), but not inside expressions.
+            children = [
+                child for child in ast.iter_child_nodes(node)
+                if isinstance(child, ast.stmt)
+            ]
+            stack.extend(
+                (child, container, in_class) for child in reversed(children)
+            )
+            continue
+
+        symbols.append((node.name, int(kind), node.lineno, container))
+        name = f'{container}.{node.name}' if container else node.name
+        stack.extend(
+            (child, name, kind == lsp.SymbolKind.Class)
+            for child in reversed(node.body)
+        )
+
+    return symbols
+
+
+def get_file_symbols(filename):
+    """
+    Get the symbols of a file, as given by `get_symbols`, or None if it
+    can't be read.
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return get_symbols(f.read())
+    except OSError:
+        return None
+
+
+# ---- Index
+# -----------------------------------------------------------------------------
+class SymbolIndex:
+    """
+    Index of the classes and functions defined in the Python files of a
+    project.
+
+    Files are parsed with the `ast` module and updated incrementally
+    according to their modification time and size. When there are many files
+    to parse (e.g. the first time a project is indexed), that's done in a
+    pool of processes. The index is saved in Spyder's config directory so
+    that it can be reused across sessions.
+
+    Notes
+    -----
+    All public methods are thread-safe.
+    """
+
+    def __init__(self, root_path):
+        self.root_path = root_path
+        self.index_path = get_project_index_path(root_path, INDEX_FILENAME)
+
+        # Map from filename to a (mtime, size, symbols) tuple
+        self._files = {}
+
+        # Map from symbol name to the files where it's defined
+        self._names = {}
+
+        # Matcher used to search symbol names and the names in it. It's
+        # created again when names are added or removed.
+        self._matcher = None
+        self._matcher_names = []
+
+        self._lock = threading.RLock()
+        self._ready = False
+        self._stopped = False
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    @property
+    def ready(self):
+        """Whether the index has the symbols of the project."""
+        return self._ready
+
+    def load(self):
+        """Load the index saved for the project, if any."""
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            if (
+                data['version'] != INDEX_VERSION
+                or data['root_path'] != self.root_path
+            ):
+                return False
+
+            files = [
+                (
+                    str(filename),
+                    int(mtime),
+                    int(size),
+                    [
+                        (str(name), int(kind), int(line), str(container))
+                        for name, kind, line, container in symbols
+                    ],
+                )
+                for filename, mtime, size, symbols in data['files']
+            ]
+        except FileNotFoundError:
+            return False
+        except Exception:
+            logger.debug(
+                f"Error loading symbol index from {self.index_path}",
+                exc_info=True
+            )
+            return False
+
+        with self._lock:
+            self._files = {}
+            self._names = {}
+            self._matcher = None
+            for filename, mtime, size, symbols in files:
+                self._add_file(filename, mtime, size, symbols)
+
+            # Files that changed since the index was saved will be updated
+            # soon after, so it can be used right away.
+            self._ready = True
+
+        return True
+
+    def save(self):
+        """Save the index to Spyder's config directory."""
+        with self._lock:
+            data = {
+                'version': INDEX_VERSION,
+                'root_path': self.root_path,
+                'files': [
+                    (filename, mtime, size, symbols)
+                    for filename, (mtime, size, symbols)
+                    in self._files.items()
+                ],
+            }
+
+            try:
+                dirname = osp.dirname(self.index_path)
+                os.makedirs(dirname, exist_ok=True)
+                with atomic_write(self.index_path, overwrite=True,
+                                  dir=dirname, mode='wb') as f:
+                    f.write(json.dumps(data, separators=(',', ':')).encode())
+            except OSError:
+                logger.debug(
+                    f"Error saving symbol index to {self.index_path}",
+                    exc_info=True
+                )
+
+    def update(self):
+        """
+        Update the index for all files in the project.
+
+        Only files that were added or whose modification time or size changed
+        since the last update are parsed again.
+        """
+        seen = set()
+        changed = []
+        for filename, st in self._walk():
+            if self._stopped:
+                return
+
+            seen.add(filename)
+            if not self.is_up_to_date(filename, st):
+                changed.append((filename, st))
+
+        if len(changed) >= MIN_FILES_FOR_POOL:
+            changed = self._index_files_in_pool(changed)
+
+        for filename, st in changed:
+            if self._stopped:
+                return
+            self._index_file(filename, st, get_file_symbols(filename))
+
+        with self._lock:
+            for filename in set(self._files) - seen:
+                self._remove_file(filename)
+            self._ready = True
+
+    def stop(self):
+        """Stop updating the index."""
+        self._stopped = True
+
+    def update_file(self, filename):
+        """Update the index for `filename`."""
+        try:
+            st = os.stat(filename)
+        except OSError:
+            self.remove_file(filename)
+            return
+
+        if self._is_indexable(filename, st):
+            if not self.is_up_to_date(filename, st):
+                self._index_file(filename, st, get_file_symbols(filename))
+        else:
+            self.remove_file(filename)
+
+    def remove_file(self, filename):
+        """Remove `filename` from the index."""
+        with self._lock:
+            self._remove_file(filename)
+
+    def remove_dir(self, dirname):
+        """Remove all files in `dirname` from the index."""
+        prefix = osp.join(dirname, '')
+        with self._lock:
+            for filename in list(self._files):
+                if filename.startswith(prefix):
+                    self._remove_file(filename)
+
+    def is_up_to_date(self, filename, st):
+        """
+        Check if `filename` is in the index and hasn't changed since it was
+        indexed.
+
+        Parameters
+        ----------
+        filename: str
+            Absolute path to the file.
+        st: os.stat_result
+            Current stat result of the file.
+        """
+        with self._lock:
+            info = self._files.get(filename)
+        return (
+            info is not None
+            and info[0] == st.st_mtime_ns
+            and info[1] == st.st_size
+        )
+
+    def get_file_symbols(self, filename):
+        """Get the symbols of `filename` in the index."""
+        with self._lock:
+            info = self._files.get(filename)
+        return [] if info is None else info[2]
+
+    def search(self, text, max_results=None, exclude=None):
+        """
+        Search for symbols whose name fuzzy matches `text`.
+
+        Parameters
+        ----------
+        text: str
+            Text to search for.
+        max_results: int, optional
+            Maximum number of results to return. Default is None, which
+            returns all of them.
+        exclude: str, optional
+            Filename whose symbols are left out of the results.
+
+        Returns
+        -------
+        list
+            List of `(filename, name, kind, line, container)` tuples, sorted
+            from the best to the worst match.
+        """
+        results = []
+        if not text:
+            return results
+
+        with self._lock:
+            if self._matcher is None:
+                self._matcher_names = sorted(self._names)
+                self._matcher = FuzzyMatcher(self._matcher_names)
+
+            matches = sorted(
+                (score, self._matcher_names[index])
+                for index, (score, __) in self._matcher.match(text).items()
+            )
+
+            for __, name in matches:
+                for filename in sorted(self._names.get(name, ())):
+                    if filename == exclude:
+                        continue
+
+                    for symbol in self._files[filename][2]:
+                        if symbol[0] == name:
+                            results.append((filename,) + symbol)
+
+                if max_results is not None and len(results) >= max_results:
+                    return results[:max_results]
+
+        return results
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _is_indexable(self, filename, st):
+        return (
+            osp.splitext(filename)[1] in INDEXED_EXTENSIONS
+            and st.st_size <= MAX_FILE_SIZE
+        )
+
+    def _walk(self):
+        """Generate the indexable files of the project with their stats."""
+        for path, dirs, files in os.walk(self.root_path):
+            dirs[:] = [
+                d for d in dirs
+                if not d.startswith('.') and d not in FOLDERS_TO_IGNORE
+            ]
+            for f in files:
+                filename = osp.join(path, f)
+                try:
+                    st = os.stat(filename)
+                except OSError:
+                    continue
+
+                if self._is_indexable(filename, st):
+                    yield filename, st
+
+    def _index_files_in_pool(self, files):
+        """
+        Parse `files` in a pool of processes.
+
+        Returns
+        -------
+        list
+            The (filename, stat) tuples of the files that couldn't be
+            parsed in the pool, which need to be parsed in the current thread.
+        """
+        filenames = [filename for filename, __ in files]
+        workers = min(MAX_POOL_WORKERS, os.cpu_count() or 1)
+        done = 0
+
+        try:
+            # Spawn processes instead of forking them because this runs in a
+            # thread of a Qt application.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')
+            ) as executor:
+                results = executor.map(
+                    get_file_symbols, filenames, chunksize=20
+                )
+                for (filename, st), symbols in zip(files, results):
+                    if self._stopped:
+                        executor.shutdown(cancel_futures=True)
+                        break
+
+                    self._index_file(filename, st, symbols)
+                    done += 1
+        except Exception:
+            logger.debug("Error parsing files in a pool", exc_info=True)
+
+        return files[done:]
+
+    def _index_file(self, filename, st, symbols):
+        with self._lock:
+            self._remove_file(filename)
+            if symbols is not None:
+                self._add_file(
+                    filename, st.st_mtime_ns, st.st_size, symbols
+                )
+
+    def _add_file(self, filename, mtime, size, symbols):
+        self._files[filename] = (mtime, size, symbols)
+        for name, *__ in symbols:
+            filenames = self._names.setdefault(name, set())
+            if not filenames:
+                self._matcher = None
+            filenames.add(filename)
+
+    def _remove_file(self, filename):
+        info = self._files.pop(filename, None)
+        if info is None:
+            return
+
+        for name, *__ in info[2]:
+            filenames = self._names.get(name)
+            if filenames is not None:
+                filenames.discard(filename)
+                if not filenames:
+                    del self._names[name]
+                    self._matcher = None
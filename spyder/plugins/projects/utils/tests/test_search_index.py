@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the project search index.
+"""
+
+# Standard library imports
+import os
+import re
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils.search_index import (
+    get_regex_literals, SearchIndex)
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / 'spam.py').write_text('import spam\nprint(spam.eggs)\n')
+    (tmp_path / 'ham.txt').write_text('Ham and EGGS\n')
+    (tmp_path / 'other.md').write_text('Nothing to see here\n')
+    (tmp_path / '.hidden').mkdir()
+    (tmp_path / '.hidden' / 'spam.py').write_text('spam\n')
+    return tmp_path
+
+
+def get_candidates(index, text, text_re=False, case_sensitive=True):
+    if text_re:
+        text = re.compile(text)
+    candidates = index.get_candidates(
+        [(text, 'utf-8')], text_re, case_sensitive
+    )
+    if candidates is None:
+        return None
+    return sorted(os.path.basename(f) for f in candidates)
+
+
+@pytest.mark.parametrize(
+    "pattern, literals",
+    [
+        (b'spam', [b'spam']),
+        (b'import\\s+spam', [b'import', b'spam']),
+        (b'spam(eggs)?ham', [b'spam', b'ham']),
+        (b'spam|ham', []),
+        (b'sp.m', [b'sp', b'm']),
+        (b'spams?', [b'spam']),
+        (b'spam\\.py', [b'spam.py']),
+        (b'[a-z]spam+x{2,}', [b'spam']),
+        (b'(?i)spam', []),
+        (b'spam(ham|eggs)', [b'spam']),
+        # Escapes are skipped as a whole
+        (b'\\x41bc', [b'bc']),
+        (b'\\101bcd', [b'bcd']),
+        (b'a\\0bcd', [b'a', b'bcd']),
+        (b'a\\012cd', [b'a', b'cd']),
+        (b'(a)\\1bcd', [b'bcd']),
+        (b'[\\x5d]spam', [b'spam']),
+        # A ] at the start of a set, after an optional ^, is in the set
+        (b'[]]abc', [b'abc']),
+        (b'[^]]abc', [b'abc']),
+    ]
+)
+def test_regex_literals(pattern, literals):
+    assert get_regex_literals(re.compile(pattern)) == literals
+
+
+def test_candidates(project):
+    """Test that only files that can contain the text are candidates."""
+    index = SearchIndex(str(project))
+    assert get_candidates(index, b'spam') is None
+
+    index.update()
+
+    assert get_candidates(index, b'spam') == ['spam.py']
+    assert get_candidates(index, b'eggs') == ['ham.txt', 'spam.py']
+    assert get_candidates(index, b'import\\s+spam', text_re=True) == [
+        'spam.py']
+    assert get_candidates(index, b'bacon') == []
+
+    # Texts shorter than a trigram can't be used to narrow down the search
+    assert get_candidates(index, b'sp') is None
+    assert get_candidates(index, b'spam|ham', text_re=True) is None
+
+    # Non-ASCII letters are not lowercased in the index, so all files are
+    # searched if the search is case insensitive
+    (project / 'other.md').write_text('\u00d1am\n', encoding='utf-8')
+    index.update()
+    assert get_candidates(
+        index, '\u00d1am'.encode('utf-8'), case_sensitive=True
+    ) == ['other.md']
+    assert get_candidates(
+        index, '\u00f1am'.encode('utf-8'), case_sensitive=False
+    ) is None
+
+
+def test_incremental_update(project):
+    """Test that changed, new and removed files are updated."""
+    index = SearchIndex(str(project))
+    index.update()
+
+    ham = project / 'ham.txt'
+    ham.write_text('Ham, spam and more spam\n')
+    os.utime(ham, ns=(0, 0))
+    assert not index.is_up_to_date(str(ham), ham.stat())
+
+    index.update_file(str(ham))
+    assert index.is_up_to_date(str(ham), ham.stat())
+    assert get_candidates(index, b'spam') == ['ham.txt', 'spam.py']
+
+    (project / 'spam.py').unlink()
+    index.update()
+    assert get_candidates(index, b'spam') == ['ham.txt']
+
+
+def test_save_and_load(project):
+    index = SearchIndex(str(project))
+    index.update()
+    index.save()
+    assert os.path.isfile(index.index_path)
+
+    # The index is not saved in the project, which could come from an
+    # untrusted source
+    assert not index.index_path.startswith(str(project))
+
+    new_index = SearchIndex(str(project))
+    assert new_index.load()
+    assert get_candidates(new_index, b'eggs') == ['ham.txt', 'spam.py']
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the project symbol index.
+"""
+
+# Standard library imports
+import json
+import os
+import textwrap
+
+# Third party imports
+from lsprotocol import types as lsp
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils import symbol_index
+from spyder.plugins.projects.utils.symbol_index import get_symbols, SymbolIndex
+
+
+CODE = textwrap.dedent("""
+    import os
+
+    class Spam:
+        def eggs(self):
+            def inner():
+                pass
+
+    if os.name == 'nt':
+        async def ham():
+            pass
+""")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / 'spam.py').write_text(CODE)
+    (tmp_path / 'broken.py').write_text('def spam(:\n')
+    (tmp_path / 'ham.txt').write_text('class Ham: pass\n')
+    (tmp_path / '.hidden').mkdir()
+    (tmp_path / '.hidden' / 'hidden.py').write_text('def spam(): pass\n')
+    return tmp_path
+
+
+def get_results(index, text, **kwargs):
+    return [
+        (os.path.basename(filename), name, line)
+        for filename, name, __, line, __ in index.search(text, **kwargs)
+    ]
+
+
+def test_get_symbols():
+    """Test that classes and functions are found with their containers."""
+    assert get_symbols(CODE) == [
+        ('Spam', lsp.SymbolKind.Class, 4, ''),
+        ('eggs', lsp.SymbolKind.Method, 5, 'Spam'),
+        ('inner', lsp.SymbolKind.Function, 6, 'Spam.eggs'),
+        ('ham', lsp.SymbolKind.Function, 10, ''),
+    ]
+    assert get_symbols('def spam(:\n') == []
+
+
+def test_search(project):
+    """Test searching symbols in the index."""
+    index = SymbolIndex(str(project))
+    assert get_results(index, 'spam') == []
+
+    index.update()
+    assert index.ready
+    assert get_results(index, 'spam') == [('spam.py', 'Spam', 4)]
+    assert get_results(index, 'in') == [('spam.py', 'inner', 6)]
+    assert get_results(index, 'h') == [('spam.py', 'ham', 10)]
+    assert get_results(index, 'spam', exclude=str(project / 'spam.py')) == []
+
+    # Results are sorted by their score
+    (project / 'other.py').write_text('def egg_spam(): pass\n')
+    index.update()
+    assert get_results(index, 'spam') == [
+        ('spam.py', 'Spam', 4),
+        ('other.py', 'egg_spam', 1)
+    ]
+    assert get_results(index, 'spam', max_results=1) == [
+        ('spam.py', 'Spam', 4)
+    ]
+
+
+def test_incremental_update(project):
+    """Test that changed, new and removed files are updated."""
+    index = SymbolIndex(str(project))
+    index.update()
+
+    spam = project / 'spam.py'
+    spam.write_text('class Bacon:\n    pass\n')
+    os.utime(spam, ns=(0, 0))
+    assert not index.is_up_to_date(str(spam), spam.stat())
+
+    index.update_file(str(spam))
+    assert index.is_up_to_date(str(spam), spam.stat())
+    assert get_results(index, 'spam') == []
+    assert get_results(index, 'bacon') == [('spam.py', 'Bacon', 1)]
+
+    spam.unlink()
+    index.update()
+    assert get_results(index, 'bacon') == []
+
+
+def test_update_in_pool(project, monkeypatch):
+    """Test that files can be parsed in a pool of processes."""
+    for i in range(5):
+        (project / f'module{i}.py').write_text(f'def function{i}(): pass\n')
+
+    monkeypatch.setattr(symbol_index, 'MIN_FILES_FOR_POOL', 2)
+    index = SymbolIndex(str(project))
+    index.update()
+
+    assert get_results(index, 'function3') == [('module3.py', 'function3', 1)]
+    assert get_results(index, 'eggs') == [('spam.py', 'eggs', 5)]
+
+
+def test_save_and_load(project):
+    index = SymbolIndex(str(project))
+    index.update()
+    index.save()
+    assert os.path.isfile(index.index_path)
+
+    # The index is not saved in the project, which could come from an
+    # untrusted source
+    assert not index.index_path.startswith(str(project))
+
+    new_index = SymbolIndex(str(project))
+    assert new_index.load()
+    assert new_index.ready
+    assert get_results(new_index, 'eggs') == [('spam.py', 'eggs', 5)]
+    assert new_index.get_file_symbols(str(project / 'spam.py')) == (
+        index.get_file_symbols(str(project / 'spam.py'))
+    )
+
+    # Indexes saved for other projects or that can't be read are ignored
+    other_index = SymbolIndex(str(project / 'other'))
+    other_index.index_path = index.index_path
+    assert not other_index.load()
+
+    with open(index.index_path, 'w') as f:
+        json.dump(
+            {'version': symbol_index.INDEX_VERSION,
+             'root_path': str(project),
+             'files': [['spam.py', 0, 0, [['Spam', 5]]]]},
+            f
+        )
+    assert not SymbolIndex(str(project)).load()
+
+
+if __name__ == "__main__":
+    pytest.main()
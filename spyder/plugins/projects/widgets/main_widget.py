@@ -32,11 +32,14 @@
 from spyder.config.base import (
     get_home_dir, get_project_config_folder, running_under_pytest)
 from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.plugins.completion.api import SYMBOL_KIND_ICON
 from spyder.plugins.completion.decorators import (
     class_register, handles, request)
 from spyder.plugins.explorer.api import DirViewActions
 from spyder.plugins.projects.api import (
     BaseProjectType, EmptyProject, WORKSPACE)
+from spyder.plugins.projects.utils.search_index import SearchIndex
+from spyder.plugins.projects.utils.symbol_index import SymbolIndex
 from spyder.plugins.projects.utils.watcher import WorkspaceWatcher
 from spyder.plugins.projects.widgets.projectdialog import (
     is_writable,
@@ -46,6 +49,7 @@
     ProjectExplorerTreeWidget)
 from spyder.plugins.switcher.utils import get_file_icon, shorten_paths
 from spyder.utils import encoding
+from spyder.utils.icon_manager import ima
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.programs import find_program
 from spyder.utils.workers import WorkerManager
@@ -81,6 +85,8 @@ class RecentProjectsMenuSections:
 
 class ProjectsOptionsMenuActions:
     SearchInSwitcher = "search_in_switcher"
+    SearchIndex = "search_index"
+    SymbolIndex = "symbol_index"
 
 
 # ---- Main widget
@@ -159,6 +165,31 @@ class ProjectExplorerWidget(PluginMainWidget):
     sig_restart_console_requested = Signal()
     """This signal is emitted to request restarting the IPython console."""
 
+    sig_search_index_changed = Signal(object)
+    """
+    This signal is emitted when the search index of the active project is
+    created or removed.
+
+    Parameters
+    ----------
+    search_index: spyder.plugins.projects.utils.search_index.SearchIndex
+        The new search index or None if there's no index available.
+    """
+
+    sig_go_to_symbol_requested = Signal(str, int, str)
+    """
+    This signal is emitted to request going to a symbol of the project.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the file where the symbol is defined.
+    line_number: int
+        Line where the symbol is defined, starting at 1.
+    name: str
+        Name of the symbol.
+    """
+
     sig_broadcast_notification_requested = Signal(str, dict)
     """
     This signal is emitted to request that the Completions plugin broadcast
@@ -189,6 +220,8 @@ def __init__(self, name, plugin, parent=None):
         self.completions_available = False
         self._fzf = find_program('fzf')
         self._default_switcher_paths = []
+        self.search_index = None
+        self.symbol_index = None
 
         # -- Tree widget
         self.treewidget = ProjectExplorerTreeWidget(self, self.show_hscrollbar)
@@ -205,6 +238,11 @@ def __init__(self, name, plugin, parent=None):
         # -- Worker manager for calls to fzf
         self._worker_manager = WorkerManager(self)
 
+        # -- Worker manager to build and update the search and symbol
+        # indexes. A single thread is used so that updates are applied in
+        # order.
+        self._index_worker_manager = WorkerManager(self, max_threads=1)
+
         # -- Signals
         self.sig_project_loaded.connect(self._setup_project)
 
@@ -285,6 +323,20 @@ def setup(self):
             option='search_files_in_switcher',
         )
 
+        search_index_action = self.create_action(
+            ProjectsOptionsMenuActions.SearchIndex,
+            text=_("Index project files to speed up Find in Files"),
+            toggled=True,
+            option='search_index',
+        )
+
+        symbol_index_action = self.create_action(
+            ProjectsOptionsMenuActions.SymbolIndex,
+            text=_("Index project symbols to search them in the switcher"),
+            toggled=True,
+            option='symbol_index',
+        )
+
         # Add some DirView actions to the Options menu for easy access.
         hidden_action = self.get_action(DirViewActions.ToggleHiddenFiles)
         single_click_action = self.get_action(DirViewActions.ToggleSingleClick)
@@ -295,6 +347,8 @@ def setup(self):
             hidden_action,
             single_click_action,
             search_in_switcher_action,
+            search_index_action,
+            symbol_index_action,
         ]:
             self.add_item_to_menu(
                 action,
@@ -307,6 +361,8 @@ def update_actions(self):
 
     def on_close(self):
         self._worker_manager.terminate_all()
+        self._stop_search_index()
+        self._stop_symbol_index()
 
     # ---- Public API
     # -------------------------------------------------------------------------
@@ -428,6 +484,8 @@ def open_project(self, path=None, project_type=None, restart_console=True,
             # multiple workspaces.
             self.sig_project_closed.emit(self.current_active_project.root_path)
             self.watcher.stop()
+            self._stop_search_index()
+            self._stop_symbol_index()
 
         self.current_active_project = project_type
         self.latest_project = project_type
@@ -443,6 +501,8 @@ def open_project(self, path=None, project_type=None, restart_console=True,
                 self.sig_project_loaded.emit(path)
 
         self.watcher.start(path)
+        self._start_search_index()
+        self._start_symbol_index()
 
         if restart_console:
             self.sig_restart_console_requested.emit()
@@ -485,6 +545,8 @@ def close_project(self):
             self._clear()
             self.sig_restart_console_requested.emit()
             self.watcher.stop()
+            self._stop_search_index()
+            self._stop_symbol_index()
 
     def delete_project(self):
         """
@@ -647,6 +709,14 @@ def get_active_project_path(self):
         if self.current_active_project:
             return self.current_active_project.root_path
 
+    def get_search_index(self):
+        """Get the search index of the active project, if available."""
+        return self.search_index
+
+    def get_symbol_index(self):
+        """Get the symbol index of the active project, if available."""
+        return self.symbol_index
+
     def save_config(self):
         """
         Save configuration: opened projects & tree widget state.
@@ -693,7 +763,7 @@ def handle_switcher_selection(self, item, mode, search_text):
 
         If the selected item is not in the section of the switcher that
         corresponds to this plugin, then ignore it. Otherwise, switch to
-        selected project file and hide the switcher.
+        selected project file or symbol and hide the switcher.
 
         Parameters
         ----------
@@ -707,20 +777,33 @@ def handle_switcher_selection(self, item, mode, search_text):
         if item.get_section() != self.get_title():
             return
 
-        # Open file in editor
-        self.sig_open_file_requested.emit(item.get_data())
+        if mode == "@":
+            # Go to symbol in editor
+            data = item.get_data()
+            self.sig_go_to_symbol_requested.emit(
+                data['filename'], data['line_number'], data['name']
+            )
+        else:
+            # Open file in editor
+            self.sig_open_file_requested.emit(item.get_data())
 
-    def handle_switcher_search(self, search_text):
+    def handle_switcher_search(self, search_text, mode=""):
         """
         Handle user typing in switcher to filter results.
 
         Load switcher results when a search text is typed for projects.
+
         Parameters
         ----------
         text: str
             The current search text in the switcher dialog box.
+        mode: str, optional
+            The current selected mode (open files "" or symbol "@").
         """
-        self._call_fzf(search_text)
+        if mode == "@":
+            self._display_symbols_in_switcher(search_text)
+        else:
+            self._call_fzf(search_text)
 
     # ---- Public API for the LSP
     # -------------------------------------------------------------------------
@@ -756,6 +839,7 @@ def handle_response(self, method, params):
     def file_created(self, src_file, is_dir):
         """Notify LSP server about file creation."""
         self._update_default_switcher_paths()
+        self._update_indexes(src_file, is_dir)
 
         # LSP specification only considers file updates
         if is_dir:
@@ -776,6 +860,8 @@ def file_created(self, src_file, is_dir):
     def file_moved(self, src_file, dest_file, is_dir):
         """Notify LSP server about a file that is moved."""
         self._update_default_switcher_paths()
+        self._update_indexes(src_file, is_dir, removed=True)
+        self._update_indexes(dest_file, is_dir)
 
         if is_dir:
             return
@@ -803,6 +889,7 @@ def file_moved(self, src_file, dest_file, is_dir):
     def file_deleted(self, src_file, is_dir):
         """Notify LSP server about file deletion."""
         self._update_default_switcher_paths()
+        self._update_indexes(src_file, is_dir, removed=True)
 
         if is_dir:
             return
@@ -824,6 +911,8 @@ def file_modified(self, src_file, is_dir):
         if is_dir:
             return
 
+        self._update_indexes(src_file, is_dir)
+
         params = {
             'params': [{
                 'file': src_file,
@@ -1211,6 +1300,157 @@ def _update_default_switcher_paths(self):
         self._default_switcher_paths = []
         self._call_fzf()
 
+    # ---- Private API for the search index
+    # -------------------------------------------------------------------------
+    def _start_search_index(self):
+        """Create the search index of the active project and update it."""
+        project_path = self.get_active_project_path()
+        if not self.get_conf("search_index") or project_path is None:
+            return
+
+        self.search_index = SearchIndex(project_path)
+        self.sig_search_index_changed.emit(self.search_index)
+
+        def build(search_index):
+            search_index.load()
+            search_index.update()
+            search_index.save()
+
+        self._run_index_worker(build, self.search_index)
+
+    def _stop_search_index(self, wait=False):
+        """
+        Stop updating the search index and save it.
+
+        Parameters
+        ----------
+        wait: bool, optional
+            Whether to save the index in the main thread. Default is False.
+        """
+        if self.search_index is None:
+            return
+
+        search_index = self.search_index
+        self.search_index = None
+        self.sig_search_index_changed.emit(None)
+
+        search_index.stop()
+        if wait:
+            search_index.save()
+        else:
+            self._run_index_worker(search_index.save)
+
+    # ---- Private API for the symbol index
+    # -------------------------------------------------------------------------
+    def _start_symbol_index(self):
+        """Create the symbol index of the active project and update it."""
+        project_path = self.get_active_project_path()
+        if not self.get_conf("symbol_index") or project_path is None:
+            return
+
+        self.symbol_index = SymbolIndex(project_path)
+
+        def build(symbol_index):
+            symbol_index.load()
+            symbol_index.update()
+            symbol_index.save()
+
+        self._run_index_worker(build, self.symbol_index)
+
+    def _stop_symbol_index(self, wait=False):
+        """
+        Stop updating the symbol index and save it.
+
+        Parameters
+        ----------
+        wait: bool, optional
+            Whether to save the index in the main thread. Default is False.
+        """
+        if self.symbol_index is None:
+            return
+
+        symbol_index = self.symbol_index
+        self.symbol_index = None
+
+        symbol_index.stop()
+        if wait:
+            symbol_index.save()
+        else:
+            self._run_index_worker(symbol_index.save)
+
+    def _display_symbols_in_switcher(self, search_text):
+        """Display the project symbols that match `search_text`."""
+        symbol_index = self.symbol_index
+        if symbol_index is None or not symbol_index.ready:
+            return
+
+        # The symbols of the current file are already shown by the Editor
+        results = symbol_index.search(
+            search_text,
+            max_results=self.MAX_SWITCHER_RESULTS,
+            exclude=self.get_plugin()._get_current_filename()
+        )
+
+        project_path = self.get_active_project_path()
+        section = self.get_title()
+        items = []
+        for i, (filename, name, kind, line, container) in enumerate(results):
+            title = f'{container}.{name}' if container else name
+            icon = ima.icon(SYMBOL_KIND_ICON.get(kind, 'no_match'))
+            description = f'{osp.relpath(filename, project_path)}:{line}'
+            data = {'filename': filename, 'line_number': line, 'name': name}
+            is_last_item = (i + 1 == len(results))
+            items.append(
+                (title, description, icon, section, data, is_last_item)
+            )
+
+        self._plugin._display_items_in_switcher(
+            items, setup=True, clear_section=True
+        )
+
+    # ---- Private API for the project indexes
+    # -------------------------------------------------------------------------
+    def _update_indexes(self, path, is_dir, removed=False):
+        """Update the project indexes after a change in the project."""
+        for index in [self.search_index, self.symbol_index]:
+            if index is None:
+                continue
+
+            if removed:
+                func = index.remove_dir if is_dir else index.remove_file
+                self._run_index_worker(func, path)
+            elif is_dir:
+                self._run_index_worker(index.update)
+            else:
+                self._run_index_worker(index.update_file, path)
+
+    def _run_index_worker(self, func, *args):
+        worker = self._index_worker_manager.create_python_worker(func, *args)
+        worker.sig_finished.connect(self._on_index_worker_finished)
+        worker.start()
+
+    def _on_index_worker_finished(self, worker, output, error):
+        if error is not None:
+            logger.debug(f"Error updating a project index: {error}")
+
+    @on_conf_change(option="search_index")
+    def _on_search_index_changed(self, value):
+        """Actions to take when users enable/disable the search index."""
+        if value:
+            if self.search_index is None:
+                self._start_search_index()
+        else:
+            self._stop_search_index()
+
+    @on_conf_change(option="symbol_index")
+    def _on_symbol_index_changed(self, value):
+        """Actions to take when users enable/disable the symbol index."""
+        if value:
+            if self.symbol_index is None:
+                self._start_symbol_index()
+        else:
+            self._stop_symbol_index()
+
     @on_conf_change(option="search_files_in_switcher")
     def _on_search_files_in_switcher_changed(self, value):
         """
@@ -30,7 +30,7 @@
     SwitcherItem, SwitcherSeparatorItem)
 from spyder.utils.palette import SpyderPalette
 from spyder.widgets.helperwidgets import HTMLDelegate
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import FuzzyMatcher
 from spyder.plugins.switcher.utils import clean_string
 
 
@@ -142,6 +142,7 @@ def __init__(self, parent, help_text=None):
         # Attributes
         self._modes = {}
         self._mode_on = ''
+        self._matcher = None
 
         font_size = self.get_font(SpyderFontType.Interface).pointSize()
         self._item_styles = {
@@ -316,20 +317,28 @@ def setup(self):
 
             titles.append(title)
 
+        # Reuse the matcher while the items don't change, so that it can
+        # narrow down the search as the user types.
+        if self._matcher is None or self._matcher.choices != titles:
+            self._matcher = FuzzyMatcher(titles)
+
         search_text = clean_string(search_text)
-        scores = get_search_scores(
+        scores = self._matcher.get_scores(
             str(search_text),
-            titles,
             template=u"<b>{0}</b>"
         )
 
+        # Only update the items whose result changed, to avoid rendering them
+        # again.
         for idx, (title, rich_title, score_value) in enumerate(scores):
             item = self.model.item(idx)
             if not self._is_separator(item) and not item.is_action_item():
                 rich_title = rich_title.replace(" ", "&nbsp;")
-                item.set_rich_title(rich_title)
+                if item.get_rich_title() != rich_title:
+                    item.set_rich_title(rich_title)
 
-            item.set_score(score_value)
+            if item.get_score() != score_value:
+                item.set_score(score_value)
 
         self.proxy.set_filter_by_score(True)
         self.proxy.sortBy('_score')
@@ -486,10 +495,12 @@ def _on_search_text_changed(self):
                     self.sig_mode_selected.emit(key)
                     break
 
-            # Emit this signal only for the files mode for now. We'll see if
-            # it's necessary for other modes later.
-            if self._mode_on == "":
-                self.sig_search_text_available.emit(clean_string(search_text))
+            # Emit this signal only for the files and symbols modes for now.
+            # We'll see if it's necessary for other modes later.
+            if self._mode_on in ["", "@"]:
+                self.sig_search_text_available.emit(
+                    clean_string(self.search_text_without_mode())
+                )
             else:
                 self.setup()
         else:
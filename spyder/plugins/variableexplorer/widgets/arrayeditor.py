@@ -51,6 +51,7 @@
 from spyder.plugins.variableexplorer.widgets.preferences import (
     PreferencesDialog
 )
+from spyder.plugins.variableexplorer.widgets.remoteview import RemoteView
 from spyder.utils.icon_manager import ima
 from spyder.utils.qthelpers import keybinding, safe_disconnect
 from spyder.utils.stylesheet import AppStyle, MAC
@@ -199,8 +200,7 @@ def __init__(self, data, format_spec=".6g", readonly=False, parent=None):
 
         if not self._data.dtype.name == 'object':
             try:
-                self.vmin = np.nanmin(self.color_func(data))
-                self.vmax = np.nanmax(self.color_func(data))
+                self.vmin, self.vmax = self.get_min_max()
                 if self.vmax == self.vmin:
                     self.vmin -= 1
                 self.hue0 = huerange[0]
@@ -217,7 +217,7 @@ def __init__(self, data, format_spec=".6g", readonly=False, parent=None):
         # crashes. See: spyder-ide/spyder#8093
         self.has_inf = False
         if data.dtype.kind in ['f', 'c']:
-            self.has_inf = np.any(np.isinf(data))
+            self.has_inf = self.get_has_inf()
 
         # Deactivate coloring for object arrays or arrays with inf values
         if self._data.dtype.name == 'object' or self.has_inf:
@@ -238,6 +238,17 @@ def __init__(self, data, format_spec=".6g", readonly=False, parent=None):
             else:
                 self.cols_loaded = self.total_cols
 
+    def get_min_max(self):
+        """Return the minimum and maximum values used to color cells."""
+        return (
+            np.nanmin(self.color_func(self._data)),
+            np.nanmax(self.color_func(self._data))
+        )
+
+    def get_has_inf(self):
+        """Return whether the array has infinite values."""
+        return np.any(np.isinf(self._data))
+
     def get_format_spec(self) -> str:
         """
         Return current format specification for floats.
@@ -433,6 +444,66 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteArrayModel(ArrayModel):
+    """
+    Array Editor Table Model for an array whose data stays in the kernel.
+
+    Values are requested in tiles to the kernel as they are displayed, and
+    the statistics used to color cells are computed there. This model is
+    read-only.
+    """
+
+    def __init__(self, remote_view, format_spec=".6g", parent=None):
+        self.remote_view = remote_view
+        self._stats = None
+        super().__init__(
+            remote_view, format_spec=format_spec, readonly=True, parent=parent
+        )
+        self.remote_view.sig_tile_loaded.connect(self._on_tile_loaded)
+
+    def _get_stats(self):
+        if self._stats is None:
+            try:
+                self._stats = self.remote_view.get_stats()
+            except Exception:
+                self._stats = {'vmin': None, 'vmax': None, 'has_inf': False}
+        return self._stats
+
+    def get_min_max(self):
+        stats = self._get_stats()
+        if stats['vmin'] is None:
+            raise ValueError("Array without numeric values")
+        return stats['vmin'], stats['vmax']
+
+    def get_has_inf(self):
+        return self._get_stats()['has_inf']
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Cells are empty until their tile is received from the kernel
+        if (
+            index.isValid()
+            and self.remote_view.get_tile(index.row(), index.column()) is None
+        ):
+            return to_qvariant('') if role == Qt.DisplayRole else to_qvariant()
+        return super().data(index, role)
+
+    def get_value(self, index):
+        return self.remote_view.get_value(index.row(), index.column())
+
+    def setData(self, index, value, role=Qt.EditRole):
+        return False
+
+    def _on_tile_loaded(self, row_start, row_stop, col_start, col_stop):
+        """Update the cells of a tile received."""
+        row_stop = min(row_stop, self.rowCount())
+        col_stop = min(col_stop, self.columnCount())
+        if row_start < row_stop and col_start < col_stop:
+            self.dataChanged.emit(
+                self.index(row_start, col_start),
+                self.index(row_stop - 1, col_stop - 1)
+            )
+
+
 class ArrayDelegate(SpyderFontsMixin, QItemDelegate):
     """Array Editor Item Delegate"""
     def __init__(self, dtype, parent=None):
@@ -677,7 +748,10 @@ def __init__(self, parent, data, readonly=False):
         QWidget.__init__(self, parent)
         self.data = data
         self.old_data_shape = None
-        if len(self.data.shape) == 1:
+        if isinstance(self.data, RemoteView):
+            # Remote views of 1d arrays are already served as columns
+            pass
+        elif len(self.data.shape) == 1:
             self.old_data_shape = self.data.shape
             self.data = self.data.reshape((self.data.shape[0], 1))
         elif len(self.data.shape) == 0:
@@ -688,8 +762,13 @@ def __init__(self, parent, data, readonly=False):
         # a `str` for arrays with strings, see spyder-ide/spyder#22466
         format_spec = SUPPORTED_FORMATS.get(data.dtype.name, '')
 
-        self.model = ArrayModel(self.data, format_spec=format_spec,
-                                readonly=readonly, parent=self)
+        if isinstance(self.data, RemoteView):
+            self.model = RemoteArrayModel(
+                self.data, format_spec=format_spec, parent=self
+            )
+        else:
+            self.model = ArrayModel(self.data, format_spec=format_spec,
+                                    readonly=readonly, parent=self)
         self.view = ArrayView(
             self, self.model, self.data.dtype, self.data.shape
         )
@@ -771,6 +850,9 @@ def __init__(
         self.dim_indexes = [{}, {}, {}]
         self.last_dim = 0  # Adjust this for changing the startup dimension
 
+        # Release the data held by the kernel for remote arrays
+        self.finished.connect(self._close_remote_view)
+
     def setup_and_check(
         self, data, title='', readonly=False, from_variable_explorer=False
     ):
@@ -974,11 +1056,19 @@ def set_data_and_check(self, data, readonly=False):
         Setup ArrayEditor:
         return False if data is not supported, True otherwise
         """
-        if not isinstance(data, (np.ndarray, np.ma.MaskedArray)):
+        if isinstance(data, RemoteView):
+            if data.kind != 'array':
+                return False
+        elif not isinstance(data, (np.ndarray, np.ma.MaskedArray)):
             return False
 
+        self._close_remote_view()
         self.data = data
-        readonly = readonly or not self.data.flags.writeable
+        readonly = (
+            readonly
+            or isinstance(data, RemoteView)
+            or not self.data.flags.writeable
+        )
         is_masked_array = isinstance(data, np.ma.MaskedArray)
 
         # Reset data for 3d arrays
@@ -1121,6 +1211,11 @@ def set_data_and_check(self, data, readonly=False):
 
         return True
 
+    def _close_remote_view(self):
+        """Close the view in the kernel of the current data, if any."""
+        if isinstance(self.data, RemoteView):
+            self.data.close()
+
     @Slot(QModelIndex, QModelIndex)
     def save_and_close_enable(self, left_top, bottom_right):
         """Handle the data change event to enable the save and close button."""
@@ -174,19 +174,24 @@ def show_warning(self, index):
                 return True
         elif (val_type in ['DataFrame', 'Series'] or 'Array' in val_type or
                 'Index' in val_type):
-            # Avoid errors for user declared types that contain words like
-            # the ones we're looking for above
-            try:
-                # From https://blender.stackexchange.com/a/131849
-                shape = [int(s) for s in val_size.strip("()").split(",") if s]
-                size = functools.reduce(operator.mul, shape)
-                if size > LARGE_ARRAY:
-                    return True
-            except Exception:
-                pass
+            if self.get_size_from_shape(val_size) > LARGE_ARRAY:
+                return True
 
         return False
 
+    def get_size_from_shape(self, val_size):
+        """
+        Return the number of elements of an object from the shape displayed
+        in the size column, or 0 if it can't be computed.
+        """
+        # Avoid errors for user declared types that don't display a shape
+        try:
+            # From https://blender.stackexchange.com/a/131849
+            shape = [int(s) for s in val_size.strip("()").split(",") if s]
+            return functools.reduce(operator.mul, shape)
+        except Exception:
+            return 0
+
     def createEditor(self, parent, option, index, object_explorer=False):
         """Overriding method createEditor"""
         self.sig_editor_creation_started.emit()
@@ -34,8 +34,10 @@
 
 # Standard library imports
 from __future__ import annotations
+from collections import OrderedDict
 import io
 import sys
+import threading
 from time import perf_counter
 from typing import Any, Callable, Optional, TYPE_CHECKING
 
@@ -58,6 +60,7 @@
     QLabel,
     QLineEdit,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QScrollBar,
     QStyle,
@@ -68,6 +71,7 @@
     QWidget,
 )
 from spyder_kernels.utils.lazymodules import numpy as np, pandas as pd
+from spyder_kernels.utils.remoteview import columns_max_min
 
 # Local imports
 from spyder.api.fonts import SpyderFontsMixin, SpyderFontType
@@ -79,11 +83,13 @@
 from spyder.plugins.variableexplorer.widgets.preferences import (
     PreferencesDialog
 )
+from spyder.plugins.variableexplorer.widgets.remoteview import RemoteView
 from spyder.utils.icon_manager import ima
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.qthelpers import keybinding, qapplication
 from spyder.utils.stylesheet import AppStyle, MAC
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.helperwidgets import MessageCheckBox
 
 
@@ -136,6 +142,7 @@ class DataframeEditorMenus:
 
 
 class DataframeEditorWidgets:
+    FilterLineEdit = 'filter_line_edit'
     OptionsToolButton = 'options_button_widget'
     Toolbar = 'toolbar'
     ToolbarStretcher = 'toolbar_stretcher'
@@ -170,6 +177,9 @@ class DataframeEditorToolbarSections:
 ROWS_TO_LOAD = 500
 COLS_TO_LOAD = 40
 
+# Maximum number of tiles of background colors kept in memory
+MAX_COLOR_TILES = 64
+
 # Background colours
 BACKGROUND_NUMBER_MINHUE = 0.66  # hue for largest number
 BACKGROUND_NUMBER_HUERANGE = 0.33  # (hue for smallest) minus (hue for largest)
@@ -184,18 +194,6 @@ class DataframeEditorToolbarSections:
 # ---- Utility functions
 # =============================================================================
 
-def is_any_real_numeric_dtype(dtype) -> bool:
-    """
-    Test whether a Pandas dtype is a real numeric type.
-    """
-    try:
-        import pandas.api.types
-        return pandas.api.types.is_any_real_numeric_dtype(dtype)
-    except Exception:
-        # Pandas version 1
-        return dtype in REAL_NUMBER_TYPES
-
-
 def bool_false_check(value):
     """
     Used to convert bool entrance to false.
@@ -214,6 +212,99 @@ def global_max(col_vals, index):
     return max(max_col), min(min_col)
 
 
+def compute_row_order(
+    df: DataFrame,
+    sort_keys: list[tuple[int, bool]],
+    filter_expr: str = '',
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+):
+    """
+    Compute the positions of the rows of a dataframe to show, in order.
+
+    The dataframe is not modified. This is safe to call from a thread other
+    than the main one.
+
+    Parameters
+    ----------
+    df : DataFrame
+        The dataframe.
+    sort_keys : list of tuple
+        Pairs (column, ascending) with the position of a column, or -1 for the
+        index, and the direction in which to sort by it. The first pair is the
+        primary key. Sorts are stable and leave missing values at the end.
+    filter_expr : str, optional
+        Expression evaluated with `DataFrame.eval` that must give a boolean
+        value per row. If given, only rows for which it's True are kept.
+    progress_callback : Optional[Callable[[int, int], None]], optional
+        Function called with the number of steps done and the total number
+        of steps (one per sort key, plus one for the filter) after each one.
+    cancel_event : Optional[threading.Event], optional
+        If this event is set, the computation stops after the current step.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        Positions in `df` of the rows to show, or None if the rows don't have
+        to be reordered or filtered, or the computation was cancelled.
+
+    Raises
+    ------
+    Exception
+        Any error raised when evaluating the filter expression or sorting.
+    """
+    total_steps = len(sort_keys) + int(bool(filter_expr))
+    if total_steps == 0:
+        return None
+
+    steps_done = 0
+
+    def step_done():
+        """Report progress and return True if the computation must stop."""
+        nonlocal steps_done
+        if cancel_event is not None and cancel_event.is_set():
+            return True
+
+        steps_done += 1
+        if progress_callback is not None:
+            progress_callback(steps_done, total_steps)
+        return False
+
+    positions = np.arange(df.shape[0])
+
+    if filter_expr:
+        mask = np.asarray(df.eval(filter_expr))
+        if mask.shape != positions.shape or mask.dtype != bool:
+            raise ValueError(
+                _("The filter expression must give a boolean value for each "
+                  "row")
+            )
+        positions = np.flatnonzero(mask)
+        if step_done():
+            return None
+
+    # Successive stable sorts, from the least to the most significant key
+    for column, ascending in reversed(sort_keys):
+        if column == -1:
+            keys = pd.Series(
+                np.arange(len(positions)), index=df.index[positions]
+            )
+            order = keys.sort_index(
+                ascending=ascending, kind='mergesort', na_position='last'
+            ).to_numpy()
+        else:
+            keys = df.iloc[positions, column].reset_index(drop=True)
+            order = keys.sort_values(
+                ascending=ascending, kind='mergesort', na_position='last'
+            ).index.to_numpy()
+
+        positions = positions[order]
+        if step_done():
+            return None
+
+    return positions
+
+
 # =============================================================================
 # ---- Main classes
 # =============================================================================
@@ -252,8 +343,24 @@ class DataFrameModel(SpyderFontsMixin, QAbstractTableModel):
         the entire dataframe.
     _format_spec : str
         Format specification for floats
+    _color_tiles : OrderedDict
+        Background colors of the tiles of ROWS_TO_LOAD rows and COLS_TO_LOAD
+        columns that have been displayed, as arrays of hues and alphas.
+    _row_order : numpy.ndarray or None
+        Positions in the dataframe of the rows shown, or None if they are
+        shown in their original order.
+
+    Signals
+    -------
+    sig_row_order_progress(int, int): Emitted with the number of steps done
+        and the total number of steps while sorting or filtering rows.
+    sig_row_order_finished(bool): Emitted when sorting or filtering rows
+        finishes, with True if the rows shown changed.
     """
 
+    sig_row_order_progress = Signal(int, int)
+    sig_row_order_finished = Signal(bool)
+
     def __init__(
         self,
         dataFrame: DataFrame,
@@ -267,6 +374,16 @@ def __init__(
         self.df_columns_list = None
         self.df_index_list = None
         self._format_spec = format_spec
+        self._color_tiles = OrderedDict()
+
+        # Sorting and filtering of rows
+        self._row_order = None
+        self._sort_keys = []
+        self._filter_expr = ''
+        self._pending_row_order = None
+        self._row_order_worker = None
+        self._row_order_cancel_event = None
+        self._worker_manager = None
         self.readonly = readonly
         self.complex_intran = None
         self.display_error_idxs = []
@@ -335,8 +452,10 @@ def _axis_levels(self, axis):
 
     @property
     def shape(self):
-        """Return the shape of the dataframe."""
-        return self.df.shape
+        """Return the shape of the dataframe, as currently shown."""
+        if self._row_order is None:
+            return self.df.shape
+        return (len(self._row_order), self.df.shape[1])
 
     @property
     def header_shape(self):
@@ -356,7 +475,14 @@ def header(self, axis, x, level=0):
         given level.
         """
         ax = self._axis(axis)
-        if not hasattr(ax, 'levels'):
+        if axis == 1:
+            # Getting labels directly avoids converting the whole index to a
+            # list, which is slow for large dataframes.
+            if len(ax) == 0:
+                return None
+            label = ax[self.row_position(x)]
+            return label[level] if hasattr(ax, 'levels') else label
+        elif not hasattr(ax, 'levels'):
             ax = self._axis_list(axis)
             if len(ax) > 0:
                 return ax[x]
@@ -385,35 +511,16 @@ def max_min_col_update(self):
         is set to None. If the dtype is complex, then compute the maximum and
         minimum of the absolute values. If vmax equals vmin, then vmin is
         decreased by one.
+
+        Columns with the same numeric dtype are processed together in a
+        single vectorized pass.
         """
+        # Background colors depend on these values
+        self._color_tiles.clear()
+
         if self.df.shape[0] == 0:  # If no rows to compute max/min then return
             return
-        self.max_min_col = []
-        for __, col in self.df.items():
-            # This is necessary to catch some errors in Pandas when computing
-            # the maximum of a column.
-            # Fixes spyder-ide/spyder#17145 and spyder-ide/spyder#24094
-            try:
-                if (
-                    is_any_real_numeric_dtype(col.dtype)
-                    or col.dtype in COMPLEX_NUMBER_TYPES
-                ):
-                    if is_any_real_numeric_dtype(col.dtype):
-                        vmax = col.max(skipna=True)
-                        vmin = col.min(skipna=True)
-                    else:
-                        vmax = col.abs().max(skipna=True)
-                        vmin = col.abs().min(skipna=True)
-                    if vmax != vmin:
-                        max_min = [vmax, vmin]
-                    else:
-                        max_min = [vmax, vmin - 1]
-                else:
-                    max_min = None
-            except (TypeError, ValueError):
-                max_min = None
-
-            self.max_min_col.append(max_min)
+        self.max_min_col = columns_max_min(self.df)
 
     def get_format_spec(self) -> str:
         """
@@ -452,23 +559,93 @@ def colum_avg(self, value: bool):
 
     def get_bgcolor(self, index):
         """Background color depending on value."""
-        column = index.column()
-
         if not self.bgcolor_enabled:
             return
 
-        value = self.get_value(index.row(), column)
-        if self.max_min_col[column] is None or pd.isna(value):
+        row, column = index.row(), index.column()
+        tile = self._get_color_tile(row, column)
+        if tile is None:
+            return
+
+        hues, alphas = tile
+        row, column = row % ROWS_TO_LOAD, column % COLS_TO_LOAD
+        hue, alpha = float(hues[row, column]), float(alphas[row, column])
+
+        if np.isnan(alpha):
+            color = None
+        elif np.isnan(hue):
             color = QColor(BACKGROUND_NONNUMBER_COLOR)
-            if isinstance(value, str):
-                color.setAlphaF(BACKGROUND_STRING_ALPHA)
-            else:
-                color.setAlphaF(BACKGROUND_MISC_ALPHA)
+            color.setAlphaF(alpha)
         else:
-            if isinstance(value, COMPLEX_NUMBER_TYPES):
-                color_func = abs
-            else:
-                color_func = float
+            color = QColor.fromHsvF(hue, BACKGROUND_NUMBER_SATURATION,
+                                    BACKGROUND_NUMBER_VALUE, alpha)
+
+        return color
+
+    def _get_color_tile(self, row, column):
+        """
+        Return the hues and alphas of the tile that contains a cell.
+
+        Colors are computed for whole tiles of ROWS_TO_LOAD rows and
+        COLS_TO_LOAD columns the first time one of their cells is painted,
+        and then kept in a cache.
+        """
+        key = (row // ROWS_TO_LOAD, column // COLS_TO_LOAD)
+        tile = self._color_tiles.get(key)
+        if tile is not None:
+            self._color_tiles.move_to_end(key)
+            return tile
+
+        row_start = key[0] * ROWS_TO_LOAD
+        col_start = key[1] * COLS_TO_LOAD
+        block = self._get_color_block(row_start, col_start)
+        if block is None:
+            return None
+
+        tile = self._compute_colors(block, col_start)
+        self._color_tiles[key] = tile
+        if len(self._color_tiles) > MAX_COLOR_TILES:
+            self._color_tiles.popitem(last=False)
+
+        return tile
+
+    def _get_color_block(self, row_start, col_start):
+        """Return the data of the tile that starts at the given cell."""
+        return self.get_window(
+            slice(row_start, row_start + ROWS_TO_LOAD),
+            slice(col_start, col_start + COLS_TO_LOAD)
+        )
+
+    def _compute_colors(self, block, col_start):
+        """
+        Compute the background colors of a block of the dataframe.
+
+        Returns
+        -------
+        tuple of numpy arrays
+            Hues and alphas of the cells in the block. Hues are NaN for cells
+            that don't contain a number, and alphas are NaN for cells that
+            don't have a background color.
+        """
+        nrows, ncols = block.shape
+        hues = np.full((nrows, ncols), np.nan)
+        alphas = np.full((nrows, ncols), np.nan)
+
+        for j in range(ncols):
+            col = block.iloc[:, j]
+            column = col_start + j
+
+            if self.max_min_col[column] is None:
+                is_string = np.fromiter(
+                    (isinstance(value, str) for value in col),
+                    dtype=bool,
+                    count=nrows
+                )
+                alphas[:, j] = np.where(
+                    is_string, BACKGROUND_STRING_ALPHA, BACKGROUND_MISC_ALPHA
+                )
+                continue
+
             vmax, vmin = self.return_max(self.max_min_col, column)
 
             # This is necessary to catch an error in Pandas when computing
@@ -480,21 +657,31 @@ def get_bgcolor(self, index):
                 else:
                     vmax_vmin_diff = vmax - vmin
             except TypeError:
-                return
+                alphas[col.isna().to_numpy(), j] = BACKGROUND_MISC_ALPHA
+                continue
 
-            hue = (BACKGROUND_NUMBER_MINHUE + BACKGROUND_NUMBER_HUERANGE *
-                   (vmax - color_func(value)) / (vmax_vmin_diff))
-            hue = float(abs(hue))
-            if hue > 1:
-                hue = 1
-            color = QColor.fromHsvF(hue, BACKGROUND_NUMBER_SATURATION,
-                                    BACKGROUND_NUMBER_VALUE,
-                                    BACKGROUND_NUMBER_ALPHA)
+            if pd.api.types.is_complex_dtype(col.dtype):
+                values = np.abs(col.to_numpy())
+            else:
+                values = col.to_numpy(dtype=float, na_value=np.nan)
 
-        return color
+            # Missing values give NaN hues
+            with np.errstate(invalid='ignore'):
+                hue = np.abs(
+                    BACKGROUND_NUMBER_MINHUE + BACKGROUND_NUMBER_HUERANGE *
+                    (vmax - values) / vmax_vmin_diff
+                )
+            hues[:, j] = np.minimum(hue, 1)
+            alphas[:, j] = np.where(
+                np.isnan(hue), BACKGROUND_MISC_ALPHA, BACKGROUND_NUMBER_ALPHA
+            )
+
+        return hues, alphas
 
     def get_value(self, row, column):
         """Return the value of the DataFrame."""
+        row = self.row_position(row)
+
         # To increase the performance iat is used but that requires error
         # handling, so fallback uses iloc
         try:
@@ -544,60 +731,173 @@ def data(self, index, role=Qt.DisplayRole):
 
     def recalculate_index(self):
         """Recalcuate index information."""
-        self.df_index_list = self.df.index.tolist()
-        self.df_columns_list = self.df.columns.tolist()
-        self.total_rows = self.df.shape[0]
+        # Lists of labels are computed again when needed
+        self.df_index_list = None
+        self.df_columns_list = None
+        self.total_rows = self.shape[0]
 
         # Necessary to set rows_loaded because rowCount() method
-        self.rows_loaded = self.df.shape[0]
+        self.rows_loaded = self.shape[0]
 
         # Necessary to set cols_loaded because of columnCount() method
         self.cols_loaded = self.df.shape[1]
         self.total_cols = self.df.shape[1]
 
-    def sort(self, column, order=Qt.AscendingOrder):
-        """Overriding sort method"""
-        if self.complex_intran is not None:
-            if self.complex_intran.any(axis=0).iloc[column]:
-                QMessageBox.critical(self.dialog, "Error",
-                                     "TypeError error: no ordering "
-                                     "relation is defined for complex numbers")
-                return False
-        try:
-            ascending = order == Qt.AscendingOrder
-            if column >= 0:
-                try:
-                    self.df.sort_values(by=self.df.columns[column],
-                                        ascending=ascending, inplace=True,
-                                        kind='mergesort')
-                except AttributeError:
-                    # for pandas version < 0.17
-                    self.df.sort(columns=self.df.columns[column],
-                                 ascending=ascending, inplace=True,
-                                 kind='mergesort')
-                except ValueError as e:
-                    # Not possible to sort on duplicate columns
-                    # See spyder-ide/spyder#5225.
-                    QMessageBox.critical(self.dialog, "Error",
-                                         "ValueError: %s" % str(e))
-                except SystemError as e:
-                    # Not possible to sort on category dtypes
-                    # See spyder-ide/spyder#5361.
-                    QMessageBox.critical(self.dialog, "Error",
-                                         "SystemError: %s" % str(e))
+    def row_position(self, row):
+        """Return the position in the dataframe of a row of the view."""
+        if self._row_order is None:
+            return row
+        return self._row_order[row]
+
+    def is_filtered(self):
+        """Return True if only the rows that match a filter are shown."""
+        return bool(self._filter_expr)
+
+    def sort(self, column, order=Qt.AscendingOrder, add=False):
+        """
+        Sort rows by a column, or by the index if `column` is -1.
+
+        The dataframe is not modified. Instead, the positions of its rows in
+        the new order are computed and the rows of the view are mapped
+        through them.
+
+        If `add` is True, the column is added as a new key to the current
+        sort, which is used to order rows that are equal for the previous
+        keys. Otherwise, it becomes the primary key and the previous ones are
+        only used to order rows that are equal for it, so that sorting is
+        stable with respect to the order shown.
+
+        Returns False if sorting failed. For large dataframes, the sort is
+        computed in a thread, and `sig_row_order_finished` is emitted when
+        it finishes.
+        """
+        ascending = order == Qt.AscendingOrder
+        if add:
+            sort_keys = list(self._sort_keys)
+            columns = [key[0] for key in sort_keys]
+            if column in columns:
+                sort_keys[columns.index(column)] = (column, ascending)
             else:
-                # Update index list
-                self.recalculate_index()
-                # To sort by index
-                self.df.sort_index(inplace=True, ascending=ascending)
-        except TypeError as e:
-            QMessageBox.critical(self.dialog, "Error",
-                                 "TypeError error: %s" % str(e))
-            return False
+                sort_keys.append((column, ascending))
+        else:
+            sort_keys = [(column, ascending)] + [
+                key for key in self._sort_keys if key[0] != column
+            ]
+
+        return self._update_row_order(sort_keys, self._filter_expr)
+
+    def set_filter(self, expression):
+        """
+        Only show rows for which `expression` is True.
+
+        The expression is evaluated with `DataFrame.eval`, so it can refer to
+        columns by their names (quoted with backticks if they are not valid
+        identifiers) and to the index. An empty expression removes the
+        filter. Like `sort`, this doesn't modify the dataframe and is done
+        in a thread for large dataframes.
+        """
+        return self._update_row_order(self._sort_keys, expression.strip())
+
+    def is_computing_row_order(self):
+        """Return True if rows are being sorted or filtered in a thread."""
+        return self._row_order_worker is not None
+
+    def cancel_row_order(self):
+        """Cancel sorting or filtering rows, if that's being done."""
+        if self._row_order_worker is not None:
+            self._cancel_row_order_worker()
+            self.sig_row_order_finished.emit(False)
+
+    def materialize_row_order(self):
+        """
+        Reorder the rows of the dataframe as they are shown.
+
+        This is necessary before editing the rows of the dataframe, because
+        that refers to their positions. A reordered copy is used, so the
+        original dataframe is not modified. Nothing is done if rows are
+        filtered.
+        """
+        self._cancel_row_order_worker()
+        if self._row_order is not None and not self.is_filtered():
+            self.df = self.df.take(self._row_order)
+            self._row_order = None
+
+    def _update_row_order(self, sort_keys, filter_expr):
+        """Compute the order of rows for the given sort and filter."""
+        self._cancel_row_order_worker()
+
+        if self.df.shape[0] <= LARGE_NROWS:
+            try:
+                row_order = compute_row_order(self.df, sort_keys, filter_expr)
+            except Exception as e:
+                self._show_row_order_error(e)
+                return False
+
+            self._set_row_order(row_order, sort_keys, filter_expr)
+            return True
+
+        if self._worker_manager is None:
+            self._worker_manager = WorkerManager(self, max_threads=1)
+
+        self._pending_row_order = (sort_keys, filter_expr)
+        self._row_order_cancel_event = threading.Event()
+        self._row_order_worker = self._worker_manager.create_python_worker(
+            compute_row_order,
+            self.df,
+            sort_keys,
+            filter_expr,
+            progress_callback=self.sig_row_order_progress.emit,
+            cancel_event=self._row_order_cancel_event,
+        )
+        self._row_order_worker.sig_finished.connect(
+            self._on_row_order_computed
+        )
+        self.sig_row_order_progress.emit(
+            0, len(sort_keys) + int(bool(filter_expr))
+        )
+        self._row_order_worker.start()
 
-        self.reset()
         return True
 
+    def _cancel_row_order_worker(self):
+        # Python threads can't be stopped, so the worker is asked to finish
+        # as soon as possible and its result is discarded.
+        if self._row_order_worker is not None:
+            self._row_order_cancel_event.set()
+            self._row_order_worker = None
+            self._pending_row_order = None
+
+    def _on_row_order_computed(self, worker, output, error):
+        """Apply the order of rows computed by a worker."""
+        if worker is not self._row_order_worker:
+            # The computation was cancelled
+            return
+
+        sort_keys, filter_expr = self._pending_row_order
+        self._row_order_worker = None
+        self._pending_row_order = None
+
+        if error is not None:
+            self._show_row_order_error(error)
+            self.sig_row_order_finished.emit(False)
+        else:
+            self._set_row_order(output, sort_keys, filter_expr)
+
+    def _set_row_order(self, row_order, sort_keys, filter_expr):
+        self._row_order = row_order
+        self._sort_keys = sort_keys
+        self._filter_expr = filter_expr
+        self.total_rows = self.shape[0]
+        self.reset()
+        self.sig_row_order_finished.emit(True)
+
+    def _show_row_order_error(self, error):
+        QMessageBox.critical(
+            self.dialog,
+            "Error",
+            "{}: {}".format(type(error).__name__, str(error))
+        )
+
     def flags(self, index):
         """Set flags"""
         result = super().flags(index)
@@ -615,6 +915,7 @@ def setData(self, index, value, role=Qt.EditRole):
 
         val = from_qvariant(value, str)
         current_value = self.get_value(row, column)
+        row = self.row_position(row)
         if isinstance(current_value, (bool, np.bool_)):
             val = bool_false_check(val)
         supported_types = (bool, np.bool_) + REAL_NUMBER_TYPES
@@ -643,6 +944,20 @@ def get_data(self):
         """Return data"""
         return self.df
 
+    def get_window(self, rows, columns):
+        """
+        Return the part of the dataframe in the given row/column slices.
+
+        Rows are taken in the order in which they are shown.
+        """
+        if self._row_order is None:
+            # Avoid copying the whole dataframe, e.g. to export it
+            if rows == slice(None) and columns == slice(None):
+                return self.df
+        else:
+            rows = self._row_order[rows]
+        return self.df.iloc[rows, columns]
+
     def rowCount(self, index=QModelIndex()):
         """DataFrame row number"""
         # Avoid a "Qt exception in virtual methods" generated in our
@@ -690,10 +1005,158 @@ def columnCount(self, index=QModelIndex()):
             return 0
 
     def reset(self):
+        self._color_tiles.clear()
         self.beginResetModel()
         self.endResetModel()
 
 
+class RemoteDataFrameModel(DataFrameModel):
+    """
+    Model for a dataframe whose data stays in the kernel.
+
+    Cells and index labels are requested in tiles to the kernel as they are
+    displayed. Sorting and column statistics are computed there too, so this
+    model is read-only.
+
+    Parameters
+    ----------
+    remote_view : RemoteView
+        View of the dataframe in the kernel.
+    format_spec : str, optional
+        Format specification for floats. The default is DEFAULT_FORMAT.
+    parent : Optional[QWidget], optional
+        The parent widget for the model. The default is None.
+    """
+
+    def __init__(
+        self,
+        remote_view: RemoteView,
+        format_spec: str = DEFAULT_FORMAT,
+        parent: Optional[QWidget] = None,
+    ):
+        self.remote_view = remote_view
+        super().__init__(
+            remote_view, format_spec=format_spec, parent=parent, readonly=True
+        )
+        self.remote_view.sig_tile_loaded.connect(self._on_tile_loaded)
+
+    def _axis(self, axis):
+        # Only the columns are available in the frontend
+        return self.remote_view.columns if axis == 0 else None
+
+    def _axis_levels(self, axis):
+        if axis == 0:
+            return self.remote_view.columns.nlevels
+        else:
+            return self.remote_view.index_nlevels
+
+    def header(self, axis, x, level=0):
+        if axis == 1:
+            # Labels are empty until a tile with their row is received
+            if self.remote_view.get_index_tile(x) is None:
+                return ''
+            return self.remote_view.get_index_label(x, level)
+
+        columns = self.remote_view.columns
+        if len(columns) == 0:
+            return None
+        elif columns.nlevels > 1:
+            return columns[x][level]
+        else:
+            return columns[x]
+
+    def name(self, axis, level):
+        if axis == 0:
+            names = self.remote_view.columns.names
+        else:
+            names = self.remote_view.index_names
+        return names[level]
+
+    def max_min_col_update(self):
+        self._color_tiles.clear()
+        try:
+            self.max_min_col = self.remote_view.get_stats()
+        except Exception:
+            self.max_min_col = None
+
+    def bgcolor(self, value: bool):
+        # Column statistics are only computed when necessary because they
+        # require a full pass over the data in the kernel.
+        if value and self.max_min_col is None:
+            self.max_min_col_update()
+        super().bgcolor(value)
+
+    def get_bgcolor(self, index):
+        if self.max_min_col is None:
+            return
+        return super().get_bgcolor(index)
+
+    def _get_color_block(self, row_start, col_start):
+        # Tiles of the remote view have the same size as the ones used for
+        # colors, so the ones already cached are reused.
+        return self.remote_view.get_tile(row_start, col_start)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Cells are empty until their tile is received from the kernel
+        if (
+            index.isValid()
+            and role in (Qt.DisplayRole, Qt.EditRole)
+            and self.remote_view.get_tile(index.row(), index.column()) is None
+        ):
+            return to_qvariant('')
+        return super().data(index, role)
+
+    def get_value(self, row, column):
+        """Return the value of a cell, requesting it from the kernel."""
+        return self.remote_view.get_value(row, column)
+
+    def get_window(self, rows, columns):
+        row_start, row_stop, __ = rows.indices(self.total_rows)
+        col_start, col_stop, __ = columns.indices(self.total_cols)
+        return self.remote_view.get_window(
+            row_start, row_stop, col_start, col_stop
+        )
+
+    def recalculate_index(self):
+        # Index labels are requested with the data, so there's nothing to do
+        pass
+
+    def sort(self, column, order=Qt.AscendingOrder, add=False):
+        """
+        Sort rows in the kernel, without modifying the dataframe.
+
+        Only sorting by a single column is supported, so `add` is ignored.
+        """
+        ascending = order == Qt.AscendingOrder
+        try:
+            self.remote_view.sort(column, ascending)
+        except Exception as e:
+            QMessageBox.critical(self.dialog, "Error", str(e))
+            return False
+
+        self.reset()
+        self.sig_row_order_finished.emit(True)
+        return True
+
+    def set_filter(self, expression):
+        """Filtering is not supported for remote dataframes."""
+        return False
+
+    def _on_tile_loaded(self, row_start, row_stop, col_start, col_stop):
+        """Update the cells and index labels of a tile received."""
+        row_stop = min(row_stop, self.rowCount())
+        col_stop = min(col_stop, self.columnCount())
+        if row_start >= row_stop:
+            return
+
+        self.headerDataChanged.emit(Qt.Vertical, row_start, row_stop - 1)
+        if col_start < col_stop:
+            self.dataChanged.emit(
+                self.index(row_start, col_start),
+                self.index(row_stop - 1, col_stop - 1)
+            )
+
+
 class DataFrameView(SpyderWidgetMixin, QTableView):
     """
     View displaying a dataframe in the dataframe editor
@@ -837,12 +1300,22 @@ def setModel(self, model: DataFrameModel) -> None:
         self.selectionModel().selectionChanged.connect(self.refresh_menu)
         self.refresh_menu()
 
+        # Exporting needs the full dataframe, which remote models don't have
+        self.export_action.setEnabled(
+            not isinstance(model, RemoteDataFrameModel)
+        )
+
     def sortByColumn(self, index):
-        """Implement a column sort."""
+        """
+        Implement a column sort.
+
+        If Shift is pressed, the column is added to the current sort.
+        """
         if self.sort_old == [None]:
             self.header_class.setSortIndicatorShown(True)
         sort_order = self.header_class.sortIndicatorOrder()
-        if not self.model().sort(index, sort_order):
+        add = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        if not self.model().sort(index, sort_order, add=add):
             if len(self.sort_old) != 2:
                 self.header_class.setSortIndicatorShown(False)
             else:
@@ -889,11 +1362,16 @@ def refresh_menu(self):
             and not self.readonly
         )
 
-        for action in [self.edit_action, self.insert_action_above,
+        # Rows and columns can't be inserted or removed while filtering rows
+        # because positions in the view don't correspond to the dataframe.
+        filtered = self.model().is_filtered()
+
+        self.edit_action.setEnabled(condition_edit)
+        for action in [self.insert_action_above,
                        self.insert_action_below, self.insert_action_after,
                        self.insert_action_before, self.duplicate_row_action,
                        self.duplicate_col_action]:
-            action.setEnabled(condition_edit)
+            action.setEnabled(condition_edit and not filtered)
 
         # Enable/disable actions for remove col/row, copy and plot
         condition_copy_remove = (
@@ -902,12 +1380,16 @@ def refresh_menu(self):
             and not self.readonly
         )
 
-        for action in [self.copy_action, self.remove_row_action,
-                       self.remove_col_action, self.histogram_action]:
-            action.setEnabled(condition_copy_remove)
+        self.copy_action.setEnabled(condition_copy_remove)
+        for action in [self.remove_row_action, self.remove_col_action]:
+            action.setEnabled(condition_copy_remove and not filtered)
 
         # Enable/disable action for plot
-        condition_plot = (index.isValid() and len(self.selectedIndexes()) > 0)
+        condition_plot = (
+            index.isValid()
+            and len(self.selectedIndexes()) > 0
+            and not isinstance(self.model(), RemoteDataFrameModel)
+        )
         self.histogram_action.setEnabled(condition_plot)
 
     def setup_menu(self):
@@ -1083,14 +1565,14 @@ def export_data(self):
             else:
                 index = True
 
+            # Export rows as they are shown, i.e. sorted and filtered
+            df = self.model().get_window(slice(None), slice(None))
+
             try:
                 if filename.endswith(('.xlsx', '.xls')):
                     df.to_excel(filename, index=index)
                 elif filename.endswith('.json'):
-                    if (
-                        isinstance(df.index, pd.RangeIndex)
-                        and df.index.name is None
-                    ):
+                    if not index:
                         df.to_json(filename, orient='records', indent=4)
                     else:
                         df.to_json(filename, orient='index', indent=4)
@@ -1116,9 +1598,9 @@ def copy(self):
         # Copy index and header too (equal True).
         # See spyder-ide/spyder#11096
         index = header = True
-        df = self.model().df
-        obj = df.iloc[slice(row_min, row_max + 1),
-                      slice(col_min, col_max + 1)]
+        obj = self.model().get_window(
+            slice(row_min, row_max + 1), slice(col_min, col_max + 1)
+        )
         output = io.StringIO()
         try:
             obj.to_csv(output, sep='\t', index=index, header=header)
@@ -1226,6 +1708,10 @@ def insert_item(self, axis=0, before_above=False):
         if not current_index.isValid():
             return False
 
+        # Rows are edited by position, so they need to be in the order in
+        # which they are shown
+        self.model().materialize_row_order()
+
         column = current_index.column()
         row = current_index.row()
         step = 0
@@ -1345,6 +1831,10 @@ def duplicate_row_col(self, dup_row=False):
         if not current_index.isValid():
             return False
 
+        # Rows are edited by position, so they need to be in the order in
+        # which they are shown
+        self.model().materialize_row_order()
+
         column = current_index.column()
         row = current_index.row()
         df = self.model().df
@@ -1509,11 +1999,16 @@ def next_index_name(self, indexes, label):
     def remove_item(self, force=False, axis=0):
         """Remove item."""
         indexes = self.selectedIndexes()
-        index_label = []
-        df = self.model().df
         if not indexes:
             return
 
+        # Rows are removed by position, so they need to be in the order in
+        # which they are shown
+        self.model().materialize_row_order()
+
+        index_label = []
+        df = self.model().df
+
         # Keep focus on the item before the deleted one
         focus_row = indexes[0].row()
         focus_col = indexes[0].column()
@@ -1629,6 +2124,10 @@ def __init__(self, model, axis, use_monospace_font=False):
             self.total_rows = self.model.shape[0]
             self._shape = (self.model.shape[0], self.model.header_shape[1])
 
+            # Index labels of remote dataframes are received after they are
+            # first shown
+            self.model.headerDataChanged.connect(self._on_index_changed)
+
     def rowCount(self, index=None):
         """Get number of rows in the header."""
         if self.axis == 0:
@@ -1666,11 +2165,9 @@ def fetch_more(self, rows=False, columns=False):
             self.cols_loaded += items_to_fetch
             self.endInsertColumns()
 
-    def sort(self, column, order=Qt.AscendingOrder):
+    def sort(self, column, order=Qt.AscendingOrder, add=False):
         """Overriding sort method."""
-        ascending = order == Qt.AscendingOrder
-        self.model.sort(self.COLUMN_INDEX, order=ascending)
-        return True
+        return self.model.sort(self.COLUMN_INDEX, order=order, add=add)
 
     def headerData(self, section, orientation, role):
         """Get the information to put in the header."""
@@ -1744,13 +2241,25 @@ def flags(self, index):
                 Qt.ItemFlag.ItemIsSelectable
         )
 
+    def _on_index_changed(self, orientation, first, last):
+        """Update the index labels of rows that changed in the model."""
+        last = min(last, self.rowCount() - 1)
+        if orientation != Qt.Vertical or first > last:
+            return
+
+        self.dataChanged.emit(
+            self.index(first, 0),
+            self.index(last, self.columnCount() - 1)
+        )
+
     def setData(self, index, value, role):
         """Cell content change"""
         df = self.model.df
 
         if role == Qt.EditRole:
             if self.axis == 1:
-                old_value = df.index[index.row()]
+                row = self.model.row_position(index.row())
+                old_value = df.index[row]
 
                 if value not in df.index.tolist():
                     if type(old_value) is tuple:
@@ -1759,9 +2268,9 @@ def setData(self, index, value, role):
                         names = rows.names
                         old_value_list[index.column()] = value
                         rows = (
-                            df.index.tolist()[0:index.row()]
+                            df.index.tolist()[0:row]
                             + [tuple(old_value_list)]
-                            + df.index.tolist()[index.row()+1:]
+                            + df.index.tolist()[row + 1:]
                         )
                         df.index = pd.MultiIndex.from_tuples(rows, names=names)
                     else:
@@ -1968,8 +2477,15 @@ def __init__(
         self.glayout = None
         self.menu_header_v = None
         self.dataTable = None
+        self.dataModel = None
         self.resizeToHeader = False
 
+        # Release the data held by the kernel for remote dataframes
+        self.finished.connect(self._close_remote_view)
+
+        # Stop sorting or filtering rows, if that's being done
+        self.finished.connect(self._cancel_row_order)
+
     def setup_and_check(
         self, data, title="", from_variable_explorer=False
     ) -> bool:
@@ -1977,12 +2493,17 @@ def setup_and_check(
         Setup editor.
 
         It returns False if data is not supported, True otherwise. Supported
-        types for data are DataFrame, Series and Index.
+        types for data are DataFrame, Series, Index and remote views of them.
         """
+        if isinstance(data, RemoteView):
+            type_name = data.type_name
+        else:
+            type_name = data.__class__.__name__
+
         if title:
-            title = str(title) + " - %s" % data.__class__.__name__
+            title = str(title) + " - %s" % type_name
         else:
-            title = _("%s editor") % data.__class__.__name__
+            title = _("%s editor") % type_name
 
         self.setup_ui(title, from_variable_explorer)
         return self.set_data_and_check(data)
@@ -2050,6 +2571,18 @@ def setup_ui(self, title: str, from_variable_explorer) -> None:
         # ---- Buttons at bottom
 
         btn_layout = QHBoxLayout()
+
+        # Progress of sorting and filtering rows in large dataframes
+        self.row_order_label = QLabel(_("Sorting and filtering rows..."))
+        self.row_order_progress = QProgressBar(self)
+        self.row_order_progress.setTextVisible(False)
+        self.row_order_cancel_button = QPushButton(_('Cancel'))
+        self.row_order_cancel_button.clicked.connect(self._cancel_row_order)
+        for widget in [self.row_order_label, self.row_order_progress,
+                       self.row_order_cancel_button]:
+            widget.hide()
+            btn_layout.addWidget(widget)
+
         btn_layout.addStretch()
 
         if self.readonly:
@@ -2096,27 +2629,43 @@ def set_data_and_check(self, data) -> bool:
 
         This method returns False if data is not supported.
         """
-        if not isinstance(data, (pd.DataFrame, pd.Series, pd.Index)):
+        if isinstance(data, RemoteView):
+            if data.kind != 'dataframe':
+                return False
+        elif not isinstance(data, (pd.DataFrame, pd.Series, pd.Index)):
             return False
 
         self._selection_rec = False
         self._model = None
-
-        if isinstance(data, pd.Series):
-            self.is_series = True
-            data = data.to_frame()
-        elif isinstance(data, pd.Index):
-            data = pd.DataFrame(data)
+        self._close_remote_view()
 
         # Create the model and view of the data
-        self.dataModel = DataFrameModel(
-            data,
-            parent=self,
-            readonly=self.readonly
-        )
+        if isinstance(data, RemoteView):
+            self.is_series = data.is_series
+            self.dataModel = RemoteDataFrameModel(data, parent=self)
+        else:
+            if isinstance(data, pd.Series):
+                self.is_series = True
+                data = data.to_frame()
+            elif isinstance(data, pd.Index):
+                data = pd.DataFrame(data)
+
+            self.dataModel = DataFrameModel(
+                data,
+                parent=self,
+                readonly=self.readonly
+            )
         self.dataModel.dataChanged.connect(self.save_and_close_enable)
+        self.dataModel.sig_row_order_progress.connect(
+            self._show_row_order_progress
+        )
+        self.dataModel.sig_row_order_finished.connect(
+            self._on_row_order_finished
+        )
         self.dataTable.setModel(self.dataModel)
 
+        self._hide_row_order_progress()
+
         # autosize columns on-demand
         self._autosized_cols = set()
 
@@ -2155,6 +2704,28 @@ def set_data_and_check(self, data) -> bool:
         options_button.setPopupMode(QToolButton.InstantPopup)
         options_button.setMenu(options_menu)
 
+        self.filter_edit = QLineEdit(self)
+        self.filter_edit.ID = DataframeEditorWidgets.FilterLineEdit
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.setPlaceholderText(_("Filter rows"))
+        self.filter_edit.setToolTip(
+            _("Only show rows for which this expression is true, e.g.<br>"
+              "<tt>a > 0 and b == 'x'</tt><br><br>"
+              "Columns are referred to by their names, which need to be "
+              "quoted with backticks if they contain spaces. Press Enter "
+              "to apply it.")
+        )
+        self.filter_edit.setMinimumWidth(
+            self.fontMetrics().averageCharWidth() * 24
+        )
+        self.filter_edit.returnPressed.connect(self._filter_rows)
+
+        # Filtering rows is done with Pandas, so it's not possible for
+        # dataframes whose data is in the kernel
+        self.filter_edit.setEnabled(
+            not isinstance(self.dataModel, RemoteDataFrameModel)
+        )
+
         self.toolbar.clear()
         self.toolbar._section_items.clear()
         self.toolbar._item_map.clear()
@@ -2178,6 +2749,7 @@ def set_data_and_check(self, data) -> bool:
             self.dataTable.remove_col_action,
             self.close_all_editors_action,
             stretcher,
+            self.filter_edit,
             self.dataTable.histogram_action,
             self.dataTable.export_action,
             self.dataTable.resize_action,
@@ -2195,6 +2767,11 @@ def set_data_and_check(self, data) -> bool:
 
         return True
 
+    def _close_remote_view(self):
+        """Close the view in the kernel of the current data, if any."""
+        if isinstance(self.dataModel, RemoteDataFrameModel):
+            self.dataModel.remote_view.close()
+
     @Slot(QModelIndex, QModelIndex)
     def save_and_close_enable(self, top_left, bottom_right):
         """Handle the data change event to enable the save and close button."""
@@ -2304,7 +2881,6 @@ def create_data_table(self):
         self.dataTable.setItemDelegate(QItemDelegate())
         self.glayout.addWidget(self.dataTable, 1, 1)
         self.setFocusProxy(self.dataTable)
-        self.dataTable.sig_sort_by_column.connect(self._sort_update)
         self.dataTable.sig_fetch_more_columns.connect(self._fetch_more_columns)
         self.dataTable.sig_fetch_more_rows.connect(self._fetch_more_rows)
 
@@ -2312,8 +2888,8 @@ def sortByIndex(self, index):
         """Implement a Index sort."""
         self.table_level.horizontalHeader().setSortIndicatorShown(True)
         sort_order = self.table_level.horizontalHeader().sortIndicatorOrder()
-        self.table_index.model().sort(index, sort_order)
-        self._sort_update()
+        add = bool(QApplication.keyboardModifiers() & Qt.ShiftModifier)
+        self.table_index.model().sort(index, sort_order, add=add)
 
     def model(self):
         """Get the model of the dataframe."""
@@ -2638,6 +3214,44 @@ def _sort_update(self):
         self.dataModel.recalculate_index()
         self.setModel(self.dataTable.model())
 
+    def _filter_rows(self):
+        """Show only the rows that match the expression in the filter box."""
+        self.dataModel.set_filter(self.filter_edit.text())
+
+    @Slot()
+    def _cancel_row_order(self):
+        """Cancel sorting or filtering rows."""
+        self.dataModel.cancel_row_order()
+
+    @Slot(int, int)
+    def _show_row_order_progress(self, steps_done, total_steps):
+        """Show the progress of sorting or filtering rows."""
+        # Progress could be reported after the computation was cancelled
+        if not self.dataModel.is_computing_row_order():
+            return
+
+        # Show a busy indicator if there's a single step
+        self.row_order_progress.setRange(
+            0, total_steps if total_steps > 1 else 0
+        )
+        self.row_order_progress.setValue(steps_done)
+        for widget in [self.row_order_label, self.row_order_progress,
+                       self.row_order_cancel_button]:
+            widget.show()
+
+    def _hide_row_order_progress(self):
+        for widget in [self.row_order_label, self.row_order_progress,
+                       self.row_order_cancel_button]:
+            widget.hide()
+
+    @Slot(bool)
+    def _on_row_order_finished(self, changed):
+        """Update views after sorting or filtering rows finished."""
+        self._hide_row_order_progress()
+        if changed:
+            self._sort_update()
+            self.dataTable.refresh_menu()
+
     def _reload(self):
         """
         Reload the model for all the QTableView objects.
@@ -93,6 +93,11 @@ def __init__(self, parent):
         self.filename = None
         self.plots_plugin_enabled = False
 
+        # Whether the kernel can send the namespace view and the properties
+        # of its variables in a single call. That's only known after it sends
+        # its first state, so separate calls are made until then.
+        self._kernel_has_view_and_properties = False
+
         # Widgets
         self.editor = None
         self.shellwidget = None
@@ -208,7 +213,15 @@ def update_view(self, kernel_state):
             A new kernel state. The structure of this dictionary is defined in
             the `SpyderKernel.get_state` method of Spyder-kernels.
         """
+        # Kernels that send namespace view deltas also have the
+        # `get_namespace_view_and_properties` handler, which older ones lack.
+        if "namespace_view_delta" in kernel_state:
+            self._kernel_has_view_and_properties = True
+            self.process_remote_view_delta(
+                kernel_state.pop("namespace_view_delta")
+            )
         if "namespace_view" in kernel_state:
+            self._kernel_has_view_and_properties = False
             self.process_remote_view(kernel_state.pop("namespace_view"))
         if "var_properties" in kernel_state:
             self.set_var_properties(kernel_state.pop("var_properties"))
@@ -217,6 +230,14 @@ def refresh_namespacebrowser(self, *, interrupt=True):
         """Refresh namespace browser"""
         if not self.shellwidget.spyder_kernel_ready:
             return
+
+        if self._kernel_has_view_and_properties:
+            self.shellwidget.call_kernel(
+                interrupt=interrupt,
+                callback=self.process_remote_view_and_properties
+            ).get_namespace_view_and_properties()
+            return
+
         self.shellwidget.call_kernel(
             interrupt=interrupt,
             callback=self.process_remote_view
@@ -241,6 +262,55 @@ def process_remote_view(self, remote_view):
         if remote_view is not None:
             self.set_data(remote_view)
 
+    def process_remote_view_and_properties(self, namespace):
+        """Process remote view and the properties of its variables."""
+        if namespace is not None:
+            # Properties are set first so that they are up to date when the
+            # new data is shown.
+            self.set_var_properties(namespace["properties"])
+            self.process_remote_view(namespace["view"])
+
+    def process_remote_view_delta(self, delta):
+        """
+        Process the changes in the remote view since it was last sent.
+
+        Parameters
+        ----------
+        delta: dict
+            Changes in the namespace view. The structure of this dictionary is
+            defined in the `SpyderKernel.get_namespace_view_delta` method of
+            Spyder-kernels.
+        """
+        if delta is None:
+            return
+
+        if delta["reset"]:
+            self.set_var_properties(delta["properties"])
+            self.set_data(delta["view"])
+            return
+
+        removed = delta["removed"]
+        changed = delta["view"]
+        if not removed and not changed:
+            return
+
+        properties = self.editor.var_properties
+        for name in removed:
+            properties.pop(name, None)
+        properties.update(delta["properties"])
+
+        # Values of variables that are already shown are updated in place.
+        # The model is only reset when variables are added or removed.
+        source_model = self.editor.source_model
+        if not removed and source_model.update_data(changed):
+            return
+
+        data = dict(source_model.get_data())
+        for name in removed:
+            data.pop(name, None)
+        data.update(changed)
+        self.set_data(data)
+
     def set_var_properties(self, properties):
         """Set properties of variables"""
         if properties is not None:
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Views of dataframes and arrays whose data stays in the kernel.
+
+They are used to display large variables in the dataframe and array editors.
+Instead of copying them to Spyder, the windows of data shown by the editors
+are requested to the kernel in tiles, which are cached here.
+
+Tiles are requested without blocking, because they are needed while the
+editors are painted. Cells are shown empty until their tile arrives.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+import logging
+import time
+
+# Third party imports
+from qtpy.QtCore import QObject, Signal
+from spyder_kernels.utils.lazymodules import pandas as pd
+
+
+logger = logging.getLogger(__name__)
+
+# Size of the tiles in which data is requested to the kernel
+TILE_ROWS = 500
+TILE_COLS = 40
+
+# Maximum number of tiles kept in memory
+MAX_CACHED_TILES = 64
+
+# Time (in seconds) after which a tile request without reply is given up
+TILE_REQUEST_TIMEOUT = 30
+
+# Time (in seconds) before a tile that couldn't be retrieved is requested again
+FAILED_TILE_RETRY_DELAY = 5
+
+
+class RemoteView(QObject):
+    """
+    View of a dataframe or an array that is held by the kernel.
+
+    Parameters
+    ----------
+    shellwidget: ShellWidget
+        Console whose kernel holds the data.
+    name: str
+        Name of the variable.
+
+    Notes
+    -----
+    Remote views are read-only.
+    """
+
+    sig_tile_loaded = Signal(int, int, int, int)
+    """
+    This signal is emitted when a tile is received from the kernel.
+
+    Parameters
+    ----------
+    row_start: int
+        First row of the tile.
+    row_stop: int
+        Row after the last one of the tile.
+    col_start: int
+        First column of the tile.
+    col_stop: int
+        Column after the last one of the tile.
+    """
+
+    def __init__(self, shellwidget, name):
+        super().__init__()
+        self.shellwidget = shellwidget
+        self.name = name
+        self.view_id, info = shellwidget.open_remote_view(name)
+
+        self.kind = info['kind']
+        self.shape = info['shape']
+        self.type_name = info['type_name']
+        self.is_series = info['is_series']
+
+        # For dataframes
+        self.columns = info.get('columns')
+        self.index_nlevels = info.get('index_nlevels', 1)
+        self.index_names = info.get('index_names', [None])
+
+        # For arrays
+        self.dtype = info.get('dtype')
+
+        self._tiles = OrderedDict()
+        self._closed = False
+
+        # Times at which tiles were requested and tiles that couldn't be
+        # retrieved were given up, by key.
+        self._pending_tiles = {}
+        self._failed_tiles = {}
+
+        # Increased when the tiles in the cache are discarded, to ignore the
+        # replies of the requests made before.
+        self._generation = 0
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    def __getitem__(self, key):
+        """Get a window of data given by a tuple of row and column slices."""
+        rows, columns = key
+        row_start, row_stop, __ = rows.indices(self.shape[0])
+        col_start, col_stop, __ = columns.indices(self.shape[1])
+        window = self.get_window(row_start, row_stop, col_start, col_stop)
+        return window if self.kind == 'array' else window.values
+
+    def get_window(self, row_start, row_stop, col_start, col_stop):
+        """Get a window of data directly from the kernel."""
+        return self.shellwidget.get_remote_view_window(
+            self.view_id, row_start, row_stop, col_start, col_stop
+        )
+
+    def get_tile(self, row, column):
+        """
+        Return the tile that contains a cell, or None if it's not available.
+
+        Tiles that are not cached are requested to the kernel without
+        blocking, and `sig_tile_loaded` is emitted when they are received.
+        Tiles that couldn't be retrieved are not requested again for
+        FAILED_TILE_RETRY_DELAY seconds.
+        """
+        key = (row // TILE_ROWS, column // TILE_COLS)
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        if not self._closed:
+            self._request_tile(key)
+
+        # The tile is available here if the reply was received synchronously
+        return self._tiles.get(key)
+
+    def get_index_tile(self, row):
+        """
+        Return a tile that contains the index labels of a row, or None if
+        none is available.
+        """
+        # Any tile in the same rows has the labels, so there's no need to
+        # request a new one if one is already cached.
+        tile_row = row // TILE_ROWS
+        for (i, j) in reversed(self._tiles):
+            if i == tile_row:
+                return self._tiles[(i, j)]
+
+        return self.get_tile(row, 0)
+
+    def get_value(self, row, column):
+        """Return the value of a cell, or None if it's not available."""
+        tile = self.get_tile(row, column)
+        if tile is None:
+            return None
+
+        row, column = row % TILE_ROWS, column % TILE_COLS
+        if self.kind == 'array':
+            return tile[row, column]
+
+        # To increase the performance iat is used but that requires error
+        # handling, so fallback uses iloc
+        try:
+            return tile.iat[row, column]
+        except pd._libs.tslib.OutOfBoundsDatetime:
+            return tile.iloc[:, column].astype(str).iat[row]
+        except Exception:
+            return tile.iloc[row, column]
+
+    def get_index_label(self, row, level=0):
+        """
+        Return the label of a row of a dataframe in the given level, or None
+        if it's not available.
+        """
+        tile = self.get_index_tile(row)
+        if tile is None:
+            return None
+
+        label = tile.index[row % TILE_ROWS]
+        return label[level] if self.index_nlevels > 1 else label
+
+    def get_stats(self):
+        """Return the statistics used to color cells."""
+        return self.shellwidget.get_remote_view_stats(self.view_id)
+
+    def sort(self, column, ascending=True):
+        """
+        Sort rows by a column, or by the index if `column` is -1.
+
+        The order is computed and kept by the kernel, so the tiles in the
+        cache are discarded.
+        """
+        self.shellwidget.sort_remote_view(self.view_id, column, ascending)
+        self._clear_tiles()
+
+    def close(self):
+        """Close the view so that the kernel releases its data."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._clear_tiles()
+        try:
+            self.shellwidget.close_remote_view(self.view_id)
+        except Exception:
+            # The console could have been closed
+            pass
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _request_tile(self, key):
+        """Request a tile to the kernel, unless it was requested already."""
+        now = time.monotonic()
+
+        failed_time = self._failed_tiles.get(key)
+        if failed_time is not None:
+            if now - failed_time < FAILED_TILE_RETRY_DELAY:
+                return
+            del self._failed_tiles[key]
+
+        request_time = self._pending_tiles.get(key)
+        if request_time is not None:
+            if now - request_time < TILE_REQUEST_TIMEOUT:
+                return
+
+            # Callbacks are not called if the kernel fails to send a tile, so
+            # the request is given up after a while.
+            self._set_tile_failed(key, "no reply from the kernel")
+            return
+
+        row_start = key[0] * TILE_ROWS
+        col_start = key[1] * TILE_COLS
+        generation = self._generation
+        self._pending_tiles[key] = now
+        try:
+            self.shellwidget.request_remote_view_window(
+                self.view_id,
+                row_start,
+                min(row_start + TILE_ROWS, self.shape[0]),
+                col_start,
+                min(col_start + TILE_COLS, self.shape[1]),
+                callback=lambda tile: self._on_tile_received(
+                    key, generation, tile
+                )
+            )
+        except Exception as error:
+            self._set_tile_failed(key, error)
+
+    def _on_tile_received(self, key, generation, tile):
+        """Cache a tile received from the kernel and notify it."""
+        if self._closed or generation != self._generation:
+            # The reply is for tiles that were discarded
+            return
+
+        self._pending_tiles.pop(key, None)
+        self._tiles[key] = tile
+        if len(self._tiles) > MAX_CACHED_TILES:
+            self._tiles.popitem(last=False)
+
+        row_start = key[0] * TILE_ROWS
+        col_start = key[1] * TILE_COLS
+        self.sig_tile_loaded.emit(
+            row_start,
+            min(row_start + TILE_ROWS, self.shape[0]),
+            col_start,
+            min(col_start + TILE_COLS, self.shape[1])
+        )
+
+    def _set_tile_failed(self, key, error):
+        """Remember that a tile couldn't be retrieved."""
+        logger.debug(
+            f"Error getting tile {key} of remote view {self.view_id}: {error}"
+        )
+        self._pending_tiles.pop(key, None)
+        self._failed_tiles[key] = time.monotonic()
+
+    def _clear_tiles(self):
+        """Discard the cached tiles and ignore the pending requests."""
+        self._tiles.clear()
+        self._pending_tiles.clear()
+        self._failed_tiles.clear()
+        self._generation += 1
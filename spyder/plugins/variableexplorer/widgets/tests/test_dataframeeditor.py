@@ -14,6 +14,7 @@
 import os
 import sys
 from datetime import datetime
+import threading
 from unittest.mock import Mock, patch, ANY
 
 # Third party imports
@@ -42,9 +43,12 @@
 # Local imports
 from spyder.utils.programs import is_module_installed
 from spyder.utils.test import close_message_box
-from spyder.plugins.variableexplorer.widgets import dataframeeditor
+from spyder.plugins.variableexplorer.widgets import dataframeeditor, remoteview
 from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
-    DataFrameEditor, DataFrameModel, COLS_TO_LOAD, LARGE_COLS)
+    DataFrameEditor, DataFrameModel, RemoteDataFrameModel, COLS_TO_LOAD,
+    LARGE_COLS, LARGE_NROWS, compute_row_order)
+from spyder.plugins.variableexplorer.widgets.remoteview import RemoteView
+from spyder_kernels.utils.remoteview import RemoteView as KernelRemoteView
 
 
 # =============================================================================
@@ -332,6 +336,110 @@ def test_dataframemodel_sort_is_stable():   # cf. spyder-ide/spyder#3010.
                                      2, 5, 7, 8, 9, 10, 13, 14, 16]]
 
 
+def test_compute_row_order():
+    """Test computing the order of rows to sort and filter dataframes."""
+    df = DataFrame(
+        {'a': [2, 1, 2, numpy.nan, 1], 'b': list('xyzwv')},
+        index=[5, 4, 3, 2, 1]
+    )
+    assert compute_row_order(df, []) is None
+
+    # Missing values are left at the end
+    order = compute_row_order(df, [(0, True)])
+    assert list(order) == [1, 4, 0, 2, 3]
+    order = compute_row_order(df, [(0, False)])
+    assert list(order) == [0, 2, 1, 4, 3]
+
+    # Several keys
+    order = compute_row_order(df, [(0, True), (1, False)])
+    assert list(order) == [1, 4, 2, 0, 3]
+
+    # Index
+    order = compute_row_order(df, [(-1, True)])
+    assert list(order) == [4, 3, 2, 1, 0]
+
+    # Filter and report progress
+    progress = []
+    order = compute_row_order(
+        df, [(1, True)], 'a > 1 or index == 2',
+        progress_callback=lambda *args: progress.append(args)
+    )
+    assert list(order) == [3, 0, 2]
+    assert progress == [(1, 2), (2, 2)]
+
+    with pytest.raises(ValueError):
+        compute_row_order(df, [], 'a + 1')
+
+    # Cancel
+    event = threading.Event()
+    event.set()
+    assert compute_row_order(df, [(0, True)], cancel_event=event) is None
+
+
+def test_dataframemodel_sort_and_filter_keep_dataframe():
+    """
+    Test that sorting and filtering rows doesn't modify the dataframe, and
+    that edits go to the right rows.
+    """
+    df = DataFrame({'a': [3, 1, 2, 1], 'b': list('wxyz')})
+    expected = df.copy()
+    dfm = DataFrameModel(df)
+
+    assert dfm.sort(0)
+    assert [data(dfm, i, 1) for i in range(4)] == list('xzyw')
+    assert dfm.header(1, 0) == 1
+    assert_frame_equal(dfm.get_data(), expected)
+
+    # Add a second key
+    assert dfm.sort(1, Qt.DescendingOrder, add=True)
+    assert [data(dfm, i, 1) for i in range(4)] == list('zxyw')
+
+    # Filter rows
+    assert dfm.set_filter('a < 3')
+    assert dfm.rowCount() == 3
+    assert [data(dfm, i, 1) for i in range(3)] == list('zxy')
+    assert_frame_equal(dfm.get_data(), expected)
+
+    # Edit a value
+    dfm.setData(dfm.createIndex(0, 1), 'v')
+    assert data(dfm, 0, 1) == 'v'
+    assert df.iloc[3, 1] == 'v'
+
+    # Remove the filter
+    assert dfm.set_filter('')
+    assert dfm.rowCount() == 4
+
+    # Put the rows of the dataframe in the order shown
+    dfm.materialize_row_order()
+    assert list(dfm.get_data()['b']) == list('xvyw')
+    assert list(df['b']) == list('wxyv')
+
+
+def test_dataframemodel_sort_large(qtbot):
+    """Test that large dataframes are sorted in a thread."""
+    nrows = int(LARGE_NROWS) + 1
+    df = DataFrame({'a': numpy.arange(nrows)[::-1]})
+    dfm = DataFrameModel(df)
+
+    with qtbot.waitSignal(dfm.sig_row_order_finished) as blocker:
+        assert dfm.sort(0)
+        assert dfm.is_computing_row_order()
+
+    assert blocker.args == [True]
+    assert not dfm.is_computing_row_order()
+    assert data(dfm, 0, 0) == '0'
+    assert df.iloc[0, 0] == nrows - 1
+
+    # Cancel sorting
+    with qtbot.waitSignal(dfm.sig_row_order_finished) as blocker:
+        dfm.sort(0, Qt.DescendingOrder)
+        dfm.cancel_row_order()
+
+    assert blocker.args == [False]
+    qtbot.wait(500)
+    assert data(dfm, 0, 0) == '0'
+
+
 def test_dataframemodel_max_min_col_update():
     df = DataFrame([[1, 2.0], [2, 2.5], [3, 9.0]])
     dfm = DataFrameModel(df)
@@ -466,6 +574,39 @@ def test_dataframemodel_get_bgcolor_with_nullable_numbers():
     assert colorclose(bgcolor(dfm, 3, 3), (h, s, v, alpha))
 
 
+def test_dataframemodel_get_bgcolor_after_changes():
+    """
+    Test that the cached background colors are updated when the data or the
+    way colors are computed change.
+    """
+    df = DataFrame([[0, 10], [1, 20], [2, 40]])
+    dfm = DataFrameModel(df)
+    h0 = dataframeeditor.BACKGROUND_NUMBER_MINHUE
+    dh = dataframeeditor.BACKGROUND_NUMBER_HUERANGE
+    s = dataframeeditor.BACKGROUND_NUMBER_SATURATION
+    v = dataframeeditor.BACKGROUND_NUMBER_VALUE
+    a = dataframeeditor.BACKGROUND_NUMBER_ALPHA
+    assert colorclose(bgcolor(dfm, 0, 0), (h0 + dh, s, v, a))
+
+    # Sort
+    dfm.sort(0, order=Qt.DescendingOrder)
+    assert colorclose(bgcolor(dfm, 0, 0), (h0, s, v, a))
+
+    # Edit a value
+    dfm.setData(dfm.createIndex(0, 1), '0')
+    assert colorclose(bgcolor(dfm, 0, 1), (h0 + dh, s, v, a))
+    assert colorclose(bgcolor(dfm, 2, 1), (h0 + 1 / 2 * dh, s, v, a))
+
+    # Use the global maximum and minimum
+    dfm.colum_avg(False)
+    assert colorclose(bgcolor(dfm, 2, 1), (h0 + 1 / 2 * dh, s, v, a))
+    assert colorclose(bgcolor(dfm, 0, 0), (h0 + 18 / 20 * dh, s, v, a))
+
+    # Disable colors
+    dfm.bgcolor(False)
+    assert bgcolor(dfm, 0, 0) is None
+
+
 def test_dataframemodel_with_format_percent_d_and_nan():
     """
     Test DataFrameModel with format `d` and dataframe containing NaN
@@ -585,6 +726,88 @@ def fake_exec(self):
     editor.set_conf('dataframe_format', '.6g')
 
 
+def test_remote_dataframemodel(qtbot, monkeypatch):
+    """
+    Test that the model for remote dataframes gets its data and sorts it
+    through the kernel, without blocking to get cells.
+    """
+    df = DataFrame({'a': [3, 1, 2], 'b': ['x', 'y', 'z']}, index=list('pqr'))
+    kernel_view = KernelRemoteView(df)
+
+    # Tiles are sent by the kernel when `reply` is called
+    requests = []
+
+    def reply():
+        for args, callback in requests:
+            callback(kernel_view.get_window(*args))
+        requests.clear()
+
+    shellwidget = Mock()
+    shellwidget.open_remote_view.return_value = (1, kernel_view.get_info())
+    shellwidget.request_remote_view_window.side_effect = (
+        lambda view_id, *args, callback: requests.append((args, callback))
+    )
+    shellwidget.get_remote_view_stats.side_effect = (
+        lambda view_id: kernel_view.get_stats()
+    )
+    shellwidget.sort_remote_view.side_effect = (
+        lambda view_id, column, ascending: kernel_view.sort(column, ascending)
+    )
+
+    dfm = RemoteDataFrameModel(RemoteView(shellwidget, 'df'))
+    assert dfm.rowCount() == 3
+    assert dfm.columnCount() == 2
+    assert dfm.header(0, 1) == 'b'
+
+    # Cells and index labels are empty until their tile is received
+    assert dfm.header(1, 0) == ''
+    assert data(dfm, 0, 1) == ''
+    assert len(requests) == 1
+
+    with qtbot.waitSignal(dfm.dataChanged):
+        reply()
+    assert dfm.header(1, 0) == 'p'
+    assert data(dfm, 0, 1) == 'x'
+
+    # Tiles are cached
+    assert data(dfm, 2, 0) == '2'
+    assert shellwidget.request_remote_view_window.call_count == 1
+
+    # Sorting is done in the kernel without modifying the dataframe
+    assert dfm.sort(0)
+    assert data(dfm, 0, 1) == ''
+    reply()
+    assert dfm.header(1, 0) == 'q'
+    assert data(dfm, 0, 1) == 'y'
+    assert list(df.index) == ['p', 'q', 'r']
+
+    # Replies for tiles discarded by sorting are ignored
+    assert dfm.sort(0, Qt.DescendingOrder)
+    assert data(dfm, 0, 1) == ''
+    args, callback = requests.pop()
+    assert dfm.sort(0)
+    callback(kernel_view.get_window(*args))
+    assert data(dfm, 0, 1) == ''
+    reply()
+    assert data(dfm, 0, 1) == 'y'
+
+    # Tiles that couldn't be requested are not requested again right away
+    assert dfm.sort(0, Qt.DescendingOrder)
+    shellwidget.request_remote_view_window.side_effect = RuntimeError
+    shellwidget.request_remote_view_window.reset_mock()
+    assert data(dfm, 0, 1) == ''
+    assert data(dfm, 1, 1) == ''
+    assert shellwidget.request_remote_view_window.call_count == 1
+
+    monkeypatch.setattr(remoteview, 'FAILED_TILE_RETRY_DELAY', 0)
+    assert data(dfm, 0, 1) == ''
+    assert shellwidget.request_remote_view_window.call_count == 2
+
+    # The view is closed in the kernel
+    dfm.remote_view.close()
+    shellwidget.close_remote_view.assert_called_once_with(1)
+
+
 def test_dataframemodel_with_format_thousands():
     """
     Check that format can include thousands separator.
@@ -798,10 +1021,11 @@ def test_sort_dataframe_with_duplicate_column(qtbot):
     editor = DataFrameEditor(None)
     editor.setup_and_check(df)
     dfm = editor.dataModel
-    QTimer.singleShot(1000, lambda: close_message_box(qtbot))
+
+    # Columns are sorted by position, so duplicated ones are not a problem
     editor.dataModel.sort(0)
-    assert [data(dfm, row, 0) for row in range(len(df))] == ['1', '3', '2']
-    assert [data(dfm, row, 1) for row in range(len(df))] == ['4', '6', '5']
+    assert [data(dfm, row, 0) for row in range(len(df))] == ['1', '2', '3']
+    assert [data(dfm, row, 1) for row in range(len(df))] == ['4', '5', '6']
     editor.dataModel.sort(1)
     assert [data(dfm, row, 0) for row in range(len(df))] == ['1', '2', '3']
     assert [data(dfm, row, 1) for row in range(len(df))] == ['4', '5', '6']
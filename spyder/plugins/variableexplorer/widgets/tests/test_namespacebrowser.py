@@ -310,5 +310,27 @@ def test_dataframeeditor_readonly(namespacebrowser, type_name, readonly):
     assert MockDataFrameEditor.call_args.kwargs['readonly'] == readonly
 
 
+def test_refresh_with_old_kernels(namespacebrowser):
+    """
+    Test that the namespace view and the variable properties are requested
+    separately until the kernel shows it can send them in a single call.
+    """
+    browser = namespacebrowser
+    call = browser.shellwidget.call_kernel.return_value
+
+    browser.refresh_namespacebrowser()
+    call.get_namespace_view.assert_called_once()
+    call.get_var_properties.assert_called_once()
+    call.get_namespace_view_and_properties.assert_not_called()
+
+    # Kernels that send view deltas can send both in a single call
+    call.reset_mock()
+    browser.update_view({'namespace_view_delta': None})
+    browser.refresh_namespacebrowser()
+    call.get_namespace_view_and_properties.assert_called_once()
+    call.get_namespace_view.assert_not_called()
+    call.get_var_properties.assert_not_called()
+
+
 if __name__ == "__main__":
     pytest.main()
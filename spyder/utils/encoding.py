@@ -12,7 +12,7 @@
 """
 
 # Standard library imports
-from codecs import BOM_UTF8, BOM_UTF16, BOM_UTF32
+from codecs import BOM_UTF8, BOM_UTF16, BOM_UTF32, lookup
 import contextlib
 import tempfile
 import locale
@@ -21,6 +21,7 @@
 import os.path as osp
 import pathlib
 import sys
+import threading
 import time
 import errno
 
@@ -33,6 +34,10 @@
 
 PREFERRED_ENCODING = locale.getpreferredencoding()
 
+# Lock to read the umask, which can only be done by setting it, from several
+# threads at the same time
+_UMASK_LOCK = threading.Lock()
+
 
 def transcode(text, input=PREFERRED_ENCODING, output=PREFERRED_ENCODING):
     """Transcode a text string"""
@@ -113,6 +118,14 @@ def to_fs_from_unicode(unic):
     'iso8859-10', 'iso8859-13', 'iso8859-14', 'latin-1', 'utf-16'
 ]
 
+# Maximum length of the start of a text where its coding declaration is
+# looked for
+CODING_SEARCH_LENGTH = 4096
+
+# Texts longer than this are passed to chardet only by their start, which
+# is enough to detect their encoding and avoids scanning big files whole
+CHARDET_MAX_LENGTH = 1024**2
+
 
 def get_coding(text, force_chardet=False, default_codec=None):
     """
@@ -126,11 +139,14 @@ def get_coding(text, force_chardet=False, default_codec=None):
     the chardet library. If default_codec is set, then do not use the chardet
     library and return default_codec if there is no "coding=xxx" declaration.
 
+    Only the start of long texts is inspected (see CODING_SEARCH_LENGTH and
+    CHARDET_MAX_LENGTH).
+
     @param text text to inspect (string)
     @return coding string
     """
     if not force_chardet:
-        for line in text.splitlines()[:2]:
+        for line in text[:CODING_SEARCH_LENGTH].splitlines()[:2]:
             try:
                 result = CODING_RE.search(str(line))
             except UnicodeDecodeError:
@@ -149,7 +165,7 @@ def get_coding(text, force_chardet=False, default_codec=None):
     # Fallback using chardet
     if isinstance(text, bytes) and (force_chardet or default_codec is None):
         # Use detect because it's thread-safe since Chardet 7.0
-        result = chardet.detect(text)
+        result = chardet.detect(text[:CHARDET_MAX_LENGTH])
         return result['encoding']
 
     return default_codec
@@ -298,8 +314,9 @@ def write(text, filename, encoding='utf-8', mode='wb'):
             creation = file_stat.st_atime
         except FileNotFoundError:
             # Creating a new file, emulate what os.open() does
-            umask = os.umask(0)
-            os.umask(umask)
+            with _UMASK_LOCK:
+                umask = os.umask(0)
+                os.umask(umask)
             # Set base permission of a file to standard permissions.
             # See #spyder-ide/spyder#14112.
             original_mode = 0o666 & ~umask
@@ -351,11 +368,44 @@ def read(filename, encoding='utf-8'):
         default_codec = 'utf-8'  # Per PEP3120
     else:
         default_codec = None
-    contents = open(filename, 'rb').read()
+    with open(filename, 'rb') as f:
+        contents = f.read()
     text, encoding = decode(contents, default_codec=default_codec)
     return text, encoding
 
 
+def guess_file_encoding(filename):
+    """
+    Guess the encoding of a file from its start, without reading it whole.
+
+    Returns a codec name that can be used to decode the contents of the file,
+    including its BOM if it has one.
+    """
+    with open(filename, 'rb') as f:
+        head = f.read(CHARDET_MAX_LENGTH)
+
+    if head.startswith(BOM_UTF8):
+        return 'utf-8-sig'
+    elif head.startswith(BOM_UTF32):
+        # This needs to be checked before UTF-16 because the UTF-32 LE BOM
+        # starts with the UTF-16 LE one
+        return 'utf-32'
+    elif head.startswith(BOM_UTF16):
+        return 'utf-16'
+
+    if filename.endswith(('.py', '.pyw', '.ipy', '.pyi')):
+        default_codec = 'utf-8'
+    else:
+        default_codec = None
+
+    coding = get_coding(head, default_codec=default_codec)
+    try:
+        lookup(coding)
+    except (TypeError, LookupError):
+        coding = 'utf-8'
+    return coding
+
+
 def readlines(filename, encoding='utf-8'):
     """
     Read lines from file ('filename')
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Persistent cache of the pixmaps of theme-colorized SVG icons.
+
+Pixmaps are rendered only for the sizes Qt asks for and saved as PNG files,
+so that icons can be loaded in later sessions without parsing their SVG
+files.
+"""
+
+# Standard library imports
+import hashlib
+import logging
+import os
+import os.path as osp
+
+# Third party imports
+from qtpy.QtCore import QSize
+from qtpy.QtGui import QColor, QIcon, QIconEngine, QPainter, QPixmap
+
+# Local imports
+from spyder import __version__
+from spyder.config.base import get_conf_path
+from spyder.utils.svg_colorizer import SVGColorize
+
+
+logger = logging.getLogger(__name__)
+
+# Sizes reported to Qt as available, which some platforms need to set window
+# icons.
+ICON_SIZES = [16, 24, 32, 48, 96, 128, 256, 512]
+
+
+def get_palette_hash(colors, disabled_color):
+    """
+    Get a short hash of the colors used to colorize icons.
+
+    Spyder's version is part of it, so that icons changed in a new version
+    are rendered again.
+    """
+    key = repr((sorted(colors.items()), disabled_color, __version__))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+
+
+class IconDiskCache:
+    """On-disk cache of icon pixmaps rendered with a color palette."""
+
+    def __init__(self, palette_hash, directory=None):
+        """
+        Parameters
+        ----------
+        palette_hash: str
+            Hash of the colors the icons are rendered with.
+        directory: str, optional
+            Directory where the cache of each palette is saved. By default,
+            it's in Spyder's configuration directory.
+        """
+        if directory is None:
+            directory = get_conf_path('icon_cache')
+        self.directory = osp.join(directory, palette_hash)
+
+    def get_path(self, name, size, dpr, disabled):
+        """Get the path of the file for a pixmap of an icon."""
+        mode = 'disabled' if disabled else 'normal'
+        return osp.join(
+            self.directory,
+            f"{name}-{size.width()}x{size.height()}@{dpr:g}-{mode}.png"
+        )
+
+    def load(self, name, size, dpr, disabled):
+        """Load a pixmap, or return None if it's not cached."""
+        path = self.get_path(name, size, dpr, disabled)
+        if not osp.isfile(path):
+            return None
+
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return None
+
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+
+    def save(self, pixmap, name, size, dpr, disabled):
+        """Save a pixmap, ignoring errors because the cache is optional."""
+        path = self.get_path(name, size, dpr, disabled)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+
+            # Write to a temporary file first so that other Spyder instances
+            # never read a partially written one.
+            if pixmap.save(temp_path, 'PNG'):
+                os.replace(temp_path, path)
+        except OSError:
+            logger.debug(f"Error saving icon to {path}", exc_info=True)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+class ColorizedSVGIconEngine(QIconEngine):
+    """
+    Icon engine that renders theme-colorized SVG icons lazily.
+
+    Pixmaps are only rendered for the sizes and modes Qt requests, and are
+    looked up in a disk cache first. The SVG file is parsed the first time a
+    pixmap is not found there.
+    """
+
+    def __init__(self, icon_path, colors, disabled_color, disk_cache=None):
+        """
+        Parameters
+        ----------
+        icon_path: str
+            Path to the SVG file.
+        colors: dict
+            Colors of the elements of the SVG file, by class name.
+        disabled_color: str
+            Color of the icon in the disabled mode.
+        disk_cache: IconDiskCache, optional
+            Cache where the rendered pixmaps are saved.
+        """
+        super().__init__()
+        self.icon_path = icon_path
+        self.colors = colors
+        self.disabled_color = disabled_color
+        self.disk_cache = disk_cache
+
+        # The modification time of the file is part of the name used in the
+        # disk cache, so that the icon is rendered again if the file changes.
+        try:
+            mtime = int(os.stat(icon_path).st_mtime)
+        except OSError:
+            mtime = 0
+        self.name = f"{osp.splitext(osp.basename(icon_path))[0]}-{mtime}"
+
+        # Pixmaps rendered in this session, by (size, dpr, disabled). Clones
+        # share them.
+        self._pixmaps = {}
+        self._svg_data = None
+
+    # ---- QIconEngine API
+    # -------------------------------------------------------------------------
+    def pixmap(self, size, mode, state):
+        return self.scaledPixmap(size, mode, state, 1.0)
+
+    def scaledPixmap(self, size, mode, state, scale):
+        # Active and selected icons look like normal ones
+        disabled = mode == QIcon.Disabled
+        key = (size.width(), size.height(), scale, disabled)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            return pixmap
+
+        if self.disk_cache is not None:
+            pixmap = self.disk_cache.load(self.name, size, scale, disabled)
+
+        if pixmap is None:
+            if disabled:
+                pixmap = self._create_disabled_pixmap(
+                    self.scaledPixmap(size, QIcon.Normal, state, scale)
+                )
+            else:
+                pixmap = self._render(size, scale)
+
+            if self.disk_cache is not None and not pixmap.isNull():
+                self.disk_cache.save(pixmap, self.name, size, scale, disabled)
+
+        self._pixmaps[key] = pixmap
+        return pixmap
+
+    def paint(self, painter, rect, mode, state):
+        scale = painter.device().devicePixelRatioF()
+        pixmap = self.scaledPixmap(rect.size(), mode, state, scale)
+        painter.drawPixmap(rect, pixmap)
+
+    def availableSizes(self, mode=QIcon.Normal, state=QIcon.Off):
+        return [QSize(size, size) for size in ICON_SIZES]
+
+    def clone(self):
+        engine = ColorizedSVGIconEngine(
+            self.icon_path, self.colors, self.disabled_color, self.disk_cache
+        )
+        engine._pixmaps = self._pixmaps
+        engine._svg_data = self._svg_data
+        return engine
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _render(self, size, scale):
+        """Render the icon to fit in a size, scaled by a device ratio."""
+        size_px = max(int(min(size.width(), size.height()) * scale), 1)
+        try:
+            if self._svg_data is None:
+                colorizer = SVGColorize(self.icon_path)
+                self._svg_data = (
+                    colorizer,
+                    colorizer.extract_colored_paths(self.colors)
+                    if colorizer.root is not None else None
+                )
+
+            colorizer, svg_paths_data = self._svg_data
+            if svg_paths_data and svg_paths_data.get('paths'):
+                pixmap = colorizer.render_colored_svg(
+                    svg_paths_data['paths'],
+                    size_px,
+                    svg_paths_data.get('width', 24),
+                    svg_paths_data.get('height', 24),
+                    svg_paths_data.get('viewbox'),
+                )
+            else:
+                pixmap = QIcon(self.icon_path).pixmap(size_px, size_px)
+        except Exception:
+            # Any error, render the icon without colorizing it
+            logger.debug(
+                f"Error colorizing icon {self.icon_path}", exc_info=True
+            )
+            pixmap = QIcon(self.icon_path).pixmap(size_px, size_px)
+
+        pixmap.setDevicePixelRatio(scale)
+        return pixmap
+
+    def _create_disabled_pixmap(self, source_pixmap):
+        """Create a disabled (grayed out) version of a pixmap."""
+        disabled_pixmap = QPixmap(source_pixmap.size())
+        disabled_pixmap.setDevicePixelRatio(source_pixmap.devicePixelRatio())
+        disabled_pixmap.fill(QColor(0, 0, 0, 0))  # Transparent
+
+        painter = QPainter(disabled_pixmap)
+        painter.drawPixmap(0, 0, source_pixmap)
+
+        # Apply disabled color overlay
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(disabled_pixmap.rect(), QColor(self.disabled_color))
+        painter.end()
+
+        return disabled_pixmap
@@ -12,15 +12,16 @@
 
 # Third party imports
 from qtpy.QtCore import QBuffer, QByteArray
-from qtpy.QtGui import QColor, QIcon, QImage, QPainter, QPixmap
+from qtpy.QtGui import QColor, QIcon, QImage, QPainter
 from qtpy.QtWidgets import QStyle, QWidget
 
 # Local imports
 from spyder.config.manager import CONF
 from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.utils.icon_cache import (
+    ColorizedSVGIconEngine, get_palette_hash, IconDiskCache)
 from spyder.utils.image_path_manager import get_image_path
 from spyder.utils.palette import SpyderPalette
-from spyder.utils.svg_colorizer import SVGColorize
 import qtawesome as qta
 
 class IconManager():
@@ -129,6 +130,7 @@ def __init__(self):
 
         # Cache for processed icons
         self._icon_cache = {}
+        self._icon_disk_cache = None
 
         self._qtaargs = {
             'environment':             [('mdi.cube-outline',), {'color': self.MAIN_FG_COLOR}],
@@ -478,8 +480,10 @@ def _process_svg_icon(self, icon_path, resample):
         Process an SVG icon with proper colorization for multi-color icons.
 
         This method handles SVG icons with multiple colored paths, each defined
-        by a class attribute that maps to a color in ICON_COLORS. It supports
-        high DPI displays by generating icons at multiple resolutions.
+        by a class attribute that maps to a color in ICON_COLORS. Pixmaps are
+        rendered lazily for the sizes requested by Qt and saved to a disk
+        cache, from which they are loaded in later sessions without parsing
+        the SVG file again.
 
         Parameters
         ----------
@@ -495,75 +499,32 @@ def _process_svg_icon(self, icon_path, resample):
             selected states
         """
         try:
-            # Use SVGColorize to extract paths with their associated colors
-            svg_paths_data = SVGColorize.get_colored_paths(
-                icon_path, self.ICON_COLORS
-            )
-            if not svg_paths_data:
-                return self._process_regular_icon(icon_path, resample)
-
-            # Define standard icon sizes for high DPI support
-            sizes = [16, 24, 32, 48, 96, 128, 256, 512]
-            icon = QIcon()
-
-            # Extract SVG metadata
-            width = svg_paths_data.get('width', 24)
-            height = svg_paths_data.get('height', 24)
-            viewbox = svg_paths_data.get('viewbox')
-            paths = svg_paths_data.get('paths', [])
-
-            # Process each size to ensure proper scaling on all displays
-            for size in sizes:
-                # Create the base pixmap for this size using SVGColorize
-                svg_colorizer = SVGColorize(icon_path)
-                pixmap = svg_colorizer.render_colored_svg(
-                    paths, size, width, height, viewbox
+            return QIcon(
+                ColorizedSVGIconEngine(
+                    icon_path,
+                    self.ICON_COLORS,
+                    SpyderPalette.COLOR_DISABLED,
+                    self._get_icon_disk_cache(),
                 )
-
-                # Add pixmap for normal state
-                icon.addPixmap(pixmap, QIcon.Normal)
-
-                # Create disabled version (grayed out)
-                disabled_pixmap = self._create_disabled_pixmap(pixmap)
-                icon.addPixmap(disabled_pixmap, QIcon.Disabled)
-
-                # Use normal state for selected state as well
-                icon.addPixmap(pixmap, QIcon.Selected)
-
-            return icon
+            )
         except Exception:
             # Any error, fall back to regular processing
             return self._process_regular_icon(icon_path, resample)
 
-    def _create_disabled_pixmap(self, source_pixmap):
+    def _get_icon_disk_cache(self):
         """
-        Create a disabled (grayed out) version of a pixmap.
+        Get the disk cache of icon pixmaps for the current palette.
 
-        Parameters
-        ----------
-        source_pixmap : QPixmap
-            Source pixmap to create disabled version from
-
-        Returns
-        -------
-        QPixmap
-            Disabled version of the pixmap
+        It's created on first use because the configuration directory can
+        be changed by command line options after this module is imported.
         """
-        disabled_pixmap = QPixmap(source_pixmap.size())
-        disabled_pixmap.fill(QColor(0, 0, 0, 0))  # Transparent
-        
-        # Draw the source pixmap first
-        disabled_painter = QPainter(disabled_pixmap)
-        disabled_painter.drawPixmap(0, 0, source_pixmap)
-        
-        # Apply disabled color overlay
-        disabled_painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
-        disabled_painter.fillRect(
-            disabled_pixmap.rect(), QColor(SpyderPalette.COLOR_DISABLED)
-        )
-        disabled_painter.end()
-        
-        return disabled_pixmap
+        if self._icon_disk_cache is None:
+            self._icon_disk_cache = IconDiskCache(
+                get_palette_hash(
+                    self.ICON_COLORS, SpyderPalette.COLOR_DISABLED
+                )
+            )
+        return self._icon_disk_cache
 
     def _process_regular_icon(self, icon_path, resample):
         """Process a regular (non-SVG) icon."""
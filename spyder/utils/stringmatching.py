@@ -13,6 +13,14 @@
 NOT_FOUND_SCORE = -1
 NO_SCORE = 0
 
+# Characters after which a match is at the start of a word
+WORD_SEPARATORS = frozenset(' _-./\\:')
+
+# Costs used by FuzzyMatcher to score a match. Lower costs are better.
+GAP_START_COST = 10
+GAP_EXTENSION_COST = 1
+NOT_WORD_START_COST = 20
+
 
 def get_search_regex(query, ignore_case=True):
     """Returns a compiled regex pattern to search for query letters in order.
@@ -232,6 +240,277 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     return results
 
 
+def get_char_mask(text):
+    """
+    Get a bitmask of the characters in `text`.
+
+    If the mask of a query has bits that are not in the mask of a text, the
+    query can't be found in it.
+    """
+    mask = 0
+    for char in set(text):
+        mask |= 1 << (ord(char) & 63)
+    return mask
+
+
+def is_subsequence(query, text):
+    """Check if all the characters of `query` appear in `text` in order."""
+    chars = iter(text)
+    return all(char in chars for char in query)
+
+
+def is_word_start(text, position):
+    """Check if the character of `text` at `position` starts a word."""
+    if position == 0:
+        return True
+    previous = text[position - 1]
+    return (
+        previous in WORD_SEPARATORS
+        or (previous.islower() and text[position].isupper())
+    )
+
+
+def lower_keeping_length(text):
+    """Lowercase `text` without changing the position of its characters."""
+    lower_text = text.lower()
+    if len(lower_text) == len(text):
+        return lower_text
+    return ''.join(
+        char.lower() if len(char.lower()) == 1 else char for char in text
+    )
+
+
+class FuzzyMatcher:
+    """
+    Fuzzy search in a list of choices.
+
+    A query matches a choice if its characters appear in it in order, like
+    with `get_search_regex`. Matches are scored with dynamic programming,
+    which finds the positions of the query characters that give consecutive
+    matches and matches at the start of words, while checking only the
+    positions between the first and last place where each character can be.
+
+    Choices are discarded with a bitmask of their characters before looking
+    into them, and the ones that matched the last query are the only ones
+    checked when the new query contains it (e.g. when typing more letters),
+    so that searching in long lists stays fast while typing.
+    """
+
+    def __init__(self, choices, ignore_case=True):
+        self.choices = [str(choice) for choice in choices]
+        self.ignore_case = ignore_case
+        if ignore_case:
+            self._texts = [lower_keeping_length(c) for c in self.choices]
+        else:
+            self._texts = self.choices
+        self._masks = [get_char_mask(text) for text in self._texts]
+
+        # Last query and its matches, to narrow the next search
+        self._last_query = None
+        self._last_matches = None
+
+    def match(self, query):
+        """
+        Search for `query` in the choices.
+
+        Returns
+        -------
+        dict
+            Mapping of the indexes of the matching choices to tuples with
+            their score (lower is better) and the positions of the query
+            characters in them.
+        """
+        query = query.replace(' ', '')
+        if self.ignore_case:
+            query = query.lower()
+
+        if (
+            self._last_query is not None
+            and is_subsequence(self._last_query, query)
+        ):
+            candidates = self._last_matches
+        else:
+            candidates = range(len(self.choices))
+
+        query_mask = get_char_mask(query)
+        masks = self._masks
+        matches = {}
+        for index in candidates:
+            if query_mask & ~masks[index]:
+                continue
+
+            result = self._score(query, index)
+            if result is not None:
+                matches[index] = result
+
+        self._last_query = query
+        self._last_matches = list(matches)
+        return matches
+
+    def get_scores(self, query, template='{}'):
+        """
+        Search for `query` in the choices and return a list of tuples.
+
+        This gives the same kind of results as `get_search_scores`: the
+        choice, its enriched text (with `template` applied to the matched
+        characters) and its score, which is `NOT_FOUND_SCORE` if the choice
+        doesn't match and `NO_SCORE` for all choices if the query is empty.
+        """
+        if not query.replace(' ', ''):
+            return [(choice, choice, NO_SCORE) for choice in self.choices]
+
+        results = [
+            (choice, choice, NOT_FOUND_SCORE) for choice in self.choices
+        ]
+        for index, (score, positions) in self.match(query).items():
+            choice = self.choices[index]
+            results[index] = (
+                choice, self._enrich(choice, positions, template), score
+            )
+        return results
+
+    def _score(self, query, index):
+        """
+        Score the match of `query` in a choice.
+
+        Returns
+        -------
+        tuple or None
+            The score and the positions of the query characters, or None if
+            the query is not in the choice.
+        """
+        text = self._texts[index]
+
+        # Earliest positions where each character can be matched
+        first = []
+        position = -1
+        for char in query:
+            position = text.find(char, position + 1)
+            if position == -1:
+                return None
+            first.append(position)
+
+        # A match of the whole query at the start of a word is the best one
+        # if it costs less than the cheapest possible match with a gap, which
+        # would end at the earliest position of the last character.
+        choice = self.choices[index]
+        position = text.find(query, first[0])
+        min_gap_cost = (
+            GAP_START_COST
+            + GAP_EXTENSION_COST * (first[-1] + 1 - len(query))
+        )
+        if (
+            position != -1
+            and GAP_EXTENSION_COST * position <= min_gap_cost
+            and is_word_start(choice, position)
+        ):
+            return (
+                GAP_EXTENSION_COST * position,
+                list(range(position, position + len(query)))
+            )
+
+        # Latest positions where each character can be matched
+        last = []
+        position = len(text)
+        for char in reversed(query):
+            position = text.rfind(char, 0, position)
+            last.append(position)
+        last.reverse()
+
+        # Each row has the (position, cost, index in the previous row) of the
+        # best match of the query up to a character, for all the positions
+        # where that character can be.
+        rows = []
+        previous_row = None
+        for char_index, char in enumerate(query):
+            row = []
+            end = last[char_index] + 1
+            position = text.find(char, first[char_index], end)
+            previous_index = 0
+            best_gap_cost = best_gap_index = None
+            while position != -1:
+                if is_word_start(choice, position):
+                    cost = 0
+                else:
+                    cost = NOT_WORD_START_COST
+
+                if previous_row is None:
+                    row.append(
+                        (position, cost + GAP_EXTENSION_COST * position, None)
+                    )
+                    position = text.find(char, position + 1, end)
+                    continue
+
+                # Best previous match to get here with a gap
+                while (
+                    previous_index < len(previous_row)
+                    and previous_row[previous_index][0] < position
+                ):
+                    previous_position, previous_cost, __ = (
+                        previous_row[previous_index]
+                    )
+                    gap_cost = (
+                        previous_cost - GAP_EXTENSION_COST * previous_position
+                    )
+                    if best_gap_cost is None or gap_cost < best_gap_cost:
+                        best_gap_cost = gap_cost
+                        best_gap_index = previous_index
+                    previous_index += 1
+
+                if best_gap_cost is not None:
+                    cost += (
+                        best_gap_cost + GAP_START_COST
+                        + GAP_EXTENSION_COST * (position - 1)
+                    )
+                    best_index = best_gap_index
+
+                    # Consecutive match
+                    previous_position, previous_cost, __ = (
+                        previous_row[previous_index - 1]
+                    )
+                    if (
+                        previous_position == position - 1
+                        and previous_cost <= cost
+                    ):
+                        cost = previous_cost
+                        best_index = previous_index - 1
+
+                    row.append((position, cost, best_index))
+
+                position = text.find(char, position + 1, end)
+
+            rows.append(row)
+            previous_row = row
+
+        # Follow the best match back to get its positions
+        entry = min(rows[-1], key=lambda entry: entry[1])
+        score = entry[1]
+        positions = [entry[0]]
+        for row in reversed(rows[:-1]):
+            entry = row[entry[2]]
+            positions.append(entry[0])
+        positions.reverse()
+
+        return score, positions
+
+    def _enrich(self, choice, positions, template):
+        """Apply `template` to the runs of matched characters of a choice."""
+        if template == '{}':
+            return choice
+
+        parts = []
+        start = 0
+        run_start = positions[0]
+        for position, next_position in zip(positions, positions[1:] + [None]):
+            if next_position != position + 1:
+                parts.append(choice[start:run_start])
+                parts.append(template.format(choice[run_start:position + 1]))
+                start = position + 1
+                run_start = next_position
+        parts.append(choice[start:])
+        return ''.join(parts)
+
+
 def test():
     template = '<b>{0}</b>'
     names = ['close pane', 'debug continue', 'debug exit', 'debug step into',
@@ -11,6 +11,7 @@
 
 # Standard library imports
 from __future__ import annotations
+from array import array
 import builtins
 import keyword
 import os
@@ -20,7 +21,8 @@
 from pygments.lexer import RegexLexer, bygroups
 from pygments.lexers import get_lexer_by_name
 from pygments.token import (Text, Other, Keyword, Name, String, Number,
-                            Comment, Generic, Token)
+                            Comment, Generic, Token, Error, Whitespace,
+                            _TokenType)
 from qtpy.QtCore import Qt, QTimer, Signal
 from qtpy.QtGui import (QColor, QCursor, QFont, QSyntaxHighlighter,
                         QTextCharFormat, QTextOption)
@@ -51,6 +53,10 @@
         r"https?://([\da-z\.-]+)\.([a-z\.]{2,6})([/\w\.-]*)[^ ^'^\"]+",
 }
 
+# Characters outside the Basic Multilingual Plane, which take two UTF-16 code
+# units in Qt strings
+ASTRAL_PATTERN = re.compile('[\U00010000-\U0010FFFF]')
+
 # Mapping for file extensions that use Pygments highlighting but should use
 # different lexers than Pygments' autodetection suggests.  Keys are file
 # extensions or tuples of extensions, values are Pygments lexer names.
@@ -493,6 +499,18 @@ class PythonSH(BaseSH):
     # Comments suitable for Outline Explorer
     OECOMMENT = re.compile(r'^(# ?--[-]+|##[#]+ )[ -]*[^- ]+')
 
+    # Text prepended to a block to tokenize it when the previous one ends
+    # inside a string
+    STATE_PREFIXES = {
+        INSIDE_DQ3STRING: r'""" ',
+        INSIDE_SQ3STRING: r"''' ",
+        INSIDE_DQSTRING: r'" ',
+        INSIDE_SQSTRING: r"' ",
+    }
+
+    # Minimum number of entries kept in the tokens cache
+    MIN_TOKENS_CACHE_SIZE = 1000
+
     def __init__(self, parent, font=None, color_scheme='Spyder'):
         BaseSH.__init__(self, parent, font, color_scheme)
         self.cell_separators = CELL_LANGUAGES['Python']
@@ -500,6 +518,62 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         self.outline_explorer_data_update_timer = QTimer()
         self.outline_explorer_data_update_timer.setSingleShot(True)
 
+        # Tokens of the blocks highlighted so far, keyed by their text and the
+        # state of the previous block
+        self._tokens_cache = {}
+
+    def tokenize(self, text, prev_state):
+        """
+        Get the tokens of a block of text.
+
+        Tokens are cached, so that blocks whose text and previous state didn't
+        change are not tokenized again, e.g. when the whole document is
+        highlighted after changing the color scheme.
+
+        Parameters
+        ----------
+        text: str
+            Text of the block.
+        prev_state: int
+            Highlighting state at the end of the previous block.
+
+        Returns
+        -------
+        tuple
+            (offset, tokens), where offset is the (negative) length of the
+            text prepended to the block to tokenize it according to
+            `prev_state`, and tokens is a tuple of (key, value, start, end)
+            entries, with spans in UTF-16 code units of the prefixed text.
+        """
+        cache_key = (prev_state, text)
+        try:
+            return self._tokens_cache[cache_key]
+        except KeyError:
+            pass
+
+        prefix = self.STATE_PREFIXES.get(prev_state, '')
+        tokens = []
+        for match in self.PROG.finditer(prefix + text):
+            for key, value in match.groupdict().items():
+                if value:
+                    tokens.append((key, value) + get_span(match, key))
+
+        # Drop the cache when it gets too big compared to the document, so
+        # that it doesn't keep the tokens of text that no longer exists.
+        max_size = max(
+            self.MIN_TOKENS_CACHE_SIZE, 2 * self.document().blockCount()
+        )
+        if len(self._tokens_cache) >= max_size:
+            self._tokens_cache.clear()
+
+        result = (-len(prefix), tuple(tokens))
+        self._tokens_cache[cache_key] = result
+        return result
+
+    def clear_tokens_cache(self):
+        """Remove all cached block tokens."""
+        self._tokens_cache.clear()
+
     def select_formats(self, start: int, inline_completion_start: int | None):
         """Decide if we need to use inline formats for highlighting."""
         formats = self.formats
@@ -514,7 +588,7 @@ def select_formats(self, start: int, inline_completion_start: int | None):
     def highlight_match(
         self,
         text,
-        match,
+        span,
         key,
         value,
         offset,
@@ -523,8 +597,8 @@ def highlight_match(
         oedata,
         inline_completion_start: int | None,
     ):
-        """Highlight a single match."""
-        start, end = get_span(match, key)
+        """Highlight a single token, whose UTF-16 span is given by `span`."""
+        start, end = span
         start = max([0, start + offset])
         end = max([0, end + offset])
         length = end - start
@@ -635,21 +709,10 @@ def highlight_block(self, text):
         data = block.userData()
 
         prev_state = tbh.get_state(block.previous())
-        if prev_state == self.INSIDE_DQ3STRING:
-            offset = -4
-            text = r'""" '+text
-        elif prev_state == self.INSIDE_SQ3STRING:
-            offset = -4
-            text = r"''' "+text
-        elif prev_state == self.INSIDE_DQSTRING:
-            offset = -2
-            text = r'" '+text
-        elif prev_state == self.INSIDE_SQSTRING:
-            offset = -2
-            text = r"' "+text
-        else:
-            offset = 0
+        if prev_state not in self.STATE_PREFIXES:
             prev_state = self.NORMAL
+        offset, tokens = self.tokenize(text, prev_state)
+        text = self.STATE_PREFIXES.get(prev_state, '') + text
 
         # Get start column for inline completions
         inline_completion_start = (
@@ -680,20 +743,18 @@ def highlight_block(self, text):
         state = self.NORMAL
         oedata = None
         import_stmt = None
-        for match in self.PROG.finditer(text):
-            for key, value in list(match.groupdict().items()):
-                if value:
-                    state, import_stmt, oedata = self.highlight_match(
-                        text,
-                        match,
-                        key,
-                        value,
-                        offset,
-                        state,
-                        import_stmt,
-                        oedata,
-                        inline_completion_start,
-                    )
+        for key, value, start, end in tokens:
+            state, import_stmt, oedata = self.highlight_match(
+                text,
+                (start, end),
+                key,
+                value,
+                offset,
+                state,
+                import_stmt,
+                oedata,
+                inline_completion_start,
+            )
 
         tbh.set_state(block, state)
 
@@ -1290,8 +1351,271 @@ def setup_formats(self, font=None):
 # highlighter based on PygmentsSH would be 2 to 3 times slower than the
 # current native PythonSH syntax highlighter.
 
+def lex_with_states(lexer, text, pos=0, stack=('root',)):
+    """
+    Tokenize text with a Pygments regex lexer, reporting its states.
+
+    This does the same as `RegexLexer.get_tokens_unprocessed`, but starts at
+    position `pos` of `text` instead of at its beginning, so that the lexer can
+    be restarted from the middle of a document with a stack of states saved
+    previously.
+
+    Yields
+    ------
+    tuple
+        (index, token type, value, stack), where stack is the tuple of lexer
+        states when the token starts a match at the beginning of a line, and
+        None otherwise.
+    """
+    tokendefs = lexer._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    while True:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if pos == 0 or text[pos - 1] == '\n':
+                    line_stack = tuple(statestack)
+                else:
+                    line_stack = None
+
+                if action is not None:
+                    if type(action) is _TokenType:
+                        yield pos, action, m.group(), line_stack
+                    else:
+                        for index, ttype, value in action(lexer, m):
+                            yield index, ttype, value, line_stack
+                            line_stack = None
+
+                pos = m.end()
+                if new_state is not None:
+                    # State transition
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == '#pop':
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == '#push':
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        # Pop, but keep at least one state on the stack
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == '#push':
+                        statestack.append(statestack[-1])
+                    statetokens = tokendefs[statestack[-1]]
+                break
+        else:
+            # No state token matched
+            try:
+                if text[pos] == '\n':
+                    # At EOL, reset state to "root"
+                    statestack = ['root']
+                    statetokens = tokendefs['root']
+                    yield pos, Whitespace, '\n', None
+                    pos += 1
+                    continue
+                yield pos, Error, text[pos], None
+                pos += 1
+            except IndexError:
+                break
+
+
+def compute_format_runs(lexer, lines, get_format_id, old_lines=None,
+                        old_runs=None, old_states=None):
+    """
+    Compute the format runs of some lines of text with a Pygments lexer.
+
+    The runs of a line are stored in an array of integers as consecutive
+    (start, length, format id) triples, with starts and lengths in UTF-16 code
+    units, as expected by Qt.
+
+    For regex lexers, the stack of lexer states at the beginning of each line
+    is also returned. If the lines of the previously highlighted text, with
+    their runs and states, are passed, the text is lexed again only from the
+    first line that changed, and until the state of the lexer converges with
+    the previous one.
+
+    Parameters
+    ----------
+    lexer: pygments.lexer.Lexer
+        Lexer to use.
+    lines: list of str
+        Lines of text.
+    get_format_id: callable
+        Function that returns the format id of a Pygments token type.
+    old_lines, old_runs, old_states: list or None
+        Lines, runs and states of the previous version of the text.
+
+    Returns
+    -------
+    tuple
+        (runs, states, changed), where runs and states are lists with an entry
+        per line, and changed is the range of lines whose runs need to be
+        applied again, or None if the text didn't change.
+    """
+    nlines = len(lines)
+    incremental = (
+        type(lexer).get_tokens_unprocessed
+        is RegexLexer.get_tokens_unprocessed
+    )
+    resume = incremental and old_states is not None
+    if old_lines is not None and lines == old_lines:
+        return old_runs, old_states, None
+
+    first = 0
+    delta = 0
+    suffix_start = nlines
+    stack = ('root',)
+    if resume:
+        # Find the lines that changed
+        first, suffix_start = _changed_lines(lines, old_lines)
+        delta = nlines - len(old_lines)
+
+        # Restart from the closest line before the first changed one whose
+        # state is known. The line just before is lexed again too because
+        # the match that ended at the start of the changed line could have
+        # looked ahead into it.
+        first = min(first - 1, nlines - 1, len(old_lines) - 1)
+        while first > 0 and old_states[first] is None:
+            first -= 1
+        if first > 0:
+            stack = old_states[first]
+        else:
+            first = 0
+
+    # The text is terminated by a newline, as Pygments lexers expect it
+    offset = sum(map(len, lines[:first])) + first
+    text = '\n'.join(lines) + '\n'
+    if incremental:
+        tokens = lex_with_states(lexer, text, offset, stack)
+    else:
+        tokens = (
+            (index, ttype, value, None)
+            for index, ttype, value in lexer.get_tokens_unprocessed(text)
+        )
+
+    runs = []
+    states = [stack if incremental else None]
+    line = first
+    line_start = offset
+    line_end = line_start + len(lines[line])
+    current = array('i')
+    converged = False
+
+    def next_line():
+        nonlocal line, line_start, line_end, current
+        runs.append(_to_utf16_runs(lines[line], current))
+        states.append(None)
+        line += 1
+        line_start = line_end + 1
+        line_end = line_start + len(lines[line])
+        current = array('i')
+
+    for index, ttype, value, token_stack in tokens:
+        while index > line_end:
+            next_line()
+
+        if index == line_start and token_stack is not None:
+            states[-1] = token_stack
+            if (resume and line >= suffix_start
+                    and old_states[line - delta] == token_stack):
+                # From here on, lexing would give the same result as before
+                converged = True
+                break
+
+        fmt = get_format_id(ttype)
+        pos = index
+        end = index + len(value)
+        while pos < end:
+            if pos > line_end:
+                next_line()
+                continue
+
+            piece_end = min(end, line_end)
+            if piece_end > pos:
+                start = pos - line_start
+                if (current and current[-1] == fmt
+                        and current[-3] + current[-2] == start):
+                    current[-2] += piece_end - pos
+                else:
+                    current.extend((start, piece_end - pos, fmt))
+                pos = piece_end
+            else:
+                # Newline at the end of the line
+                pos += 1
+
+    if converged:
+        runs.extend(old_runs[line - delta:])
+        states[-1:] = old_states[line - delta:]
+        changed = (first, line)
+    else:
+        runs.append(_to_utf16_runs(lines[line], current))
+        # Lines not reached by the lexer, which shouldn't happen
+        missing = nlines - first - len(runs)
+        runs.extend(array('i') for __ in range(missing))
+        states.extend([None] * missing)
+        changed = (first, nlines)
+
+    if resume:
+        runs = old_runs[:first] + runs
+        states = old_states[:first] + states
+    elif old_lines is not None:
+        # Lines whose text or runs didn't change don't need to be
+        # highlighted again
+        first, last = _changed_lines(
+            list(zip(lines, runs)), list(zip(old_lines, old_runs))
+        )
+        changed = (first, max(first, last))
+
+    return runs, states, changed
+
+
+def _changed_lines(lines, old_lines):
+    """
+    Return the range of lines that differ between two versions of a text.
+
+    The range goes from the first line that changed to the start of the
+    lines shared by both versions at their end.
+    """
+    first = 0
+    max_prefix = min(len(lines), len(old_lines))
+    while first < max_prefix and lines[first] == old_lines[first]:
+        first += 1
+
+    suffix = 0
+    max_suffix = max_prefix - first
+    while suffix < max_suffix and lines[-1 - suffix] == old_lines[-1 - suffix]:
+        suffix += 1
+
+    return first, len(lines) - suffix
+
+
+def _to_utf16_runs(line, runs):
+    """Convert the starts and lengths of runs to UTF-16 code units."""
+    if line.isascii() or not ASTRAL_PATTERN.search(line):
+        return runs
+
+    utf16_runs = array('i')
+    for i in range(0, len(runs), 3):
+        start = qstring_length(line[:runs[i]])
+        length = qstring_length(line[runs[i]:runs[i] + runs[i + 1]])
+        utf16_runs.extend((start, length, runs[i + 2]))
+    return utf16_runs
+
+
 class PygmentsSH(BaseSH):
-    """Generic Pygments syntax highlighter."""
+    """
+    Generic Pygments syntax highlighter.
+
+    The text is lexed in a thread, and the formats of its tokens are stored
+    per line as runs of (start, length, format id). Only the lines whose runs
+    changed since the last time the text was lexed are highlighted again.
+    """
     # Store the language name and a ref to the lexer
     _lang_name = None
     _lexer = None
@@ -1320,8 +1644,16 @@ def __init__(self, parent, font=None, color_scheme=None):
         # parsing
         self._worker_manager = WorkerManager()
 
-        # Store the format for all the tokens after Pygments parsing
-        self._charlist = []
+        # Spyder formats used for Pygments tokens, which are referred to in
+        # format runs by their position in this list
+        self._format_names = sorted(set(self._tokmap.values()))
+        self._format_ids = {}
+
+        # Lines of the last lexed text, with their format runs and the stacks
+        # of lexer states at their start
+        self._lines = None
+        self._line_runs = []
+        self._line_states = None
 
         # Flag variable to avoid unnecessary highlights if the worker has not
         # yet finished processing
@@ -1331,74 +1663,97 @@ def stop(self):
         self._worker_manager.terminate_all()
 
     def make_charlist(self):
-        """Parses the complete text and stores format for each character."""
+        """Lex the text that changed and highlight the affected lines."""
 
         def worker_output(worker, output, error):
             """Worker finished callback."""
-            self._charlist = output
-            if error is None and output:
-                self._allow_highlight = True
+            if error is not None or output is None:
+                return
+
+            # Results for an outdated version of the text are discarded,
+            # so that the next time lines are compared to the last ones that
+            # were highlighted.
+            if revision != self.document().revision():
+                return
+
+            runs, states, changed = output
+            self._lines = lines
+            self._line_runs = runs
+            self._line_states = states
+
+            self._allow_highlight = True
+            if changed is None:
                 BaseSH.rehighlight(self)
+            else:
+                self._rehighlight_lines(*changed)
             self._allow_highlight = False
 
         text = str(self.document().toPlainText())
-        tokens = self._lexer.get_tokens(text)
+        lines = text.split('\n')
+        revision = self.document().revision()
 
         # Before starting a new worker process make sure to end previous
         # incarnations
         self._worker_manager.terminate_all()
 
         worker = self._worker_manager.create_python_worker(
-            self._make_charlist,
-            tokens,
-            self._tokmap,
-            self.formats,
+            compute_format_runs,
+            self._lexer,
+            lines,
+            self._get_format_id,
+            self._lines,
+            self._line_runs,
+            self._line_states,
         )
         worker.sig_finished.connect(worker_output)
         worker.start()
 
-    def _make_charlist(self, tokens, tokmap, formats):
-        """
-        Parses the complete text and stores format for each character.
-
-        Uses the attached lexer to parse into a list of tokens and Pygments
-        token types.  Then breaks tokens into individual letters, each with a
-        Spyder token type attached.  Stores this list as self._charlist.
-
-        It's attached to the contentsChange signal of the parent QTextDocument
-        so that the charlist is updated whenever the document changes.
-        """
+    def _get_format_id(self, typ):
+        """Get the id of the Spyder format for a Pygments token type."""
+        try:
+            return self._format_ids[typ]
+        except KeyError:
+            pass
 
-        def _get_fmt(typ):
-            """Get the Spyder format code for the given Pygments token type."""
-            # Exact matches first
-            if typ in tokmap:
-                return tokmap[typ]
+        # Exact matches first
+        name = self._tokmap.get(typ)
+        if name is None:
             # Partial (parent-> child) matches
-            for key, val in tokmap.items():
-                if typ in key: # Checks if typ is a subtype of key.
-                    return val
+            for key, val in self._tokmap.items():
+                if typ in key:  # Checks if typ is a subtype of key.
+                    name = val
+                    break
+            else:
+                name = 'normal'
 
-            return 'normal'
+        format_id = self._format_names.index(name)
+        self._format_ids[typ] = format_id
+        return format_id
 
-        charlist = []
-        for typ, token in tokens:
-            fmt = formats[_get_fmt(typ)]
-            for letter in token:
-                charlist.append((fmt, letter))
+    def _rehighlight_lines(self, first, last):
+        """Highlight again the blocks from line `first` to `last`."""
+        if first == 0 and last >= self.document().blockCount():
+            BaseSH.rehighlight(self)
+            return
 
-        return charlist
+        block = self.document().findBlockByNumber(first)
+        if self.editor is not None:
+            with self.editor.enable_qt_undo_redo():
+                while block.isValid() and block.blockNumber() < last:
+                    self.rehighlightBlock(block)
+                    block = block.next()
 
     def highlightBlock(self, text):
         """ Actually highlight the block"""
-        # Note that an undefined blockstate is equal to -1, so the first block
-        # will have the correct behaviour of starting at 0.
+        # Block states are not used, so that highlighting a block doesn't
+        # force highlighting the following ones.
         if self._allow_highlight:
-            start = self.previousBlockState() + 1
-            end = start + qstring_length(text)
-            for i, (fmt, letter) in enumerate(self._charlist[start:end]):
-                self.setFormat(i, 1, fmt)
-            self.setCurrentBlockState(end)
+            block_number = self.currentBlock().blockNumber()
+            if block_number < len(self._line_runs):
+                runs = self._line_runs[block_number]
+                formats = [self.formats[name] for name in self._format_names]
+                for i in range(0, len(runs), 3):
+                    self.setFormat(runs[i], runs[i + 1], formats[runs[i + 2]])
             self.highlight_extras(text)
 
     def rehighlight(self):
@@ -9,13 +9,16 @@
 import pathlib
 import stat
 import sys
+import threading
+import time
 
 import chardet
 from flaky import flaky
 from packaging.version import parse
 import pytest
 
-from spyder.utils.encoding import is_text_file, read, write
+from spyder.utils.encoding import (
+    guess_file_encoding, is_text_file, read, write)
 
 
 CD_VERSION = parse(chardet.__version__)
@@ -74,6 +77,45 @@ def test_permissions(tmpdir):
     assert old_mode == new_mode
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Only on Linux and macOS")
+def test_write_new_files_from_threads(tmpdir, monkeypatch):
+    """
+    Check that writing new files from several threads at the same time
+    doesn't change the umask or the permissions of the files.
+    """
+    # Let other threads run right after the umask is set
+    set_umask = os.umask
+
+    def slow_umask(mask):
+        old_mask = set_umask(mask)
+        time.sleep(0.001)
+        return old_mask
+
+    umask = os.umask(0o022)
+    monkeypatch.setattr(os, "umask", slow_umask)
+    try:
+        def write_files(prefix):
+            for i in range(50):
+                write("Some text", str(tmpdir.join(f"{prefix}{i}.txt")))
+
+        threads = [
+            threading.Thread(target=write_files, args=(prefix,))
+            for prefix in ["spam", "eggs"]
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert set_umask(0o022) == 0o022
+        assert {
+            stat.S_IMODE(os.stat(str(path)).st_mode)
+            for path in tmpdir.listdir()
+        } == {0o644}
+    finally:
+        set_umask(umask)
+
+
 @flaky(max_runs=10)
 def test_timestamp(tmpdir):
     """Check that the modification timestamp is preserved."""
@@ -122,6 +164,23 @@ def test_files_encodings(expected_encoding, text_file):
     assert encoding.lower() == expected_encoding.lower()
 
 
+def test_guess_file_encoding(tmpdir):
+    """Test guessing the encoding of a file from its start."""
+    p = tmpdir.join("spam.py")
+    p.write_binary(b"# -*- coding: iso8859-9 -*-\n" + b"x = 1\n" * 100)
+    assert guess_file_encoding(str(p)) == "iso8859-9"
+
+    p.write_binary(b"x = 1\n")
+    assert guess_file_encoding(str(p)) == "utf-8"
+
+    p = tmpdir.join("spam.txt")
+    p.write_binary("spam".encode("utf-8-sig"))
+    assert guess_file_encoding(str(p)) == "utf-8-sig"
+
+    p.write_binary("spam".encode("utf-16"))
+    assert guess_file_encoding(str(p)) == "utf-16"
+
+
 @pytest.mark.skipif(os.name == "nt", reason="Only on Linux and macOS")
 def test_file_gid(tmpdir):
     gid_file = tmpdir.mkdir("sub").join("random_log.log")
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""Tests for icon_cache.py"""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+import pytest
+from qtpy.QtCore import QSize
+from qtpy.QtGui import QIcon
+
+# Local imports
+from spyder.utils import icon_cache
+from spyder.utils.icon_cache import (
+    ColorizedSVGIconEngine, get_palette_hash, IconDiskCache)
+from spyder.utils.icon_manager import ima
+from spyder.utils.image_path_manager import get_image_path
+from spyder.utils.palette import SpyderPalette
+from spyder.utils.qthelpers import qapplication
+
+
+def create_icon(disk_cache):
+    engine = ColorizedSVGIconEngine(
+        get_image_path('binary'),
+        ima.ICON_COLORS,
+        SpyderPalette.COLOR_DISABLED,
+        disk_cache
+    )
+    return QIcon(engine)
+
+
+def test_icon_disk_cache(tmp_path, monkeypatch):
+    """
+    Test that pixmaps are only rendered for the requested sizes and loaded
+    from the disk cache without parsing the SVG file again.
+    """
+    qapp = qapplication()  # noqa
+    palette_hash = get_palette_hash(
+        ima.ICON_COLORS, SpyderPalette.COLOR_DISABLED
+    )
+    disk_cache = IconDiskCache(palette_hash, str(tmp_path))
+
+    pixmap = create_icon(disk_cache).pixmap(QSize(24, 24))
+    assert not pixmap.isNull()
+
+    # Only the requested size was rendered and saved
+    name = ColorizedSVGIconEngine(get_image_path('binary'), {}, '').name
+    assert list((tmp_path / palette_hash).iterdir()) == [
+        tmp_path / palette_hash / osp.basename(
+            disk_cache.get_path(name, QSize(24, 24), 1, False)
+        )
+    ]
+
+    # A new icon takes its pixmaps from the cache, without parsing the SVG
+    parsed = []
+    monkeypatch.setattr(icon_cache, 'SVGColorize', parsed.append)
+    cached_pixmap = create_icon(disk_cache).pixmap(QSize(24, 24))
+    assert cached_pixmap.toImage() == pixmap.toImage()
+    assert not parsed
+
+    # Disabled pixmaps are cached too
+    disabled_pixmap = create_icon(disk_cache).pixmap(
+        QSize(24, 24), QIcon.Disabled
+    )
+    assert not disabled_pixmap.isNull()
+    assert len(list((tmp_path / palette_hash).iterdir())) == 2
+
+
+def test_palette_hash():
+    """Test that icons are cached separately for each palette."""
+    colors = {'ICON_1': '#FFFFFF'}
+    assert get_palette_hash(colors, '#000000') == get_palette_hash(
+        dict(colors), '#000000'
+    )
+    assert get_palette_hash(colors, '#000000') != get_palette_hash(
+        {'ICON_1': '#FAFAFA'}, '#000000'
+    )
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -15,7 +15,8 @@
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import (
+    FuzzyMatcher, get_search_scores, NOT_FOUND_SCORE)
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +217,47 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_fuzzy_matcher():
+    """Test the scores and enriched text given by FuzzyMatcher."""
+    names = ['layout preferences', 'save current layout', 'play all',
+             'LayoutManager', 'close pane', 'clear line']
+    matcher = FuzzyMatcher(names)
+
+    results = matcher.get_scores('lay', template='<b>{0}</b>')
+    results = sorted(
+        [result for result in results if result[-1] != NOT_FOUND_SCORE],
+        key=lambda result: result[-1]
+    )
+    assert results == [
+        ('layout preferences', '<b>lay</b>out preferences', 0),
+        ('LayoutManager', '<b>Lay</b>outManager', 0),
+        ('save current layout', 'save current <b>lay</b>out', 13),
+        ('play all', 'p<b>lay</b> all', 21),
+    ]
+
+    # Matches at the start of words are preferred
+    assert matcher.get_scores('cl', template='<b>{0}</b>')[1] == (
+        'save current layout', 'save <b>c</b>urrent <b>l</b>ayout', 22
+    )
+    assert matcher.match('lm') == {3: (15, [0, 6])}
+
+
+def test_fuzzy_matcher_narrowing():
+    """
+    Test that narrowing the search with the previous results gives the same
+    results as searching from scratch.
+    """
+    with open(__file__) as f:
+        names = f.read().split()
+
+    matcher = FuzzyMatcher(names)
+    for query in ['s', 'se', 'sef', 'self', 'e', 'elf', 'Elf']:
+        assert matcher.match(query) == FuzzyMatcher(names).match(query)
+        assert len(matcher.match(query)) == len([
+            result for result in get_search_scores(query, names)
+            if result[-1] != NOT_FOUND_SCORE
+        ])
+
+
 if __name__ == "__main__":
     pytest.main()
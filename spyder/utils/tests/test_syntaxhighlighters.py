@@ -5,11 +5,13 @@
 
 """Tests for syntaxhighlighters.py"""
 
+from pygments.lexers import get_lexer_by_name
 import pytest
 from qtpy.QtWidgets import QApplication
-from qtpy.QtGui import QTextDocument
+from qtpy.QtGui import QSyntaxHighlighter, QTextDocument
 
-from spyder.utils.syntaxhighlighters import HtmlSH, PythonSH, MarkdownSH
+from spyder.utils.syntaxhighlighters import (
+    HtmlSH, PythonSH, MarkdownSH, compute_format_runs, lex_with_states)
 
 def compare_formats(actualFormats, expectedFormats, sh):
     assert len(actualFormats) == len(expectedFormats)
@@ -129,5 +131,98 @@ def test_python_not_an_outline_explorer_comment(line):
     assert not PythonSH.OECOMMENT.match(line)
 
 
+def test_PythonSH_tokens_cache():
+    """
+    Test that block tokens are cached by text and previous state, and that
+    highlighting from the cache gives the same formats.
+    """
+    txt = 'x = """doc\nimport os as o\n"""\nimport os as o'
+    doc = QTextDocument(txt)
+    sh = PythonSH(doc, color_scheme='Spyder')
+    QSyntaxHighlighter.rehighlight(sh)
+
+    blocks = [doc.findBlockByNumber(i) for i in range(doc.blockCount())]
+    formats = [
+        [(f.start, f.length, f.format) for f in block.layout().formats()]
+        for block in blocks
+    ]
+
+    # The same text is tokenized differently depending on the previous state
+    offset, tokens = sh.tokenize('import os as o', sh.INSIDE_DQ3STRING)
+    assert offset == -4
+    assert tokens[0][0] == 'uf_dq3string'
+    offset, tokens = sh.tokenize('import os as o', sh.NORMAL)
+    assert offset == 0
+    assert tokens[0][:2] == ('keyword', 'import')
+    assert sh.tokenize('import os as o', sh.NORMAL)[1] is tokens
+
+    # Highlighting again only uses cached tokens
+    cache_size = len(sh._tokens_cache)
+    QSyntaxHighlighter.rehighlight(sh)
+    assert len(sh._tokens_cache) == cache_size
+    assert formats == [
+        [(f.start, f.length, f.format) for f in block.layout().formats()]
+        for block in blocks
+    ]
+
+    sh.clear_tokens_cache()
+    assert not sh._tokens_cache
+
+
+def test_lex_with_states():
+    """Test that lexing with states gives the same tokens as Pygments."""
+    lexer = get_lexer_by_name('ini')
+    text = '[section]\nkey = "value" ; comment\n\nother = 1\n'
+    tokens = list(lex_with_states(lexer, text))
+    assert [token[:3] for token in tokens] == list(
+        lexer.get_tokens_unprocessed(text))
+
+    # States are reported for matches at the start of lines
+    assert tokens[0][3] == ('root',)
+    assert all(stack is None for __, __, value, stack in tokens
+               if value == '"value"')
+
+
+@pytest.mark.parametrize('lang', ['ini', 'html', 'c'])
+def test_compute_format_runs_incremental(lang):
+    """
+    Test that format runs computed incrementally after an edit are the same
+    as those computed for the whole text.
+    """
+    lexer = get_lexer_by_name(lang)
+    format_ids = {}
+
+    def get_format_id(ttype):
+        return format_ids.setdefault(ttype, len(format_ids))
+
+    lines = [
+        '[a] <p class="x"> /* comment',
+        'key = value ; comment -->',
+        'int x = 1; <!-- 𨭎 */',
+        '',
+        '[b] -->',
+        'other = "y" </p>',
+        '',
+    ] * 20
+    runs, states, changed = compute_format_runs(lexer, lines, get_format_id)
+    assert changed == (0, len(lines))
+    assert len(runs) == len(states) == len(lines)
+
+    # Nothing needs to be highlighted again if the text didn't change
+    assert compute_format_runs(
+        lexer, lines, get_format_id, lines, runs, states)[2] is None
+
+    for line, new_text in [(30, '"'), (31, '<!--'), (42, '/*'), (0, '*/')]:
+        new_lines = lines[:line] + [new_text + lines[line]] + lines[line + 1:]
+        new_runs, new_states, changed = compute_format_runs(
+            lexer, new_lines, get_format_id, lines, runs, states)
+        assert new_runs == compute_format_runs(
+            lexer, new_lines, get_format_id)[0]
+        assert changed[0] <= line < changed[1]
+
+    # Runs are given in UTF-16 code units
+    assert runs[2][-3] + runs[2][-2] == len('int x = 1; <!-- 𨭎 */') + 1
+
+
 if __name__ == '__main__':
     pytest.main()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+
+"""
+Benchmarks for the Python syntax highlighter.
+
+They need pytest-benchmark. For instance, to compare the results of two
+branches run::
+
+    python runtests.py --benchmark-autosave \
+        spyder/utils/tests/test_syntaxhighlighters_benchmark.py
+
+in each of them and then ``pytest-benchmark compare``.
+"""
+
+# Third party imports
+import pytest
+from qtpy.QtGui import QSyntaxHighlighter, QTextCursor, QTextDocument
+
+# Local imports
+from spyder.utils import syntaxhighlighters
+from spyder.utils.syntaxhighlighters import PythonSH
+
+
+pytest.importorskip('pytest_benchmark')
+
+
+# =============================================================================
+# ---- Auxiliary functions
+# =============================================================================
+def get_numpy_module_text(name):
+    """Get the source code of a NumPy module, or skip if not available."""
+    module = pytest.importorskip(name)
+    with open(module.__file__, encoding='utf-8') as f:
+        return f.read()
+
+
+def get_generated_text(n_functions=2000):
+    """Get generated code, similar to the one produced by code generators."""
+    lines = []
+    for i in range(n_functions):
+        lines += [
+            f'def function_{i}(x, y=None, *args, **kwargs):',
+            f'    """Docstring of function {i}.',
+            '',
+            f'    Returns {i} plus the sum of the arguments.',
+            '    """',
+            f"    values = [x, y or 0x{i:x}, {i}.5e-3] + list(args)",
+            f"    name = 'function_{i}'  # Name",
+            '    return sum(values) + len(kwargs) if name else None',
+            '',
+        ]
+    return '\n'.join(lines)
+
+
+def get_text(source):
+    """Get the text to highlight for a given source."""
+    if source == 'generated':
+        return get_generated_text()
+    elif source == 'spyder':
+        with open(syntaxhighlighters.__file__, encoding='utf-8') as f:
+            return f.read()
+    else:
+        return get_numpy_module_text(source)
+
+
+SOURCES = [
+    'numpy._core.fromnumeric',
+    'numpy.lib._function_base_impl',
+    'spyder',
+    'generated',
+]
+
+
+# =============================================================================
+# ---- Fixtures
+# =============================================================================
+@pytest.fixture(params=SOURCES)
+def highlighter(qtbot, request):
+    """Python highlighter for a document with the text of a large file."""
+    text = get_text(request.param)
+    document = QTextDocument(text)
+    sh = PythonSH(document, color_scheme='Spyder')
+    QSyntaxHighlighter.rehighlight(sh)
+
+    # The highlighter is deleted with its document, so this keeps a reference
+    # to it until the benchmark finishes.
+    yield sh
+
+
+# =============================================================================
+# ---- Benchmarks
+# =============================================================================
+@pytest.mark.slow
+def test_full_highlight_cold(benchmark, highlighter):
+    """Highlight a whole file without cached tokens."""
+    benchmark.pedantic(
+        QSyntaxHighlighter.rehighlight,
+        args=(highlighter,),
+        setup=highlighter.clear_tokens_cache,
+        rounds=5
+    )
+
+
+@pytest.mark.slow
+def test_full_highlight_cached(benchmark, highlighter):
+    """
+    Highlight a whole file again with cached tokens, e.g. after changing the
+    color scheme.
+    """
+    benchmark.pedantic(
+        QSyntaxHighlighter.rehighlight,
+        args=(highlighter,),
+        rounds=5
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize('edit', ['x', '"""'])
+def test_incremental_highlight(benchmark, highlighter, edit):
+    """
+    Highlight the blocks affected by typing in the middle of a file.
+
+    Inserting a triple quote changes the state of all the following blocks, so
+    that's the worst case.
+    """
+    document = highlighter.document()
+    cursor = QTextCursor(
+        document.findBlockByNumber(document.blockCount() // 2)
+    )
+
+    def type_and_undo():
+        cursor.insertText(edit)
+        for __ in range(len(edit)):
+            cursor.deletePreviousChar()
+
+    benchmark(type_and_undo)
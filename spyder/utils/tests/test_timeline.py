@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+
+"""Tests for timeline.py"""
+
+# Standard library imports
+import json
+import time
+
+# Local imports
+from spyder.utils.timeline import Timeline
+
+
+def test_spans():
+    """Test that nested spans are recorded only while recording."""
+    timeline = Timeline('Startup')
+    with timeline.span('Ignored'):
+        pass
+    assert timeline.get_spans() == []
+
+    timeline.start()
+    with timeline.span('Setup'):
+        with timeline.span('editor.on_initialize', 'plugin'):
+            time.sleep(0.01)
+    timeline.add_span('Spawn kernel', time.perf_counter())
+    timeline.finish()
+
+    with timeline.span('After startup'):
+        pass
+
+    spans = timeline.get_spans()
+    assert [(span['name'], span['depth']) for span in spans] == [
+        ('Startup', 0),
+        ('Setup', 1),
+        ('editor.on_initialize', 2),
+        ('Spawn kernel', 1),
+    ]
+    assert spans[1]['duration'] >= spans[2]['duration'] >= 0.01
+    assert spans[0]['duration'] >= spans[1]['duration']
+
+    # Starting again clears the previous spans
+    timeline.start()
+    timeline.finish()
+    assert [span['name'] for span in timeline.get_spans()] == ['Startup']
+
+
+def test_find_regressions():
+    """Test comparing the duration of phases with their budgets."""
+    timeline = Timeline('Startup')
+    timeline.start()
+    now = time.perf_counter()
+    timeline.add_span('editor.on_initialize', now - 2, now)
+    timeline.add_span('console.on_initialize', now - 0.5, now)
+    timeline.add_span('Restore layout', now - 0.2, now - 0.1)
+    timeline.add_span('Restore layout', now - 0.1, now)
+
+    budgets = {'*.on_initialize': 1, 'Restore layout': 0.15}
+    regressions = timeline.find_regressions(budgets)
+    assert sorted(name for name, __, __ in regressions) == [
+        'Restore layout',
+        'editor.on_initialize',
+    ]
+    assert timeline.find_regressions({'*': 10}) == []
+
+
+def test_reports(tmp_path):
+    """Test the Chrome trace file and the summary table."""
+    timeline = Timeline('Startup')
+    timeline.start()
+    with timeline.span('find_internal_plugins'):
+        time.sleep(0.002)
+    with timeline.span('Too short to show'):
+        pass
+    timeline.finish()
+
+    filename = tmp_path / 'trace.json'
+    timeline.write_chrome_trace(str(filename))
+    with open(filename, encoding='utf-8') as f:
+        events = json.load(f)['traceEvents']
+    assert [event['name'] for event in events] == [
+        'Startup',
+        'find_internal_plugins',
+        'Too short to show',
+    ]
+    assert all(event['ph'] == 'X' for event in events)
+    assert events[1]['dur'] >= 2000
+
+    lines = timeline.format_summary().splitlines()
+    assert lines[0].split() == ['Phase', 'Start', '(ms)', 'Duration', '(ms)']
+    assert [line.split()[0] for line in lines[2:]] == [
+        'Startup',
+        'find_internal_plugins',
+    ]
+    assert lines[3].startswith('  find_internal_plugins')
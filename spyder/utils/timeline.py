@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Timeline of the phases of Spyder's startup.
+
+Spans are always recorded while Spyder starts, because that only takes a
+couple of calls to `time.perf_counter` per phase. They are reported when
+Spyder is started with the `--profile-startup` option.
+"""
+
+# Standard library imports
+from contextlib import contextmanager
+import fnmatch
+import json
+import os
+import threading
+import time
+
+
+class Timeline:
+    """
+    Recorder of the spans of time taken by named phases.
+
+    Spans are only recorded between calls to `start` and `finish`, so that
+    instrumented code that also runs after startup (e.g. registering a plugin
+    or spawning a kernel) doesn't keep adding them.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.origin = time.perf_counter()
+
+        # List of (name, category, start, end, depth, thread id) tuples
+        self._spans = []
+        self._recording = False
+        self._local = threading.local()
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    @property
+    def recording(self):
+        """Whether spans are being recorded."""
+        return self._recording
+
+    def start(self):
+        """
+        Start recording spans.
+
+        This does nothing if spans are already being recorded, so that it can
+        be called from the different entry points of the application.
+        """
+        if self._recording:
+            return
+
+        self.origin = time.perf_counter()
+        self._spans = []
+        self._recording = True
+
+    def finish(self):
+        """Stop recording spans and add one for the whole timeline."""
+        if not self._recording:
+            return
+
+        self._recording = False
+        self._spans.insert(
+            0,
+            (self.name, 'total', self.origin, time.perf_counter(), 0,
+             threading.get_ident())
+        )
+
+    @contextmanager
+    def span(self, name, category='phase'):
+        """Record the time taken by the code in a `with` block."""
+        if not self._recording:
+            yield
+            return
+
+        depth = getattr(self._local, 'depth', 0)
+        self._local.depth = depth + 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self._local.depth = depth
+            self.add_span(name, start, end, category, depth=depth + 1)
+
+    def add_span(self, name, start, end=None, category='phase', depth=1):
+        """
+        Record a span of time.
+
+        Parameters
+        ----------
+        name: str
+            Name of the phase.
+        start: float
+            Value of `time.perf_counter` when the phase started.
+        end: float, optional
+            Value of `time.perf_counter` when the phase ended. Now by default.
+        category: str, optional
+            Category of the phase, shown in trace viewers.
+        depth: int, optional
+            Nesting level of the phase in the summary table.
+        """
+        if not self._recording:
+            return
+
+        if end is None:
+            end = time.perf_counter()
+
+        # Appending to a list is thread-safe, so spans can be recorded by any
+        # thread.
+        self._spans.append(
+            (name, category, start, end, depth, threading.get_ident())
+        )
+
+    def get_spans(self):
+        """
+        Get the recorded spans, sorted by start time.
+
+        Returns
+        -------
+        list of dict
+            Name, category, start and duration (in seconds since the start of
+            the timeline) and nesting depth of each span.
+        """
+        spans = sorted(self._spans, key=lambda span: (span[2], span[4]))
+        return [
+            {
+                'name': name,
+                'category': category,
+                'start': start - self.origin,
+                'duration': end - start,
+                'depth': depth,
+                'thread': thread,
+            }
+            for name, category, start, end, depth, thread in spans
+        ]
+
+    def get_durations(self):
+        """Get the total duration (in seconds) of each phase by name."""
+        durations = {}
+        for span in self.get_spans():
+            name = span['name']
+            durations[name] = durations.get(name, 0) + span['duration']
+        return durations
+
+    def find_regressions(self, budgets):
+        """
+        Find the phases that took longer than their budget.
+
+        Parameters
+        ----------
+        budgets: dict
+            Maximum duration (in seconds) of the phases whose names match
+            each key, which can be a shell-style wildcard pattern (e.g.
+            ``'*.on_initialize'``).
+
+        Returns
+        -------
+        list of tuple
+            (name, duration, budget) of each phase over its budget.
+        """
+        regressions = []
+        for name, duration in self.get_durations().items():
+            for pattern, budget in budgets.items():
+                if fnmatch.fnmatchcase(name, pattern) and duration > budget:
+                    regressions.append((name, duration, budget))
+                    break
+        return regressions
+
+    def to_chrome_trace(self):
+        """
+        Get the spans in the Trace Event Format.
+
+        The result can be loaded in ``chrome://tracing`` or Perfetto.
+        """
+        pid = os.getpid()
+        events = [
+            {
+                'name': span['name'],
+                'cat': span['category'],
+                'ph': 'X',
+                'ts': round(span['start'] * 1e6, 3),
+                'dur': round(span['duration'] * 1e6, 3),
+                'pid': pid,
+                'tid': span['thread'],
+            }
+            for span in self.get_spans()
+        ]
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, filename):
+        """Write the spans to a JSON file in the Trace Event Format."""
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+
+    def format_summary(self, min_duration=0.001):
+        """
+        Format the spans as a table with their start and duration.
+
+        Spans shorter than `min_duration` seconds are left out, to keep the
+        table readable.
+        """
+        spans = [
+            span for span in self.get_spans()
+            if span['duration'] >= min_duration or span['depth'] == 0
+        ]
+        if not spans:
+            return ''
+
+        names = ['  ' * span['depth'] + span['name'] for span in spans]
+        width = max(len(name) for name in names + ['Phase'])
+        lines = [
+            f"{'Phase':<{width}}  {'Start (ms)':>10}  {'Duration (ms)':>13}",
+            '-' * (width + 27),
+        ]
+        for name, span in zip(names, spans):
+            lines.append(
+                f"{name:<{width}}  {span['start'] * 1000:>10.1f}  "
+                f"{span['duration'] * 1000:>13.1f}"
+            )
+        return '\n'.join(lines)
+
+
+STARTUP_TIMELINE = Timeline('Startup')
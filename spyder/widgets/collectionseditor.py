@@ -72,11 +72,16 @@
 from spyder.utils.misc import getcwd_or_home
 from spyder.utils.qthelpers import mimedata2url
 from spyder.utils.stringmatching import get_search_scores, get_search_regex
+from spyder.plugins.variableexplorer.widgets.arrayeditor import ArrayEditor
 from spyder.plugins.variableexplorer.widgets.collectionsdelegate import (
     CollectionsDelegate,
+    LARGE_ARRAY,
     SELECT_ROW_BUTTON_SIZE,
 )
+from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
+    DataFrameEditor)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
+from spyder.plugins.variableexplorer.widgets.remoteview import RemoteView
 from spyder.widgets.emptymessage import EmptyMessageWidget
 from spyder.widgets.helperwidgets import CustomSortFilterProxy, MessageCheckBox
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
@@ -304,6 +309,49 @@ def set_data(self, data, coll_filter=None):
 
         self.reset()
 
+    def update_data(self, changed):
+        """
+        Update the values of some keys without resetting the model.
+
+        Parameters
+        ----------
+        changed: dict
+            New values of keys that are already in the model.
+
+        Returns
+        -------
+        bool
+            False if the model data is not a dictionary or `changed` has keys
+            that are not in the model. In that case nothing is updated and
+            `set_data` needs to be called instead.
+        """
+        if not isinstance(self._data, dict):
+            return False
+
+        rows = {key: row for row, key in enumerate(self.keys)}
+        if any(key not in rows for key in changed):
+            return False
+
+        for key, value in changed.items():
+            self._data[key] = value
+
+            # Sizes and types are only computed for the rows loaded so far
+            row = rows[key]
+            if row < self.rows_loaded:
+                if self.remote:
+                    self.sizes[row] = value['size']
+                    self.types[row] = value['type']
+                else:
+                    self.sizes[row] = get_size(value)
+                    self.types[row] = get_human_readable_type(value)
+
+                self.dataChanged.emit(
+                    self.index(row, 0),
+                    self.index(row, self.columnCount() - 1)
+                )
+
+        return True
+
     def set_size_and_type(self, start=None, stop=None):
         data = self._data
 
@@ -2183,6 +2231,84 @@ class RemoteCollectionsDelegate(CollectionsDelegate):
     def __init__(self, parent=None, namespacebrowser=None):
         CollectionsDelegate.__init__(self, parent, namespacebrowser)
 
+    def use_remote_view(self, index):
+        """
+        Decide if a variable is displayed with its data kept in the kernel.
+
+        That's done for dataframes and arrays that are large enough to take
+        a long time to be transferred to Spyder.
+        """
+        val_type = index.sibling(index.row(), 1).data()
+        val_size = index.sibling(index.row(), 2).data()
+
+        return (
+            any(
+                name in val_type
+                for name in ['DataFrame', 'Series', 'Index', 'Array']
+            )
+            and self.get_size_from_shape(val_size) > LARGE_ARRAY
+        )
+
+    def createEditor(self, parent, option, index, object_explorer=False):
+        """Overriding method createEditor"""
+        if (
+            index.column() >= 3
+            and not object_explorer
+            and self.use_remote_view(index)
+        ):
+            self.sig_editor_creation_started.emit()
+            source_index = index.model().mapToSource(index)
+            name = source_index.model().keys[source_index.row()]
+
+            try:
+                remote_view = self.parent().open_remote_view(name)
+            except Exception:
+                # The kernel could not support remote views or this variable
+                # (e.g. 3d arrays). In that case, its value is retrieved.
+                remote_view = None
+
+            if remote_view is not None:
+                self.create_remote_editor(parent, index, name, remote_view)
+                return None
+
+        return super().createEditor(parent, option, index, object_explorer)
+
+    def create_remote_editor(self, parent, index, name, remote_view):
+        """Create a read-only editor for a remote view of a variable."""
+        key = index.model().get_key(index)
+        table = self.parent()
+
+        def get_data():
+            return table.open_remote_view(name)
+
+        if remote_view.kind == 'dataframe':
+            editor = DataFrameEditor(
+                parent=parent,
+                namespacebrowser=self.namespacebrowser,
+                data_function=get_data,
+                readonly=True
+            )
+            success = editor.setup_and_check(
+                remote_view, title=key, from_variable_explorer=True
+            )
+        else:
+            editor = ArrayEditor(parent=parent, data_function=get_data)
+            success = editor.setup_and_check(
+                remote_view,
+                title=key,
+                readonly=True,
+                from_variable_explorer=True
+            )
+
+        if not success:
+            remote_view.close()
+            self.sig_editor_shown.emit()
+            return
+
+        editor.sig_close_all_editors_requested.connect(self.close_all_editors)
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=key, readonly=True))
+
     def get_value(self, index):
         if index.isValid():
             source_index = index.model().mapToSource(index)
@@ -2283,6 +2409,10 @@ def get_value(self, name):
         value = self.shellwidget.get_value(name)
         return value
 
+    def open_remote_view(self, name):
+        """Open a view of a variable whose data stays in the kernel"""
+        return RemoteView(self.shellwidget, name)
+
     def new_value(self, name, value):
         """Create new value in data"""
         try:
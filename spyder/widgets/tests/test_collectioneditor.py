@@ -330,6 +330,22 @@ def test_collectionsmodel_with_two_ints():
     assert data(cm, 1, 3) == '1'
 
 
+def test_collectionsmodel_update_data():
+    """Test that values of existing keys are updated without a reset."""
+    coll = {'y': 2, 'x': [1]}
+    cm = CollectionsModel(MockParent(), coll)
+
+    assert cm.update_data({'x': [1, 2], 'y': 'spam'})
+    assert data(cm, 0, 1) == 'str'
+    assert data(cm, 0, 3) == 'spam'
+    assert data(cm, 1, 2) == 2
+    assert data(cm, 1, 3) == '[1, 2]'
+
+    # Keys that are not in the model can't be updated
+    assert not cm.update_data({'z': 1})
+    assert cm.rowCount() == 2
+
+
 def test_collectionsmodel_with_index():
     # Regression test for spyder-ide/spyder#3380,
     # modified for spyder-ide/spyder#3758.